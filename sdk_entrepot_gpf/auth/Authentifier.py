@@ -6,6 +6,7 @@ from typing import Dict, Optional
 import requests
 import pyotp
 
+from sdk_entrepot_gpf.helper.SessionHelper import SessionHelper
 from sdk_entrepot_gpf.pattern.Singleton import Singleton
 from sdk_entrepot_gpf.auth.Token import Token
 from sdk_entrepot_gpf.auth.Errors import AuthentificationError
@@ -23,6 +24,7 @@ class Authentifier(metaclass=Singleton):
         __nb_attempts (int): nombre de tentatives possibles en cas de problème rencontré pendant la récupération du jeton
         __sec_between_attempt (int): nombre de secondes entre deux tentatives en cas de problème rencontré pendant la récupération du jeton
         __last_token (Token): sauvegarde du dernier jeton récupéré (pour éviter de multiples requêtes au serveur KeyCloak)
+        __session (requests.Session): session HTTP propre au serveur d'authentification (réutilisation des connexions)
     """
 
     def __init__(self) -> None:
@@ -41,6 +43,8 @@ class Authentifier(metaclass=Singleton):
             "http": Config().get_str("store_authentification", "http_proxy"),
             "https": Config().get_str("store_authentification", "https_proxy"),
         }
+        # Session dédiée au serveur d'authentification
+        self.__session = SessionHelper.new_session("store_authentification")
         # Permettra la sauvegarde du dernier jeton récupéré (pour éviter de multiples requêtes au serveur KeyCloak)
         self.__last_token: Optional[Token] = None
 
@@ -91,7 +95,7 @@ class Authentifier(metaclass=Singleton):
                 # On affiche le TOTP Code en mode debug :
                 Config().om.debug(f"TOTP code : {d_data['totp']} ({datetime.datetime.now():%H:%M:%S})")
             # Requête KeyCloak de récupération du jeton
-            o_response = requests.post(
+            o_response = self.__session.post(
                 self.__token_url,
                 data=d_data,
                 headers={
@@ -1,12 +1,19 @@
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
 import hashlib
+import os
+from typing import Callable, Dict, List, Optional, Tuple
 
 from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.io.Md5Cache import Md5Cache
 
 
 class FileHelper:
     """Classe d'aide pour gérer les fichiers."""
 
+    # Taille de lecture par défaut pour le calcul des clefs md5 (1 Mo)
+    MD5_BUFFER_SIZE = 1024 * 1024
+
     @staticmethod
     def read(file_path: Path, file_not_found_pattern: str = "Fichier {path} non trouvé", encoding: str = "utf8") -> str:
         """Lit et retourne le contenu d'un fichier.
@@ -57,18 +64,78 @@ class FileHelper:
         return f"{f_size_in_bytes / f_size_tb:.2f} TO"
 
     @staticmethod
-    def md5_hash(file_path: Path) -> str:
+    def md5_hash(file_path: Path, buffer_size: int = MD5_BUFFER_SIZE, use_cache: bool = True) -> str:
         """
         Méthode permettant de calculer la clef md5 d'un fichier
 
         Args:
             file_path (Path): chemin d'un fichier
+            buffer_size (int, optional): taille (en octets) des blocs lus
+            use_cache (bool, optional): réutilise la clef du cache persistant si le fichier n'a pas changé (cf. `Md5Cache`)
 
         Returns:
             str: clef md5 du fichier
         """
+        if use_cache:
+            return FileHelper.md5_hash_files([file_path], buffer_size=buffer_size)[file_path]
         s_file_hash = hashlib.md5()
         with file_path.open("rb") as o_file:
-            for o_chunk in iter(lambda: o_file.read(4096), b""):
+            for o_chunk in iter(lambda: o_file.read(buffer_size), b""):
                 s_file_hash.update(o_chunk)
         return s_file_hash.hexdigest()
+
+    @staticmethod
+    def md5_hash_files(
+        files: List[Path],
+        nb_workers: int = 1,
+        buffer_size: int = MD5_BUFFER_SIZE,
+        callback: Optional[Callable[[Path, str], None]] = None,
+    ) -> Dict[Path, str]:
+        """Calcule les clefs md5 de plusieurs fichiers, éventuellement dans plusieurs processus.
+
+        Les clefs des fichiers non modifiés sont reprises du cache persistant (cf. `Md5Cache`), les autres y sont
+        enregistrées après calcul. Les plus gros fichiers sont traités en premier pour mieux répartir la charge entre les processus.
+
+        Args:
+            files (List[Path]): fichiers à traiter
+            nb_workers (int, optional): nombre de processus (1 : calcul dans le processus courant)
+            buffer_size (int, optional): taille (en octets) des blocs lus
+            callback (Optional[Callable[[Path, str], None]], optional): fonction appelée à la fin du calcul de chaque fichier (suivi de l'avancement)
+
+        Returns:
+            Dict[Path, str]: clef md5 de chaque fichier
+        """
+        d_md5 = Md5Cache().get(files)
+        if callback is not None:
+            for p_file, s_md5 in d_md5.items():
+                callback(p_file, s_md5)
+        # État des fichiers à calculer (lu avant le calcul pour le cache)
+        d_stats = {p_file: p_file.stat() for p_file in files if p_file not in d_md5}
+        l_files = sorted(d_stats, key=lambda p_file: d_stats[p_file].st_size, reverse=True)
+        l_entries: List[Tuple[Path, os.stat_result, str]] = []
+        try:
+            if nb_workers <= 1 or len(l_files) <= 1:
+                for p_file in l_files:
+                    d_md5[p_file] = FileHelper.md5_hash(p_file, buffer_size, False)
+                    l_entries.append((p_file, d_stats[p_file], d_md5[p_file]))
+                    if callback is not None:
+                        callback(p_file, d_md5[p_file])
+            else:
+                with ProcessPoolExecutor(max_workers=min(nb_workers, len(l_files))) as o_executor:
+                    d_futures: Dict["Future[str]", Path] = {o_executor.submit(FileHelper.md5_hash, p_file, buffer_size, False): p_file for p_file in l_files}
+                    try:
+                        for o_future in as_completed(d_futures):
+                            p_file = d_futures[o_future]
+                            d_md5[p_file] = o_future.result()
+                            l_entries.append((p_file, d_stats[p_file], d_md5[p_file]))
+                            if callback is not None:
+                                callback(p_file, d_md5[p_file])
+                    except BaseException:
+                        # Interruption (erreur, annulation) : les fichiers non commencés ne sont pas traités
+                        for o_future in d_futures:
+                            o_future.cancel()
+                        raise
+        finally:
+            # Les clefs calculées sont conservées même en cas d'interruption
+            Md5Cache().put(l_entries)
+        return d_md5
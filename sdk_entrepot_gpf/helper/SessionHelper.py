@@ -0,0 +1,40 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class SessionHelper:
+    """Classe d'aide pour créer des sessions HTTP réutilisant leurs connexions (pool de connexions)."""
+
+    @staticmethod
+    def new_session(section: str) -> requests.Session:
+        """Crée une session `requests` dont le pool de connexions est paramétré selon la section de configuration indiquée.
+
+        Les options lues dans la section sont :
+
+        * `pool_connections` : nombre d'hôtes différents dont les connexions sont conservées ;
+        * `pool_maxsize` : nombre maximal de connexions conservées par hôte ;
+        * `pool_block` : si vrai, on attend qu'une connexion se libère plutôt que d'en ouvrir une nouvelle au-delà de `pool_maxsize` ;
+        * `keep_alive` : si faux, les connexions sont fermées après chaque requête ;
+        * `max_retries` : nombre de tentatives de connexion gérées par `urllib3` (en plus des tentatives gérées par le SDK).
+
+        Args:
+            section (str): section de la configuration contenant les paramètres du pool
+
+        Returns:
+            requests.Session: session prête à l'emploi
+        """
+        o_session = requests.Session()
+        o_adapter = HTTPAdapter(
+            pool_connections=Config().get_int(section, "pool_connections", 10),
+            pool_maxsize=Config().get_int(section, "pool_maxsize", 10),
+            max_retries=Config().get_int(section, "max_retries", 0),
+            pool_block=Config().get_bool(section, "pool_block", False),
+        )
+        o_session.mount("https://", o_adapter)
+        o_session.mount("http://", o_adapter)
+        # Sans keep-alive, on demande au serveur de fermer la connexion après chaque réponse
+        if not Config().get_bool(section, "keep_alive", True):
+            o_session.headers["Connection"] = "close"
+        return o_session
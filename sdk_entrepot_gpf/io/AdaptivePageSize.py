@@ -0,0 +1,122 @@
+import math
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.pattern.Singleton import Singleton
+
+
+class AdaptivePageSize(metaclass=Singleton):
+    """Taille de page adaptative pour les requêtes de listing, mémorisée par (route, datastore).
+
+    La taille de départ est `store_api.nb_limit`. Tant qu'une page complète est récupérée en moins de
+    `store_api.page_size_max_item_latency` secondes par élément, la taille est multipliée par
+    `store_api.page_size_growth_factor` (dans la limite de `store_api.page_size_max`). En cas de timeout
+    ou d'erreur serveur (5xx), elle est divisée par ce même facteur (sans descendre sous `store_api.page_size_min`)
+    et la taille en échec n'est plus atteinte par la suite.
+
+    La taille retenue est conservée pour toute la durée du programme. Le mécanisme est désactivé par
+    défaut (`store_api.page_size_adaptive`), la taille est alors toujours `store_api.nb_limit`.
+    """
+
+    def __init__(self) -> None:
+        self.__enabled = Config().get_bool("store_api", "page_size_adaptive", False)
+        self.__start = Config().get_int("store_api", "nb_limit")
+        self.__min = Config().get_int("store_api", "page_size_min", 1)
+        self.__max = Config().get_int("store_api", "page_size_max", 100)
+        self.__max_item_latency = Config().get_float("store_api", "page_size_max_item_latency", 0.05)
+        self.__growth_factor = Config().get_float("store_api", "page_size_growth_factor", 2)
+        self.__sizes: Dict[Tuple[str, Optional[str]], int] = {}
+        # Plus petite taille ayant échoué (on ne réessaie pas de l'atteindre)
+        self.__failed_sizes: Dict[Tuple[str, Optional[str]], int] = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Indique si la taille de page est adaptative."""
+        return self.__enabled
+
+    def get(self, route_name: str, datastore: Optional[str] = None) -> int:
+        """Renvoie la taille de page à utiliser pour la route et le datastore indiqués.
+
+        Args:
+            route_name (str): nom de la route de listing
+            datastore (Optional[str], optional): identifiant du datastore
+
+        Returns:
+            int: taille de page
+        """
+        if not self.__enabled:
+            return self.__start
+        with self.__lock:
+            return self.__sizes.get((route_name, datastore), self.__start)
+
+    def __set(self, route_name: str, datastore: Optional[str], size: int) -> int:
+        i_size = max(self.__min, min(self.__max, size))
+        with self.__lock:
+            self.__sizes[(route_name, datastore)] = i_size
+        return i_size
+
+    def record(self, route_name: str, datastore: Optional[str], size: int, nb_items: int, elapsed: float) -> int:
+        """Prend en compte le temps de récupération d'une page et renvoie la taille à utiliser ensuite.
+
+        Args:
+            route_name (str): nom de la route de listing
+            datastore (Optional[str]): identifiant du datastore
+            size (int): taille de la page demandée
+            nb_items (int): nombre d'éléments reçus
+            elapsed (float): durée de la requête (en secondes)
+
+        Returns:
+            int: nouvelle taille de page
+        """
+        if not self.__enabled:
+            return size
+        # On n'agrandit la page que si elle était pleine (sinon le listing est terminé) et rapide
+        if nb_items >= size and elapsed / max(nb_items, 1) <= self.__max_item_latency:
+            i_size = math.ceil(size * self.__growth_factor)
+            with self.__lock:
+                i_failed_size = self.__failed_sizes.get((route_name, datastore))
+            if i_failed_size is None or i_size < i_failed_size:
+                return self.__set(route_name, datastore, i_size)
+        return self.__set(route_name, datastore, size)
+
+    def back_off(self, route_name: str, datastore: Optional[str], size: int) -> int:
+        """Réduit la taille de page suite à un timeout ou une erreur serveur.
+
+        Args:
+            route_name (str): nom de la route de listing
+            datastore (Optional[str]): identifiant du datastore
+            size (int): taille de la page en échec
+
+        Returns:
+            int: nouvelle taille de page (égale à `size` si on ne peut pas réduire)
+        """
+        if not self.__enabled:
+            return size
+        with self.__lock:
+            self.__failed_sizes[(route_name, datastore)] = min(size, self.__failed_sizes.get((route_name, datastore), size))
+        return self.__set(route_name, datastore, int(size // self.__growth_factor))
+
+    @staticmethod
+    def is_overload(error: Exception) -> bool:
+        """Indique si l'erreur peut être due à une page trop grande (timeout ou erreur serveur).
+
+        Args:
+            error (Exception): erreur levée par la requête
+
+        Returns:
+            bool: True si réduire la taille de page peut aider
+        """
+        for o_error in (error, error.__cause__):
+            if isinstance(o_error, requests.Timeout) or (getattr(o_error, "status_code", None) or 0) >= 500:
+                return True
+        return False
+
+    def reset(self) -> None:
+        """Oublie les tailles mémorisées."""
+        with self.__lock:
+            self.__sizes = {}
+            self.__failed_sizes = {}
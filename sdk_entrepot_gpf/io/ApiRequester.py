@@ -4,19 +4,35 @@ import re
 import time
 import datetime
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BufferedReader
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, List, Union
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, List, Type, Union
 import requests
 from requests_toolbelt import MultipartEncoder
 
 from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.auth.Authentifier import Authentifier
 from sdk_entrepot_gpf.helper.JsonHelper import JsonHelper
+from sdk_entrepot_gpf.helper.SessionHelper import SessionHelper
 from sdk_entrepot_gpf.pattern.Singleton import Singleton
 from sdk_entrepot_gpf.io.JsonConverter import JsonConverter
-from sdk_entrepot_gpf.io.Errors import ApiError, ConflictError, RouteNotFoundError, InternalServerError, NotFoundError, NotAuthorizedError, BadRequestError, StatusCodeError
+from sdk_entrepot_gpf.io.Errors import (
+    AbstractRequestError,
+    ApiError,
+    ConflictError,
+    RouteNotFoundError,
+    InternalServerError,
+    NotFoundError,
+    NotAuthorizedError,
+    BadRequestError,
+    StatusCodeError,
+)
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.AdaptivePageSize import AdaptivePageSize
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy
+from sdk_entrepot_gpf.io.RateLimiter import RateLimiter
+from sdk_entrepot_gpf.io.ResponseCache import ResponseCache
 
 
 class ApiRequester(metaclass=Singleton):
@@ -30,16 +46,59 @@ class ApiRequester(metaclass=Singleton):
 
     regex_content_range = re.compile(Config().get_str("store_api", "regex_content_range"))
 
+    # Politique de nouvelles tentatives (peut être remplacée par une classe fille de RetryPolicy)
+    retry_policy_class: Type[RetryPolicy] = RetryPolicy
+
     def __init__(self) -> None:
         # Récupération du convertisseur Json
         self.__jsonConverter = JsonConverter()
-        self.__nb_attempts = Config().get_int("store_api", "nb_attempts")
-        self.__sec_between_attempt = Config().get_int("store_api", "sec_between_attempt")
         # Récupération des paramètres du proxy
         self.__proxy = {
             "http": Config().get_str("store_api", "http_proxy"),
             "https": Config().get_str("store_api", "https_proxy"),
         }
+        # Session partagée par toutes les requêtes (réutilisation des connexions TCP/TLS)
+        self.__session = SessionHelper.new_session("store_api")
+        # Limiteur de débit partagé par tous les threads
+        self.__rate_limiter = RateLimiter()
+        # Cache des réponses pour les requêtes conditionnelles (ETag/Last-Modified)
+        self.__response_cache = ResponseCache.from_config()
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Renvoie le limiteur de débit appliqué à toutes les requêtes.
+
+        Returns:
+            limiteur de débit
+        """
+        return self.__rate_limiter
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        """Renvoie le cache des réponses utilisé pour les requêtes GET conditionnelles.
+
+        Returns:
+            cache des réponses
+        """
+        return self.__response_cache
+
+    @response_cache.setter
+    def response_cache(self, response_cache: ResponseCache) -> None:
+        self.__response_cache = response_cache
+
+    @property
+    def session(self) -> requests.Session:
+        """Renvoie la session HTTP partagée par toutes les requêtes à l'API.
+
+        Returns:
+            session HTTP (avec pool de connexions)
+        """
+        return self.__session
+
+    def close(self) -> None:
+        """Ferme les connexions ouvertes par la session et en recrée une nouvelle."""
+        self.__session.close()
+        self.__session = SessionHelper.new_session("store_api")
 
     def route_request(
         self,
@@ -47,9 +106,10 @@ class ApiRequester(metaclass=Singleton):
         route_params: Optional[Dict[str, Any]] = None,
         method: str = "GET",
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any], bytes]] = None,
         files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
         timeout: Optional[int] = -1000,
+        header: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
         """Exécute une requête à l'API à partir du nom d'une route. La requête est retentée plusieurs fois s'il y a un problème.
 
@@ -58,9 +118,10 @@ class ApiRequester(metaclass=Singleton):
             route_params (Optional[Dict[str, Any]], optional): Paramètres obligatoires pour compléter la route.
             params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL.
             method (str, optional): méthode de la requête.
-            data (Optional[Dict[str, Any]], optional): Données de la requête.
+            data (Optional[Union[Dict[str, Any], List[Any], bytes]], optional): Données de la requête (envoyées brutes si `bytes`).
             files (Optional[Dict[str, Tuple[Any]]], optional): Liste des fichiers à envoyer {"file":('fichier.ext', File)}.
             timeout (Optional[int], optional): timeout en seconde ou None pour désactiver le timeout.
+            header (Optional[Dict[str, str]], optional): Header additionnel (complète celui de la configuration de la route).
 
         Raises:
             RouteNotFoundError: levée si la route demandée n'est pas définie dans les paramètres
@@ -92,8 +153,9 @@ class ApiRequester(metaclass=Singleton):
         if not route_params.get("datastore", None):
             Config().om.warning("Le datastore (entrepôt) à utiliser n'est pas défini. Consultez l'aide pour corriger ce problème.")
 
-        # On convertie les données Python en text puis en JSON
-        data = self.__jsonConverter.convert(data)
+        # On convertie les données Python en text puis en JSON (sauf données brutes)
+        if not isinstance(data, bytes):
+            data = self.__jsonConverter.convert(data)
 
         # On récupère la route
         s_route = Config().get("routing", route_name, fallback=None)
@@ -107,30 +169,37 @@ class ApiRequester(metaclass=Singleton):
         d_header = {}
         if s_header is not None:
             d_header = JsonHelper.loads(s_header, f"config.routing.{route_name}_header")
+        if header:
+            d_header = {**d_header, **header}
 
         # Exécution de la requête en boucle jusqu'au succès (ou erreur au bout d'un certains temps)
-        return self.url_request(s_url, method, params, data, files, d_header, timeout)
+        return self.url_request(s_url, method, params, data, files, d_header, timeout, route_name=route_name)
 
     def url_request(
         self,
         url: str,
         method: str = "GET",
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any], bytes]] = None,
         files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
         header: Dict[str, str] = {},
         timeout: Optional[int] = -1000,
+        route_name: Optional[str] = None,
     ) -> requests.Response:
         """Effectue une requête à l'API à partir d'une url. La requête est retentée plusieurs fois s'il y a un problème.
 
+        Les nouvelles tentatives suivent la politique `retry_policy_class` (délai exponentiel avec gigue,
+        plafond, durée totale maximale et prise en compte de l'en-tête `Retry-After`).
+
         Args:
             url (str): url absolue de la requête
             method (str, optional): méthode de la requête
             params (Optional[Dict[str, Any]], optional): paramètres de la requête (ajouté à l'url)
-            data (Optional[Union[Dict[str, Any], List[Any]]], optional): contenue de la requête (ajouté au corp)
+            data (Optional[Union[Dict[str, Any], List[Any], bytes]], optional): contenue de la requête (ajouté au corp, brut si `bytes`)
             files (Optional[Dict[str, Tuple[Any]]], optional): fichiers à envoyer
             header (Dict[str, str], optional): Header additionnel pour la requête
             timeout (Optional[int], optional): timeout en seconde ou None pour désactiver le timeout.
+            route_name (Optional[str], optional): nom de la route (pour appliquer sa politique de nouvelles tentatives)
 
         Returns:
             réponse si succès
@@ -141,12 +210,15 @@ class ApiRequester(metaclass=Singleton):
             s_timeout = Config().get("store_api", "timeout")
             timeout = None if not s_timeout or s_timeout == "null" else int(s_timeout)
 
+        # Politique de nouvelles tentatives
+        o_policy = self.retry_policy_class.from_config(route_name)
+        f_start = time.monotonic()
         i_nb_attempts = 0
         while True:
             i_nb_attempts += 1
             try:
                 # On fait la requête
-                return self.__url_request(url, method, params=params, data=data, files=files, header=header, timeout=timeout)
+                return self.__url_request(url, method, params=params, data=data, files=files, header=header, timeout=timeout, route_name=route_name)
 
             except (requests.HTTPError, requests.URLRequired) as e_error:
                 # S'il y a une erreur d'URL, on ne retente pas, on indique de contacter le support
@@ -171,8 +243,9 @@ class ApiRequester(metaclass=Singleton):
                 # Affiche la pile d'exécution
                 Config().om.debug(traceback.format_exc())
                 # Une erreur s'est produite : attend un peu et relance une nouvelle fois la fonction
-                if i_nb_attempts < self.__nb_attempts:
-                    time.sleep(self.__sec_between_attempt)
+                f_delay = o_policy.next_delay(i_nb_attempts)
+                if o_policy.can_retry(method, None, i_nb_attempts, time.monotonic() - f_start, f_delay):
+                    time.sleep(f_delay)
                 # Le nombre de tentatives est atteint : comme dirait Jim, this is the end...
                 else:
                     raise GpfSdkError(s_message) from e_connexion
@@ -181,12 +254,17 @@ class ApiRequester(metaclass=Singleton):
                 # Pour les autres erreurs, on retente selon les paramètres indiqués.
                 # On récupère la classe de l'erreur histoire que ce soit plus parlant...
                 s_title = e_error.__class__.__name__
-                Config().om.warning(f"L'exécution d'une requête a échoué (tentative {i_nb_attempts}/{self.__nb_attempts})... ({s_title})")
+                Config().om.warning(f"L'exécution d'une requête a échoué (tentative {i_nb_attempts}/{o_policy.nb_attempts})... ({s_title})")
                 # Affiche la pile d'exécution
                 Config().om.debug(traceback.format_exc())
+                # Code retour et délai éventuellement imposé par l'API (429, 503...)
+                i_status_code: Optional[int] = getattr(e_error, "status_code", None)
+                s_retry_after: Optional[str] = getattr(e_error, "retry_after", None)
                 # Une erreur s'est produite : attend un peu et relance une nouvelle fois la fonction
-                if i_nb_attempts < self.__nb_attempts:
-                    time.sleep(self.__sec_between_attempt)
+                f_delay = o_policy.next_delay(i_nb_attempts, s_retry_after)
+                if o_policy.can_retry(method, i_status_code, i_nb_attempts, time.monotonic() - f_start, f_delay):
+                    Config().om.debug(f"Nouvelle tentative dans {f_delay:.2f} s.")
+                    time.sleep(f_delay)
                 # Le nombre de tentatives est atteint : comme dirait Jim, this is the end...
                 else:
                     s_message = f"L'exécution d'une requête a échoué après {i_nb_attempts} tentatives."
@@ -197,10 +275,11 @@ class ApiRequester(metaclass=Singleton):
         url: str,
         method: str = "GET",
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any], bytes]] = None,
         files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
         header: Dict[str, str] = {},
         timeout: Optional[int] = None,
+        route_name: Optional[str] = None,
     ) -> requests.Response:
         """Effectue une requête à l'API à partir d'une url. Ne retente pas plusieurs fois si problème.
 
@@ -208,20 +287,35 @@ class ApiRequester(metaclass=Singleton):
             url (str): url absolue de la requête
             method (str, optional): méthode de la requête.
             params (Optional[Dict[str, Any]], optional): paramètres.
-            data (Optional[Union[Dict[str, Any], List[Any]]], optional): données.
+            data (Optional[Union[Dict[str, Any], List[Any], bytes]], optional): données (brutes si `bytes`).
             files (Optional[Dict[str, Tuple[Any]]], optional): fichiers.
             header (Dict[str, str], optional): Header additionnel pour la requête.
             timeout (Optional[int], optional): timeout en seconde ou None pour désactiver le timeout.
+            route_name (Optional[str], optional): nom de la route (pour appliquer sa limite de débit)
 
         Returns:
             réponse si succès
         """
-        Config().om.debug(f"__url_request(url={url}, method={method}, params={params}, data={data}, timeout={timeout}, timestamp={datetime.datetime.now()})")
+        # Respect de la limite de débit (globale et de la route)
+        f_wait = self.__rate_limiter.acquire(route_name)
+        if f_wait > 0:
+            Config().om.debug(f"__url_request : limite de débit atteinte, attente de {f_wait:.2f} s.")
+
+        # Les données brutes ne sont pas affichées (ni conservées dans les erreurs)
+        o_data = None if isinstance(data, bytes) else data
+        s_data = f"<{len(data)} octets>" if isinstance(data, bytes) else str(data)
+        Config().om.debug(f"__url_request(url={url}, method={method}, params={params}, data={s_data}, timeout={timeout}, timestamp={datetime.datetime.now()})")
 
         # Définition du header
         d_headers = Authentifier().get_http_header(json_content_type=files is None)
         d_headers.update(header)
 
+        # Requête conditionnelle si une réponse revalidable est en cache (sauf téléchargements de fichiers)
+        s_cache_key: Optional[str] = None
+        if method == ApiRequester.GET and not files and self.__response_cache.enabled and not str(route_name).endswith("_download"):
+            s_cache_key = ResponseCache.key(url, params)
+            d_headers.update(self.__response_cache.conditional_headers(s_cache_key))
+
         # Création du MultipartEncoder (cf. https://github.com/requests/toolbelt#multipartform-data-encoder)
         d_requests: Dict[str, Any] = {
             "url": url,
@@ -237,37 +331,71 @@ class ApiRequester(metaclass=Singleton):
             d_headers["content-type"] = o_me.content_type
             # Execution de la requête
             d_requests.update({"data": o_me})
+        elif isinstance(data, bytes):
+            # Données brutes (morceau de fichier par exemple)
+            d_headers["content-type"] = "application/octet-stream"
+            d_requests.update({"data": data})
         else:
             d_requests.update({"params": params, "json": data})
 
         # exécution de la requête
-        r = requests.request(**d_requests)
-        Config().om.debug(f"__url_request(url={url}, method={method}, params={params}, data={data}, timeout={timeout}, timestamp={datetime.datetime.now()}, status={r.status_code})")
+        r = self.__session.request(**d_requests)
+        Config().om.debug(f"__url_request(url={url}, method={method}, params={params}, data={s_data}, timeout={timeout}, timestamp={datetime.datetime.now()}, status={r.status_code})")
 
         # Vérification du résultat...
+        if r.status_code == 304 and s_cache_key is not None:
+            # Non modifié : on renvoie la réponse en cache
+            o_cached_response = self.__response_cache.response(s_cache_key, r)
+            if o_cached_response is not None:
+                return o_cached_response
         if r.status_code >= 200 and r.status_code < 300:
-            # Si c'est ok, on renvoie la réponse
+            # Si c'est ok, on conserve la réponse si elle est revalidable et on la renvoie
+            if s_cache_key is not None:
+                self.__response_cache.put(s_cache_key, r)
             return r
+        # Erreur : on lève l'exception correspondant au code retour
+        raise ApiRequester.__status_error(r, url, method, params, o_data)
+
+    @staticmethod
+    def __status_error(r: requests.Response, url: str, method: str, params: Optional[Dict[str, Any]], data: Optional[Union[Dict[str, Any], List[Any]]]) -> AbstractRequestError:
+        """Instancie l'erreur correspondant au code retour (non 2XX) d'une réponse de l'API.
+
+        Args:
+            r (requests.Response): réponse de l'API
+            url (str): url de la requête
+            method (str): méthode de la requête
+            params (Optional[Dict[str, Any]]): paramètres de la requête
+            data (Optional[Union[Dict[str, Any], List[Any]]]): données envoyées
+
+        Returns:
+            AbstractRequestError: erreur à lever
+        """
         # Erreur sans retour attendu/possible
+        e_error: AbstractRequestError
         if r.status_code == 500:
             # Erreur interne (pas de retour)
-            raise InternalServerError(url, method, params, data)
+            e_error = InternalServerError(url, method, params, data)
         # Erreurs avec retour attendu/possible
-        if r.status_code == 404:
+        elif r.status_code == 404:
             # Element non trouvé (pas de retour)
-            raise NotFoundError(url, method, params, data, r.text)
-        if r.status_code in (403, 401):
+            e_error = NotFoundError(url, method, params, data, r.text)
+        elif r.status_code in (403, 401):
             # Action non autorisée
             Authentifier().revoke_token()  # On révoque le token
-            raise NotAuthorizedError(url, method, params, data, r.text)
-        if r.status_code == 400:
+            e_error = NotAuthorizedError(url, method, params, data, r.text)
+        elif r.status_code == 400:
             # Requête incorrecte
-            raise BadRequestError(url, method, params, data, r.text)
-        if r.status_code == 409:
+            e_error = BadRequestError(url, method, params, data, r.text)
+        elif r.status_code == 409:
             # Conflit
-            raise ConflictError(url, method, params, data, r.text)
-        # Autre erreur
-        raise StatusCodeError(url, method, params, data, r.status_code, r.text)
+            e_error = ConflictError(url, method, params, data, r.text)
+        else:
+            # Autre erreur
+            e_error = StatusCodeError(url, method, params, data, r.status_code, r.text)
+        # On conserve le code retour et le délai éventuellement imposé par l'API pour les nouvelles tentatives
+        e_error.status_code = r.status_code
+        e_error.retry_after = r.headers.get("Retry-After")
+        return e_error
 
     def route_upload_file(
         self,
@@ -347,3 +475,176 @@ class ApiRequester(metaclass=Singleton):
             return False
         # Sinon, on compare la len indiquée par le serveur à celle de notre liste, si c'est égal ou supérieur on arrête
         return not length >= int(o_result.group("len"))
+
+    @staticmethod
+    def range_total(content_range: Optional[str]) -> Optional[int]:
+        """Fonction renvoyant le nombre total d'éléments indiqué par le `Content-Range` d'une réponse.
+
+        Args:
+            content_range (Optional[str]): Content-Range renvoyé par l'API
+
+        Returns:
+            nombre total d'éléments ou None si non renseigné ou non parsable
+        """
+        if content_range is None:
+            return None
+        o_result = ApiRequester.regex_content_range.search(content_range)
+        if o_result is None:
+            return None
+        return int(o_result.group("len"))
+
+    def route_request_pages(
+        self,
+        route_name: str,
+        route_params: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        nb_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """Exécute une requête de listing sur toutes les pages et renvoie la concaténation des éléments, dans l'ordre.
+
+        Par défaut les pages sont demandées les unes après les autres. Si `nb_workers` (par défaut
+        `store_api.nb_parallel_pages`) est supérieur à 1, le nombre total d'éléments est lu dans le
+        `Content-Range` de la première réponse et les pages restantes sont demandées en parallèle. Si la taille
+        de page est adaptative, la durée de chaque page est prise en compte pour les listings suivants et, en cas
+        de timeout ou d'erreur serveur, la taille est réduite et le listing est refait page par page.
+
+        Args:
+            route_name (str): Route de listing à utiliser
+            route_params (Optional[Dict[str, Any]], optional): Paramètres obligatoires pour compléter la route.
+            params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL (hors `page` et `limit`).
+            limit (Optional[int], optional): Nombre d'éléments par page (par défaut, cf. `AdaptivePageSize`).
+            nb_workers (Optional[int], optional): Nombre de pages demandées simultanément.
+
+        Returns:
+            liste des éléments renvoyés par l'API
+        """
+        i_workers = nb_workers if nb_workers is not None else Config().get_int("store_api", "nb_parallel_pages", 1)
+        if i_workers <= 1:
+            # Mode séquentiel (avec taille de page éventuellement adaptative)
+            l_items: List[Any] = []
+            for l_page in self.route_request_iter_pages(route_name, route_params=route_params, params=params, limit=limit):
+                l_items += l_page
+            return l_items
+
+        o_page_size = AdaptivePageSize()
+        s_datastore = (route_params or {}).get("datastore")
+        b_adaptive = limit is None and o_page_size.enabled
+        i_limit = limit if limit is not None else o_page_size.get(route_name, s_datastore)
+
+        def get_page(i_page: int) -> Tuple[List[Any], Optional[str]]:
+            f_start = time.monotonic()
+            o_response = self.route_request(route_name, route_params=route_params, params={**(params or {}), **{"page": i_page, "limit": i_limit}})
+            l_page = list(o_response.json())
+            if b_adaptive and len(l_page) >= i_limit:
+                # Toutes les pages d'un listing parallèle ont la même taille : la mesure des pages pleines sert aux listings suivants
+                o_page_size.record(route_name, s_datastore, i_limit, len(l_page), time.monotonic() - f_start)
+            return l_page, o_response.headers.get("Content-Range")
+
+        try:
+            return ApiRequester.__get_pages_parallel(get_page, i_limit, i_workers)
+        except (requests.Timeout, GpfSdkError) as e_error:
+            # La taille de page est peut-être trop grande : on la réduit et on refait le listing page par page
+            if not b_adaptive or not AdaptivePageSize.is_overload(e_error) or o_page_size.back_off(route_name, s_datastore, i_limit) >= i_limit:
+                raise
+            Config().om.debug(f"Listing {route_name} : échec avec des pages de {i_limit} éléments, reprise page par page avec une taille réduite.")
+        return [o_item for l_page in self.route_request_iter_pages(route_name, route_params=route_params, params=params) for o_item in l_page]
+
+    @staticmethod
+    def __get_pages_parallel(get_page: Callable[[int], Tuple[List[Any], Optional[str]]], limit: int, nb_workers: int) -> List[Any]:
+        """Récupère toutes les pages d'un listing en demandant en parallèle les pages suivant la première.
+
+        Args:
+            get_page (Callable[[int], Tuple[List[Any], Optional[str]]]): fonction renvoyant les éléments et le `Content-Range` d'une page
+            limit (int): nombre d'éléments par page
+            nb_workers (int): nombre de pages demandées simultanément
+
+        Returns:
+            liste des éléments renvoyés par l'API, dans l'ordre
+        """
+        # Première page : elle permet de connaître le nombre total d'éléments
+        l_items, s_content_range = get_page(1)
+        i_page = 2
+        b_next_page = ApiRequester.range_next_page(s_content_range, len(l_items))
+
+        if b_next_page:
+            # On calcule le nombre de pages restantes et on les récupère en parallèle (map conserve l'ordre)
+            i_nb_pages = -(-int(ApiRequester.range_total(s_content_range) or 0) // limit)
+            if i_nb_pages >= i_page:
+                with ThreadPoolExecutor(max_workers=min(nb_workers, i_nb_pages - 1)) as o_executor:
+                    for l_page, s_content_range in o_executor.map(get_page, range(i_page, i_nb_pages + 1)):
+                        l_items += l_page
+                i_page = i_nb_pages + 1
+                b_next_page = ApiRequester.range_next_page(s_content_range, len(l_items))
+
+        # Fin de listing si la liste a bougé pendant les requêtes parallèles
+        while b_next_page:
+            l_page, s_content_range = get_page(i_page)
+            l_items += l_page
+            b_next_page = bool(l_page) and ApiRequester.range_next_page(s_content_range, len(l_items))
+            i_page += 1
+        return l_items
+
+    def route_request_iter_pages(
+        self,
+        route_name: str,
+        route_params: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[List[Any]]:
+        """Exécute une requête de listing page par page et renvoie les éléments de chaque page au fur et à mesure.
+
+        Si `limit` n'est pas indiqué, la taille de page est donnée par `AdaptivePageSize` : elle peut
+        évoluer d'une page à l'autre. Elle n'est agrandie que si le nombre d'éléments déjà récupérés reste
+        un multiple de la nouvelle taille ; en cas de réduction, le listing reprend à partir du dernier élément
+        récupéré (la page demandée peut alors recouvrir des éléments déjà reçus, qui sont ignorés).
+
+        Args:
+            route_name (str): Route de listing à utiliser
+            route_params (Optional[Dict[str, Any]], optional): Paramètres obligatoires pour compléter la route.
+            params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL (hors `page` et `limit`).
+            limit (Optional[int], optional): Nombre d'éléments par page (adaptatif si non indiqué).
+            prefetch (bool, optional): si True, la page suivante est demandée pendant le traitement de la page courante.
+
+        Yields:
+            éléments de chaque page renvoyés par l'API
+        """
+        o_page_size = AdaptivePageSize()
+        s_datastore = (route_params or {}).get("datastore")
+        b_adaptive = limit is None and o_page_size.enabled
+        i_limit = limit if limit is not None else o_page_size.get(route_name, s_datastore)
+
+        def get_page(i_offset: int, i_limit: int) -> Tuple[List[Any], Optional[str], float]:
+            # Page contenant l'élément i_offset : on ignore les éléments précédents, déjà récupérés
+            f_start = time.monotonic()
+            o_response = self.route_request(route_name, route_params=route_params, params={**(params or {}), **{"page": i_offset // i_limit + 1, "limit": i_limit}})
+            return list(o_response.json())[i_offset % i_limit :], o_response.headers.get("Content-Range"), time.monotonic() - f_start
+
+        i_nb_items = 0
+        with ThreadPoolExecutor(max_workers=1) as o_executor:
+            o_future: Optional["Future[Tuple[List[Any], Optional[str], float]]"] = o_executor.submit(get_page, 0, i_limit)
+            while o_future is not None:
+                try:
+                    l_items, s_content_range, f_elapsed = o_future.result()
+                except (requests.Timeout, GpfSdkError) as e_error:
+                    # La page est peut-être trop grande : on réessaie avec une page plus petite à partir du dernier élément récupéré
+                    i_new_limit = o_page_size.back_off(route_name, s_datastore, i_limit) if b_adaptive and AdaptivePageSize.is_overload(e_error) else i_limit
+                    if i_new_limit >= i_limit:
+                        raise
+                    Config().om.debug(f"Listing {route_name} : réduction de la taille de page de {i_limit} à {i_new_limit}.")
+                    i_limit = i_new_limit
+                    o_future = o_executor.submit(get_page, i_nb_items, i_limit)
+                    continue
+                i_nb_items += len(l_items)
+                if b_adaptive:
+                    i_new_limit = o_page_size.record(route_name, s_datastore, i_limit, len(l_items), f_elapsed)
+                    if i_nb_items % i_new_limit == 0:
+                        i_limit = i_new_limit
+                o_future = None
+                b_next_page = ApiRequester.range_next_page(s_content_range, i_nb_items) and bool(l_items)
+                if b_next_page and prefetch:
+                    o_future = o_executor.submit(get_page, i_nb_items, i_limit)
+                yield l_items
+                if b_next_page and not prefetch:
+                    o_future = o_executor.submit(get_page, i_nb_items, i_limit)
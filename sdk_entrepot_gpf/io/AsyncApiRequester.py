@@ -0,0 +1,124 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from io import BufferedReader
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+import requests
+
+from sdk_entrepot_gpf.pattern.Singleton import Singleton
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
+
+R = TypeVar("R")
+
+
+class AsyncApiRequester(metaclass=Singleton):
+    """Classe singleton permettant d'attendre (`await`) les requêtes à l'API GPF depuis une boucle `asyncio`.
+
+    Les requêtes sont exécutées par `ApiRequester` dans un pool de threads : le routage, les tentatives
+    et la conversion des erreurs (cf. `io/Errors.py`) sont donc strictement les mêmes qu'en mode synchrone,
+    et la session HTTP (pool de connexions) est partagée.
+
+    Attributes:
+        __executor (ThreadPoolExecutor): pool de threads exécutant les requêtes (taille `store_api.async_max_workers`)
+    """
+
+    def __init__(self) -> None:
+        self.__executor = ThreadPoolExecutor(max_workers=Config().get_int("store_api", "async_max_workers"), thread_name_prefix="AsyncApiRequester")
+
+    async def run(self, function: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Exécute une fonction bloquante dans le pool de threads et attend son résultat sans bloquer la boucle.
+
+        Args:
+            function (Callable[..., R]): fonction à exécuter
+            *args (Any): arguments positionnels de la fonction
+            **kwargs (Any): arguments nommés de la fonction
+
+        Returns:
+            R: valeur retournée par la fonction (les exceptions levées sont propagées)
+        """
+        o_loop = asyncio.get_running_loop()
+        return await o_loop.run_in_executor(self.__executor, functools.partial(function, *args, **kwargs))
+
+    async def route_request(
+        self,
+        route_name: str,
+        route_params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any], bytes]] = None,
+        files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
+        timeout: Optional[int] = -1000,
+        header: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Version asynchrone de `ApiRequester.route_request`.
+
+        Args:
+            route_name (str): Route à utiliser
+            route_params (Optional[Dict[str, Any]], optional): Paramètres obligatoires pour compléter la route.
+            method (str, optional): méthode de la requête.
+            params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL.
+            data (Optional[Union[Dict[str, Any], List[Any], bytes]], optional): Données de la requête (envoyées brutes si `bytes`).
+            files (Optional[Dict[str, Tuple[Any]]], optional): Liste des fichiers à envoyer {"file":('fichier.ext', File)}.
+            timeout (Optional[int], optional): timeout en seconde ou None pour désactiver le timeout.
+            header (Optional[Dict[str, str]], optional): Header additionnel (complète celui de la configuration de la route).
+
+        Returns:
+            réponse vérifiée
+        """
+        return await self.run(ApiRequester().route_request, route_name, route_params, method, params, data, files, timeout, header)
+
+    async def url_request(
+        self,
+        url: str,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None,
+        header: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = -1000,
+    ) -> requests.Response:
+        """Version asynchrone de `ApiRequester.url_request`.
+
+        Args:
+            url (str): url absolue de la requête
+            method (str, optional): méthode de la requête
+            params (Optional[Dict[str, Any]], optional): paramètres de la requête (ajouté à l'url)
+            data (Optional[Union[Dict[str, Any], List[Any]]], optional): contenue de la requête (ajouté au corp)
+            files (Optional[Dict[str, Tuple[Any]]], optional): fichiers à envoyer
+            header (Optional[Dict[str, str]], optional): Header additionnel pour la requête
+            timeout (Optional[int], optional): timeout en seconde ou None pour désactiver le timeout.
+
+        Returns:
+            réponse si succès
+        """
+        return await self.run(ApiRequester().url_request, url, method, params, data, files, header if header is not None else {}, timeout)
+
+    async def route_upload_file(
+        self,
+        route_name: str,
+        file_path: Path,
+        file_key: str,
+        route_params: Optional[Dict[str, Any]] = None,
+        method: str = "POST",
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        timeout: Optional[int] = -1000,
+    ) -> requests.Response:
+        """Version asynchrone de `ApiRequester.route_upload_file`.
+
+        Args:
+            route_name (str): Route à utiliser
+            file_path (Path): Chemin du fichier à uploader
+            file_key (str): nom de la clef dans le dictionnaire
+            route_params (Optional[Dict[str, Any]], optional): Paramètres obligatoires pour compléter la route.
+            method (str, optional): méthode de la requête.
+            params (Optional[Dict[str, Any]], optional): Paramètres optionnels de l'URL.
+            data (Optional[Dict[str, Any]], optional): Données de la requête.
+            timeout (Optional[int], optional): timeout en seconde ou None pour désactiver le timeout.
+
+        Returns:
+            réponse vérifiée
+        """
+        return await self.run(ApiRequester().route_upload_file, route_name, file_path, file_key, route_params, method, params, data, timeout)
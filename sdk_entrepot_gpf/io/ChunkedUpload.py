@@ -0,0 +1,202 @@
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy
+
+
+class ChunkedUpload:
+    """Téléversement d'un fichier par morceaux avec reprise sur interruption.
+
+    Chaque morceau (`upload.chunk_size` octets) est envoyé dans une requête `PUT` sur la route indiquée avec
+    un en-tête `Content-Range: bytes début-fin/taille`. Si la réponse contient un en-tête `Range: bytes=0-fin`,
+    il indique ce que le serveur a effectivement reçu ; sinon le morceau est considéré comme acquitté.
+
+    Chaque morceau est tenté jusqu'à `upload.chunk_nb_attempts` fois (délai selon la politique de nouvelles
+    tentatives de la route). C'est le seul niveau de nouvelles tentatives : la route ne doit pas être rejouée
+    par `ApiRequester` (cf. `upload_push_data_chunk_retry_methods`, vide par défaut). La position acquittée
+    est consignée dans un journal local (`upload.chunk_journal_dir`, par défaut dans le dossier temporaire) :
+    un téléversement interrompu reprend au dernier morceau acquitté au lieu de repartir de zéro, à condition
+    que la taille du fichier partiel sur le serveur corresponde au journal (cf. `resume_offset`).
+
+    Attributes:
+        chunk_size (int): taille des morceaux en octets (0 pour désactiver le découpage)
+        journal_dir (Path): dossier du journal local
+        nb_attempts (int): nombre de tentatives par morceau
+    """
+
+    regex_range = re.compile(r"bytes=\d+-(?P<end>\d+)")
+
+    def __init__(self, chunk_size: int, journal_dir: Path, nb_attempts: int = 3) -> None:
+        self.chunk_size = chunk_size
+        self.journal_dir = journal_dir
+        self.nb_attempts = nb_attempts
+
+    @classmethod
+    def from_config(cls) -> "ChunkedUpload":
+        """Instancie le téléverseur selon la configuration (section `upload`).
+
+        Returns:
+            ChunkedUpload: téléverseur paramétré
+        """
+        s_journal_dir = Config().get("upload", "chunk_journal_dir")
+        return cls(
+            chunk_size=Config().get_int("upload", "chunk_size", 0),
+            journal_dir=Path(s_journal_dir) if s_journal_dir else Config().get_temp() / "upload_journal",
+            nb_attempts=Config().get_int("upload", "chunk_nb_attempts", 3),
+        )
+
+    def is_chunked(self, file_path: Path) -> bool:
+        """Indique si le fichier doit être envoyé par morceaux (découpage actif et fichier plus gros qu'un morceau).
+
+        Args:
+            file_path (Path): fichier à envoyer
+
+        Returns:
+            bool: True si le fichier doit être découpé
+        """
+        return self.chunk_size > 0 and file_path.stat().st_size > self.chunk_size
+
+    def journal_file(self, route_name: str, file_path: Path, route_params: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Path:
+        """Renvoie le chemin du journal d'un téléversement (dépend de la destination et de la version du fichier).
+
+        Args:
+            route_name (str): route de téléversement
+            file_path (Path): fichier à envoyer
+            route_params (Optional[Dict[str, Any]], optional): paramètres de la route
+            params (Optional[Dict[str, Any]], optional): paramètres de la requête
+
+        Returns:
+            Path: chemin du fichier journal
+        """
+        o_stat = file_path.stat()
+        s_key = json.dumps([route_name, route_params, params, str(file_path.resolve()), o_stat.st_size, o_stat.st_mtime_ns], sort_keys=True, default=str)
+        return self.journal_dir / f"{hashlib.sha256(s_key.encode('utf-8')).hexdigest()}.json"
+
+    def acknowledged(self, route_name: str, file_path: Path, route_params: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> int:
+        """Renvoie le nombre d'octets déjà acquittés par le serveur d'après le journal.
+
+        Args:
+            route_name (str): route de téléversement
+            file_path (Path): fichier à envoyer
+            route_params (Optional[Dict[str, Any]], optional): paramètres de la route
+            params (Optional[Dict[str, Any]], optional): paramètres de la requête
+
+        Returns:
+            int: nombre d'octets acquittés (0 si pas de journal)
+        """
+        p_journal = self.journal_file(route_name, file_path, route_params, params)
+        if not p_journal.exists():
+            return 0
+        try:
+            return int(json.loads(p_journal.read_text(encoding="utf-8"))["offset"])
+        except (OSError, ValueError, KeyError):
+            # Journal illisible : on repart de zéro
+            return 0
+
+    def resume_offset(self, route_name: str, file_path: Path, remote_size: int, route_params: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> int:
+        """Renvoie la position de reprise d'un téléversement après vérification de la taille reçue par le serveur.
+
+        Si la taille du fichier partiel sur le serveur diffère de la position consignée dans le journal,
+        le journal est supprimé et le téléversement repartira de zéro.
+
+        Args:
+            route_name (str): route de téléversement
+            file_path (Path): fichier à envoyer
+            remote_size (int): taille du fichier partiel sur le serveur (0 s'il est absent)
+            route_params (Optional[Dict[str, Any]], optional): paramètres de la route
+            params (Optional[Dict[str, Any]], optional): paramètres de la requête
+
+        Returns:
+            int: position de reprise (0 si le téléversement doit repartir de zéro)
+        """
+        i_offset = self.acknowledged(route_name, file_path, route_params, params)
+        if i_offset and i_offset != remote_size:
+            Config().om.warning(f"Téléversement de {file_path.name} : le serveur a reçu {remote_size} octets au lieu de {i_offset}, reprise à zéro.")
+            self.journal_file(route_name, file_path, route_params, params).unlink()
+            return 0
+        return i_offset
+
+    def upload(self, route_name: str, file_path: Path, route_params: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None, method: str = ApiRequester.PUT) -> None:
+        """Téléverse le fichier par morceaux en reprenant au dernier morceau acquitté.
+
+        Args:
+            route_name (str): route de téléversement
+            file_path (Path): fichier à envoyer
+            route_params (Optional[Dict[str, Any]], optional): paramètres de la route
+            params (Optional[Dict[str, Any]], optional): paramètres de la requête
+            method (str, optional): méthode des requêtes
+
+        Raises:
+            GpfSdkError: levée si un morceau n'a pas pu être envoyé après toutes les tentatives
+        """
+        i_size = file_path.stat().st_size
+        p_journal = self.journal_file(route_name, file_path, route_params, params)
+        i_offset = self.acknowledged(route_name, file_path, route_params, params)
+        if i_offset:
+            Config().om.info(f"Reprise du téléversement de {file_path.name} à {i_offset}/{i_size} octets.")
+        p_journal.parent.mkdir(parents=True, exist_ok=True)
+        o_policy = RetryPolicy.from_config(route_name)
+        with file_path.open("rb") as o_file:
+            while i_offset < i_size:
+                o_file.seek(i_offset)
+                o_chunk = o_file.read(self.chunk_size)
+                i_new_offset = self.__send_chunk(route_name, o_chunk, i_offset, i_size, route_params, params, method, o_policy)
+                if i_new_offset <= i_offset:
+                    raise GpfSdkError(f"Téléversement de {file_path.name} : le serveur n'a acquitté aucun octet à partir de {i_offset}.")
+                i_offset = i_new_offset
+                # Le morceau est acquitté : on le consigne dans le journal
+                p_journal.write_text(json.dumps({"file": str(file_path), "size": i_size, "offset": i_offset}), encoding="utf-8")
+                Config().om.debug(f"Téléversement de {file_path.name} : {i_offset}/{i_size} octets.")
+        # Téléversement terminé : le journal n'est plus utile
+        p_journal.unlink()
+
+    def __send_chunk(
+        self,
+        route_name: str,
+        chunk: bytes,
+        offset: int,
+        size: int,
+        route_params: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        method: str,
+        policy: RetryPolicy,
+    ) -> int:
+        """Envoie un morceau (avec nouvelles tentatives) et renvoie la nouvelle position acquittée.
+
+        Args:
+            route_name (str): route de téléversement
+            chunk (bytes): contenu du morceau
+            offset (int): position du début du morceau
+            size (int): taille totale du fichier
+            route_params (Optional[Dict[str, Any]]): paramètres de la route
+            params (Optional[Dict[str, Any]]): paramètres de la requête
+            method (str): méthode de la requête
+            policy (RetryPolicy): politique de délai entre les tentatives
+
+        Returns:
+            int: position acquittée par le serveur
+        """
+        d_header = {"Content-Range": f"bytes {offset}-{offset + len(chunk) - 1}/{size}"}
+        for i_attempt in range(1, self.nb_attempts + 1):
+            try:
+                o_response = ApiRequester().route_request(route_name, route_params=dict(route_params or {}), method=method, params=params, data=chunk, header=d_header)
+            except (requests.Timeout, GpfSdkError) as e_error:
+                if i_attempt >= self.nb_attempts:
+                    raise GpfSdkError(f"Échec de l'envoi du morceau {d_header['Content-Range']} après {i_attempt} tentatives.") from e_error
+                f_delay = policy.next_delay(i_attempt)
+                Config().om.warning(f"Échec de l'envoi du morceau {d_header['Content-Range']} (tentative {i_attempt}/{self.nb_attempts}), nouvelle tentative dans {f_delay:.2f} s.")
+                time.sleep(f_delay)
+                continue
+            # Le serveur peut indiquer ce qu'il a effectivement reçu
+            o_match = ChunkedUpload.regex_range.search(o_response.headers.get("Range", ""))
+            return int(o_match.group("end")) + 1 if o_match else offset + len(chunk)
+        return offset
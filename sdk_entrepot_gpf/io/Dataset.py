@@ -1,8 +1,16 @@
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Pattern
+from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.helper.FileHelper import FileHelper
 
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.FileBundler import FileBundler
 
 
 class Dataset:
@@ -16,14 +24,21 @@ class Dataset:
         __data_files (List[Path]): Liste des fichiers de données à importer sur l'entrepôt.
         __md5_files (List[Path]): Liste des fichiers md5 à importer sur l'entrepôt.
         __root_dir (Path): Chemin racine du dataset (absolu ou relatif ?)
+        __md5_generated (bool): Indique si les fichiers md5 manquants ont été générés
+        __bundler (FileBundler): Regroupement des petits fichiers dans des archives
+        __bundled (bool): Indique si les petits fichiers ont été regroupés
+        __include (Optional[Pattern[str]]): Motifs des fichiers à livrer (tous si None)
+        __exclude (Optional[Pattern[str]]): Motifs des fichiers à ne pas livrer (aucun si None)
     """
 
-    def __init__(self, dataset: Dict[Any, Any], p_root_dir: Path) -> None:
+    def __init__(self, dataset: Dict[Any, Any], p_root_dir: Path, generate_md5: Optional[bool] = None) -> None:
         """Constructeur
 
         Args:
             dataset (Dict[Any, Any]): dataset tel que dans le fichier descriptif de livraison
             p_root_dir (Path): Chemin racine à partir duquel sont définis les data_dirs
+            generate_md5 (Optional[bool], optional): génère les fichiers md5 dès la construction (par défaut, sauf si `upload.md5_while_uploading`
+                ou si les petits fichiers sont regroupés). Sinon ils sont générés lors de l'appel à `generate_md5_files`.
         """
         # Définition des attributs
         self.__data_dirs: List[Path] = [Path(i) for i in dataset["data_dirs"]]  # Chemins relatifs
@@ -33,11 +48,30 @@ class Dataset:
         self.__data_files: Dict[Path, str] = {}
         self.__md5_files: List[Path] = []
         self.__root_dir: Path = p_root_dir
+        self.__md5_generated = False
+        self.__include = Dataset.__compile_globs(dataset.get("include", []))
+        self.__exclude = Dataset.__compile_globs(dataset.get("exclude", []))
+        # Les fichiers md5 d'un dataset filtré sont propres à ses filtres (plusieurs datasets peuvent filtrer différemment un même dossier)
+        s_md5_suffix = ".md5"
+        if self.__include is not None or self.__exclude is not None:
+            s_filters = json.dumps([dataset.get("include", []), dataset.get("exclude", [])])
+            s_md5_suffix = f".{hashlib.sha256(s_filters.encode('utf-8')).hexdigest()[:8]}.md5"
+        # Archives de regroupement propres au dataset (dossiers, filtres et livraison)
+        s_bundle_key = json.dumps([dataset["data_dirs"], dataset.get("include", []), dataset.get("exclude", []), self.__upload_infos], sort_keys=True, default=str)
+        self.__bundler = FileBundler.from_config(p_root_dir, s_bundle_key)
+        self.__bundled = False
 
         # Listing des fichiers de donnée à envoyer
         self.__list_data_files()
-        # Génération des fichier md5 si nécessaire et listing
-        self.__generate_md5_files()
+        # Listing des fichiers md5 (un par dossier de données)
+        if self.__bundler.enabled:
+            # Les fichiers md5 décrivent les archives de regroupement (créées juste avant le téléversement), ils sont à côté d'elles
+            self.__md5_files = [(self.__bundler.directory / p_dir).with_suffix(".md5") for p_dir in self.__data_dirs]
+        else:
+            self.__md5_files = [(self.__root_dir.absolute() / p_dir).with_suffix(s_md5_suffix) for p_dir in self.__data_dirs]
+        # Génération des fichier md5 si nécessaire
+        if generate_md5 if generate_md5 is not None else not (Config().get_bool("upload", "md5_while_uploading", False) or self.__bundler.enabled):
+            self.generate_md5_files()
 
     def __list_data_files(self) -> None:
         """Liste tous les fichiers de données à importer sur l'entrepôt API.
@@ -46,41 +80,166 @@ class Dataset:
         """
         p_abs_root_dir = self.__root_dir.absolute()
         for p_dir in self.__data_dirs:
-            self.__list_rec(p_abs_root_dir, p_dir)
+            self.__list_dir(p_abs_root_dir, p_dir)
 
-    def __generate_md5_files(self) -> None:
+    @staticmethod
+    def __compile_globs(globs: List[str]) -> Optional[Pattern[str]]:
+        """Compile une liste de motifs (syntaxe `fnmatch`) en une seule expression régulière.
+
+        Args:
+            globs (List[str]): motifs
+
+        Returns:
+            Optional[Pattern[str]]: expression régulière (None si aucun motif)
+        """
+        if not globs:
+            return None
+        return re.compile("|".join(f"(?:{fnmatch.translate(s_glob)})" for s_glob in globs))
+
+    def __is_selected(self, file_path: str) -> bool:
+        """Indique si un fichier est à livrer selon les motifs `include` et `exclude` du dataset.
+
+        Args:
+            file_path (str): chemin du fichier relatif au dossier racine (séparateur `/`)
+
+        Returns:
+            bool: True si le fichier est à livrer
+        """
+        if self.__include is not None and not self.__include.match(file_path):
+            return False
+        return self.__exclude is None or not self.__exclude.match(file_path)
+
+    def bundle_files(self) -> None:
+        """Regroupe les petits fichiers de données dans des archives si `upload.bundle_max_file_size` est défini (cf. `FileBundler`).
+
+        Sans effet si c'est déjà fait. Les fichiers md5 décrivant les archives ne sont supprimés (pour être
+        régénérés) que si les fichiers à livrer de leur dossier ont changé (manifeste `.md5.json` à côté).
+        """
+        if self.__bundled or not self.__bundler.enabled:
+            return
+        self.__data_files = self.__bundler.bundle(self.__data_files)
+        self.__check_md5_manifests()
+        self.__bundled = True
+
+    def __check_md5_manifests(self) -> None:
+        """Supprime (pour qu'ils soient régénérés) les fichiers md5 dont les fichiers à livrer ont changé.
+
+        La liste des fichiers décrits par chaque fichier md5 (chemin, taille et date de modification) est
+        conservée dans un manifeste `.md5.json` à côté de lui.
+        """
+        for p_dir, p_md5_file in zip(self.__data_dirs, self.__md5_files):
+            l_manifest = [[self.__api_file_path(p_file), o_stat.st_size, o_stat.st_mtime_ns] for p_file in self.__dir_files(p_dir) for o_stat in [p_file.stat()]]
+            p_manifest = p_md5_file.with_suffix(".md5.json")
+            if FileBundler.read_manifest(p_manifest) != l_manifest:
+                p_md5_file.unlink(missing_ok=True)
+                p_manifest.parent.mkdir(parents=True, exist_ok=True)
+                p_manifest.write_text(json.dumps(l_manifest), encoding="utf-8")
+
+    def __dir_files(self, data_dir: Path) -> List[Path]:
+        """Liste les fichiers à livrer d'un dossier de données, dans l'ordre de leur chemin sur l'entrepôt.
+
+        Args:
+            data_dir (Path): dossier de données (relatif au dossier racine)
+
+        Returns:
+            List[Path]: fichiers à livrer du dossier et de ses sous-dossiers
+        """
+        s_dir = data_dir.as_posix()
+        l_dir_files = [p_file for p_file, s_api_path in self.__data_files.items() if s_api_path == s_dir or s_api_path.startswith(f"{s_dir}/")]
+        return sorted(l_dir_files, key=self.__api_file_path)
+
+    def generate_md5_files(self, cancel: Optional[threading.Event] = None) -> None:
         """Génère les fichiers de clés md5 à importer sur l'entrepôt API.
         Pour chaque dossier de donnée, cherche un fichier .md5 correspondant,
         s'il n'existe pas il est créé et rempli en parcourant les fichiers enfants du dossier.
-        S'il existe, rien n'est fait.
+        S'il existe, rien n'est fait (sauf si les fichiers qu'il décrit ont changé, pour un dataset filtré ou regroupé).
+        Les fichiers md5 d'un dataset filtré (`include`, `exclude`) sont nommés selon les filtres : `<dossier>.<clef>.md5`.
+
+        Les clefs sont calculées dans `upload.md5_nb_workers` processus par blocs de `upload.md5_buffer_size` octets.
+        Sans effet si les fichiers ont déjà été générés.
+
+        Args:
+            cancel (Optional[threading.Event], optional): annulation du calcul (vérifiée après chaque fichier,
+                les clefs déjà calculées restent dans le cache md5). Defaults to None.
+
+        Raises:
+            GpfSdkError: levée si le calcul a été annulé
         """
-        p_abs_root_dir = self.__root_dir.absolute()
+        if self.__md5_generated:
+            return
+        # Les fichiers md5 décrivent les archives de regroupement éventuelles
+        self.bundle_files()
+        if (self.__include is not None or self.__exclude is not None) and not self.__bundled:
+            # Fichiers md5 d'un dataset filtré : régénérés si la sélection a changé
+            self.__check_md5_manifests()
         s_pattern = Config().get("upload", "md5_pattern")
 
-        # On parcourt le dictionnaire des répertoires
-        for p_dir in self.__data_dirs:
-            p_md5_dir = Path(p_abs_root_dir / p_dir)
-            p_md5_dir_suf = p_md5_dir.with_suffix(".md5")
-
+        # On parcourt le dictionnaire des répertoires pour lister les fichiers à traiter
+        # la liste des fichiers est ordonnée selon le chemin du ficher
+        d_md5_dirs: Dict[Path, List[Path]] = {}
+        for p_dir, p_md5_file in zip(self.__data_dirs, self.__md5_files):
             # On teste si le fichier md5 existe, sinon on le crée
-            if not p_md5_dir_suf.exists():
-                Config().om.info(f"Le fichier md5 {p_md5_dir_suf.relative_to(self.__root_dir)} n'existe pas, il va être créé")
+            if not p_md5_file.exists():
+                Config().om.info(f"Le fichier md5 {p_md5_file} n'existe pas, il va être créé")
+                d_md5_dirs[p_md5_file] = self.__dir_files(p_dir)
 
-                # On parcourt les fichiers pour remplir un dictionnaire temporaire
-                # la liste des fichiers est ordonnée selon le chemin complet du ficher
-                d_md5 = {}
-                for p_file in sorted(self.__data_files, key=str):
-                    if p_md5_dir in p_file.parents:
-                        p_file_trunc = p_file.relative_to(self.__root_dir)
-                        d_md5[p_file_trunc] = FileHelper.md5_hash(p_file)
+        # Calcul des clefs de tous les fichiers en une fois (répartition sur les processus)
+        l_files = list(dict.fromkeys(p_file for l_dir_files in d_md5_dirs.values() for p_file in l_dir_files))
+        i_nb_workers = Config().get_int("upload", "md5_nb_workers", 1) or os.cpu_count() or 1
+        i_buffer_size = Config().get_int("upload", "md5_buffer_size", FileHelper.MD5_BUFFER_SIZE)
+        d_md5 = FileHelper.md5_hash_files(l_files, i_nb_workers, i_buffer_size, Dataset.__md5_progress(l_files, cancel))
 
-                # A la fin on rempli le fichier .md5
-                with open(p_md5_dir_suf, "w", encoding="utf-8") as o_md5_file:
-                    for p_file, s_md5 in d_md5.items():
-                        o_md5_file.write(f"{s_pattern}\n".format(md5_key=s_md5, file_path=p_file.as_posix()))
+        # A la fin on rempli les fichiers .md5 (écriture dans un fichier temporaire : pas de fichier md5 incomplet si interruption)
+        for p_md5_file, l_dir_files in d_md5_dirs.items():
+            # fichier temporaire propre au thread (livraisons simultanées d'un même dossier)
+            p_tmp = p_md5_file.with_suffix(f".md5.{threading.get_ident()}.tmp")
+            with open(p_tmp, "w", encoding="utf-8") as o_md5_file:
+                for p_file in l_dir_files:
+                    o_md5_file.write(f"{s_pattern}\n".format(md5_key=d_md5[p_file], file_path=self.__api_file_path(p_file)))
+            p_tmp.replace(p_md5_file)
+        self.__md5_generated = True
+
+    def __api_file_path(self, file_path: Path) -> str:
+        """Renvoie le chemin d'un fichier à livrer tel qu'il sera sur l'entrepôt (relatif au dossier racine).
+
+        Args:
+            file_path (Path): fichier à livrer
+
+        Returns:
+            str: chemin du fichier sur l'entrepôt
+        """
+        return f"{self.__data_files[file_path]}/{file_path.name}"
 
-            # Enfin, on l'ajoute à la liste des fichiers md5
-            self.__md5_files.append(p_md5_dir_suf)
+    @staticmethod
+    def __md5_progress(files: List[Path], cancel: Optional[threading.Event] = None) -> Callable[[Path, str], None]:
+        """Renvoie la fonction de suivi du calcul des clefs md5 (un message tous les 10 % du volume traité).
+
+        Args:
+            files (List[Path]): fichiers à traiter
+            cancel (Optional[threading.Event], optional): annulation du calcul. Defaults to None.
+
+        Returns:
+            Callable[[Path, str], None]: fonction appelée après le traitement de chaque fichier
+        """
+        i_total_size = sum(p_file.stat().st_size for p_file in files)
+        d_progress = {"nb": 0, "size": 0, "step": 0}
+
+        def progress(p_file: Path, md5_key: str) -> None:  # pylint:disable=unused-argument
+            if cancel is not None and cancel.is_set():
+                raise GpfSdkError("Calcul des clefs md5 annulé.")
+            d_progress["nb"] += 1
+            d_progress["size"] += p_file.stat().st_size
+            i_step = 10 * d_progress["size"] // i_total_size if i_total_size else 10
+            if i_step > d_progress["step"] or d_progress["nb"] == len(files):
+                d_progress["step"] = i_step
+                s_size = f"{FileHelper.format_size(d_progress['size'])}/{FileHelper.format_size(i_total_size)}"
+                Config().om.info(f"Calcul des clefs md5 : {d_progress['nb']}/{len(files)} fichiers, {s_size} ({10 * i_step} %)")
+
+        return progress
+
+    @property
+    def md5_generated(self) -> bool:
+        return self.__md5_generated
 
     @property
     def data_dirs(self) -> List[Path]:
@@ -106,25 +265,30 @@ class Dataset:
     def md5_files(self) -> List[Path]:
         return self.__md5_files
 
-    def __list_rec(self, root_dir: Path, path_rep: Path) -> None:
-        """Fonction récursive permettant de lister des fichiers
+    def __list_dir(self, root_dir: Path, path_rep: Path) -> None:
+        """Liste les fichiers d'un dossier et de ses sous-dossiers.
+
+        Parcours itératif (pas de limite de profondeur) avec `os.scandir` : le type des entrées est fourni
+        par le système lors du listing, sans appel `stat` supplémentaire par fichier.
 
         Args:
             root_dir (Path): Chemin absolu du dossier racine
             path_rep (Path): Chemin du dossier à lister
         """
-
-        p_rep = root_dir / path_rep
-        l_elt = p_rep.iterdir()
-
-        for p_elt in l_elt:
-            p_rep_elt = path_rep / p_elt
-            # Appel récursif si l'élément est un dossier
-            if p_elt.is_dir():
-                self.__list_rec(p_rep, Path(p_elt.name))
-            # L'élément est un fichier
-            elif p_elt.is_file():
-                # Création du chemin relatif pour l'API
-                p_api = p_rep_elt.relative_to(self.__root_dir)
-                # Remplissage du dictionnaire __data_files
-                self.__data_files[p_rep_elt] = p_api.parent.as_posix()
+        s_root_dir = str(root_dir)
+        l_stack = [os.path.join(s_root_dir, path_rep)]
+        while l_stack:
+            s_dir = l_stack.pop()
+            # Chemin relatif pour l'API (commun à tous les fichiers du dossier)
+            s_api_path = Path(os.path.relpath(s_dir, s_root_dir)).as_posix()
+            l_sub_dirs = []
+            with os.scandir(s_dir) as o_entries:
+                for o_entry in o_entries:
+                    # L'élément est un dossier : il sera listé ensuite
+                    if o_entry.is_dir():
+                        l_sub_dirs.append(o_entry.path)
+                    # L'élément est un fichier : remplissage du dictionnaire __data_files
+                    elif o_entry.is_file() and self.__is_selected(f"{s_api_path}/{o_entry.name}"):
+                        self.__data_files[Path(o_entry.path)] = s_api_path
+            # On empile à l'envers pour lister les sous-dossiers dans l'ordre
+            l_stack.extend(reversed(l_sub_dirs))
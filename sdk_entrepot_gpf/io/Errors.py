@@ -66,6 +66,9 @@ class AbstractRequestError(ApiError):
         self.method = method
         self.params = params
         self.data = json.dumps(data)
+        # Code retour et en-tête Retry-After de la réponse (renseignés par ApiRequester)
+        self.status_code: Optional[int] = None
+        self.retry_after: Optional[str] = None
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class FileBundler:
+    """Regroupement des petits fichiers d'une livraison dans des archives ZIP.
+
+    Les fichiers de moins de `upload.bundle_max_file_size` octets d'un même dossier distant sont regroupés
+    (par ordre de chemin) dans des archives `_bundle_00001.zip`, `_bundle_00002.zip`... d'au plus
+    `upload.bundle_size` octets, déposées dans ce même dossier distant. Les archives sont écrites dans
+    `upload.bundle_dir` : leur taille et leur clef md5 doivent être connues avant l'envoi (reprise de
+    livraison, fichier md5).
+
+    Les archives sont reproductibles (ordre et dates des fichiers fixes) et ne sont reconstruites que si
+    les fichiers qu'elles contiennent ont changé (manifeste `.json` à côté de chaque archive) : une livraison
+    relancée retrouve les mêmes archives.
+
+    Attributes:
+        max_file_size (int): taille (en octets) en dessous de laquelle un fichier est regroupé (0 : désactivé)
+        bundle_size (int): taille maximale (en octets) du contenu d'une archive
+        compress (bool): compression des archives (sinon les fichiers sont simplement stockés)
+        directory (Path): dossier local des archives
+    """
+
+    BUNDLE_NAME = "_bundle_{num:05d}.zip"
+    # Le format ZIP ne gère pas les dates antérieures au 01/01/1980
+    ZIP_MIN_TIMESTAMP = 315532800
+
+    def __init__(self, max_file_size: int, bundle_size: int, compress: bool, directory: Path) -> None:
+        self.max_file_size = max_file_size
+        self.bundle_size = bundle_size
+        self.compress = compress
+        self.directory = directory
+
+    @classmethod
+    def from_config(cls, root_dir: Path, key: str = "") -> "FileBundler":
+        """Instancie le regroupement selon la configuration (section `upload`).
+
+        Args:
+            root_dir (Path): dossier racine du dataset
+            key (str, optional): clef du dataset (dossiers, filtres, livraison) : les archives de chaque dataset sont dans un dossier distinct,
+                même si plusieurs datasets partagent le même dossier racine
+
+        Returns:
+            FileBundler: regroupement paramétré
+        """
+        s_directory = Config().get("upload", "bundle_dir")
+        p_directory = Path(s_directory) if s_directory else Config().get_temp() / "upload_bundles"
+        s_root_key = hashlib.sha256(f"{root_dir.absolute()}\n{key}".encode("utf-8")).hexdigest()[:16]
+        return cls(
+            max_file_size=Config().get_int("upload", "bundle_max_file_size", 0),
+            bundle_size=Config().get_int("upload", "bundle_size", 100 * 1024 * 1024),
+            compress=Config().get_bool("upload", "bundle_compress", False),
+            directory=p_directory / s_root_key,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Indique si les petits fichiers sont regroupés."""
+        return self.max_file_size > 0
+
+    def bundle(self, data_files: Dict[Path, str]) -> Dict[Path, str]:
+        """Regroupe les petits fichiers et renvoie la nouvelle liste des fichiers à livrer.
+
+        Args:
+            data_files (Dict[Path, str]): fichiers à livrer (chemin local => dossier distant)
+
+        Returns:
+            Dict[Path, str]: fichiers à livrer, les petits fichiers étant remplacés par les archives les contenant
+        """
+        if not self.enabled:
+            return data_files
+        d_files: Dict[Path, str] = {}
+        # Petits fichiers de chaque dossier distant : (fichier, taille, date de modification)
+        d_small_files: Dict[str, List[Tuple[Path, int, int]]] = {}
+        for p_file, s_api_path in data_files.items():
+            o_stat = p_file.stat()
+            if o_stat.st_size < self.max_file_size:
+                d_small_files.setdefault(s_api_path, []).append((p_file, o_stat.st_size, o_stat.st_mtime_ns))
+            else:
+                d_files[p_file] = s_api_path
+        for s_api_path, l_small_files in d_small_files.items():
+            # Un fichier seul n'est pas regroupé
+            if len(l_small_files) == 1:
+                d_files[l_small_files[0][0]] = s_api_path
+                continue
+            l_bundles = self.__split(sorted(l_small_files, key=lambda o_file: o_file[0].name))
+            for i_num, l_bundle in enumerate(l_bundles, start=1):
+                p_bundle = self.directory / s_api_path / FileBundler.BUNDLE_NAME.format(num=i_num)
+                self.__write(p_bundle, l_bundle)
+                d_files[p_bundle] = s_api_path
+            Config().om.info(f"{len(l_small_files)} petits fichiers de {s_api_path} regroupés dans {len(l_bundles)} archive(s).")
+        return d_files
+
+    def __split(self, files: List[Tuple[Path, int, int]]) -> List[List[Tuple[Path, int, int]]]:
+        """Répartit les fichiers dans des archives d'au plus `bundle_size` octets (au moins un fichier par archive).
+
+        Args:
+            files (List[Tuple[Path, int, int]]): fichiers (chemin, taille, date de modification)
+
+        Returns:
+            List[List[Tuple[Path, int, int]]]: fichiers de chaque archive
+        """
+        l_bundles: List[List[Tuple[Path, int, int]]] = []
+        i_size = 0
+        for o_file in files:
+            if not l_bundles or (i_size + o_file[1] > self.bundle_size and l_bundles[-1]):
+                l_bundles.append([])
+                i_size = 0
+            l_bundles[-1].append(o_file)
+            i_size += o_file[1]
+        return l_bundles
+
+    def __write(self, bundle_path: Path, files: List[Tuple[Path, int, int]]) -> None:
+        """Écrit une archive, sauf si elle existe déjà avec le même contenu.
+
+        Args:
+            bundle_path (Path): chemin de l'archive
+            files (List[Tuple[Path, int, int]]): fichiers à archiver (chemin, taille, date de modification)
+        """
+        p_manifest = bundle_path.with_suffix(".json")
+        l_manifest = [[p_file.name, i_size, i_mtime_ns] for p_file, i_size, i_mtime_ns in files] + [self.compress]
+        if bundle_path.exists() and FileBundler.read_manifest(p_manifest) == l_manifest:
+            return
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        p_tmp = bundle_path.with_suffix(".zip.tmp")
+        i_compression = zipfile.ZIP_DEFLATED if self.compress else zipfile.ZIP_STORED
+        with zipfile.ZipFile(p_tmp, "w", compression=i_compression) as o_zip:
+            for p_file, _, i_mtime_ns in files:
+                # Date du fichier (et non date courante) : archive identique tant que les fichiers n'ont pas changé
+                o_date = time.gmtime(max(i_mtime_ns // 10**9, FileBundler.ZIP_MIN_TIMESTAMP))
+                o_info = zipfile.ZipInfo(p_file.name, date_time=(o_date.tm_year, o_date.tm_mon, o_date.tm_mday, o_date.tm_hour, o_date.tm_min, o_date.tm_sec))
+                o_info.compress_type = i_compression
+                # Copie par blocs, sans charger le fichier en mémoire
+                with p_file.open("rb") as o_src, o_zip.open(o_info, "w") as o_dst:
+                    for o_chunk in iter(lambda: o_src.read(1024 * 1024), b""):  # pylint:disable=cell-var-from-loop
+                        o_dst.write(o_chunk)
+        p_tmp.replace(bundle_path)
+        p_manifest.write_text(json.dumps(l_manifest), encoding="utf-8")
+
+    @staticmethod
+    def read_manifest(manifest_path: Path) -> Optional[List[object]]:
+        """Lit un manifeste (contenu d'une archive ou fichiers décrits par un fichier md5).
+
+        Args:
+            manifest_path (Path): chemin du manifeste
+
+        Returns:
+            Optional[List[object]]: contenu du manifeste (None s'il est absent ou illisible)
+        """
+        try:
+            return list(json.loads(manifest_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            return None
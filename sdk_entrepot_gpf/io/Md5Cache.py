@@ -0,0 +1,110 @@
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.pattern.Singleton import Singleton
+
+
+class Md5Cache(metaclass=Singleton):
+    """Cache persistant des clefs md5 des fichiers (base SQLite).
+
+    Chaque clef est indexée par le chemin absolu du fichier et n'est réutilisée que si la taille, la date de
+    modification (en nanosecondes) et l'inode du fichier n'ont pas changé : seuls les fichiers modifiés sont
+    recalculés lorsqu'une livraison est relancée. La base (`upload.md5_cache_file`, par défaut `md5_cache.sqlite`
+    dans le dossier temporaire) peut être partagée par plusieurs processus. Le cache est désactivé si
+    `upload.md5_cache` vaut `false`.
+    """
+
+    def __init__(self) -> None:
+        self.__enabled = Config().get_bool("upload", "md5_cache", True)
+        s_file = Config().get("upload", "md5_cache_file")
+        self.__file = Path(s_file) if s_file else Config().get_temp() / "md5_cache.sqlite"
+        self.__lock = threading.Lock()
+        self.__initialized = False
+
+    @property
+    def enabled(self) -> bool:
+        """Indique si le cache est actif."""
+        return self.__enabled
+
+    @property
+    def file(self) -> Path:
+        """Chemin de la base SQLite."""
+        return self.__file
+
+    @staticmethod
+    def __signature(file_path: Path, stat: Optional[os.stat_result] = None) -> Tuple[str, int, int, int]:
+        """Renvoie la clef du fichier (chemin absolu) et ce qui permet de détecter une modification.
+
+        Args:
+            file_path (Path): fichier
+            stat (Optional[os.stat_result], optional): état du fichier (lu si non fourni)
+
+        Returns:
+            Tuple[str, int, int, int]: chemin absolu, taille, date de modification (ns), inode
+        """
+        o_stat = stat if stat is not None else file_path.stat()
+        return (str(file_path.resolve()), o_stat.st_size, o_stat.st_mtime_ns, o_stat.st_ino)
+
+    def __connect(self) -> sqlite3.Connection:
+        """Ouvre la base (et crée la table si besoin).
+
+        Returns:
+            sqlite3.Connection: connexion à la base
+        """
+        with self.__lock:
+            if not self.__initialized:
+                self.__file.parent.mkdir(parents=True, exist_ok=True)
+                with closing(sqlite3.connect(self.__file, timeout=60)) as o_connection:
+                    with o_connection:
+                        o_connection.execute("CREATE TABLE IF NOT EXISTS md5 (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, inode INTEGER, md5 TEXT)")
+                self.__initialized = True
+        return sqlite3.connect(self.__file, timeout=60)
+
+    def get(self, files: List[Path]) -> Dict[Path, str]:
+        """Renvoie les clefs en cache des fichiers non modifiés.
+
+        Args:
+            files (List[Path]): fichiers recherchés
+
+        Returns:
+            Dict[Path, str]: clef md5 des fichiers trouvés (les autres sont absents)
+        """
+        d_md5: Dict[Path, str] = {}
+        if not self.__enabled or not files:
+            return d_md5
+        try:
+            with closing(self.__connect()) as o_connection:
+                for p_file in files:
+                    o_signature = Md5Cache.__signature(p_file)
+                    o_row = o_connection.execute("SELECT md5 FROM md5 WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ?", o_signature).fetchone()
+                    if o_row is not None:
+                        d_md5[p_file] = o_row[0]
+        except sqlite3.Error as e_error:
+            Config().om.warning(f"Cache des clefs md5 {self.__file} inutilisable ({e_error}), les clefs sont recalculées.")
+        return d_md5
+
+    def put(self, entries: List[Tuple[Path, os.stat_result, str]]) -> None:
+        """Enregistre des clefs calculées (en une transaction).
+
+        L'état du fichier doit être lu avant le calcul : si le fichier est modifié pendant le calcul,
+        la clef enregistrée ne sera pas réutilisée.
+
+        Args:
+            entries (List[Tuple[Path, os.stat_result, str]]): fichier, état du fichier avant calcul, clef md5
+        """
+        if not self.__enabled or not entries:
+            return
+        try:
+            with closing(self.__connect()) as o_connection:
+                with o_connection:
+                    o_connection.executemany(
+                        "INSERT OR REPLACE INTO md5 (path, size, mtime_ns, inode, md5) VALUES (?, ?, ?, ?, ?)",
+                        [(*Md5Cache.__signature(p_file, o_stat), s_md5) for p_file, o_stat, s_md5 in entries],
+                    )
+        except sqlite3.Error as e_error:
+            Config().om.warning(f"Cache des clefs md5 {self.__file} inutilisable ({e_error}), les clefs ne sont pas conservées.")
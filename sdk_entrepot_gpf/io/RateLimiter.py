@@ -0,0 +1,99 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class TokenBucket:
+    """Seau à jetons (token bucket) thread-safe.
+
+    Le seau se remplit de `rate` jetons par seconde dans la limite de `capacity` jetons. Chaque requête
+    consomme un jeton ; s'il n'y en a plus, l'appelant attend le temps nécessaire. Le jeton est réservé
+    avant l'attente : les threads sont servis dans l'ordre d'arrivée sans garder le verrou pendant l'attente.
+
+    Attributes:
+        rate (float): nombre de jetons ajoutés par seconde
+        capacity (float): nombre maximal de jetons (rafale autorisée)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity else max(1.0, rate)
+        self.__tokens = self.capacity
+        self.__last = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Consomme un jeton en attendant si nécessaire.
+
+        Returns:
+            float: temps attendu (en secondes)
+        """
+        with self.__lock:
+            f_now = time.monotonic()
+            self.__tokens = min(self.capacity, self.__tokens + (f_now - self.__last) * self.rate)
+            self.__last = f_now
+            self.__tokens -= 1
+            f_wait = 0.0 if self.__tokens >= 0 else -self.__tokens / self.rate
+        if f_wait > 0:
+            time.sleep(f_wait)
+        return f_wait
+
+
+class RateLimiter:
+    """Limiteur de débit côté client partagé par tous les threads utilisant `ApiRequester`.
+
+    Une limite globale (`store_api.rate_limit` requêtes par seconde, rafale `store_api.rate_limit_burst`)
+    s'applique à toutes les requêtes ; une limite supplémentaire peut être définie par route dans la section
+    `routing` (`<route>_rate_limit` et `<route>_rate_limit_burst`). Une limite à 0 désactive la limitation.
+    """
+
+    # Clef du seau global
+    GLOBAL = ""
+
+    def __init__(self) -> None:
+        self.__buckets: Dict[str, Optional[TokenBucket]] = {}
+        self.__lock = threading.Lock()
+
+    def __get_bucket(self, route_name: str) -> Optional[TokenBucket]:
+        """Renvoie (en le créant si besoin) le seau associé à une route ou le seau global.
+
+        Args:
+            route_name (str): nom de la route ou `RateLimiter.GLOBAL`
+
+        Returns:
+            Optional[TokenBucket]: seau ou None si pas de limite
+        """
+        with self.__lock:
+            if route_name not in self.__buckets:
+                if route_name == RateLimiter.GLOBAL:
+                    f_rate = Config().get_float("store_api", "rate_limit", 0)
+                    f_burst = Config().get_float("store_api", "rate_limit_burst", 0)
+                else:
+                    f_rate = Config().get_float("routing", f"{route_name}_rate_limit", 0)
+                    f_burst = Config().get_float("routing", f"{route_name}_rate_limit_burst", 0)
+                self.__buckets[route_name] = TokenBucket(f_rate, f_burst) if f_rate > 0 else None
+            return self.__buckets[route_name]
+
+    def acquire(self, route_name: Optional[str] = None) -> float:
+        """Attend que la requête puisse partir selon la limite globale et celle de la route.
+
+        Args:
+            route_name (Optional[str], optional): nom de la route de la requête
+
+        Returns:
+            float: temps attendu (en secondes)
+        """
+        f_wait = 0.0
+        l_keys = [RateLimiter.GLOBAL] if route_name is None else [route_name, RateLimiter.GLOBAL]
+        for s_key in l_keys:
+            o_bucket = self.__get_bucket(s_key)
+            if o_bucket is not None:
+                f_wait += o_bucket.acquire()
+        return f_wait
+
+    def reset(self) -> None:
+        """Oublie les seaux créés (pour relire la configuration)."""
+        with self.__lock:
+            self.__buckets = {}
@@ -0,0 +1,234 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class ResponseCache:
+    """Cache des réponses aux requêtes GET permettant de faire des requêtes conditionnelles (ETag/Last-Modified).
+
+    Chaque réponse ayant un en-tête `ETag` ou `Last-Modified` est conservée (clef : URL complète, paramètres compris).
+    À la requête suivante sur la même URL, les en-têtes `If-None-Match`/`If-Modified-Since` sont envoyés ;
+    si l'API répond `304 Not Modified`, la réponse conservée est renvoyée sans retélécharger le corps.
+
+    Le cache est désactivé par défaut. Le cache mémoire est borné (LRU, `store_api.cache_size` entrées, 0 pour
+    désactiver le cache) et les réponses de plus de `store_api.cache_max_entry_size` octets (téléchargements de
+    fichiers par exemple) ne sont pas conservées. Si `store_api.cache_dir` est renseigné, les réponses sont aussi
+    écrites sur disque pour être réutilisées par les exécutions suivantes du programme ; le dossier est borné à
+    `store_api.cache_dir_max_size` octets (les fichiers les moins récemment utilisés sont supprimés).
+    """
+
+    def __init__(self, size: int, directory: Optional[Path] = None, max_entry_size: int = 1024 * 1024, directory_max_size: int = 100 * 1024 * 1024) -> None:
+        self.__size = size
+        self.__directory = directory
+        self.__max_entry_size = max_entry_size
+        self.__directory_max_size = directory_max_size
+        self.__entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.__lock = threading.Lock()
+        # taille (en octets) du dossier du cache, calculée au premier enregistrement
+        self.__directory_size: Optional[int] = None
+        if self.__directory is not None:
+            self.__directory.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_config(cls) -> "ResponseCache":
+        """Instancie le cache selon la configuration (section `store_api`).
+
+        Returns:
+            ResponseCache: cache paramétré
+        """
+        s_directory = Config().get("store_api", "cache_dir")
+        return cls(
+            Config().get_int("store_api", "cache_size", 0),
+            Path(s_directory) if s_directory else None,
+            Config().get_int("store_api", "cache_max_entry_size", 1024 * 1024),
+            Config().get_int("store_api", "cache_dir_max_size", 100 * 1024 * 1024),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Indique si le cache est actif (taille non nulle)."""
+        return self.__size > 0
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Calcule la clef de cache d'une requête (URL complète avec paramètres encodés).
+
+        Args:
+            url (str): url de la requête
+            params (Optional[Dict[str, Any]], optional): paramètres de la requête
+
+        Returns:
+            str: clef de cache
+        """
+        o_prepared = requests.models.PreparedRequest()
+        o_prepared.prepare_url(url, params)
+        return str(o_prepared.url)
+
+    def __file(self, key: str) -> Optional[Path]:
+        if self.__directory is None:
+            return None
+        return self.__directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Récupère l'entrée associée à la clef (en mémoire puis sur disque).
+
+        Args:
+            key (str): clef de cache
+
+        Returns:
+            Optional[Dict[str, Any]]: entrée (`etag`, `last_modified`, `headers`, `content`, `encoding`) ou None
+        """
+        if not self.enabled:
+            return None
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                return self.__entries[key]
+        p_file = self.__file(key)
+        if p_file is None or not p_file.exists():
+            return None
+        try:
+            d_stored = json.loads(p_file.read_text(encoding="utf-8"))
+            d_entry = {**d_stored, "content": base64.b64decode(d_stored["content"])}
+            # fichier récemment utilisé : supprimé en dernier
+            os.utime(p_file)
+        except (OSError, ValueError, KeyError):
+            # Fichier illisible : on l'ignore
+            return None
+        self.__store(key, d_entry)
+        return d_entry
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """Renvoie les en-têtes conditionnels à envoyer pour la clef indiquée.
+
+        Args:
+            key (str): clef de cache
+
+        Returns:
+            Dict[str, str]: en-têtes `If-None-Match`/`If-Modified-Since` (vide si pas d'entrée)
+        """
+        d_entry = self.get(key)
+        d_headers: Dict[str, str] = {}
+        if d_entry is not None:
+            if d_entry.get("etag"):
+                d_headers["If-None-Match"] = d_entry["etag"]
+            if d_entry.get("last_modified"):
+                d_headers["If-Modified-Since"] = d_entry["last_modified"]
+        return d_headers
+
+    def put(self, key: str, response: requests.Response) -> None:
+        """Conserve la réponse si elle peut être revalidée (présence d'un `ETag` ou d'un `Last-Modified`)
+        et si elle n'est pas trop volumineuse (ni lue au fil de l'eau).
+
+        Args:
+            key (str): clef de cache
+            response (requests.Response): réponse reçue
+        """
+        if not self.enabled:
+            return
+        s_etag = response.headers.get("ETag")
+        s_last_modified = response.headers.get("Last-Modified")
+        if not s_etag and not s_last_modified:
+            return
+        # Réponse lue au fil de l'eau (corps non chargé) : on ne la lit pas
+        if getattr(response, "_content", None) is False:
+            return
+        s_content_length = response.headers.get("Content-Length", "")
+        if (s_content_length.isdigit() and int(s_content_length) > self.__max_entry_size) or len(response.content) > self.__max_entry_size:
+            return
+        d_entry: Dict[str, Any] = {
+            "etag": s_etag,
+            "last_modified": s_last_modified,
+            "headers": dict(response.headers),
+            "content": response.content,
+            "encoding": response.encoding,
+        }
+        self.__store(key, d_entry)
+        p_file = self.__file(key)
+        if p_file is not None:
+            d_stored = {**d_entry, "content": base64.b64encode(response.content).decode("ascii")}
+            try:
+                s_stored = json.dumps(d_stored)
+                p_file.write_text(s_stored, encoding="utf-8")
+            except OSError as e_error:
+                Config().om.debug(f"Impossible d'écrire le cache {p_file} : {e_error}")
+            else:
+                self.__trim_directory(len(s_stored))
+
+    def __trim_directory(self, written: int) -> None:
+        """Supprime les fichiers les moins récemment utilisés si le dossier du cache dépasse sa taille maximale.
+
+        Args:
+            written (int): nombre d'octets qui viennent d'être écrits
+        """
+        assert self.__directory is not None
+        with self.__lock:
+            if self.__directory_size is not None:
+                self.__directory_size += written
+                if self.__directory_size <= self.__directory_max_size:
+                    return
+            # (re)calcul de la taille à partir des fichiers, du plus ancien au plus récent
+            l_files = []
+            for p_file in self.__directory.glob("*.json"):
+                try:
+                    o_stat = p_file.stat()
+                except OSError:
+                    continue
+                l_files.append((o_stat.st_mtime_ns, o_stat.st_size, p_file))
+            l_files.sort()
+            self.__directory_size = sum(i_size for _, i_size, _ in l_files)
+            for _, i_size, p_file in l_files:
+                if self.__directory_size <= self.__directory_max_size:
+                    break
+                p_file.unlink(missing_ok=True)
+                self.__directory_size -= i_size
+
+    def __store(self, key: str, entry: Dict[str, Any]) -> None:
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__size:
+                self.__entries.popitem(last=False)
+
+    def response(self, key: str, not_modified: requests.Response) -> Optional[requests.Response]:
+        """Reconstruit une réponse 200 à partir du cache suite à une réponse `304 Not Modified`.
+
+        Args:
+            key (str): clef de cache
+            not_modified (requests.Response): réponse 304 reçue
+
+        Returns:
+            Optional[requests.Response]: réponse reconstruite ou None si pas d'entrée
+        """
+        d_entry = self.get(key)
+        if d_entry is None:
+            return None
+        o_response = requests.Response()
+        o_response.status_code = 200
+        o_response._content = d_entry["content"]  # pylint:disable=protected-access
+        # On garde les en-têtes d'origine (Content-Range...) en mettant à jour les validateurs
+        d_headers = dict(d_entry["headers"])
+        for s_header in ("ETag", "Last-Modified", "Date"):
+            if s_header in not_modified.headers:
+                d_headers[s_header] = not_modified.headers[s_header]
+        o_response.headers = CaseInsensitiveDict(d_headers)
+        o_response.encoding = d_entry["encoding"]
+        o_response.url = not_modified.url
+        o_response.request = not_modified.request
+        o_response.elapsed = not_modified.elapsed
+        return o_response
+
+    def clear(self) -> None:
+        """Vide le cache mémoire (le cache disque est conservé)."""
+        with self.__lock:
+            self.__entries.clear()
@@ -0,0 +1,166 @@
+import random
+import datetime
+from email.utils import parsedate_to_datetime
+from typing import List, Optional, Set
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class RetryPolicy:
+    """Politique de nouvelles tentatives utilisée par `ApiRequester.url_request`.
+
+    Le délai avant la tentative `n` vaut `min(max_delay, base_delay * backoff_factor ** (n - 1))`, tiré
+    aléatoirement entre 0 et cette valeur si la gigue (`jitter`) est activée (« full jitter »). Si l'API
+    renvoie un en-tête `Retry-After` (429, 503...), il est utilisé à la place du délai calculé.
+
+    Les paramètres par défaut sont lus dans la section `store_api` (`nb_attempts`, `sec_between_attempt`
+    et options `retry_*`), les codes et méthodes rejouables peuvent être surchargés par route dans la
+    section `routing` (`<route>_retry_status` et `<route>_retry_methods`).
+
+    Pour changer de politique, il suffit de dériver cette classe et de l'indiquer dans `ApiRequester.retry_policy_class`.
+
+    Attributes:
+        nb_attempts (int): nombre maximal de tentatives (première comprise)
+        base_delay (float): délai de base entre deux tentatives (en secondes)
+        backoff_factor (float): facteur multiplicatif du délai à chaque tentative
+        max_delay (float): délai maximal entre deux tentatives (en secondes)
+        jitter (bool): tirage aléatoire du délai entre 0 et le délai calculé
+        max_total_time (float): durée totale maximale consacrée aux tentatives (en secondes, 0 pour illimitée)
+        retry_status (Set[int]): codes HTTP rejouables (vide : tous ceux qui ne sont pas définitifs)
+        retry_methods (Set[str]): méthodes HTTP rejouables
+    """
+
+    def __init__(
+        self,
+        nb_attempts: int,
+        base_delay: float,
+        backoff_factor: float = 2,
+        max_delay: float = 60,
+        jitter: bool = True,
+        max_total_time: float = 0,
+        retry_status: Optional[Set[int]] = None,
+        retry_methods: Optional[Set[str]] = None,
+    ) -> None:
+        self.nb_attempts = nb_attempts
+        self.base_delay = base_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.max_total_time = max_total_time
+        self.retry_status: Set[int] = retry_status if retry_status is not None else set()
+        self.retry_methods: Set[str] = retry_methods if retry_methods is not None else {"GET", "POST", "PUT", "PATCH", "DELETE"}
+
+    @classmethod
+    def from_config(cls, route_name: Optional[str] = None) -> "RetryPolicy":
+        """Instancie la politique à partir de la configuration, éventuellement surchargée pour une route.
+
+        Args:
+            route_name (Optional[str], optional): nom de la route (pour lire `<route>_retry_status` et `<route>_retry_methods`).
+
+        Returns:
+            RetryPolicy: politique à appliquer
+        """
+        s_status = Config().get("store_api", "retry_status", "")
+        s_methods = Config().get("store_api", "retry_methods", "GET,POST,PUT,PATCH,DELETE")
+        if route_name is not None:
+            s_status = Config().get("routing", f"{route_name}_retry_status", s_status)
+            s_methods = Config().get("routing", f"{route_name}_retry_methods", s_methods)
+        return cls(
+            nb_attempts=Config().get_int("store_api", "nb_attempts"),
+            base_delay=Config().get_float("store_api", "sec_between_attempt"),
+            backoff_factor=Config().get_float("store_api", "retry_backoff_factor", 2),
+            max_delay=Config().get_float("store_api", "retry_max_delay", 60),
+            jitter=Config().get_bool("store_api", "retry_jitter", True),
+            max_total_time=Config().get_float("store_api", "retry_max_total_time", 0),
+            retry_status={int(s) for s in RetryPolicy.__split(s_status)},
+            retry_methods={s.upper() for s in RetryPolicy.__split(s_methods)},
+        )
+
+    @staticmethod
+    def __split(value: Optional[str]) -> List[str]:
+        """Découpe une liste de valeurs séparées par des virgules en ignorant les valeurs vides.
+
+        Args:
+            value (Optional[str]): chaîne à découper
+
+        Returns:
+            List[str]: valeurs
+        """
+        if not value:
+            return []
+        return [s.strip() for s in value.split(",") if s.strip()]
+
+    @staticmethod
+    def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        """Parse la valeur de l'en-tête `Retry-After` (nombre de secondes ou date HTTP).
+
+        Args:
+            retry_after (Optional[str]): valeur de l'en-tête
+
+        Returns:
+            Optional[float]: nombre de secondes à attendre ou None si absent ou non parsable
+        """
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            o_date = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if o_date.tzinfo is None:
+            o_date = o_date.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (o_date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+    def is_retryable(self, method: str, status_code: Optional[int] = None) -> bool:
+        """Indique si une requête en échec peut être rejouée.
+
+        Args:
+            method (str): méthode de la requête
+            status_code (Optional[int], optional): code HTTP reçu (None si pas de réponse)
+
+        Returns:
+            bool: True si la requête peut être rejouée
+        """
+        if method.upper() not in self.retry_methods:
+            return False
+        if status_code is None or not self.retry_status:
+            return True
+        return status_code in self.retry_status
+
+    def next_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Calcule le délai à attendre après l'échec de la tentative `attempt`.
+
+        Args:
+            attempt (int): numéro de la tentative ayant échoué (à partir de 1)
+            retry_after (Optional[str], optional): valeur de l'en-tête `Retry-After` de la réponse
+
+        Returns:
+            float: délai en secondes
+        """
+        f_retry_after = RetryPolicy.parse_retry_after(retry_after)
+        if f_retry_after is not None:
+            return f_retry_after
+        f_delay = min(self.max_delay, self.base_delay * self.backoff_factor ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, f_delay)
+        return f_delay
+
+    def can_retry(self, method: str, status_code: Optional[int], attempt: int, elapsed: float, delay: float) -> bool:
+        """Indique s'il faut faire une nouvelle tentative.
+
+        Args:
+            method (str): méthode de la requête
+            status_code (Optional[int]): code HTTP reçu (None si pas de réponse)
+            attempt (int): numéro de la tentative ayant échoué (à partir de 1)
+            elapsed (float): temps déjà passé depuis la première tentative (en secondes)
+            delay (float): délai prévu avant la prochaine tentative (en secondes)
+
+        Returns:
+            bool: True s'il faut retenter
+        """
+        if attempt >= self.nb_attempts or not self.is_retryable(method, status_code):
+            return False
+        return self.max_total_time <= 0 or elapsed + delay <= self.max_total_time
@@ -1,10 +1,13 @@
 import sys
+import threading
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from sdk_entrepot_gpf.helper.JsonHelper import JsonHelper
 from sdk_entrepot_gpf.io.Color import Color
+from sdk_entrepot_gpf.io.Dataset import Dataset
 from sdk_entrepot_gpf.io.DescriptorFileReader import DescriptorFileReader
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.io.UploadDescriptorFileReader import UploadDescriptorFileReader
@@ -22,7 +25,7 @@ from sdk_entrepot_gpf.scripts.utils import Utils
 class Delivery:
     """Classe pour manipuler les entités en cas d'utilisation cli."""
 
-    def __init__(self, datastore: Optional[str], file: Path, behavior: str, check_before_close: bool, mode_cartes: bool) -> None:
+    def __init__(self, datastore: Optional[str], file: Path, behavior: str, check_before_close: bool, mode_cartes: bool, jobs: int = 1) -> None:
         """Si un id est précisé, on récupère l'entité et on fait d'éventuelles actions.
         Sinon on liste les entités avec éventuellement des filtres.
 
@@ -32,12 +35,14 @@ class Delivery:
             behavior (str): comportement de gestion des conflits
             check_before_close (bool): si on doit revérifier la livraison avant sa fermeture
             mode_cartes (bool): activation du mode cartes.gouv
+            jobs (int, optional): nombre de livraisons effectuées simultanément
         """
         self.datastore = datastore
         self.file = file
         self.behavior = behavior
         self.check_before_close = check_before_close
         self.mode_cartes = mode_cartes
+        self.jobs = jobs
         # On ouvre le fichier indiqué
         self.data = JsonHelper.load(self.file)
 
@@ -46,7 +51,7 @@ class Delivery:
         if "datasets" in self.data:
             Config().om.info("Téléversement de données...", green_colored=True)
             # on livre les données selon le fichier descripteur donné
-            d_res = self.upload_from_descriptor_file(self.file, self.behavior, self.datastore, self.check_before_close, self.mode_cartes)
+            d_res = self.upload_from_descriptor_file(self.file, self.behavior, self.datastore, self.check_before_close, self.mode_cartes, jobs=self.jobs)
             # Affichage du bilan
             Config().om.info("-" * 100)
             if d_res["upload_fail"] or d_res["check_fail"]:
@@ -89,9 +94,14 @@ class Delivery:
         mode_cartes: Optional[bool] = None,
         callback: Optional[Callable[[str], None]] = print,
         ctrl_c_action: Optional[Callable[[], bool]] = Utils.ctrl_c_upload,
+        jobs: int = 1,
     ) -> Dict[str, Any]:
         """réalisation des livraisons (upload) décrites par le fichier indiqué
 
+        Si jobs est supérieur à 1, jusqu'à jobs livraisons sont effectuées simultanément puis les vérifications
+        de toutes les livraisons sont suivies ensemble. Un ctrl-C pendant les livraisons annule celles qui ne sont
+        pas commencées et arrête les autres après le fichier en cours.
+
         Args:
             file (Union[Path, str]): chemin du fichier descripteur de livraison
             behavior (Optional[str]): comportement dans le cas où une livraison de même nom existe, comportment par défaut si None
@@ -100,6 +110,7 @@ class Delivery:
             mode_cartes (Optional[bool]): Si le mode carte est activé
             callback (Optional[Callable[[str], None]]): fonction de callback à exécuter avec le message de suivi.
             ctrl_c_action (Optional[Callable[[], bool]]): gestion du ctrl-C
+            jobs (int): nombre de livraisons effectuées simultanément (1 : livraisons et suivis l'un après l'autre)
 
         Returns:
             Dict[str, Any]: dictionnaire avec le résultat des livraisons :
@@ -110,40 +121,47 @@ class Delivery:
         o_dfu = UploadDescriptorFileReader(Path(file))
         s_behavior = str(behavior).upper() if behavior is not None else None
 
-        l_uploads: List[Upload] = []  # liste des uploads lancées
         d_upload_fail: Dict[str, Exception] = {}  # dictionnaire upload : erreur des uploads qui ont fail
         l_check_ko: List[Upload] = []  # liste des uploads dont les vérifications plantes
 
-        # on fait toutes les livraisons
-        Config().om.info(f"LIVRAISONS : ({len(o_dfu.datasets)})", green_colored=True)
-        for o_dataset in o_dfu.datasets:
+        o_cancel = threading.Event()
+
+        def run_upload(o_dataset: Dataset) -> Optional[Upload]:
+            """Effectue une livraison et renvoie l'Upload (None en cas d'erreur ou d'interruption)."""
+            if o_cancel.is_set():
+                return None
             s_nom = o_dataset.upload_infos["name"]
             Config().om.info(f"{Color.BLUE} * {s_nom}{Color.END}")
             try:
                 o_ua = UploadAction(o_dataset, compatibility_cartes=mode_cartes, behavior=s_behavior)
-                o_upload = o_ua.run(datastore, check_before_close=check_before_close)
-                l_uploads.append(o_upload)
+                return o_ua.run(datastore, check_before_close=check_before_close, cancel=o_cancel)
             except Exception as e:
-                s_nom = o_dataset.upload_infos["name"]
                 d_upload_fail[s_nom] = e
                 Config().om.error(f"livraison {s_nom} : {e}")
                 Config().om.debug(traceback.format_exc())
+            return None
+
+        # on fait toutes les livraisons
+        Config().om.info(f"LIVRAISONS : ({len(o_dfu.datasets)})", green_colored=True)
+        if jobs > 1:
+            l_uploads = [o_upload for o_upload in Delivery.__run_uploads_parallel(run_upload, o_dfu.datasets, jobs, o_cancel) if o_upload is not None]
+        else:
+            l_uploads = [o_upload for o_upload in map(run_upload, o_dfu.datasets) if o_upload is not None]
 
         # vérification des livraisons
         Config().om.info("Fin des livraisons.", green_colored=True)
         Config().om.info("Suivi des vérifications :", green_colored=True)
         l_check_ko = []
         l_check_ok = []
-        for o_upload in l_uploads:
-            Config().om.info(f"{Color.BLUE} * {o_upload}{Color.END}")
-            b_res = Utils.monitoring_upload(
-                o_upload,
-                "Livraison {upload} créée avec succès.",
-                "Livraison {upload} créée en erreur !",
-                callback,
-                ctrl_c_action,
-                mode_cartes,
-            )
+        if jobs > 1:
+            # suivi simultané de toutes les livraisons
+            l_res = Utils.monitoring_uploads(l_uploads, "Livraison {upload} créée avec succès.", "Livraison {upload} créée en erreur !", callback, ctrl_c_action, mode_cartes)
+        else:
+            l_res = []
+            for o_upload in l_uploads:
+                Config().om.info(f"{Color.BLUE} * {o_upload}{Color.END}")
+                l_res.append(Utils.monitoring_upload(o_upload, "Livraison {upload} créée avec succès.", "Livraison {upload} créée en erreur !", callback, ctrl_c_action, mode_cartes))
+        for o_upload, b_res in zip(l_uploads, l_res):
             if b_res:
                 l_check_ok.append(o_upload)
             else:
@@ -156,6 +174,42 @@ class Delivery:
             "check_fail": l_check_ko,
         }
 
+    @staticmethod
+    def __run_uploads_parallel(run_upload: Callable[[Dataset], Optional[Upload]], datasets: List[Dataset], jobs: int, cancel: threading.Event) -> List[Optional[Upload]]:
+        """Effectue les livraisons simultanément (jobs au plus) et renvoie leurs résultats dans l'ordre des datasets.
+
+        En cas de ctrl-C, les livraisons pas encore commencées sont annulées et les autres sont arrêtées
+        (via cancel) sans les attendre, puis l'interruption est relancée.
+
+        Args:
+            run_upload (Callable[[Dataset], Optional[Upload]]): fonction effectuant une livraison
+            datasets (List[Dataset]): datasets à livrer
+            jobs (int): nombre de livraisons effectuées simultanément
+            cancel (threading.Event): signal d'arrêt des livraisons en cours
+
+        Returns:
+            List[Optional[Upload]]: livraisons effectuées (None en cas d'erreur)
+        """
+        o_executor = ThreadPoolExecutor(max_workers=jobs)
+        l_futures: List["Future[Optional[Upload]]"] = []
+        try:
+            for o_dataset in datasets:
+                l_futures.append(o_executor.submit(run_upload, o_dataset))
+            # attente par intervalles : une attente sans délai n'est pas toujours interrompue par le ctrl-C
+            while wait(l_futures, timeout=1).not_done:
+                pass
+            l_uploads = [o_future.result() for o_future in l_futures]
+        except KeyboardInterrupt:
+            Config().om.warning("Interruption : arrêt des livraisons en cours...")
+            # annulation avant le signal d'arrêt : un thread libéré ne doit pas commencer une nouvelle livraison
+            for o_future in l_futures:
+                o_future.cancel()
+            cancel.set()
+            o_executor.shutdown(wait=False)
+            raise
+        o_executor.shutdown()
+        return l_uploads
+
     @staticmethod
     def display_bilan_upload_file(d_res: Dict[str, Any]) -> None:
         """Affichage du bilan pour le téléversement de fichiers (annexe, static, metadata)
@@ -88,10 +88,19 @@ class Entities:
                 d_tags_filter = StoreEntity.filter_dict_from_str(self.args.tags)
             else:
                 d_tags_filter = None
-            l_entities = self.entity_class.api_list(infos_filter=d_infos_filter, tags_filter=d_tags_filter, page=getattr(self.args, "page", None), datastore=self.datastore)
-            Config().om.info(f"Affichage de {len(l_entities)} {self.entity_class.entity_titles()} :", green_colored=True)
             l_props = str(Config().get("cli", f"list_{self.entity_type}", "_id,name"))
-            print(tabulate([o_e.get_store_properties(l_props.split(",")) for o_e in l_entities], headers="keys"))
+            if getattr(self.args, "stream", False) is True:
+                # Affichage au fil de l'eau (une ligne par entité, colonnes séparées par des tabulations)
+                print("\t".join(l_props.split(",")))
+                i_nb = 0
+                for o_entity in self.entity_class.api_iter(infos_filter=d_infos_filter, tags_filter=d_tags_filter, datastore=self.datastore):
+                    print("\t".join(str(v) for v in o_entity.get_store_properties(l_props.split(",")).values()), flush=True)
+                    i_nb += 1
+                Config().om.info(f"{i_nb} {self.entity_class.entity_titles()} affichées.", green_colored=True)
+            else:
+                l_entities = self.entity_class.api_list(infos_filter=d_infos_filter, tags_filter=d_tags_filter, page=getattr(self.args, "page", None), datastore=self.datastore)
+                Config().om.info(f"Affichage de {len(l_entities)} {self.entity_class.entity_titles()} :", green_colored=True)
+                print(tabulate([o_e.get_store_properties(l_props.split(",")) for o_e in l_entities], headers="keys"))
 
     def action(self, o_entity: StoreEntity) -> bool:  # pylint:disable=too-many-return-statements
         """Traite les actions s'il y a lieu. Renvoie true si on doit afficher l'entité.
@@ -402,7 +411,10 @@ class Entities:
             o_sub_parser.add_argument("id", type=str, nargs="?", default=None, help="Id de l'entité à afficher ou à utiliser pour lancer les actions")
             # Filtres
             o_sub_parser.add_argument("--infos", "-i", type=str, default=None, help=f"Filtrer les {o_entity.entity_titles()} selon les infos")
-            o_sub_parser.add_argument("--page", "-p", type=int, default=None, help="Page à récupérer. Toutes si non indiqué.")
+            # Une page précise ou toutes les pages au fil de l'eau
+            o_list_group = o_sub_parser.add_mutually_exclusive_group()
+            o_list_group.add_argument("--page", "-p", type=int, default=None, help="Page à récupérer. Toutes si non indiqué.")
+            o_list_group.add_argument("--stream", action="store_true", default=False, help="Affiche les entités au fur et à mesure de leur récupération (toutes les pages).")
             if issubclass(o_entity, TagInterface):
                 l_epilog.append(
                     f"""    * lister les {o_entity.entity_titles()} avec d'optionnels filtres sur les infos et les tags : {o_entity.entity_name()} [--infos INFO=VALEUR] [--tags TAG=VALEUR]"""
@@ -462,6 +474,7 @@ class Entities:
             l_epilog.append("""""")
             l_epilog.append("""Exemples :""")
             l_epilog.append(f"""    * Listing des {o_entity.entity_title()}s dont le nom contient 'D038' : {o_entity.entity_name()} --infos name=%D038%""")
+            l_epilog.append(f"""    * Listing au fil de l'eau de toutes les {o_entity.entity_title()}s : {o_entity.entity_name()} --stream""")
             l_epilog.append(f"""    * Affichage d'une {o_entity.entity_title()} : {o_entity.entity_name()} 576c85eb-6a2e-4d0c-a0c9-ddb83536e1dc""")
             l_epilog.append(f"""    * Suppression d'une {o_entity.entity_title()} en cascade : {o_entity.entity_name()} 576c85eb-6a2e-4d0c-a0c9-ddb83536e1dc --delete --cascade""")
             if o_entity == Upload:
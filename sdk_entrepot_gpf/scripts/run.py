@@ -81,11 +81,14 @@ class Main:
                     d_params,
                     d_tags,
                     self.o_args.comments,
+                    self.o_args.all,
+                    self.o_args.jobs,
+                    self.o_args.resume,
                 )
             else:  # TODO à retirer
                 self.workflow()
         elif self.o_args.task == "delivery":
-            Delivery(self.datastore, self.o_args.file, self.o_args.behavior, self.o_args.check_before_close, self.o_args.mode_cartes)
+            Delivery(self.datastore, self.o_args.file, self.o_args.behavior, self.o_args.check_before_close, self.o_args.mode_cartes, self.o_args.jobs)
         elif self.o_args.task == "dataset":
             self.dataset()
         elif self.o_args.task == "delete":
@@ -144,20 +147,27 @@ class Main:
         o_sub_parser.add_argument("--params", "-p", type=str, nargs=2, action="append", metavar=("Clef", "Valeur"), default=[], help="Paramètres supplémentaires à passer au workflow à résoudre.")
 
         # Parser pour workflow
-        s_epilog_workflow = """quatre types de lancement :
+        s_epilog_workflow = """cinq types de lancement :
         * liste des exemples de workflow disponibles (déprécié) : `` (aucun arguments)
         * Récupération d'un workflow exemple (déprécié) : `--name NAME`
         * Vérification de la structure du fichier workflow et affichage des étapes : `--file FILE`
         * Lancement l'une étape d'un workflow : `--file FILE --step STEP [--behavior BEHAVIOR]`
+        * Lancement de toutes les étapes d'un workflow (chacune dès que ses parents sont terminés) : `--file FILE --all [--jobs N] [--behavior BEHAVIOR]`
           Il est alors possible de :
             - préciser des paramètres pour la résolution du workflow : `-p param1_clef param1_valeur -p "param2 clef" "param2 valeur"`
             - préciser des tags à ajouter : `-t clef1 valeur1 -t clef2 valeur2`
             - préciser des commentaires à ajouter : `-c "commentaire 1" -c "commentaire 2"`
+            - journaliser l'exécution et reprendre une étape interrompue sans relancer les actions terminées (journal `<nom du workflow>.journal.json` à côté du fichier) : `--resume`
         """
         o_sub_parser = o_sub_parsers.add_parser("workflow", help="Workflow (lancement, vérification)", epilog=s_epilog_workflow, formatter_class=argparse.RawTextHelpFormatter)
         o_sub_parser.add_argument("--file", "-f", type=str, default=None, help="Chemin du fichier à utiliser OU chemin où extraire le dataset")
         o_sub_parser.add_argument("--name", "-n", type=str, default=None, help="Nom du workflow à extraire")
         o_sub_parser.add_argument("--step", "-s", type=str, default=None, help="Étape du workflow à lancer")
+        o_sub_parser.add_argument("--all", "-a", action="store_true", help="Lancer toutes les étapes du workflow en respectant leurs parents")
+        o_sub_parser.add_argument("--jobs", "-j", type=int, default=1, help="Nombre maximum d'étapes lancées simultanément avec --all (défaut : 1)")
+        o_sub_parser.add_argument(
+            "--resume", "-r", action="store_true", help="Journaliser l'exécution et reprendre à partir du journal du workflow : les actions déjà terminées (même contexte) ne sont pas relancées"
+        )
         o_sub_parser.add_argument("--behavior", "-b", choices=ProcessingExecutionAction.BEHAVIORS, default=None, help="Action à effectuer si l'exécution de traitement existe déjà")
         o_sub_parser.add_argument("--tags", "-t", type=str, nargs=2, action="append", metavar=("Clef", "Valeur"), default=[], help="Tags à ajouter aux actions (plusieurs tags possibles)")
         o_sub_parser.add_argument(
@@ -205,6 +215,7 @@ class Main:
         o_sub_parser.add_argument("file", type=Path, default=None, help="Chemin du fichier descriptif à utiliser")
         o_sub_parser.add_argument("--behavior", "-b", choices=UploadAction.BEHAVIORS, default=None, help="Action à effectuer s'il y a un conflit.")
         o_sub_parser.add_argument("--check-before-close", action="store_true", default=False, help="Si on vérifie l'ensemble de la livraison avant de fermer la livraison (uniquement avec --file|-f)")
+        o_sub_parser.add_argument("--jobs", "-j", type=int, default=1, help="Nombre de livraisons de données effectuées simultanément (suivi groupé des vérifications si supérieur à 1)")
 
         # Parser pour les entités
         Entities.complete_parser_entities(o_sub_parsers)
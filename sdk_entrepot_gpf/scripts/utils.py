@@ -1,8 +1,12 @@
 import sys
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
+from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import ApiError
 from sdk_entrepot_gpf.workflow.action.UploadAction import UploadAction
+from sdk_entrepot_gpf.store.CheckExecution import CheckExecution
+from sdk_entrepot_gpf.store.LogTailer import LogTailer
 from sdk_entrepot_gpf.store.Upload import Upload
 
 
@@ -35,8 +39,62 @@ class Utils:
             Config().om.info(message_ok.format(upload=upload), green_colored=True)
         else:
             Config().om.error(message_ko.format(upload=upload))
+            Utils.print_failed_checks_logs(upload)
         return b_res
 
+    @staticmethod
+    def monitoring_uploads(
+        uploads: List[Upload],
+        message_ok: str,
+        message_ko: str,
+        callback: Optional[Callable[[str], None]] = None,
+        ctrl_c_action: Optional[Callable[[], bool]] = None,
+        mode_cartes: Optional[bool] = None,
+    ) -> List[bool]:
+        """Monitoring simultané de plusieurs uploads et affichage état de sortie de chacun
+
+        Args:
+            uploads (List[Upload]): uploads à monitorer
+            message_ok (str): message si les vérifications sont ok
+            message_ko (str): message si les vérifications sont en erreur
+            callback (Optional[Callable[[str], None]], optional): fonction de callback à exécuter avec le message de suivi.
+            ctrl_c_action (Optional[Callable[[], bool]], optional): gestion du ctrl-C
+            mode_cartes (Optional[bool]): Si le mode carte est activé
+        Returns:
+            List[bool]: pour chaque upload (dans l'ordre), True si toutes les vérifications sont ok, sinon False
+        """
+        l_res = UploadAction.monitor_uploads_until_end(uploads, callback, ctrl_c_action, mode_cartes)
+        for o_upload, b_res in zip(uploads, l_res):
+            if b_res:
+                Config().om.info(message_ok.format(upload=o_upload), green_colored=True)
+            else:
+                Config().om.error(message_ko.format(upload=o_upload))
+                Utils.print_failed_checks_logs(o_upload)
+        return l_res
+
+    @staticmethod
+    def print_failed_checks_logs(upload: Upload) -> None:
+        """Affiche les lignes d'erreur des logs des vérifications en échec d'une livraison.
+
+        Les logs sont lus avec un LogTailer (page par page, sans les concaténer).
+
+        Args:
+            upload (Upload): livraison vérifiée
+        """
+        for d_check_exec in upload.api_list_checks()["failed"]:
+            o_tailer = LogTailer(CheckExecution(d_check_exec, datastore=upload.datastore))
+            try:
+                l_errors = [s_line for s_line in o_tailer.new_lines() if "ERROR" in s_line]
+            except (GpfSdkError, ApiError) as e_error:
+                # Logs non disponibles (route non définie, erreur de l'API...) : on passe à la vérification suivante
+                Config().om.debug(f"Logs de la vérification {d_check_exec['_id']} indisponibles : {e_error}")
+                continue
+            s_name = d_check_exec.get("check", {}).get("name", d_check_exec["_id"])
+            if l_errors:
+                Config().om.warning(f"Vérification {s_name} en échec, extrait des logs :\n" + "\n".join(l_errors))
+            else:
+                Config().om.warning(f"Vérification {s_name} en échec (pas de log contenant 'ERROR').")
+
     @staticmethod
     def ctrl_c_action() -> bool:
         """fonction callback pour la gestion du ctrl-C
@@ -3,18 +3,20 @@ from typing import Dict, List, Optional
 
 from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.helper.JsonHelper import JsonHelper
-from sdk_entrepot_gpf.helper.PrintLogHelper import PrintLogHelper
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import ApiError
 from sdk_entrepot_gpf.scripts.resolve import ResolveCli
 from sdk_entrepot_gpf.scripts.utils import Utils
+from sdk_entrepot_gpf.store.LogTailer import LogTailer
 from sdk_entrepot_gpf.workflow.Workflow import Workflow
+from sdk_entrepot_gpf.workflow.WorkflowJournal import WorkflowJournal
 from sdk_entrepot_gpf.store.ProcessingExecution import ProcessingExecution
 
 
 class WorkflowCli:
     """Classe pour lancer les workflows via le cli."""
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         datastore: Optional[str],
         file: Path,
@@ -23,6 +25,9 @@ class WorkflowCli:
         params: Dict[str, str],
         tags: Dict[str, str],
         comments: List[str],
+        all_steps: bool = False,
+        jobs: int = 1,
+        resume: bool = False,
     ) -> None:
         """Si un id est précisé, on récupère l'entité et on fait d'éventuelles actions.
         Sinon on liste les entités avec éventuellement des filtres.
@@ -35,6 +40,9 @@ class WorkflowCli:
             params (Dict[str, str]): paramètres complémentaires
             tags (Dict[str, str]): tags à ajouter
             comments (List[str]): commentaires à ajouter
+            all_steps (bool, optional): lancement de toutes les étapes (en respectant leurs parents). Defaults to False.
+            jobs (int, optional): nombre maximum d'étapes lancées simultanément avec all_steps. Defaults to 1.
+            resume (bool, optional): reprise à partir du journal du workflow (actions déjà terminées non relancées). Defaults to False.
         """
         self.datastore = datastore
         self.file = file
@@ -43,19 +51,25 @@ class WorkflowCli:
         self.params = params
         self.tags = tags
         self.comments = comments
+        self.all_steps = all_steps
+        self.jobs = jobs
+        self.resume = resume
 
         # Ouverture du fichier
         p_workflow = Path(self.file).absolute()
         Config().om.info(f"Ouverture du workflow {p_workflow}...")
-        self.workflow = Workflow(p_workflow.stem, JsonHelper.load(p_workflow))
+        # journal d'exécution à côté du fichier (actions terminées), seulement si une reprise est demandée :
+        # l'exécution est alors journalisée et reprend là où la précédente (lancée avec --resume) s'est arrêtée
+        o_journal = WorkflowJournal.for_workflow(p_workflow, True, {"params": self.params}) if self.resume else None
+        self.workflow = Workflow(p_workflow.stem, JsonHelper.load(p_workflow), o_journal)
 
         # Y'a-t-il une étape d'indiquée
-        if self.step is None:
+        if self.step is None and not self.all_steps:
             # Si pas d'étape indiquée, on valide le workflow
             Config().om.info("Validation du workflow...")
             self.validate()
         else:
-            # Sinon on lance l'étape indiquée
+            # Sinon on lance l'étape indiquée (ou toutes les étapes)
             self.run()
 
     def validate(self) -> None:
@@ -75,28 +89,51 @@ class WorkflowCli:
             Config().om.info(f"   * {s_step}")
 
     def run(self) -> None:
-        """Lancement de l'étape indiquée."""
-        assert self.step is not None
+        """Lancement de l'étape indiquée (ou de toutes les étapes)."""
+        assert self.step is not None or self.all_steps
         # On initialise les résolveurs
         ResolveCli.init_resolvers(self.params)
 
         # le comportement
         s_behavior = str(self.behavior).upper() if self.behavior is not None else None
-        # on reset l'afficheur de log
-        PrintLogHelper.reset()
+        # lecteurs incrémentaux des logs (un par exécution de traitement)
+        d_tailers: Dict[str, LogTailer] = {}
+        # exécutions dont les logs sont indisponibles (message affiché une seule fois)
+        l_unavailable: List[str] = []
 
         # et on lance l'étape en précisant l'afficheur de log et le comportement
         def callback_run_step(processing_execution: ProcessingExecution) -> None:
-            """fonction callback pour l'affichage des logs lors du suivi d'un traitement
+            """fonction callback pour l'affichage des nouveaux logs lors du suivi d'un traitement
 
             Args:
                 processing_execution (ProcessingExecution): processing exécution en cours
             """
+            o_tailer = d_tailers.setdefault(processing_execution.id, LogTailer(processing_execution))
             try:
-                PrintLogHelper.print(processing_execution.api_logs())
-            except Exception:
-                PrintLogHelper.print("Logs indisponibles pour le moment...")
+                l_lines = o_tailer.new_lines()
+            except (GpfSdkError, ApiError):
+                if processing_execution.id not in l_unavailable:
+                    l_unavailable.append(processing_execution.id)
+                    print("Logs indisponibles pour le moment...")
+                return
+            if processing_execution.id in l_unavailable:
+                l_unavailable.remove(processing_execution.id)
+            if l_lines:
+                print("\n".join(l_lines))
 
+        # toutes les étapes : lancées dès que leurs parents sont terminés
+        if self.all_steps:
+            self.workflow.run_all(
+                self.jobs,
+                callback_run_step,
+                Utils.ctrl_c_action,
+                behavior=s_behavior,
+                datastore=self.datastore,
+                comments=self.comments,
+                tags=self.tags,
+            )
+            return
+        assert self.step is not None
         # on lance le monitoring de l'étape en précisant la gestion du ctrl-C
         self.workflow.run_step(
             self.step,
@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Optional, Type, TypeVar
+from typing import Dict, Iterator, List, Optional, Type, TypeVar
 from sdk_entrepot_gpf.Errors import GpfSdkError
 
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
@@ -17,7 +17,14 @@ class Datastore(StoreEntity):
     _entity_titles = "entrepôts"
 
     @classmethod
-    def api_list(cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, page: Optional[int] = None, datastore: Optional[str] = None) -> List[T]:
+    def api_list(
+        cls: Type[T],
+        infos_filter: Optional[Dict[str, str]] = None,
+        tags_filter: Optional[Dict[str, str]] = None,
+        page: Optional[int] = None,
+        datastore: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[T]:
         """Liste les entités de l'API respectant les paramètres donnés.
 
         Args:
@@ -25,6 +32,7 @@ class Datastore(StoreEntity):
             tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
             page: Numéro page à récupérer, toutes si None.
             datastore: Identifiant du datastore
+            fields: Non utilisé (les champs renvoyés sont toujours `_id`, `name` et `technical_name`)
 
         Returns:
             (List[StoreEntity]): liste des entités retournées par l'API
@@ -61,6 +69,31 @@ class Datastore(StoreEntity):
         # On renvoie la liste des entités récupérées
         return l_entities
 
+    @classmethod
+    def api_iter(
+        cls: Type[T],
+        infos_filter: Optional[Dict[str, str]] = None,
+        tags_filter: Optional[Dict[str, str]] = None,
+        datastore: Optional[str] = None,
+        page_size: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[T]:
+        """Parcourt les entrepôts de l'API respectant les paramètres donnés.
+
+        Il n'y a pas de route de listing paginé (les entrepôts sont ceux des communautés de l'utilisateur) : on renvoie simplement le résultat de `api_list`.
+
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+            datastore: Identifiant du datastore
+            page_size: Non utilisé (pas de pagination)
+            fields: Non utilisé
+
+        Yields:
+            (StoreEntity): entités retournées par l'API
+        """
+        yield from cls.api_list(infos_filter=infos_filter, tags_filter=tags_filter, datastore=datastore, fields=fields)
+
     @staticmethod
     def get_id(datastore: str) -> str:
         """récupération de l'id du datastore à partir de son nom ou id
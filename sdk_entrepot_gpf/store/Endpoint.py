@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Type
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity, T
@@ -13,7 +13,14 @@ class Endpoint(StoreEntity):
     _entity_titles = "points de montage"
 
     @classmethod
-    def api_list(cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, page: Optional[int] = None, datastore: Optional[str] = None) -> List[T]:
+    def api_list(
+        cls: Type[T],
+        infos_filter: Optional[Dict[str, str]] = None,
+        tags_filter: Optional[Dict[str, str]] = None,
+        page: Optional[int] = None,
+        datastore: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[T]:
         """Liste les points de montage de l'API respectant les paramètres donnés.
 
         Args:
@@ -21,6 +28,7 @@ class Endpoint(StoreEntity):
             tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
             page: Numéro page à récupérer, toutes si None.
             datastore: Identifiant du datastore
+            fields: Non utilisé (les points de montage sont renvoyés complets)
 
         Returns:
             List[T]: liste des entités retournées
@@ -50,6 +58,31 @@ class Endpoint(StoreEntity):
         # A la fin, on renvoie la liste
         return l_endpoints
 
+    @classmethod
+    def api_iter(
+        cls: Type[T],
+        infos_filter: Optional[Dict[str, str]] = None,
+        tags_filter: Optional[Dict[str, str]] = None,
+        datastore: Optional[str] = None,
+        page_size: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[T]:
+        """Parcourt les points de montage de l'API respectant les paramètres donnés.
+
+        Il n'y a pas de route de listing paginé (les points de montage sont lus sur l'entrepôt) : on renvoie simplement le résultat de `api_list`.
+
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+            datastore: Identifiant du datastore
+            page_size: Non utilisé (pas de pagination)
+            fields: Non utilisé
+
+        Yields:
+            (StoreEntity): entités retournées par l'API
+        """
+        yield from cls.api_list(infos_filter=infos_filter, tags_filter=tags_filter, datastore=datastore, fields=fields)
+
     def api_update(self) -> None:
         return None
 
@@ -0,0 +1,51 @@
+from typing import List
+
+from sdk_entrepot_gpf.store.interface.LogsInterface import LogsInterface
+
+
+class LogTailer:
+    """Lecture incrémentale des logs d'une entité (exécution de traitement, exécution de vérification...).
+
+    Contrairement à `LogsInterface.api_logs()` qui récupère toutes les pages à chaque appel, le lecteur retient
+    la dernière page lue et le nombre de lignes déjà renvoyées de cette page : chaque appel à `new_lines()` ne
+    demande que la dernière page (et les suivantes si elle est complète). La taille des pages est donc fixe.
+
+    La dernière ligne renvoyée est également retenue : si elle ne se retrouve pas à sa place (logs réécrits),
+    la lecture reprend depuis le début.
+
+    Attributes:
+        entity (LogsInterface): entité dont on lit les logs
+        page_size (int): nombre de lignes par page
+    """
+
+    def __init__(self, entity: LogsInterface, page_size: int = 2000) -> None:
+        self.entity = entity
+        self.page_size = page_size
+        # page en cours de lecture et nombre de lignes déjà renvoyées de cette page
+        self.__page = 1
+        self.__nb_seen = 0
+        self.__last_line: str = ""
+
+    def new_lines(self) -> List[str]:
+        """Renvoie les lignes de logs apparues depuis le dernier appel.
+
+        Returns:
+            List[str]: nouvelles lignes
+        """
+        l_new_lines: List[str] = []
+        while True:
+            l_lines = self.entity.api_logs_page(self.__page, self.page_size)
+            if self.__nb_seen > 0 and (len(l_lines) < self.__nb_seen or l_lines[self.__nb_seen - 1] != self.__last_line):
+                # Les logs ne correspondent plus à ce qui a été lu : on reprend depuis le début
+                self.__page, self.__nb_seen = 1, 0
+                l_new_lines = []
+                continue
+            l_new_lines += l_lines[self.__nb_seen :]
+            if l_lines:
+                self.__last_line = l_lines[-1]
+            if len(l_lines) < self.page_size:
+                self.__nb_seen = len(l_lines)
+                return l_new_lines
+            # Page complète : les lignes suivantes sont sur la page suivante
+            self.__page += 1
+            self.__nb_seen = 0
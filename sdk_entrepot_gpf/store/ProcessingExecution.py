@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Optional
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
+from sdk_entrepot_gpf.store.StoreEntityCache import StoreEntityCache
 from sdk_entrepot_gpf.store.interface.CsfInterface import CsfInterface
 from sdk_entrepot_gpf.store.interface.LogsInterface import LogsInterface
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
@@ -36,6 +37,8 @@ class ProcessingExecution(CsfInterface, LogsInterface, StoreEntity):
             method=ApiRequester.POST,
             route_params={self._entity_name: self.id, "datastore": self.datastore},
         )
+        # Le statut en cache n'est plus à jour
+        StoreEntityCache().invalidate(self._entity_name, self.datastore, self.id)
 
     def api_abort(self) -> None:
         """Annule l'exécution du traitement sur l'API."""
@@ -48,6 +51,8 @@ class ProcessingExecution(CsfInterface, LogsInterface, StoreEntity):
             method=ApiRequester.POST,
             route_params={self._entity_name: self.id, "datastore": self.datastore},
         )
+        # Le statut en cache n'est plus à jour
+        StoreEntityCache().invalidate(self._entity_name, self.datastore, self.id)
 
     @property
     def launch(self) -> Optional[datetime]:
@@ -1,14 +1,17 @@
 import json
 from abc import ABC
 import time
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, TypeVar
 from datetime import datetime
 from dateutil import parser
 
 from sdk_entrepot_gpf.helper.DictHelper import DictHelper
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import NotFoundError
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
+from sdk_entrepot_gpf.store.StoreEntityCache import StoreEntityCache
 
 T = TypeVar("T", bound="StoreEntity")
 
@@ -34,6 +37,8 @@ class StoreEntity(ABC):
         """Classe instanciée à partir de la représentation envoyée par l'API d'une entité."""
         self._store_api_dict: Dict[str, Any] = store_api_dict
         self._datastore: Optional[str] = datastore
+        # Entité issue d'un listing (seuls certains champs sont renseignés) : complétée à la demande
+        self._partial: bool = False
 
     ##############################################################
     # Propriétés d'accès
@@ -48,6 +53,15 @@ class StoreEntity(ABC):
         """
         return str(self._store_api_dict["_id"])
 
+    @property
+    def is_partial(self) -> bool:
+        """Indique si l'entité est partielle (issue d'un listing et pas encore complétée).
+
+        Returns:
+            True si seuls certains champs de l'entité sont connus
+        """
+        return self._partial
+
     @property
     def datastore(self) -> Optional[str]:
         """Renvoie l'identifiant du datastore de l'entité
@@ -66,9 +80,9 @@ class StoreEntity(ABC):
         Returns:
             Propriétés de l'entité (sous la même forme que celle renvoyée par l'API)
         """
-        # Si keeps est défini, on retourne seulement les propriétés demandées en gérant les erreurs
+        # Si keeps est défini, on retourne seulement les propriétés demandées en gérant les erreurs (sans compléter l'entité)
         if keeps:
-            return {k: self.get(k) for k in keeps}
+            return {k: DictHelper.get(self._store_api_dict, k, raise_error=False) for k in keeps}
         # Sinon, on retourne toutes les propriétés
         return self._store_api_dict
 
@@ -113,8 +127,8 @@ class StoreEntity(ABC):
             method=ApiRequester.POST,
             data=data,
         )
-        # Instanciation
-        return cls(o_response.json(), datastore=s_datastore)
+        # Instanciation (et mise en cache)
+        return StoreEntityCache().put(cls(o_response.json(), datastore=s_datastore))
 
     @classmethod
     def api_get(cls: Type[T], id_: str, datastore: Optional[str] = None) -> T:
@@ -127,6 +141,10 @@ class StoreEntity(ABC):
         Returns:
             (StoreEntity): L'entité instanciée correspondante
         """
+        # Si l'entité est en cache (et n'a pas expiré), on la renvoie directement
+        o_cached = StoreEntityCache().get(cls._entity_name, datastore, id_)
+        if isinstance(o_cached, cls):
+            return o_cached
         # Génération du nom de la route
         s_route = f"{cls._entity_name}_get"
         # Requête
@@ -134,25 +152,21 @@ class StoreEntity(ABC):
             s_route,
             route_params={"datastore": datastore, cls._entity_name: id_},
         )
-        # Instanciation
-        return cls(o_response.json(), datastore)
+        # Instanciation (et mise en cache)
+        return StoreEntityCache().put(cls(o_response.json(), datastore))
 
     @classmethod
-    def api_list(cls: Type[T], infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, page: Optional[int] = None, datastore: Optional[str] = None) -> List[T]:
-        """Liste les entités de l'API respectant les paramètres donnés.
+    def _list_params(cls, infos_filter: Optional[Dict[str, str]] = None, tags_filter: Optional[Dict[str, str]] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Construit les paramètres d'une requête de listing.
 
         Args:
             infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
             tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
-            page: Numéro page à récupérer, toutes si None.
-            datastore: Identifiant du datastore
+            fields: Champs à renvoyer en plus de l'identifiant (par défaut ceux de la classe)
 
         Returns:
-            (List[StoreEntity]): liste des entités retournées par l'API
+            Dict[str, Any]: paramètres de la requête (hors `page` et `limit`)
         """
-        # Nombre d'éléments max à lister par requête
-        i_limit = Config().get_int("store_api", "nb_limit")
-
         # Gestion des paramètres nuls
         infos_filter = infos_filter if infos_filter is not None else {}
         tags_filter = tags_filter if tags_filter is not None else {}
@@ -161,39 +175,105 @@ class StoreEntity(ABC):
         d_params: Dict[str, Any] = {**infos_filter, **{f"tags[{k}]": v for k, v in tags_filter.items()}}
 
         # Ajout des champs supplémentaires si nécessaires
-        if cls._entity_fields is not None:
+        if fields is not None:
+            d_params["fields"] = fields
+        elif cls._entity_fields is not None:
             d_params["fields"] = cls._entity_fields.split(",")
+        return d_params
+
+    @classmethod
+    def _from_list_item(cls: Type[T], store_api_dict: Dict[str, Any], datastore: Optional[str] = None) -> T:
+        """Instancie une entité partielle à partir d'un élément de listing (en réutilisant l'entité complète en cache).
+
+        Args:
+            store_api_dict: Propriétés de l'entité renvoyées par le listing
+            datastore: Identifiant du datastore
+
+        Returns:
+            (StoreEntity): entité (complétée à la demande si un champ manquant est demandé)
+        """
+        o_entity = cls(store_api_dict, datastore)
+        o_entity._partial = True
+        return StoreEntityCache().put(o_entity, full=False)
+
+    @classmethod
+    def api_list(
+        cls: Type[T],
+        infos_filter: Optional[Dict[str, str]] = None,
+        tags_filter: Optional[Dict[str, str]] = None,
+        page: Optional[int] = None,
+        datastore: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[T]:
+        """Liste les entités de l'API respectant les paramètres donnés.
+
+        Les entités renvoyées sont partielles : seuls l'identifiant et les champs demandés (`fields`, par
+        défaut ceux de la classe) sont connus. Le reste est récupéré à la demande, lors de l'accès à une
+        clef absente via `entity[clef]` ou `entity.get(clef)`.
+
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+            page: Numéro page à récupérer, toutes si None.
+            datastore: Identifiant du datastore
+            fields: Champs à récupérer pour chaque entité (par défaut ceux de la classe)
+
+        Returns:
+            (List[StoreEntity]): liste des entités retournées par l'API
+        """
+        # Paramètres de la requête (filtres et champs)
+        d_params = cls._list_params(infos_filter, tags_filter, fields)
 
         # Génération du nom de la route
         s_route = f"{cls._entity_name}_list"
 
-        # Liste pour stocker les entités
-        l_entities: List[T] = []
+        d_route_params = {"datastore": datastore}
 
-        # Numéro de la page demandée
-        i_page = 1 if page is None else page
+        if page is None:
+            # Toutes les pages (éventuellement récupérées en parallèle, cf. `store_api.nb_parallel_pages`)
+            l_items = ApiRequester().route_request_pages(s_route, route_params=d_route_params, params=d_params)
+        else:
+            # On liste les entités à la page demandée
+            i_limit = Config().get_int("store_api", "nb_limit")
+            l_items = ApiRequester().route_request(s_route, route_params=d_route_params, params={**d_params, **{"page": page, "limit": i_limit}}).json()
 
-        # Flag indiquant s'il faut requêter la prochaine page
-        b_next_page = True
-
-        # On requête tant qu'on est à la page spécifiquement demandée ou qu'on veut toutes les pages et que la dernière n'était pas vide
-        while i_page == page or (page is None and b_next_page is True):
-            # On liste les entités à la bonne page
-            o_response = ApiRequester().route_request(
-                s_route,
-                route_params={"datastore": datastore},
-                params={**d_params, **{"page": i_page, "limit": i_limit}},
-            )
-            # On les ajoute à la liste
-            l_entities += [cls(i, datastore) for i in o_response.json()]
-            # On regarde le Content-Range de la réponse pour savoir si on doit refaire une requête pour récupérer la fin
-            b_next_page = ApiRequester.range_next_page(o_response.headers.get("Content-Range"), len(l_entities))
-            # On passe à la page suivante
-            i_page += 1
+        # On instancie les entités (en réutilisant les entités complètes en cache)
+        l_entities = [cls._from_list_item(i, datastore) for i in l_items]
 
         # On renvoie la liste des entités récupérées
         return l_entities
 
+    @classmethod
+    def api_iter(
+        cls: Type[T],
+        infos_filter: Optional[Dict[str, str]] = None,
+        tags_filter: Optional[Dict[str, str]] = None,
+        datastore: Optional[str] = None,
+        page_size: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[T]:
+        """Parcourt les entités de l'API respectant les paramètres donnés, page par page.
+
+        Contrairement à `api_list`, les entités sont renvoyées au fur et à mesure : la page suivante
+        est demandée (en arrière-plan) pendant que l'appelant traite la page courante.
+
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+            datastore: Identifiant du datastore
+            page_size: Nombre d'entités par page (par défaut `store_api.nb_limit`, éventuellement adaptée)
+            fields: Champs à récupérer pour chaque entité (par défaut ceux de la classe)
+
+        Yields:
+            (StoreEntity): entités retournées par l'API
+        """
+        d_params = cls._list_params(infos_filter, tags_filter, fields)
+        s_route = f"{cls._entity_name}_list"
+        # La taille de page est adaptative si elle n'est pas indiquée (cf. `AdaptivePageSize`)
+        for l_items in ApiRequester().route_request_iter_pages(s_route, route_params={"datastore": datastore}, params=d_params, limit=page_size, prefetch=True):
+            for d_item in l_items:
+                yield cls._from_list_item(d_item, datastore)
+
     def api_delete(self) -> None:
         """Supprime l'entité de l'API."""
         s_route = f"{self._entity_name}_delete"
@@ -203,6 +283,8 @@ class StoreEntity(ABC):
             method=ApiRequester.DELETE,
             route_params={"datastore": self.datastore, self._entity_name: self.id},
         )
+        # L'entité n'existe plus : on l'oublie
+        StoreEntityCache().invalidate(self._entity_name, self.datastore, self.id)
 
     def api_update(self) -> None:
         """Met à jour l'instance Python représentant l'entité en récupérant les infos à jour sur l'API.
@@ -211,12 +293,81 @@ class StoreEntity(ABC):
         # Génération du nom de la route
         s_route = f"{self._entity_name}_get"
         # Requête
-        o_response = ApiRequester().route_request(
-            s_route,
-            route_params={"datastore": self.datastore, self._entity_name: self.id},
-        )
+        try:
+            o_response = ApiRequester().route_request(
+                s_route,
+                route_params={"datastore": self.datastore, self._entity_name: self.id},
+            )
+        except NotFoundError:
+            # L'entité n'existe plus : on l'oublie
+            StoreEntityCache().invalidate(self._entity_name, self.datastore, self.id)
+            raise
         # Mise à jour du stockage local
         self._store_api_dict = o_response.json()
+        self._partial = False
+        # Rafraîchissement du cache
+        StoreEntityCache().put(self)
+
+    ##############################################################
+    # Fonctions asynchrones d'interface avec l'API
+    ##############################################################
+
+    @classmethod
+    async def aapi_create(cls: Type[T], data: Optional[Dict[str, Any]], route_params: Optional[Dict[str, Any]] = None) -> T:
+        """Version asynchrone de `api_create`.
+
+        Args:
+            data: Données nécessaires pour la création.
+            route_params: Paramètres de résolution de la route.
+
+        Returns:
+            (StoreEntity): Entité créée
+        """
+        return await AsyncApiRequester().run(cls.api_create, data, route_params)
+
+    @classmethod
+    async def aapi_get(cls: Type[T], id_: str, datastore: Optional[str] = None) -> T:
+        """Version asynchrone de `api_get`.
+
+        Args:
+            id_: Identifiant de l'entité
+            datastore: Identifiant du datastore
+
+        Returns:
+            (StoreEntity): L'entité instanciée correspondante
+        """
+        return await AsyncApiRequester().run(cls.api_get, id_, datastore)
+
+    @classmethod
+    async def aapi_list(
+        cls: Type[T],
+        infos_filter: Optional[Dict[str, str]] = None,
+        tags_filter: Optional[Dict[str, str]] = None,
+        page: Optional[int] = None,
+        datastore: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[T]:
+        """Version asynchrone de `api_list`.
+
+        Args:
+            infos_filter: Filtres sur les attributs sous la forme `{"nom_attribut": "valeur_attribut"}`
+            tags_filter: Filtres sur les tags sous la forme `{"nom_tag": "valeur_tag"}`
+            page: Numéro page à récupérer, toutes si None.
+            datastore: Identifiant du datastore
+            fields: Champs à récupérer pour chaque entité (par défaut ceux de la classe)
+
+        Returns:
+            (List[StoreEntity]): liste des entités retournées par l'API
+        """
+        return await AsyncApiRequester().run(cls.api_list, infos_filter, tags_filter, page, datastore, fields)
+
+    async def aapi_delete(self) -> None:
+        """Version asynchrone de `api_delete`."""
+        await AsyncApiRequester().run(self.api_delete)
+
+    async def aapi_update(self) -> None:
+        """Version asynchrone de `api_update`."""
+        await AsyncApiRequester().run(self.api_update)
 
     @staticmethod
     def filter_dict_from_str(filters: Optional[str]) -> Dict[str, str]:
@@ -334,6 +485,9 @@ class StoreEntity(ABC):
     def __getitem__(self, key: str) -> Any:
         # La classe se comporte comme un dictionnaire
         # et permet de récupérer les info de _store_api_dict
+        if key not in self._store_api_dict:
+            # Entité partielle : on la complète avant de conclure que la clef n'existe pas
+            self._hydrate()
         return self._store_api_dict[key]
 
     def get(self, key: str) -> Any:
@@ -345,7 +499,18 @@ class StoreEntity(ABC):
         Returns:
             Any: valeur demandée ou None si non trouvée.
         """
-        return DictHelper.get(self._store_api_dict, key, raise_error=False)
+        o_value = DictHelper.get(self._store_api_dict, key, raise_error=False)
+        if o_value is None and self._partial:
+            # Entité partielle : on la complète avant de conclure que la clef n'existe pas
+            self._hydrate()
+            o_value = DictHelper.get(self._store_api_dict, key, raise_error=False)
+        return o_value
+
+    def _hydrate(self) -> None:
+        """Complète l'entité (une seule fois) si elle est partielle."""
+        if self._partial:
+            Config().om.debug(f"Récupération complète de {self}")
+            self.api_update()
 
     ##############################################################
     # Fonction test d'égalité
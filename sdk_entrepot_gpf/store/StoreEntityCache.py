@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple, TypeVar
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.pattern.Singleton import Singleton
+
+if TYPE_CHECKING:
+    from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
+
+E = TypeVar("E", bound="StoreEntity")
+
+
+class StoreEntityCache(metaclass=Singleton):
+    """Cache mémoire des entités (identity map) partagé par toutes les classes filles de `StoreEntity`.
+
+    Les entités sont indexées par (type d'entité, datastore, identifiant) : tant que l'entrée n'a pas expiré
+    (`store_api.entity_cache_ttl` secondes), `api_get` renvoie la même instance sans requêter l'API.
+    Le cache est borné (`store_api.entity_cache_size` entités, les moins récemment utilisées sont oubliées)
+    et désactivé si `entity_cache_ttl` vaut 0 (valeur par défaut).
+
+    Les entités issues d'un listing sont partielles (seuls quelques champs sont renvoyés par l'API) : elles
+    sont conservées mais ne sont pas renvoyées par `get` tant qu'elles n'ont pas été complétées (`api_update`).
+    """
+
+    def __init__(self) -> None:
+        self.__ttl = Config().get_float("store_api", "entity_cache_ttl", 0)
+        self.__size = Config().get_int("store_api", "entity_cache_size", 1000)
+        # clef => (date d'expiration, entité complète ?, entité)
+        self.__entries: "OrderedDict[Tuple[str, Optional[str], str], Tuple[float, bool, StoreEntity]]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Indique si le cache est actif (durée de vie non nulle)."""
+        return self.__ttl > 0 and self.__size > 0
+
+    @staticmethod
+    def key(entity_name: str, datastore: Optional[str], id_: str) -> Tuple[str, Optional[str], str]:
+        """Calcule la clef d'une entité (le datastore par défaut est celui de la configuration).
+
+        Args:
+            entity_name (str): type d'entité
+            datastore (Optional[str]): identifiant du datastore
+            id_ (str): identifiant de l'entité
+
+        Returns:
+            Tuple[str, Optional[str], str]: clef de l'entité
+        """
+        return (entity_name, datastore or Config().get("store_api", "datastore"), id_)
+
+    def get(self, entity_name: str, datastore: Optional[str], id_: str, partial: bool = False) -> Optional["StoreEntity"]:
+        """Renvoie l'entité en cache si elle n'a pas expiré.
+
+        Args:
+            entity_name (str): type d'entité
+            datastore (Optional[str]): identifiant du datastore
+            id_ (str): identifiant de l'entité
+            partial (bool, optional): si True, renvoie aussi les entités partielles (issues d'un listing)
+
+        Returns:
+            Optional[StoreEntity]: entité en cache ou None
+        """
+        if not self.enabled:
+            return None
+        o_key = StoreEntityCache.key(entity_name, datastore, id_)
+        with self.__lock:
+            if o_key not in self.__entries:
+                return None
+            f_expire, b_full, o_entity = self.__entries[o_key]
+            if f_expire < time.monotonic():
+                del self.__entries[o_key]
+                return None
+            self.__entries.move_to_end(o_key)
+            return o_entity if b_full or partial else None
+
+    def put(self, entity: E, full: bool = True) -> E:
+        """Ajoute (ou rafraîchit) une entité dans le cache.
+
+        Une entité partielle ne remplace pas une entité complète non expirée : les champs listés sont
+        reportés dans l'entité en cache, qui est renvoyée à la place (identity map).
+
+        Args:
+            entity (StoreEntity): entité à conserver
+            full (bool, optional): True si l'entité contient toutes ses propriétés
+
+        Returns:
+            StoreEntity: entité à utiliser
+        """
+        if not self.enabled:
+            return entity
+        o_key = StoreEntityCache.key(entity.entity_name(), entity.datastore, entity.id)
+        f_now = time.monotonic()
+        with self.__lock:
+            if not full and o_key in self.__entries:
+                f_expire, b_full, o_cached = self.__entries[o_key]
+                if b_full and f_expire >= f_now and isinstance(o_cached, type(entity)):
+                    o_cached.get_store_properties().update(entity.get_store_properties())
+                    self.__entries.move_to_end(o_key)
+                    return o_cached
+            self.__entries[o_key] = (f_now + self.__ttl, full, entity)
+            self.__entries.move_to_end(o_key)
+            while len(self.__entries) > self.__size:
+                self.__entries.popitem(last=False)
+        return entity
+
+    def invalidate(self, entity_name: str, datastore: Optional[str], id_: str) -> None:
+        """Oublie une entité (suite à une modification ou une suppression).
+
+        Args:
+            entity_name (str): type d'entité
+            datastore (Optional[str]): identifiant du datastore
+            id_ (str): identifiant de l'entité
+        """
+        with self.__lock:
+            self.__entries.pop(StoreEntityCache.key(entity_name, datastore, id_), None)
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self.__lock:
+            self.__entries.clear()
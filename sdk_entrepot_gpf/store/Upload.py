@@ -2,12 +2,15 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
+from sdk_entrepot_gpf.store.StoreEntityCache import StoreEntityCache
 from sdk_entrepot_gpf.store.interface.TagInterface import TagInterface
 from sdk_entrepot_gpf.store.interface.CommentInterface import CommentInterface
 from sdk_entrepot_gpf.store.interface.SharingInterface import SharingInterface
 from sdk_entrepot_gpf.store.interface.EventInterface import EventInterface
 from sdk_entrepot_gpf.store.interface.PartialEditInterface import PartialEditInterface
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
+from sdk_entrepot_gpf.io.ChunkedUpload import ChunkedUpload
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
 
@@ -36,6 +39,9 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
     def api_push_data_file(self, file_path: Path, api_path: str) -> None:
         """Téléverse via l'API un fichier de données associé à cette Livraison.
 
+        Si la route `upload_push_data_chunk` est définie et que le fichier dépasse `upload.chunk_size`,
+        il est envoyé par morceaux avec reprise (cf. `ChunkedUpload`).
+
         Args:
             file_path: chemin local vers le fichier à envoyer
             api_path: chemin distant du dossier où déposer le fichier
@@ -45,16 +51,47 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
         # Récupération du nom de la clé pour le fichier
         s_file_key = Config().get_str("upload", "push_data_file_key")
 
+        d_route_params = {"datastore": self.datastore, self._entity_name: self.id}
+        d_params = {"path": api_path + "/" + file_path.name}
+
+        # Téléversement par morceaux si la route est définie et que le fichier est gros
+        s_chunk_route = f"{self._entity_name}_push_data_chunk"
+        o_chunked_upload = ChunkedUpload.from_config()
+        if Config().get("routing", s_chunk_route) and o_chunked_upload.is_chunked(file_path):
+            o_chunked_upload.upload(s_chunk_route, file_path, route_params=d_route_params, params=d_params)
+            return
+
         # Requête
         ApiRequester().route_upload_file(
             s_route,
             file_path,
             s_file_key,
-            route_params={"datastore": self.datastore, self._entity_name: self.id},
-            params={"path": api_path + "/" + file_path.name},
+            route_params=d_route_params,
+            params=d_params,
             method=ApiRequester.POST,
         )
 
+    def is_push_data_file_resumable(self, file_path: Path, api_path: str, remote_size: int) -> bool:
+        """Indique si le téléversement par morceaux d'un fichier de données a été interrompu et peut être repris.
+
+        La reprise n'est possible que si la taille du fichier partiel sur l'entrepôt correspond à la position
+        consignée dans le journal local ; sinon le journal est supprimé et le téléversement repartira de zéro.
+
+        Args:
+            file_path: chemin local vers le fichier à envoyer
+            api_path: chemin distant du dossier où déposer le fichier
+            remote_size: taille du fichier partiel sur l'entrepôt (0 s'il est absent)
+
+        Returns:
+            True si des morceaux ont déjà été acquittés par le serveur
+        """
+        s_chunk_route = f"{self._entity_name}_push_data_chunk"
+        o_chunked_upload = ChunkedUpload.from_config()
+        if not Config().get("routing", s_chunk_route) or not o_chunked_upload.is_chunked(file_path):
+            return False
+        d_route_params = {"datastore": self.datastore, self._entity_name: self.id}
+        return o_chunked_upload.resume_offset(s_chunk_route, file_path, remote_size, route_params=d_route_params, params={"path": api_path + "/" + file_path.name}) > 0
+
     def api_delete_data_file(self, api_path: str) -> None:
         """Supprime un fichier de données de la Livraison.
 
@@ -203,3 +240,70 @@ class Upload(TagInterface, CommentInterface, SharingInterface, EventInterface, P
             method=ApiRequester.POST,
             data=check_ids,
         )
+        # Les vérifications en cache ne sont plus à jour
+        StoreEntityCache().invalidate(self._entity_name, self.datastore, self.id)
+
+    async def aapi_push_data_file(self, file_path: Path, api_path: str) -> None:
+        """Version asynchrone de `api_push_data_file`.
+
+        Args:
+            file_path: chemin local vers le fichier à envoyer
+            api_path: chemin distant du dossier où déposer le fichier
+        """
+        await AsyncApiRequester().run(self.api_push_data_file, file_path, api_path)
+
+    async def aapi_delete_data_file(self, api_path: str) -> None:
+        """Version asynchrone de `api_delete_data_file`.
+
+        Args:
+            api_path: chemin distant vers le fichier à supprimer
+        """
+        await AsyncApiRequester().run(self.api_delete_data_file, api_path)
+
+    async def aapi_push_md5_file(self, file_path: Path) -> None:
+        """Version asynchrone de `api_push_md5_file`.
+
+        Args:
+            file_path: chemin local vers le fichier à envoyer
+        """
+        await AsyncApiRequester().run(self.api_push_md5_file, file_path)
+
+    async def aapi_delete_md5_file(self, api_path: str) -> None:
+        """Version asynchrone de `api_delete_md5_file`.
+
+        Args:
+            api_path: chemin distant vers le fichier à supprimer
+        """
+        await AsyncApiRequester().run(self.api_delete_md5_file, api_path)
+
+    async def aapi_open(self) -> None:
+        """Version asynchrone de `api_open`."""
+        await AsyncApiRequester().run(self.api_open)
+
+    async def aapi_close(self) -> None:
+        """Version asynchrone de `api_close`."""
+        await AsyncApiRequester().run(self.api_close)
+
+    async def aapi_tree(self) -> List[Dict[str, Any]]:
+        """Version asynchrone de `api_tree`.
+
+        Returns:
+            Arborescence telle que renvoyée par l'API
+        """
+        return await AsyncApiRequester().run(self.api_tree)
+
+    async def aapi_list_checks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Version asynchrone de `api_list_checks`.
+
+        Returns:
+            Liste des Vérifications demandées (clef `asked`), en cours (`in_progress`), passées (`passed`) et en échec (`failed`)
+        """
+        return await AsyncApiRequester().run(self.api_list_checks)
+
+    async def aapi_run_checks(self, check_ids: List[str]) -> None:
+        """Version asynchrone de `api_run_checks`.
+
+        Args:
+            check_ids: Liste des identifiants des Vérifications à lancer
+        """
+        await AsyncApiRequester().run(self.api_run_checks, check_ids)
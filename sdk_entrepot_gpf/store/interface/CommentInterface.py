@@ -1,5 +1,6 @@
 from typing import Any, Dict, List
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 
 
@@ -69,3 +70,36 @@ class CommentInterface(StoreEntity):
             method=ApiRequester.DELETE,
             route_params={self._entity_name: self.id, "comment": id_, "datastore": self.datastore},
         )
+
+    async def aapi_add_comment(self, comment_data: Dict[str, str]) -> None:
+        """Version asynchrone de `api_add_comment`.
+
+        Args:
+            comment_data (Dict[str, str]): données du commentaire
+        """
+        await AsyncApiRequester().run(self.api_add_comment, comment_data)
+
+    async def aapi_list_comments(self) -> List[Dict[str, Any]]:
+        """Version asynchrone de `api_list_comments`.
+
+        Returns:
+            List[Dict[str, Any]]: liste des commentaires
+        """
+        return await AsyncApiRequester().run(self.api_list_comments)
+
+    async def aapi_edit_comment(self, id_: str, comment_data: Dict[str, str]) -> None:
+        """Version asynchrone de `api_edit_comment`.
+
+        Args:
+            id_ (str): identifiant du commentaire
+            comment_data (Dict[str, str]): données du commentaire
+        """
+        await AsyncApiRequester().run(self.api_edit_comment, id_, comment_data)
+
+    async def aapi_remove_comment(self, id_: str) -> None:
+        """Version asynchrone de `api_remove_comment`.
+
+        Args:
+            id_ (str): identifiant du commentaire
+        """
+        await AsyncApiRequester().run(self.api_remove_comment, id_)
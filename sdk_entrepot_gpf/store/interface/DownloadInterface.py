@@ -3,6 +3,7 @@ from typing import Optional
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 
 
 class DownloadInterface(StoreEntity):
@@ -27,3 +28,12 @@ class DownloadInterface(StoreEntity):
 
         with file_path.open("wb", encoding="UTF-8") as o_out_file:
             o_out_file.write(o_response.content)
+
+    async def aapi_download(self, file_path: Path, datastore: Optional[str] = None) -> None:
+        """Version asynchrone de `api_download`.
+
+        Args:
+            file_path: chemin local où enregistrer le fichier
+            datastore (Optional[str]): id du datastore à utiliser. Defaults to None.
+        """
+        await AsyncApiRequester().run(self.api_download, file_path, datastore)
@@ -2,6 +2,7 @@ from typing import Any, Dict, List
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 
 
 class EventInterface(StoreEntity):
@@ -22,3 +23,11 @@ class EventInterface(StoreEntity):
         )
         l_events: List[Dict[str, Any]] = o_response.json()
         return l_events
+
+    async def aapi_events(self) -> List[Dict[str, Any]]:
+        """Version asynchrone de `api_events`.
+
+        Returns:
+            List[Dict[str, Any]]: liste des événements
+        """
+        return await AsyncApiRequester().run(self.api_events)
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 
 
 class FullEditInterface(StoreEntity):
@@ -33,3 +34,11 @@ class FullEditInterface(StoreEntity):
         d_data = {**self.get_store_properties(), **data_edit}
 
         self.api_full_edit(d_data)
+
+    async def aapi_full_edit(self, data_edit: Dict[str, str]) -> None:
+        """Version asynchrone de `api_full_edit`.
+
+        Args:
+            data_edit (Dict[str, str]): nouvelles valeurs de propriétés
+        """
+        await AsyncApiRequester().run(self.api_full_edit, data_edit)
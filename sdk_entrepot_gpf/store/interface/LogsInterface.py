@@ -1,6 +1,7 @@
 from typing import List
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 
 
 class LogsInterface(StoreEntity):
@@ -15,33 +16,34 @@ class LogsInterface(StoreEntity):
         # Génération du nom de la route
         s_route = f"{self._entity_name}_logs"
 
-        # Numéro de la page
-        i_page = 1
-        # Flag indiquant s'il faut requêter la prochaine page
-        b_next_page = True
-        # nombre de ligne
-        i_limit = 2000
-        # stockage de la liste des logs
-        l_logs: List[str] = []
-
-        # on veut toutes les pages
-        while b_next_page:
-            # On liste les entités à la bonne page
-            o_response = ApiRequester().route_request(
-                s_route,
-                route_params={"datastore": self.datastore, self._entity_name: self.id},
-                params={"page": i_page, "limit": i_limit},
-            )
-            # On les ajoute à la liste
-            l_logs += o_response.json()
-            # On regarde le Content-Range de la réponse pour savoir si on doit refaire une requête pour récupérer la fin
-            b_next_page = ApiRequester.range_next_page(o_response.headers.get("Content-Range"), len(l_logs))
-            # On passe à la page suivante
-            i_page += 1
+        # On récupère toutes les pages (éventuellement en parallèle, cf. `store_api.nb_parallel_pages`)
+        l_logs: List[str] = ApiRequester().route_request_pages(
+            s_route,
+            route_params={"datastore": self.datastore, self._entity_name: self.id},
+            limit=2000,
+        )
 
         # Les logs sont une liste de string, on concatène tout
         return "\n".join(l_logs)
 
+    def api_logs_page(self, page: int, limit: int = 2000) -> List[str]:
+        """Récupère une seule page des logs de cette entité sur l'API.
+
+        Args:
+            page (int): numéro de la page (à partir de 1)
+            limit (int, optional): nombre de lignes par page
+
+        Returns:
+            List[str]: lignes de la page (vide si la page n'existe pas encore)
+        """
+        s_route = f"{self._entity_name}_logs"
+        o_response = ApiRequester().route_request(
+            s_route,
+            route_params={"datastore": self.datastore, self._entity_name: self.id},
+            params={"page": page, "limit": limit},
+        )
+        return list(o_response.json())
+
     def api_logs_filter(self, substring: str) -> List[str]:
         """Récupère les logs de cette entité en renvoyant les lignes contenant la substring passée en paramètre.
 
@@ -53,27 +55,29 @@ class LogsInterface(StoreEntity):
         """
         s_route = f"{self._entity_name}_logs"
 
-        # Numéro de la page
-        i_page = 1
-        # Flag indiquant s'il faut requêter la prochaine page
-        b_next_page = True
-        # nombre de ligne
-        i_limit = 2000
-        # stockage de la liste des logs
-        l_logs: List[str] = []
-
-        # on veut toutes les pages
-        while b_next_page:
-            # On liste les entités à la bonne page
-            o_response = ApiRequester().route_request(
-                s_route,
-                route_params={"datastore": self.datastore, self._entity_name: self.id},
-                params={"page": i_page, "limit": i_limit},
-            )
-            # On les ajoute à la liste
-            l_logs += o_response.json()
-            # On regarde le Content-Range de la réponse pour savoir si on doit refaire une requête pour récupérer la fin
-            b_next_page = ApiRequester.range_next_page(o_response.headers.get("Content-Range"), len(l_logs))
-            # On passe à la page suivante
-            i_page += 1
+        # On récupère toutes les pages (éventuellement en parallèle, cf. `store_api.nb_parallel_pages`)
+        l_logs: List[str] = ApiRequester().route_request_pages(
+            s_route,
+            route_params={"datastore": self.datastore, self._entity_name: self.id},
+            limit=2000,
+        )
         return [s_line for s_line in l_logs if substring in s_line]
+
+    async def aapi_logs(self) -> str:
+        """Version asynchrone de `api_logs`.
+
+        Returns:
+            str: les logs récupérés
+        """
+        return await AsyncApiRequester().run(self.api_logs)
+
+    async def aapi_logs_filter(self, substring: str) -> List[str]:
+        """Version asynchrone de `api_logs_filter`.
+
+        Args:
+            substring: filtres sur les lignes de logs
+
+        Returns:
+            List[str]: listes des lignes renvoyées
+        """
+        return await AsyncApiRequester().run(self.api_logs_filter, substring)
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 
 
 class PartialEditInterface(StoreEntity):
@@ -30,3 +31,11 @@ class PartialEditInterface(StoreEntity):
             data_edit (Dict[str, Any]): nouvelles valeurs de propriétés
         """
         self.api_partial_edit(data_edit)
+
+    async def aapi_partial_edit(self, data_edit: Dict[str, str]) -> None:
+        """Version asynchrone de `api_partial_edit`.
+
+        Args:
+            data_edit (Dict[str, str]): nouvelles valeurs pour les propriétés à modifier
+        """
+        await AsyncApiRequester().run(self.api_partial_edit, data_edit)
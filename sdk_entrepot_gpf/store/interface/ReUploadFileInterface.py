@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 
@@ -32,3 +33,11 @@ class ReUploadFileInterface(StoreEntity):
 
         # Mise à jour du stockage local (_store_api_dict)
         self.api_update()
+
+    async def aapi_re_upload(self, file: Path) -> None:
+        """Version asynchrone de `api_re_upload`.
+
+        Args:
+            file (Path): nom du ficher à upload
+        """
+        await AsyncApiRequester().run(self.api_re_upload, file)
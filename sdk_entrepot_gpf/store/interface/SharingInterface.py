@@ -2,6 +2,7 @@ from typing import Dict, List
 
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 
 
 class SharingInterface(StoreEntity):
@@ -55,3 +56,27 @@ class SharingInterface(StoreEntity):
             route_params={self._entity_name: self.id, "datastore": self.datastore},
             params={"datastores": datastore_ids},
         )
+
+    async def aapi_add_sharings(self, datastore_ids: List[str]) -> None:
+        """Version asynchrone de `api_add_sharings`.
+
+        Args:
+            datastore_ids (List[str]): liste des identifiants des datastore avec qui partager l'entité
+        """
+        await AsyncApiRequester().run(self.api_add_sharings, datastore_ids)
+
+    async def aapi_list_sharings(self) -> List[Dict[str, str]]:
+        """Version asynchrone de `api_list_sharings`.
+
+        Returns:
+            List[Dict[str, str]]: Liste des datastore {id_ et name}
+        """
+        return await AsyncApiRequester().run(self.api_list_sharings)
+
+    async def aapi_remove_sharings(self, datastore_ids: List[str]) -> None:
+        """Version asynchrone de `api_remove_sharings`.
+
+        Args:
+            datastore_ids (List[str]): liste des identifiants des datastore à retirer du partage
+        """
+        await AsyncApiRequester().run(self.api_remove_sharings, datastore_ids)
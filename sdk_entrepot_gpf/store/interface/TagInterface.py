@@ -2,7 +2,9 @@ from typing import Dict, List
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
+from sdk_entrepot_gpf.store.StoreEntityCache import StoreEntityCache
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
 
 
 class TagInterface(StoreEntity):
@@ -15,6 +17,9 @@ class TagInterface(StoreEntity):
         Raises :
             StoreEntityError : si le tag n'existe pas
         """
+        # Entité partielle sans le tag : on la complète
+        if tag_name not in self._store_api_dict.get("tags", {}):
+            self._hydrate()
         # On vérifie que l'entité a bien une propriété tags et le tag souhaité
         if "tags" in self._store_api_dict and tag_name in self._store_api_dict["tags"]:
             return str(self._store_api_dict["tags"][tag_name])
@@ -39,6 +44,8 @@ class TagInterface(StoreEntity):
             route_params={self._entity_name: self.id, "datastore": self.datastore},
             data=tags_data,
         )
+        # Les tags en cache ne sont plus à jour
+        StoreEntityCache().invalidate(self._entity_name, self.datastore, self.id)
 
     def api_remove_tags(self, tag_keys: List[str]) -> None:
         """Supprime des tags de l'entité.
@@ -56,3 +63,21 @@ class TagInterface(StoreEntity):
             # dans les paramètres (params), on met en clé "tag[]" et en valeur la liste des tags :
             params={"tags[]": tag_keys},
         )
+        # Les tags en cache ne sont plus à jour
+        StoreEntityCache().invalidate(self._entity_name, self.datastore, self.id)
+
+    async def aapi_add_tags(self, tags_data: Dict[str, str]) -> None:
+        """Version asynchrone de `api_add_tags`.
+
+        Args:
+            tags_data (Dict[str, str]): liste des clés/valeurs à ajouter
+        """
+        await AsyncApiRequester().run(self.api_add_tags, tags_data)
+
+    async def aapi_remove_tags(self, tag_keys: List[str]) -> None:
+        """Version asynchrone de `api_remove_tags`.
+
+        Args:
+            tag_keys (List[str]): liste des clés des tags à supprimer
+        """
+        await AsyncApiRequester().run(self.api_remove_tags, tag_keys)
@@ -0,0 +1,198 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class StatusPoller:
+    """Suivi centralisé de l'état de plusieurs entités (livraisons, exécutions de traitement...).
+
+    Chaque entité suivie est décrite par une fonction de mise à jour (qui renvoie son état), une fonction
+    indiquant si l'état est final et une callback. À chaque tour, les entités dont c'est le moment sont mises
+    à jour ensemble (en parallèle si `nb_workers` > 1), puis on attend la prochaine entité à mettre à jour :
+    un seul thread suit toutes les entités.
+
+    Les mises à jour sont adaptatives : une entité est mise à jour toutes les `interval` secondes juste après
+    son ajout ou un changement d'état, puis, si son état n'a pas changé depuis `nb_checks_before_backoff` mises à
+    jour, de moins en moins souvent (intervalle multiplié par `backoff_factor` à chaque fois, limité à
+    `max_interval` secondes). Si la fin de l'entité peut être estimée (fonction `remaining` de `add()`, par exemple
+    à partir de la durée des exécutions passées d'un traitement), l'entité n'est pas mise à jour plus souvent
+    que nécessaire avant la fin estimée : le délai est alors la moitié du temps restant (limité à `max_interval`).
+
+    Le suivi peut être interrompu (ctrl-C) puis repris en rappelant `run()` : l'état de chaque entité est conservé.
+
+    Attributes:
+        interval (float): nombre de secondes entre deux mises à jour d'une entité
+        max_interval (float): nombre maximum de secondes entre deux mises à jour d'une entité
+        nb_checks_before_backoff (int): nombre de mises à jour sans changement avant d'espacer les mises à jour
+        backoff_factor (float): facteur d'espacement des mises à jour d'une entité dont l'état ne change pas
+        nb_workers (int): nombre de mises à jour effectuées simultanément
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        max_interval: Optional[float] = None,
+        nb_checks_before_backoff: int = 0,
+        nb_workers: int = 1,
+        backoff_factor: float = 2.0,
+    ) -> None:
+        self.interval = interval
+        self.max_interval = max(interval, max_interval) if max_interval is not None else interval
+        self.nb_checks_before_backoff = nb_checks_before_backoff
+        self.backoff_factor = max(1.0, backoff_factor)
+        self.nb_workers = nb_workers
+        # entités suivies (clef => description et état du suivi)
+        self.__entities: Dict[Hashable, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_config(cls, section: str) -> "StatusPoller":
+        """Instancie le suivi selon la configuration de la section indiquée (`upload` ou `processing_execution`).
+
+        Args:
+            section (str): section de la configuration
+
+        Returns:
+            StatusPoller: suivi paramétré
+        """
+        return cls(
+            interval=Config().get_int(section, "nb_sec_between_check_updates"),
+            max_interval=Config().get_int(section, "max_sec_between_check_updates", 0),
+            nb_checks_before_backoff=Config().get_int(section, "nb_checks_before_backoff", 0),
+            nb_workers=Config().get_int(section, "nb_workers_check_updates", 1),
+            backoff_factor=Config().get_float(section, "backoff_factor", 2.0),
+        )
+
+    def add(
+        self,
+        key: Hashable,
+        refresh: Callable[[], Any],
+        is_finished: Callable[[Any], bool],
+        callback: Optional[Callable[[Any], None]] = None,
+        on_change_only: bool = False,
+        remaining: Optional[Callable[[Any], Optional[float]]] = None,
+    ) -> None:
+        """Ajoute une entité à suivre.
+
+        Args:
+            key (Hashable): clef de l'entité (unique)
+            refresh (Callable[[], Any]): fonction de mise à jour, renvoie l'état de l'entité
+            is_finished (Callable[[Any], bool]): indique si l'état est final (l'entité n'est alors plus mise à jour)
+            callback (Optional[Callable[[Any], None]], optional): fonction appelée avec l'état après chaque mise à jour
+            on_change_only (bool, optional): si True, la callback n'est appelée que si l'état a changé
+            remaining (Optional[Callable[[Any], Optional[float]]], optional): estimation du nombre de secondes avant
+                un état final selon l'état (None si inconnu)
+        """
+        self.__entities[key] = {
+            "refresh": refresh,
+            "is_finished": is_finished,
+            "callback": callback,
+            "on_change_only": on_change_only,
+            "remaining": remaining,
+            "state": None,
+            "nb_checks": 0,
+            "nb_unchanged": 0,
+            "finished": False,
+            "next_check": 0.0,
+        }
+
+    @property
+    def pending(self) -> List[Hashable]:
+        """Clefs des entités dont l'état n'est pas final."""
+        return [o_key for o_key, d_entity in self.__entities.items() if not d_entity["finished"]]
+
+    def state(self, key: Hashable) -> Any:
+        """Renvoie le dernier état connu d'une entité.
+
+        Args:
+            key (Hashable): clef de l'entité
+
+        Returns:
+            Any: dernier état (None si l'entité n'a pas encore été mise à jour)
+        """
+        return self.__entities[key]["state"]
+
+    def run(self) -> Dict[Hashable, Any]:
+        """Met à jour les entités jusqu'à ce qu'elles soient toutes dans un état final.
+
+        Returns:
+            Dict[Hashable, Any]: état final de chaque entité
+        """
+        while True:
+            f_now = time.monotonic()
+            l_due = [o_key for o_key in self.pending if self.__entities[o_key]["next_check"] <= f_now]
+            self.__check(l_due)
+            l_pending = self.pending
+            if not l_pending:
+                break
+            # On attend la prochaine entité à mettre à jour
+            f_next_check = min(self.__entities[o_key]["next_check"] for o_key in l_pending)
+            time.sleep(max(0.0, f_next_check - time.monotonic()))
+        return {o_key: d_entity["state"] for o_key, d_entity in self.__entities.items()}
+
+    def __check(self, keys: List[Hashable]) -> None:
+        """Met à jour ensemble les entités indiquées.
+
+        Args:
+            keys (List[Hashable]): clefs des entités à mettre à jour
+        """
+        if self.nb_workers > 1 and len(keys) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.nb_workers, len(keys))) as o_executor:
+                for o_key, o_state in zip(keys, o_executor.map(self.__refresh, keys)):
+                    self.__update(o_key, o_state)
+        else:
+            for o_key in keys:
+                self.__update(o_key, self.__refresh(o_key))
+
+    def __update(self, key: Hashable, state: Any) -> None:
+        """Enregistre le nouvel état d'une entité, appelle sa callback et planifie sa prochaine mise à jour.
+
+        Les états sont enregistrés au fur et à mesure : une interruption pendant un tour ne perd pas les mises à jour déjà faites.
+
+        Args:
+            key (Hashable): clef de l'entité
+            state (Any): nouvel état de l'entité
+        """
+        d_entity = self.__entities[key]
+        b_changed = d_entity["nb_checks"] == 0 or state != d_entity["state"]
+        d_entity["state"] = state
+        d_entity["nb_checks"] += 1
+        d_entity["nb_unchanged"] = 0 if b_changed else d_entity["nb_unchanged"] + 1
+        if d_entity["callback"] is not None and (b_changed or not d_entity["on_change_only"]):
+            d_entity["callback"](state)
+        if d_entity["is_finished"](state):
+            d_entity["finished"] = True
+        else:
+            f_remaining = d_entity["remaining"](state) if d_entity["remaining"] is not None else None
+            d_entity["next_check"] = time.monotonic() + self._next_interval(d_entity["nb_unchanged"], f_remaining)
+
+    def __refresh(self, key: Hashable) -> Any:
+        """Met à jour une entité.
+
+        Args:
+            key (Hashable): clef de l'entité
+
+        Returns:
+            Any: nouvel état de l'entité
+        """
+        return self.__entities[key]["refresh"]()
+
+    def _next_interval(self, nb_unchanged: int, remaining: Optional[float] = None) -> float:
+        """Calcule le délai avant la prochaine mise à jour d'une entité.
+
+        Args:
+            nb_unchanged (int): nombre de mises à jour successives sans changement d'état
+            remaining (Optional[float], optional): estimation du nombre de secondes avant un état final
+
+        Returns:
+            float: délai en secondes
+        """
+        f_interval = float(self.interval)
+        if self.nb_checks_before_backoff > 0 and nb_unchanged >= self.nb_checks_before_backoff:
+            i_exponent = min(nb_unchanged - self.nb_checks_before_backoff + 1, 64)
+            f_interval = min(self.interval * self.backoff_factor**i_exponent, self.max_interval)
+        # Fin estimée lointaine : on se rapproche de moitié en moitié
+        if remaining is not None and remaining / 2 > f_interval:
+            f_interval = min(remaining / 2, self.max_interval)
+        return float(f_interval)
@@ -1,4 +1,7 @@
+import hashlib
 import json
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
@@ -9,6 +12,7 @@ from sdk_entrepot_gpf.helper.JsonHelper import JsonHelper
 from sdk_entrepot_gpf.store.ProcessingExecution import ProcessingExecution
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.workflow.Errors import WorkflowError
+from sdk_entrepot_gpf.workflow.WorkflowJournal import WorkflowJournal
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.workflow.action.ActionAbstract import ActionAbstract
 from sdk_entrepot_gpf.workflow.action.CopyConfigurationAction import CopyConfigurationAction
@@ -37,9 +41,17 @@ class Workflow:
     Attributes:
         __name (str): Nom du workflow
         __raw_definition_dict (dict): Définition du workflow
+        __journal (Optional[WorkflowJournal]): journal d'exécution (actions terminées, reprise)
     """
 
-    def __init__(self, name: str, raw_dict: Dict[str, Any]) -> None:
+    # états d'une étape lancée par run_all()
+    STEP_SUCCESS = "SUCCESS"
+    STEP_FAILED = "FAILED"
+    STEP_SKIPPED = "SKIPPED"
+    # état propre à chaque thread secondaire : arrêt demandé (partagé avec les lancements imbriqués) et arrêt déjà transmis
+    __thread_state = threading.local()
+
+    def __init__(self, name: str, raw_dict: Dict[str, Any], journal: Optional[WorkflowJournal] = None) -> None:
         """La classe est instanciée à partir d'un nom et d'une représentation du workflow.
 
         La représentation du workflow peut provenir par exemple d'un fichier JSON.
@@ -47,9 +59,11 @@ class Workflow:
         Args:
             name (str) : Nom du workflow
             raw_dict (dict): Workflow non résolu
+            journal (Optional[WorkflowJournal]): journal d'exécution (enregistrement des actions terminées et reprise). Defaults to None.
         """
         self.__name = name
         self.__raw_definition_dict = raw_dict
+        self.__journal = journal
         self.__datastore = raw_dict["datastore"] if "datastore" in raw_dict else None
 
     def get_raw_dict(self) -> Dict[str, Any]:
@@ -90,17 +104,60 @@ class Workflow:
             List[StoreEntity]: liste des entités créées
         """
         Config().om.info(f"Lancement de l'étape {step_name}...")
+        if self.__journal is not None:
+            self.__journal.start_step(step_name)
         # si compatibility_cartes n'est pas déterminé on récupère la valeur dans le workflow ou None
         if compatibility_cartes is None:
             compatibility_cartes = self.__raw_definition_dict.get("compatibility_cartes")
-        # Création d'une liste pour stocker les entités créées
-        l_store_entity: List[StoreEntity] = []
         # Récupération de l'étape dans la définition de workflow (datastore forcé, sinon datastore du workflow/None)
         d_step_definition = self.__get_step_definition(step_name, comments, tags, datastore if datastore else self.__datastore)
+        # Itérations lancées en parallèle si demandé
+        i_iter_parallel = int(d_step_definition.get("iter_parallel", 1))
+        if "iter_vals" in d_step_definition and i_iter_parallel > 1 and d_step_definition["actions"]:
+            return self.__run_iterations(step_name, d_step_definition, i_iter_parallel, callback, ctrl_c_action, behavior, datastore, compatibility_cartes)
+        return self.__run_actions(step_name, d_step_definition, d_step_definition["actions"], callback, ctrl_c_action, behavior, datastore, compatibility_cartes)
+
+    def __run_actions(
+        self,
+        step_name: str,
+        step_definition: Dict[str, Any],
+        actions: List[Dict[str, Any]],
+        callback: Optional[Callable[[ProcessingExecution], None]],
+        ctrl_c_action: Optional[Callable[[], bool]],
+        behavior: Optional[str],
+        datastore: Optional[str],
+        compatibility_cartes: Optional[bool],
+        first_index: int = 0,
+    ) -> List[StoreEntity]:
+        """Lance à la suite les actions indiquées d'une étape (chaque action étant la parente de la suivante).
+
+        Avec un journal en mode reprise, les premières actions déjà terminées ne sont pas relancées.
+
+        Args:
+            step_name (str): nom de l'étape
+            step_definition (Dict[str, Any]): définition de l'étape
+            actions (List[Dict[str, Any]]): définition des actions à lancer
+            callback (Optional[Callable[[ProcessingExecution], None]]): callback de suivi si création d'une exécution de traitement.
+            ctrl_c_action (Optional[Callable[[], bool]]): gestion du ctrl-C lors d'une exécution de traitement.
+            behavior (Optional[str]): comportement à adopter si une entité existe déjà sur l'entrepôt.
+            datastore (Optional[str]): id du datastore forcé
+            compatibility_cartes (Optional[bool]): ajout des tags pour compatibilité avec cartes.gouv.fr.
+            first_index (int, optional): numéro de la première action dans l'étape (itérations). Defaults to 0.
+
+        Raises:
+            WorkflowError: levée si une exécution de traitement ne s'est pas bien passée
+
+        Returns:
+            List[StoreEntity]: liste des entités créées
+        """
+        # Création d'une liste pour stocker les entités créées
+        l_store_entity: List[StoreEntity] = []
         # initialisation des actions parentes
         o_parent_action: Optional[ActionAbstract] = None
+        # journal à consulter (reprise) tant que les actions sont terminées
+        o_resume_journal = self.__journal if self.__journal is not None and self.__journal.resume else None
         # Pour chaque action définie dans le workflow, instanciation de l'objet Action puis création sur l'entrepôt
-        for d_action_raw in d_step_definition["actions"]:
+        for i_index, d_action_raw in enumerate(actions, first_index):
             # création de l'action
             o_action = Workflow.generate(step_name, d_action_raw, o_parent_action, behavior, compatibility_cartes)
             # choix du datastore
@@ -109,7 +166,17 @@ class Workflow:
             ## sinon datastore du workflow au niveau de l'étape
             ## sinon datastore du workflow au niveau global (self.__datastore)
             # NB: si None il sera récupérer dans la configuration
-            s_use_datastore = datastore if datastore else o_action.definition_dict.get("datastore", d_step_definition.get("datastore", self.__datastore))
+            s_use_datastore = datastore if datastore else o_action.definition_dict.get("datastore", step_definition.get("datastore", self.__datastore))
+            # contexte de résolution de l'action (la définition brute contient encore les paramètres à résoudre)
+            d_context = self.__get_action_context(step_name, step_definition, i_index, s_use_datastore)
+            # action terminée lors d'une exécution précédente (même contexte) : ni résolution ni lancement
+            l_action_entities = o_resume_journal.get_done(step_name, i_index, d_action_raw, d_context) if o_resume_journal is not None else None
+            if l_action_entities is not None:
+                Config().om.info(f"Action '{o_action.workflow_context}-{o_action.index}' déjà terminée (journal), on passe à la suivante.")
+                l_store_entity.extend(l_action_entities)
+                o_parent_action = o_action
+                continue
+            o_resume_journal = None
 
             # résolution
             o_action.resolve(datastore=s_use_datastore)
@@ -118,25 +185,13 @@ class Workflow:
             o_action.run(s_use_datastore)
             # on attend la fin de l'exécution si besoin
             if isinstance(o_action, ProcessingExecutionAction):
-                s_status = o_action.monitoring_until_end(callback=callback, ctrl_c_action=ctrl_c_action)
-                if s_status != ProcessingExecution.STATUS_SUCCESS:
-                    s_error_message = f"L'exécution de traitement {o_action} ne s'est pas bien passée. Sortie {s_status}."
-                    Config().om.error(s_error_message)
-                    raise WorkflowError(s_error_message)
+                Workflow.__wait_processing_execution(o_action, callback, ctrl_c_action)
 
             # On récupère l'entité créée par l'Action
-            if isinstance(o_action, ProcessingExecutionAction):
-                # Ajout de upload et/ou stored_data
-                if o_action.upload is not None:
-                    l_store_entity.append(o_action.upload)
-                if o_action.stored_data is not None:
-                    l_store_entity.append(o_action.stored_data)
-            elif isinstance(o_action, ConfigurationAction):
-                if o_action.configuration is not None:
-                    l_store_entity.append(o_action.configuration)
-            elif isinstance(o_action, OfferingAction):
-                if o_action.offering is not None:
-                    l_store_entity.append(o_action.offering)
+            l_action_entities = Workflow.__get_created_entities(o_action)
+            l_store_entity.extend(l_action_entities)
+            if self.__journal is not None:
+                self.__journal.record(step_name, i_index, d_action_raw, o_action.definition_dict, l_action_entities, d_context)
 
             # Message de fin
             Config().om.info(f"Exécution de l'action '{o_action.workflow_context}-{o_action.index}' : terminée")
@@ -145,6 +200,364 @@ class Workflow:
         # Retour de la liste
         return l_store_entity
 
+    @staticmethod
+    def __wait_processing_execution(action: ProcessingExecutionAction, callback: Optional[Callable[[ProcessingExecution], None]], ctrl_c_action: Optional[Callable[[], bool]]) -> None:
+        """Attend la fin d'une exécution de traitement.
+
+        Args:
+            action (ProcessingExecutionAction): action ayant lancé l'exécution de traitement
+            callback (Optional[Callable[[ProcessingExecution], None]]): callback de suivi de l'exécution de traitement.
+            ctrl_c_action (Optional[Callable[[], bool]]): gestion du ctrl-C lors de l'exécution de traitement.
+
+        Raises:
+            WorkflowError: levée si l'exécution de traitement ne s'est pas bien passée
+        """
+        s_status = action.monitoring_until_end(callback=callback, ctrl_c_action=ctrl_c_action)
+        if s_status != ProcessingExecution.STATUS_SUCCESS:
+            s_error_message = f"L'exécution de traitement {action} ne s'est pas bien passée. Sortie {s_status}."
+            Config().om.error(s_error_message)
+            raise WorkflowError(s_error_message)
+
+    @staticmethod
+    def __get_created_entities(action: ActionAbstract) -> List[StoreEntity]:
+        """Renvoie les entités créées par une action lancée.
+
+        Args:
+            action (ActionAbstract): action lancée
+
+        Returns:
+            List[StoreEntity]: entités créées (upload et/ou donnée stockée, configuration ou offre)
+        """
+        l_store_entity: List[StoreEntity] = []
+        if isinstance(action, ProcessingExecutionAction):
+            # Ajout de upload et/ou stored_data
+            if action.upload is not None:
+                l_store_entity.append(action.upload)
+            if action.stored_data is not None:
+                l_store_entity.append(action.stored_data)
+        elif isinstance(action, ConfigurationAction):
+            if action.configuration is not None:
+                l_store_entity.append(action.configuration)
+        elif isinstance(action, OfferingAction):
+            if action.offering is not None:
+                l_store_entity.append(action.offering)
+        return l_store_entity
+
+    def __get_action_context(self, step_name: str, step_definition: Dict[str, Any], index: int, datastore: Optional[str]) -> Dict[str, Any]:
+        """Renvoie le contexte de résolution d'une action, conservé dans le journal pour la reprise.
+
+        Args:
+            step_name (str): nom de l'étape
+            step_definition (Dict[str, Any]): définition de l'étape
+            index (int): numéro de l'action dans l'étape
+            datastore (Optional[str]): datastore utilisé par l'action (None : celui de la configuration)
+
+        Returns:
+            Dict[str, Any]: datastore utilisé et, pour une étape avec itérations, valeur de l'itération
+        """
+        d_context: Dict[str, Any] = {"datastore": datastore if datastore else Config().get("store_api", "datastore")}
+        if "iter_vals" in step_definition:
+            i_nb_actions = len(self.__raw_definition_dict["workflow"]["steps"][step_name]["actions"])
+            d_context["iter_val"] = step_definition["iter_vals"][index // i_nb_actions]
+        return d_context
+
+    def __run_iterations(
+        self,
+        step_name: str,
+        step_definition: Dict[str, Any],
+        max_parallel: int,
+        callback: Optional[Callable[[ProcessingExecution], None]],
+        ctrl_c_action: Optional[Callable[[], bool]],
+        behavior: Optional[str],
+        datastore: Optional[str],
+        compatibility_cartes: Optional[bool],
+    ) -> List[StoreEntity]:
+        """Lance en parallèle (au plus `max_parallel` à la fois) les actions de chaque itération d'une étape (`iter_parallel`).
+
+        Les actions d'une itération sont lancées à la suite ; une itération en échec n'arrête pas les autres,
+        les itérations en échec sont indiquées à la fin.
+
+        Args:
+            step_name (str): nom de l'étape
+            step_definition (Dict[str, Any]): définition de l'étape (actions de toutes les itérations à la suite)
+            max_parallel (int): nombre maximum d'itérations lancées simultanément
+            callback (Optional[Callable[[ProcessingExecution], None]]): callback de suivi si création d'une exécution de traitement.
+            ctrl_c_action (Optional[Callable[[], bool]]): gestion du ctrl-C lors d'une exécution de traitement.
+            behavior (Optional[str]): comportement à adopter si une entité existe déjà sur l'entrepôt.
+            datastore (Optional[str]): id du datastore forcé
+            compatibility_cartes (Optional[bool]): ajout des tags pour compatibilité avec cartes.gouv.fr.
+
+        Raises:
+            WorkflowError: levée si au moins une itération a échoué
+
+        Returns:
+            List[StoreEntity]: liste des entités créées (dans l'ordre des itérations)
+        """
+        # actions de chaque itération
+        i_nb_actions = len(self.__raw_definition_dict["workflow"]["steps"][step_name]["actions"])
+        d_iterations: Dict[str, List[Dict[str, Any]]] = {}
+        # numéro (dans l'étape) de la première action de chaque itération
+        d_first_index: Dict[str, int] = {}
+        for i_num, o_val in enumerate(step_definition["iter_vals"]):
+            s_iteration = f"{step_name} (itération n°{i_num + 1}" + (f" : {o_val})" if isinstance(o_val, (str, float, int)) else ")")
+            d_iterations[s_iteration] = step_definition["actions"][i_num * i_nb_actions : (i_num + 1) * i_nb_actions]
+            d_first_index[s_iteration] = i_num * i_nb_actions
+        Config().om.info(f"Lancement des {len(d_iterations)} itérations de l'étape {step_name} ({max_parallel} au maximum en même temps)...")
+
+        def run(iteration: str, iteration_callback: Optional[Callable[[ProcessingExecution], None]], iteration_ctrl_c_action: Optional[Callable[[], bool]]) -> List[StoreEntity]:
+            return self.__run_actions(
+                step_name, step_definition, d_iterations[iteration], iteration_callback, iteration_ctrl_c_action, behavior, datastore, compatibility_cartes, d_first_index[iteration]
+            )
+
+        d_results: Dict[str, List[StoreEntity]] = {}
+        d_status: Dict[str, str] = {}
+        Workflow.__run_parallel({s_iteration: [] for s_iteration in d_iterations}, run, max_parallel, callback, ctrl_c_action, d_results, d_status)
+        l_failed = [s_iteration for s_iteration, s_status in d_status.items() if s_status == Workflow.STEP_FAILED]
+        if l_failed:
+            s_error_message = f"{len(l_failed)} itération(s) sur {len(d_iterations)} de l'étape {step_name} ont échoué : {', '.join(l_failed)}."
+            Config().om.error(s_error_message)
+            raise WorkflowError(s_error_message)
+        return [o_entity for s_iteration in d_iterations for o_entity in d_results[s_iteration]]
+
+    def run_all(
+        self,
+        max_parallel: int = 1,
+        callback: Optional[Callable[[ProcessingExecution], None]] = None,
+        ctrl_c_action: Optional[Callable[[], bool]] = None,
+        behavior: Optional[str] = None,
+        datastore: Optional[str] = None,
+        comments: List[str] = [],
+        tags: Dict[str, str] = {},
+        compatibility_cartes: Optional[bool] = None,
+    ) -> Dict[str, List[StoreEntity]]:
+        """Lance toutes les étapes du workflow en respectant leurs parents. Renvoie les entités créées par chaque étape.
+
+        Une étape est lancée dès que tous ses parents se sont bien terminés : jusqu'à `max_parallel` étapes
+        indépendantes (branches distinctes du workflow) sont lancées en même temps. Si une étape échoue, ses
+        descendants ne sont pas lancés mais les autres branches continuent ; une WorkflowError est levée à la fin.
+
+        Args:
+            max_parallel (int, optional): nombre maximum d'étapes lancées simultanément. Defaults to 1.
+            callback (Optional[Callable[[ProcessingExecution], None]], optional): callback de suivi si création d'une exécution de traitement.
+            ctrl_c_action (Optional[Callable[[], bool]], optional): gestion du ctrl-C lors d'une exécution de traitement.
+            behavior (Optional[str]): comportement à adopter si une entité existe déjà sur l'entrepôt.
+            datastore (Optional[str]): id du datastore à utiliser.
+            comments (Optional[List[str]]): liste des commentaire à rajouter à toutes les actions.
+            tags (Optional[Dict[str, str]]): dictionnaire des tags à rajouter pour toutes les actions.
+            compatibility_cartes (Optional[bool]): ajout des tags pour compatibilité avec cartes.gouv.fr.
+
+        Raises:
+            WorkflowError: levée si les parents des étapes sont incohérents ou si une étape a échoué
+
+        Returns:
+            Dict[str, List[StoreEntity]]: entités créées par chaque étape lancée
+        """
+        d_parents = self.__get_parents()
+        d_results: Dict[str, List[StoreEntity]] = {}
+        # état de chaque étape terminée : succès, échec ou non lancée (un parent a échoué)
+        d_status: Dict[str, str] = {}
+
+        def run(step_name: str, step_callback: Optional[Callable[[ProcessingExecution], None]], step_ctrl_c_action: Optional[Callable[[], bool]]) -> List[StoreEntity]:
+            # copies : la récupération de l'étape complète les commentaires et les tags
+            return self.run_step(step_name, step_callback, step_ctrl_c_action, behavior, datastore, list(comments), dict(tags), compatibility_cartes)
+
+        if max_parallel <= 1:
+            # lancement séquentiel (dans le thread principal pour la gestion du ctrl-C)
+            l_waiting = list(d_parents)
+            while l_waiting:
+                for s_step in Workflow.__pop_ready_steps(l_waiting, d_parents, d_status):
+                    try:
+                        d_results[s_step] = run(s_step, callback, ctrl_c_action)
+                        d_status[s_step] = Workflow.STEP_SUCCESS
+                    except Exception as e_error:
+                        Config().om.error(f"L'étape {s_step} a échoué : {e_error}")
+                        d_status[s_step] = Workflow.STEP_FAILED
+                Workflow.__pop_blocked_steps(l_waiting, d_parents, d_status)
+        else:
+            Workflow.__run_parallel(d_parents, run, max_parallel, callback, ctrl_c_action, d_results, d_status)
+
+        l_failed = [s_step for s_step, s_status in d_status.items() if s_status == Workflow.STEP_FAILED]
+        if l_failed:
+            s_error_message = f"Les étapes suivantes ont échoué : {', '.join(l_failed)}."
+            l_skipped = [s_step for s_step, s_status in d_status.items() if s_status == Workflow.STEP_SKIPPED]
+            if l_skipped:
+                s_error_message += f" Étapes non lancées : {', '.join(l_skipped)}."
+            Config().om.error(s_error_message)
+            raise WorkflowError(s_error_message)
+        return d_results
+
+    @staticmethod
+    def __run_parallel(
+        parents: Dict[str, List[str]],
+        run: Callable[[str, Optional[Callable[[ProcessingExecution], None]], Optional[Callable[[], bool]]], List[StoreEntity]],
+        max_parallel: int,
+        callback: Optional[Callable[[ProcessingExecution], None]],
+        ctrl_c_action: Optional[Callable[[], bool]],
+        results: Dict[str, List[StoreEntity]],
+        status: Dict[str, str],
+    ) -> None:
+        """Lance les étapes dans des threads, chacune dès que ses parents se sont bien terminés.
+
+        Seul le thread principal reçoit le ctrl-C : ctrl_c_action y est appelée une seule fois et, si l'arrêt est
+        demandé, les exécutions de traitement en cours de toutes les étapes sont arrêtées. Un lancement imbriqué
+        (itérations d'une étape elle-même lancée dans un thread) partage l'arrêt du lancement englobant : toutes
+        les itérations en cours sont arrêtées et les suivantes ne sont pas lancées.
+
+        Args:
+            parents (Dict[str, List[str]]): parents de chaque étape (triées)
+            run (Callable): lancement d'une étape (nom, callback, gestion du ctrl-C)
+            max_parallel (int): nombre maximum d'étapes lancées simultanément
+            callback (Optional[Callable[[ProcessingExecution], None]]): callback de suivi des exécutions de traitement
+            ctrl_c_action (Optional[Callable[[], bool]]): gestion du ctrl-C
+            results (Dict[str, List[StoreEntity]]): entités créées par chaque étape (complété)
+            status (Dict[str, str]): état de chaque étape terminée (complété)
+
+        Raises:
+            KeyboardInterrupt: transmis si l'arrêt a été demandé
+        """
+        l_waiting = list(parents)
+        o_parent_abort: Optional[threading.Event] = getattr(Workflow.__thread_state, "abort", None)
+        o_abort = o_parent_abort if o_parent_abort is not None else threading.Event()
+        with ThreadPoolExecutor(max_workers=max_parallel) as o_executor:
+            d_futures: Dict["Future[List[StoreEntity]]", str] = {}
+            while (l_waiting and not o_abort.is_set()) or d_futures:
+                if not o_abort.is_set():
+                    for s_step in Workflow.__pop_ready_steps(l_waiting, parents, status):
+                        d_futures[o_executor.submit(Workflow.__run_in_thread, o_abort, run, s_step, Workflow.__thread_callback(callback, o_abort))] = s_step
+                    Workflow.__pop_blocked_steps(l_waiting, parents, status)
+                try:
+                    l_done, _ = wait(list(d_futures), return_when=FIRST_COMPLETED)
+                except KeyboardInterrupt:
+                    if ctrl_c_action is None or ctrl_c_action():
+                        o_abort.set()
+                    continue
+                for o_future in l_done:
+                    s_step = d_futures.pop(o_future)
+                    o_exception = o_future.exception()
+                    if o_exception is None:
+                        results[s_step] = o_future.result()
+                        status[s_step] = Workflow.STEP_SUCCESS
+                    else:
+                        Config().om.error(f"L'étape {s_step} a échoué : {o_exception}")
+                        status[s_step] = Workflow.STEP_FAILED
+        if o_abort.is_set():
+            raise KeyboardInterrupt()
+
+    def __get_parents(self) -> Dict[str, List[str]]:
+        """Renvoie les parents de chaque étape en vérifiant qu'ils existent et qu'il n'y a pas de cycle.
+
+        Raises:
+            WorkflowError: levée si un parent n'existe pas ou si les étapes dépendent les unes des autres
+
+        Returns:
+            Dict[str, List[str]]: parents de chaque étape
+        """
+        d_parents: Dict[str, List[str]] = {s_step: list(self.__raw_definition_dict["workflow"]["steps"][s_step].get("parents", [])) for s_step in self.steps}
+        for s_step, l_parents in d_parents.items():
+            for s_parent in l_parents:
+                if s_parent not in d_parents:
+                    raise WorkflowError(f"Le parent « {s_parent} » de l'étape « {s_step} » n'est pas défini dans le workflow.")
+        # tri topologique : on retire au fur et à mesure les étapes dont tous les parents ont été retirés
+        l_remaining = list(d_parents)
+        l_sorted: List[str] = []
+        while l_remaining:
+            l_ready = [s_step for s_step in l_remaining if all(s_parent in l_sorted for s_parent in d_parents[s_step])]
+            if not l_ready:
+                raise WorkflowError(f"Les étapes suivantes dépendent les unes des autres (cycle) : {', '.join(l_remaining)}.")
+            l_sorted.extend(l_ready)
+            l_remaining = [s_step for s_step in l_remaining if s_step not in l_ready]
+        return {s_step: d_parents[s_step] for s_step in l_sorted}
+
+    @staticmethod
+    def __pop_ready_steps(waiting: List[str], parents: Dict[str, List[str]], status: Dict[str, str]) -> List[str]:
+        """Retire et renvoie les étapes en attente dont tous les parents se sont bien terminés.
+
+        Args:
+            waiting (List[str]): étapes en attente (modifiée)
+            parents (Dict[str, List[str]]): parents de chaque étape
+            status (Dict[str, str]): état de chaque étape terminée
+
+        Returns:
+            List[str]: étapes à lancer
+        """
+        l_ready = [s_step for s_step in waiting if all(status.get(s_parent) == Workflow.STEP_SUCCESS for s_parent in parents[s_step])]
+        for s_step in l_ready:
+            waiting.remove(s_step)
+        return l_ready
+
+    @staticmethod
+    def __pop_blocked_steps(waiting: List[str], parents: Dict[str, List[str]], status: Dict[str, str]) -> None:
+        """Retire les étapes en attente qui ne seront pas lancées (un de leurs ancêtres a échoué) et les marque comme non lancées.
+
+        Args:
+            waiting (List[str]): étapes en attente (modifiée)
+            parents (Dict[str, List[str]]): parents de chaque étape
+            status (Dict[str, str]): état de chaque étape terminée (complété)
+        """
+        # un blocage se propage aux descendants : on boucle jusqu'à stabilité
+        while True:
+            l_blocked = [s_step for s_step in waiting if any(status.get(s_parent) in (Workflow.STEP_FAILED, Workflow.STEP_SKIPPED) for s_parent in parents[s_step])]
+            if not l_blocked:
+                break
+            for s_step in l_blocked:
+                Config().om.warning(f"L'étape {s_step} n'est pas lancée car un de ses parents a échoué.")
+                waiting.remove(s_step)
+                status[s_step] = Workflow.STEP_SKIPPED
+
+    @staticmethod
+    def __run_in_thread(
+        abort: threading.Event,
+        run: Callable[[str, Optional[Callable[[ProcessingExecution], None]], Optional[Callable[[], bool]]], List[StoreEntity]],
+        step_name: str,
+        callback: Callable[[ProcessingExecution], None],
+    ) -> List[StoreEntity]:
+        """Lance une étape dans un thread secondaire en y mémorisant l'arrêt partagé (lancements imbriqués).
+
+        Une étape en attente d'un thread libre n'est pas lancée si l'arrêt a été demandé entre temps.
+
+        Args:
+            abort (threading.Event): arrêt demandé
+            run (Callable): lancement d'une étape (nom, callback, gestion du ctrl-C)
+            step_name (str): nom de l'étape
+            callback (Callable[[ProcessingExecution], None]): callback de suivi de l'étape
+
+        Raises:
+            KeyboardInterrupt: levée si l'arrêt a été demandé avant le lancement de l'étape
+
+        Returns:
+            List[StoreEntity]: entités créées par l'étape
+        """
+        if abort.is_set():
+            raise KeyboardInterrupt()
+        Workflow.__thread_state.abort = abort
+        Workflow.__thread_state.interrupted = False
+        return run(step_name, callback, lambda: True)
+
+    @staticmethod
+    def __thread_callback(callback: Optional[Callable[[ProcessingExecution], None]], abort: threading.Event) -> Callable[[ProcessingExecution], None]:
+        """Renvoie la callback de suivi d'une étape lancée dans un thread secondaire.
+
+        Seul le thread principal reçoit le ctrl-C : si l'arrêt est demandé, la callback lève une fois par thread
+        KeyboardInterrupt (dans le thread de l'étape ou de chaque itération lancée en parallèle) pour arrêter
+        les exécutions de traitement en cours.
+
+        Args:
+            callback (Optional[Callable[[ProcessingExecution], None]]): callback de suivi demandée
+            abort (threading.Event): arrêt demandé
+
+        Returns:
+            Callable[[ProcessingExecution], None]: callback de suivi de l'étape
+        """
+
+        def thread_callback(processing_execution: ProcessingExecution) -> None:
+            if abort.is_set() and not getattr(Workflow.__thread_state, "interrupted", False):
+                Workflow.__thread_state.interrupted = True
+                raise KeyboardInterrupt()
+            if callback is not None:
+                callback(processing_execution)
+
+        return thread_callback
+
     def __get_step_definition(self, step_name: str, comments: List[str] = [], tags: Dict[str, str] = {}, datastore: Optional[str] = None) -> Dict[str, Any]:
         """Renvoie le dictionnaire correspondant à une étape du workflow à partir de son nom.
         Lève une WorkflowError avec un message clair si l'étape n'est pas trouvée.
@@ -185,9 +598,12 @@ class Workflow:
                     l_actions += JsonHelper.loads(s_actions.replace("{" + d_step["iter_key"] + "}", o_val), "iter_val str/float/int")
             else:
                 # on a une liste de sous dict ou apparenté on utilise un résolveur
+                # (nom propre à l'étape : les étapes lancées en parallèle ne doivent pas écraser les résolveurs des autres)
+                s_step_key = hashlib.sha256(step_name.encode("utf-8")).hexdigest()[:8]
                 for i, o_val in enumerate(d_step["iter_vals"]):
-                    l_actions += JsonHelper.loads(s_actions.replace(d_step["iter_key"], f"iter_resolve_{i}"), f"iter_vals list({i})")
-                    GlobalResolver().add_resolver(DictResolver(f"iter_resolve_{i}", o_val))
+                    s_resolver_name = f"iter_resolve_{s_step_key}_{i}"
+                    l_actions += JsonHelper.loads(s_actions.replace(d_step["iter_key"], s_resolver_name), f"iter_vals list({i})")
+                    GlobalResolver().add_resolver(DictResolver(s_resolver_name, o_val))
             d_step["actions"] = l_actions
 
         elif "iter_vals" in d_step or "iter_key" in d_step:
@@ -0,0 +1,148 @@
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.store import TYPE__ENTITY
+from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
+
+
+class WorkflowJournal:
+    """Journal d'exécution d'un workflow (fichier JSON, par défaut à côté du fichier du workflow).
+
+    Pour chaque étape et chaque action terminée (numérotée dans l'ordre des actions de l'étape, itérations
+    comprises), le journal conserve la définition de l'action avant et après résolution ainsi que les
+    entités créées. En mode reprise (`resume`), les actions déjà terminées d'une étape relancée ne sont ni
+    résolues ni lancées (aucune requête à l'API) : l'exécution reprend à la première action non terminée.
+    Une action n'est considérée comme terminée que si sa définition et son contexte de résolution (paramètres
+    du journal, ex. paramètres `-p` de la ligne de commande, datastore utilisé, valeur de l'itération) n'ont pas
+    changé depuis : la définition brute contient encore les paramètres à résoudre.
+
+    Hors reprise, le journal d'une étape est vidé à son lancement.
+
+    Attributes:
+        path (Path): chemin du fichier journal
+        resume (bool): reprise des étapes à partir du journal
+        context (Dict[str, Any]): contexte de résolution commun à toutes les actions (ex. paramètres)
+    """
+
+    SUFFIX = ".journal.json"
+
+    def __init__(self, path: Path, resume: bool = False, context: Optional[Dict[str, Any]] = None) -> None:
+        self.path = path
+        self.resume = resume
+        self.context = context if context is not None else {}
+        self.__lock = threading.Lock()
+        self.__steps: Dict[str, Dict[str, Dict[str, Any]]] = self.__read()
+
+    @classmethod
+    def for_workflow(cls, workflow_path: Path, resume: bool = False, context: Optional[Dict[str, Any]] = None) -> "WorkflowJournal":
+        """Instancie le journal situé à côté du fichier du workflow (`mon_workflow.journal.json`).
+
+        Args:
+            workflow_path (Path): chemin du fichier du workflow
+            resume (bool, optional): reprise des étapes à partir du journal. Defaults to False.
+            context (Optional[Dict[str, Any]], optional): contexte de résolution commun à toutes les actions. Defaults to None.
+
+        Returns:
+            WorkflowJournal: journal du workflow
+        """
+        return cls(workflow_path.with_name(workflow_path.stem + WorkflowJournal.SUFFIX), resume, context)
+
+    def start_step(self, step_name: str) -> None:
+        """Indique le lancement d'une étape : hors reprise, son journal est vidé.
+
+        Args:
+            step_name (str): nom de l'étape
+        """
+        if self.resume:
+            return
+        with self.__lock:
+            if self.__steps.pop(step_name, None) is not None:
+                self.__write()
+
+    def get_done(self, step_name: str, index: int, definition: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Optional[List[StoreEntity]]:
+        """Renvoie les entités créées par une action terminée lors d'une exécution précédente (en mode reprise).
+
+        Args:
+            step_name (str): nom de l'étape
+            index (int): numéro de l'action dans l'étape
+            definition (Dict[str, Any]): définition (non résolue) de l'action
+            context (Optional[Dict[str, Any]], optional): contexte de résolution propre à l'action (datastore, itération). Defaults to None.
+
+        Returns:
+            Optional[List[StoreEntity]]: entités créées, None si l'action est à lancer
+        """
+        if not self.resume:
+            return None
+        with self.__lock:
+            d_entry = self.__steps.get(step_name, {}).get(str(index))
+        if d_entry is None or d_entry["definition"] != definition or d_entry.get("context") != self.__context(context):
+            return None
+        return [TYPE__ENTITY[d_entity["type"]](d_entity["properties"], d_entity["datastore"]) for d_entity in d_entry["entities"]]
+
+    def record(
+        self,
+        step_name: str,
+        index: int,
+        definition: Dict[str, Any],
+        resolved_definition: Dict[str, Any],
+        entities: List[StoreEntity],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Enregistre une action terminée (le fichier est réécrit aussitôt).
+
+        Args:
+            step_name (str): nom de l'étape
+            index (int): numéro de l'action dans l'étape
+            definition (Dict[str, Any]): définition (non résolue) de l'action
+            resolved_definition (Dict[str, Any]): définition résolue de l'action
+            entities (List[StoreEntity]): entités créées par l'action
+            context (Optional[Dict[str, Any]], optional): contexte de résolution propre à l'action (datastore, itération). Defaults to None.
+        """
+        d_entry = {
+            "definition": definition,
+            "context": self.__context(context),
+            "resolved_definition": resolved_definition,
+            "entities": [{"type": o_entity.entity_name(), "datastore": o_entity.datastore, "properties": o_entity.get_store_properties()} for o_entity in entities],
+            "date": datetime.now().isoformat(timespec="seconds"),
+        }
+        with self.__lock:
+            self.__steps.setdefault(step_name, {})[str(index)] = d_entry
+            self.__write()
+
+    def __context(self, context: Optional[Dict[str, Any]]) -> Any:
+        """Contexte de résolution complet d'une action, sous la forme relue depuis le fichier (comparaison).
+
+        Args:
+            context (Optional[Dict[str, Any]]): contexte de résolution propre à l'action
+
+        Returns:
+            Any: contexte commun complété par celui de l'action
+        """
+        return json.loads(json.dumps({**self.context, **(context or {})}, ensure_ascii=False, default=str))
+
+    def __read(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Lit le journal.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: actions terminées de chaque étape (vide si le journal est absent ou illisible)
+        """
+        try:
+            return dict(json.loads(self.path.read_text(encoding="utf-8"))["steps"])
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError) as e_error:
+            Config().om.warning(f"Journal du workflow {self.path} illisible ({e_error}), il est ignoré.")
+            return {}
+
+    def __write(self) -> None:
+        """Écrit le journal (fichier temporaire puis remplacement : le journal n'est jamais à moitié écrit)."""
+        p_tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            p_tmp.write_text(json.dumps({"steps": self.__steps}, ensure_ascii=False, indent=2), encoding="utf-8")
+            p_tmp.replace(self.path)
+        except OSError as e_error:
+            Config().om.warning(f"Journal du workflow {self.path} non enregistré ({e_error}).")
@@ -1,11 +1,17 @@
+import statistics
 import time
+from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Union
 
+from dateutil import parser
+
 from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import ApiError
 from sdk_entrepot_gpf.store.ProcessingExecution import ProcessingExecution
 from sdk_entrepot_gpf.store.StoredData import StoredData
 from sdk_entrepot_gpf.workflow.Errors import StepActionError
+from sdk_entrepot_gpf.workflow.StatusPoller import StatusPoller
 from sdk_entrepot_gpf.workflow.action.ActionAbstract import ActionAbstract
 from sdk_entrepot_gpf.store.Upload import Upload
 from sdk_entrepot_gpf.workflow.action.UploadAction import UploadAction
@@ -25,6 +31,9 @@ class ProcessingExecutionAction(ActionAbstract):
         __StoredData (Optional[StoredData]): représentation Python de la donnée stockée en sortie (null si livraison en sortie)
     """
 
+    # Statuts finaux d'une exécution de traitement
+    STATUS_END = [ProcessingExecution.STATUS_ABORTED, ProcessingExecution.STATUS_SUCCESS, ProcessingExecution.STATUS_FAILURE]
+
     # Comportements possibles pour une ProcessingExecutionAction
     BEHAVIORS = [
         ActionAbstract.BEHAVIOR_STOP,
@@ -364,6 +373,33 @@ class ProcessingExecutionAction(ActionAbstract):
             str: statut final de l'exécution du traitement
         """
 
+        return ProcessingExecutionAction.monitor_executions_until_end([self], callback, ctrl_c_action)[0]
+
+    @staticmethod
+    def monitor_executions_until_end(
+        actions: List["ProcessingExecutionAction"],
+        callback: Optional[Callable[[ProcessingExecution], None]] = None,
+        ctrl_c_action: Optional[Callable[[], bool]] = None,
+    ) -> List[str]:
+        """Attend que les ProcessingExecutions des actions indiquées soient toutes terminées avant de rendre la main.
+
+        Les exécutions sont suivies ensemble par un StatusPoller (section `processing_execution` de la configuration) :
+        à chaque tour, les exécutions non terminées sont mises à jour ensemble et celles dont le statut n'évolue plus
+        sont interrogées de moins en moins souvent.
+
+        La fonction callback indiquée est exécutée après chaque vérification du statut d'une exécution en lui passant
+        en paramètre la processing execution. Si l'utilisateur stoppe le programme (par ctrl-C), toutes les exécutions
+        non terminées sont arrêtées si ctrl_c_action() renvoie True (ou est None).
+
+        Args:
+            actions (List[ProcessingExecutionAction]): actions dont les exécutions sont à suivre
+            callback (Optional[Callable[[ProcessingExecution], None]], optional): fonction de callback à exécuter. Prend en argument le traitement (callback(processing-execution)).
+            ctrl_c_action (Optional[Callable[[], bool]], optional): fonction de gestion du ctrl-C. Renvoie True si on doit stopper les traitements.
+
+        Returns:
+            List[str]: statut final de l'exécution de chaque action (dans l'ordre)
+        """
+
         def callback_not_null(o_pe: ProcessingExecution) -> None:
             """fonction pour éviter des if à chaque appel
 
@@ -374,84 +410,175 @@ class ProcessingExecutionAction(ActionAbstract):
                 callback(o_pe)
 
         # NOTE :  Ne pas utiliser self.__processing_execution mais self.processing_execution pour faciliter les tests
-        i_nb_sec_between_check = Config().get_int("processing_execution", "nb_sec_between_check_updates")
-        Config().om.info(f"Monitoring du traitement toutes les {i_nb_sec_between_check} secondes...", force_flush=True)
-        if self.processing_execution is None:
-            raise StepActionError("Aucune processing-execution trouvée. Impossible de suivre le déroulement du traitement")
-
-        self.processing_execution.api_update()
-        s_status = self.processing_execution.get_store_properties()["status"]
-        while s_status not in [ProcessingExecution.STATUS_ABORTED, ProcessingExecution.STATUS_SUCCESS, ProcessingExecution.STATUS_FAILURE]:
+        o_poller = StatusPoller.from_config("processing_execution")
+        b_predict_duration = Config().get_bool("processing_execution", "predict_duration", False)
+        Config().om.info(f"Monitoring du traitement toutes les {o_poller.interval} secondes...", force_flush=True)
+        for o_action in actions:
+            o_processing_execution = o_action.processing_execution
+            if o_processing_execution is None:
+                raise StepActionError("Aucune processing-execution trouvée. Impossible de suivre le déroulement du traitement")
+            o_poller.add(
+                o_action,
+                o_action._update_status,  # pylint:disable=protected-access
+                lambda s_status: s_status in ProcessingExecutionAction.STATUS_END,
+                lambda _, o_pe=o_processing_execution: callback_not_null(o_pe),  # type: ignore[misc]
+                remaining=o_action._remaining_estimator() if b_predict_duration else None,  # pylint:disable=protected-access
+            )
+
+        while o_poller.pending:
             try:
-                # appel de la fonction affichant les logs
-                callback_not_null(self.processing_execution)
-
-                # On attend le temps demandé
-                time.sleep(i_nb_sec_between_check)
-
-                # On met à jour __processing_execution + valeur status
-                self.processing_execution.api_update()
-                s_status = self.processing_execution.get_store_properties()["status"]
-
+                o_poller.run()
             except KeyboardInterrupt:
+                l_pending = o_poller.pending
                 # on appelle la callback de gestion du ctrl-C
                 if ctrl_c_action is None or ctrl_c_action():
-                    # on doit arrêter le traitement (maj + action spécifique selon le statut)
-
-                    # mise à jour du traitement
-                    self.processing_execution.api_update()
-
-                    # si le traitement est déjà dans un statut terminé, on ne fait rien => transmission de l'interruption
-                    s_status = self.processing_execution.get_store_properties()["status"]
-
-                    # si le traitement est terminé, on fait un dernier affichage :
-                    if s_status in [ProcessingExecution.STATUS_ABORTED, ProcessingExecution.STATUS_SUCCESS, ProcessingExecution.STATUS_FAILURE]:
-                        callback_not_null(self.processing_execution)
-                        Config().om.warning("traitement déjà terminé.")
-                        raise
-
-                    # arrêt du traitement
-                    Config().om.warning("Ctrl+C : traitement en cours d’interruption, veuillez attendre...", force_flush=True)
-                    self.processing_execution.api_abort()
-                    # attente que le traitement passe dans un statut terminé
-                    self.processing_execution.api_update()
-                    s_status = self.processing_execution.get_store_properties()["status"]
-                    while s_status not in [ProcessingExecution.STATUS_ABORTED, ProcessingExecution.STATUS_SUCCESS, ProcessingExecution.STATUS_FAILURE]:
-                        # On attend 2s
-                        time.sleep(2)
-                        # On met à jour __processing_execution + valeur status
-                        self.processing_execution.api_update()
-                        s_status = self.processing_execution.get_store_properties()["status"]
-                    # traitement terminé. On fait un dernier affichage :
-                    callback_not_null(self.processing_execution)
-
-                    # si statut Aborted :
-                    # suppression de l'upload ou de la stored data en sortie
-                    if s_status == ProcessingExecution.STATUS_ABORTED and self.output_new_entity:
-                        if self.upload is not None:
-                            Config().om.warning("Suppression de l'upload en cours de remplissage suite à l’interruption du programme")
-                            self.upload.api_delete()
-                        elif self.stored_data is not None:
-                            Config().om.warning("Suppression de la stored-data en cours de remplissage suite à l'interruption du programme")
-                            self.stored_data.api_delete()
+                    # on doit arrêter les traitements non terminés
+                    for o_action in actions:
+                        if o_action in l_pending:
+                            o_action._interrupt(callback_not_null)  # pylint:disable=protected-access
                     # enfin, transmission de l'interruption
                     raise
+                # reprise du suivi : on réaffiche les traitements non terminés
+                for o_action in actions:
+                    if o_action in l_pending:
+                        callback_not_null(o_action.processing_execution)  # type: ignore[arg-type]
+
+        # Si on est sorti de la boucle c'est que les processing executions sont terminées
+        l_status = []
+        for o_action in actions:
+            s_status = str(o_poller.state(o_action))
+            o_action._end_monitoring(s_status)  # pylint:disable=protected-access
+            l_status.append(s_status)
+        ## on return les status de fin
+        return l_status
+
+    def _update_status(self) -> str:
+        """Met à jour la processing execution et renvoie son statut.
+
+        Returns:
+            str: statut de l'exécution du traitement
+        """
+        assert self.processing_execution is not None
+        self.processing_execution.api_update()
+        return str(self.processing_execution.get_store_properties()["status"])
 
-        # Si on est sorti du while c'est que la processing execution est terminée
-        ## dernier affichage
+    def _expected_duration(self) -> Optional[float]:
+        """Estime la durée (en secondes) de l'exécution : médiane des durées des exécutions réussies du même traitement.
+
+        Toutes les exécutions réussies du traitement sont listées (champs `start` et `finish` seulement, l'API ne
+        permettant pas de les trier) et seules les `processing_execution.predict_duration_sample` plus récentes
+        (selon leur date de fin) sont prises en compte.
+
+        Returns:
+            Optional[float]: durée estimée (None si aucune exécution passée n'est exploitable)
+        """
+        assert self.processing_execution is not None
+        d_processing = self.processing_execution.get_store_properties().get("processing") or {}
+        if "_id" not in d_processing:
+            return None
+        try:
+            l_executions = ProcessingExecution.api_list(
+                infos_filter={"processing": d_processing["_id"], "status": ProcessingExecution.STATUS_SUCCESS},
+                datastore=self.processing_execution.datastore,
+                fields=["start", "finish"],
+            )
+        except ApiError as e_error:
+            Config().om.debug(f"Durée des exécutions passées du traitement non récupérée : {e_error}")
+            return None
+        # (fin, durée) des exécutions passées terminées
+        l_ends = []
+        for o_execution in l_executions:
+            d_properties = o_execution.get_store_properties()
+            if o_execution.id != self.processing_execution.id and d_properties.get("start") and d_properties.get("finish"):
+                o_finish = parser.isoparse(d_properties["finish"])
+                l_ends.append((o_finish, (o_finish - parser.isoparse(d_properties["start"])).total_seconds()))
+        l_ends.sort(key=lambda o_end: o_end[0], reverse=True)
+        l_durations = [f_duration for _, f_duration in l_ends[: Config().get_int("processing_execution", "predict_duration_sample", 10)]]
+        return float(statistics.median(l_durations)) if l_durations else None
+
+    def _remaining_estimator(self) -> Optional[Callable[[str], Optional[float]]]:
+        """Renvoie la fonction estimant le temps restant avant la fin de l'exécution selon son statut.
+
+        Returns:
+            Optional[Callable[[str], Optional[float]]]: estimation du temps restant (None si la durée ne peut pas être estimée)
+        """
+        f_duration = self._expected_duration()
+        if f_duration is None:
+            return None
+        Config().om.debug(f"Durée estimée du traitement : {f_duration:.0f} secondes")
+        f_expected: float = f_duration
+
+        def remaining(status: str) -> Optional[float]:
+            """Temps restant estimé (en secondes) d'une exécution en cours, None si elle n'a pas démarré."""
+            assert self.processing_execution is not None
+            s_start = self.processing_execution.get_store_properties().get("start")
+            if status != ProcessingExecution.STATUS_PROGRESS or not s_start:
+                return None
+            o_start = parser.isoparse(s_start)
+            if o_start.tzinfo is None:
+                o_start = o_start.replace(tzinfo=timezone.utc)
+            return f_expected - (datetime.now(timezone.utc) - o_start).total_seconds()
+
+        return remaining
+
+    def _interrupt(self, callback_not_null: Callable[[ProcessingExecution], None]) -> None:
+        """Arrête la processing execution suite à un ctrl-C (et supprime la sortie créée si elle a été annulée).
+
+        Args:
+            callback_not_null (Callable[[ProcessingExecution], None]): fonction d'affichage du traitement
+        """
+        assert self.processing_execution is not None
+        # mise à jour du traitement
+        self.processing_execution.api_update()
+
+        # si le traitement est déjà dans un statut terminé, on ne fait rien => transmission de l'interruption
+        s_status = self.processing_execution.get_store_properties()["status"]
+
+        # si le traitement est terminé, on fait un dernier affichage :
+        if s_status in ProcessingExecutionAction.STATUS_END:
+            callback_not_null(self.processing_execution)
+            Config().om.warning("traitement déjà terminé.")
+            return
+
+        # arrêt du traitement
+        Config().om.warning("Ctrl+C : traitement en cours d’interruption, veuillez attendre...", force_flush=True)
+        self.processing_execution.api_abort()
+        # attente que le traitement passe dans un statut terminé
+        self.processing_execution.api_update()
+        s_status = self.processing_execution.get_store_properties()["status"]
+        while s_status not in ProcessingExecutionAction.STATUS_END:
+            # On attend 2s
+            time.sleep(2)
+            # On met à jour __processing_execution + valeur status
+            self.processing_execution.api_update()
+            s_status = self.processing_execution.get_store_properties()["status"]
+        # traitement terminé. On fait un dernier affichage :
         callback_not_null(self.processing_execution)
 
-        # gestion du mode cartes
+        # si statut Aborted :
+        # suppression de l'upload ou de la stored data en sortie
+        if s_status == ProcessingExecution.STATUS_ABORTED and self.output_new_entity:
+            if self.upload is not None:
+                Config().om.warning("Suppression de l'upload en cours de remplissage suite à l’interruption du programme")
+                self.upload.api_delete()
+            elif self.stored_data is not None:
+                Config().om.warning("Suppression de la stored-data en cours de remplissage suite à l'interruption du programme")
+                self.stored_data.api_delete()
+
+    def _end_monitoring(self, status: str) -> None:
+        """Actions de fin de suivi d'une processing execution terminée (gestion du mode cartes).
+
+        Args:
+            status (str): statut final de l'exécution du traitement
+        """
+        assert self.processing_execution is not None
         if self.__mode_cartes and self.processing_execution.id == Config().get_str("compatibility_cartes", "id_mise_en_base"):
             if not self.__inputs_upload:
                 raise GpfSdkError("Intégration de données vecteur livrées en base : input and output obligatoires")
-            s_key = "execution_end_ok_integration_progress" if s_status == ProcessingExecution.STATUS_SUCCESS else "execution_end_ko_integration_progress"
+            s_key = "execution_end_ok_integration_progress" if status == ProcessingExecution.STATUS_SUCCESS else "execution_end_ko_integration_progress"
             for o_upload in self.__inputs_upload:
                 o_upload.api_add_tags({"integration_progress": Config().get_str("compatibility_cartes", s_key)})
 
-        ## on return le status de fin
-        return str(s_status)
-
     @property
     def processing_execution(self) -> Optional[ProcessingExecution]:
         return self.__processing_execution
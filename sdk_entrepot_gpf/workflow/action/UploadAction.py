@@ -1,5 +1,8 @@
+import functools
 from pathlib import Path
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional, Tuple
 import requests
 
@@ -11,6 +14,7 @@ from sdk_entrepot_gpf.store.Upload import Upload
 from sdk_entrepot_gpf.io.Dataset import Dataset
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.workflow.Errors import UploadFileError
+from sdk_entrepot_gpf.workflow.StatusPoller import StatusPoller
 from sdk_entrepot_gpf.workflow.action.ActionAbstract import ActionAbstract
 
 
@@ -42,22 +46,25 @@ class UploadAction:
         # On suit le comportement donnée en paramètre ou à défaut celui de la config
         self.__behavior: str = behavior if behavior is not None else Config().get_str("upload", "behavior_if_exists")
         self.__mode_cartes = compatibility_cartes if compatibility_cartes is not None else Config().get_bool("compatibility_cartes", "activate", False)
+        self.__cancel: Optional[threading.Event] = None
 
-    def run(self, datastore: Optional[str], check_before_close: bool = False) -> Upload:
+    def run(self, datastore: Optional[str], check_before_close: bool = False, cancel: Optional[threading.Event] = None) -> Upload:
         """Crée la livraison décrite dans le dataset et livre les données avant de
         retourner la livraison créée.
 
         Args:
             datastore (Optional[str]): id du datastore à utiliser. Si None, le datastore sera récupéré dans la configuration.
             check_before_close (bool): Vérification de l'arborescence de la livraison avant fermeture.
+            cancel (Optional[threading.Event]): si positionné, le téléversement s'arrête avant le fichier suivant (ex : ctrl-C pendant des livraisons simultanées)
 
         Raises:
-            GpfSdkError: levée si création non effectuée
+            GpfSdkError: levée si création non effectuée ou si le téléversement est interrompu
 
         Returns:
             livraison créée
         """
         Config().om.info("Création et complétion d'une livraison...", force_flush=True)
+        self.__cancel = cancel
         # test: si le mode carte est actif alors le tag datasheet_name doit être présent
         if self.__mode_cartes and "datasheet_name" not in self.__dataset.tags:
             raise GpfSdkError("En mode compatibilité avec cartes.gouv, le tag datasheet_name contenant le nom de la fiche de donnée est obligatoire")
@@ -76,8 +83,21 @@ class UploadAction:
         self.__add_comments()
 
         self.__add_carte_tags("upload_upload_start")
-        # Envoie des fichiers de données (pas de vérification sur les problèmes de livraison si check_before_close)
-        self.__push_data_files(not check_before_close)
+        # Regroupement éventuel des petits fichiers juste avant le téléversement
+        self.__dataset.bundle_files()
+        # Génération des fichiers md5 (si pas déjà faite) pendant le téléversement des fichiers de données
+        o_md5_cancel = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as o_md5_executor:
+            o_md5_future = o_md5_executor.submit(self.__dataset.generate_md5_files, o_md5_cancel)
+            try:
+                # Envoie des fichiers de données (pas de vérification sur les problèmes de livraison si check_before_close)
+                self.__push_data_files(not check_before_close)
+            except BaseException:
+                # Téléversement en échec ou interrompu : on annule le calcul des clefs md5 et on attend sa fin
+                o_md5_cancel.set()
+                UploadAction.__report_md5(o_md5_future)
+                raise
+        o_md5_future.result()
         # Envoie des fichiers md5 (pas de vérification sur les problèmes de livraison si check_before_close)
         self.__push_md5_files(not check_before_close)
         if check_before_close:
@@ -99,6 +119,19 @@ class UploadAction:
         # On ne devrait pas arriver ici...
         raise GpfSdkError("Erreur à la création de la livraison.")
 
+    @staticmethod
+    def __report_md5(md5_future: "Future[None]") -> None:
+        """Attend la fin du calcul des clefs md5 annulé suite à un échec du téléversement et indique son résultat.
+
+        Args:
+            md5_future (Future[None]): calcul des clefs md5
+        """
+        o_error = md5_future.exception()
+        if o_error is None:
+            Config().om.info("Fichiers md5 générés avant l'arrêt du téléversement.")
+        else:
+            Config().om.warning(f"Génération des fichiers md5 arrêtée : {o_error}")
+
     def __create_upload(self, datastore: Optional[str]) -> None:
         """Crée l'upload après avoir vérifié s'il n'existe pas déjà...
 
@@ -191,6 +224,7 @@ class UploadAction:
                 self.__upload.api_push_data_file,
                 self.__upload.api_delete_data_file,
                 check_conflict,
+                self.__upload.is_push_data_file_resumable,
             )
 
             Config().om.info(f"Livraison {self.__upload}: les {len(self.__dataset.data_files)} fichiers de données ont été ajoutés avec succès. ({i_file_upload} livré(s) lors de ce traitement)")
@@ -221,7 +255,14 @@ class UploadAction:
             raise GpfSdkError(f"Aucune livraison de définie - impossible de livrer {nom}")
         self.__upload.api_push_md5_file(path)
 
-    def __push_files(self, l_files: List[Tuple[Path, str]], f_api_push: Callable[[Path, str], None], f_api_delete: Callable[[str], None], check_conflict: bool = True) -> int:
+    def __push_files(
+        self,
+        l_files: List[Tuple[Path, str]],
+        f_api_push: Callable[[Path, str], None],
+        f_api_delete: Callable[[str], None],
+        check_conflict: bool = True,
+        f_api_resumable: Optional[Callable[[Path, str, int], bool]] = None,
+    ) -> int:
         """pousse un ficher de données ou un ficher md5 sur le store. Gère la reprise de Livraison et les conflicts lors de la livraison.
 
         Args:
@@ -229,6 +270,7 @@ class UploadAction:
             f_api_push (Callable[[Path, str], None]): fonction pour livrer les données
             f_api_delete (Callable[[str], None]): fonction pour supprimé les données si livrer partiellement.
             check_conflict (bool): Si une vérification de la bonne livraison des fichier en conflict ou en timeout est lancée..
+            f_api_resumable (Optional[Callable[[Path, str, int], bool]]): fonction indiquant si un fichier livré partiellement (taille distante en 3e paramètre) peut être repris.
 
         Returns:
             int: nombre de ficher réellement téléverser durant l'action
@@ -238,36 +280,56 @@ class UploadAction:
         # Liste les fichiers téléversés sur l'entrepôt et récupère leur taille
         l_arborescence = self.__upload.api_tree()
         d_destination_taille = UploadAction.parse_tree(l_arborescence)
-        l_conflict = []
-        i_file_upload = 0
-        for p_file_path, s_api_path in l_files:
+        s_name = self.__upload["name"]
+        i_nb_files = len(l_files)
+
+        def push_file(o_item: Tuple[int, Tuple[Path, str]]) -> Optional[bool]:
+            """Livre un fichier (None : déjà livré, True : livré, False : conflit ou timeout)."""
+            i_num, (p_file_path, s_api_path) = o_item
+            if self.__cancel is not None and self.__cancel.is_set():
+                raise GpfSdkError(f"Livraison {s_name} : téléversement interrompu")
             # Regarde si le fichier du dataset est déjà dans la liste des fichiers téléversés sur l'entrepôt
             # NB: sur l'entrepot, tous les fichiers md5 sont à la racine
             s_data_api_path = f"{s_api_path}/{p_file_path.name}" if s_api_path else p_file_path.name
-            Config().om.info(f"Livraison {self.__upload['name']} : livraison de {s_data_api_path}...")
-            if s_data_api_path in d_destination_taille:
-                # le fichier est déjà livré, on check sa taille :
-                if d_destination_taille[s_data_api_path] == p_file_path.stat().st_size:
-                    # le fichier a été complètement téléversé. On passe au fichier suivant.
-                    Config().om.info(f"Livraison {self.__upload['name']} : livraison de {s_data_api_path}: déjà livré")
-                    continue
-
-                # le fichier n'a pas été téléversé en totalité.
-                # Si le mode "Append" n'est pas disponible sur le serveur, il faut supprimer le fichier à moitié téléversé.
-                # Sinon il faudra reprendre le téléversement (!)
+            # Le numéro du fichier permet de suivre les livraisons menées en parallèle
+            s_prefix = f"Livraison {s_name} : [{i_num}/{i_nb_files}] livraison de {s_data_api_path}"
+            Config().om.info(f"{s_prefix}...")
+            i_remote_size = d_destination_taille.get(s_data_api_path)
+            if i_remote_size is not None and i_remote_size == p_file_path.stat().st_size:
+                # le fichier a été complètement téléversé. On passe au fichier suivant.
+                Config().om.info(f"{s_prefix}: déjà livré")
+                return None
+
+            # le fichier n'a pas été téléversé en totalité (ou pas du tout).
+            # Si le téléversement par morceaux a été interrompu et que la taille sur l'entrepôt correspond au journal,
+            # on le reprend au dernier morceau acquitté. Sinon il faut supprimer le fichier à moitié téléversé.
+            if f_api_resumable is not None and f_api_resumable(p_file_path, s_api_path, i_remote_size or 0):
+                Config().om.info(f"{s_prefix}: reprise du téléversement")
+            elif i_remote_size is not None:
                 f_api_delete(s_data_api_path)
 
             try:
                 # livraison du fichier
                 f_api_push(p_file_path, s_api_path)
-                i_file_upload += 1
-                Config().om.info(f"Livraison {self.__upload['name']} : livraison de {s_data_api_path}: terminé")
+                Config().om.info(f"{s_prefix}: terminé")
+                return True
             except requests.Timeout:
-                Config().om.warning(f"Livraison {self.__upload['name']} : livraison de {s_data_api_path}: timeout.")
-                l_conflict.append((p_file_path, s_api_path))
+                Config().om.warning(f"{s_prefix}: timeout.")
             except ConflictError:
-                Config().om.warning(f"Livraison {self.__upload['name']} : livraison de {s_data_api_path}: conflict.")
-                l_conflict.append((p_file_path, s_api_path))
+                Config().om.warning(f"{s_prefix}: conflict.")
+            return False
+
+        # Livraison des fichiers, éventuellement en parallèle (les résultats restent dans l'ordre des fichiers)
+        i_parallel = Config().get_int("upload", "parallel_files", 1)
+        l_items = list(enumerate(l_files, start=1))
+        if i_parallel > 1 and i_nb_files > 1:
+            with ThreadPoolExecutor(max_workers=min(i_parallel, i_nb_files)) as o_executor:
+                l_results = list(o_executor.map(push_file, l_items))
+        else:
+            l_results = [push_file(o_item) for o_item in l_items]
+        i_file_upload = l_results.count(True)
+        l_conflict = [o_file for o_file, b_result in zip(l_files, l_results) if b_result is False]
+
         if not check_conflict and l_conflict:
             # pas de vérification des conflicts
             Config().om.info(f"Livraison {self.__upload}: {len(l_conflict)} fichiers en conflict : " + "\n * ".join([s_data_api_path for (p_file_path, s_data_api_path) in l_conflict]))
@@ -359,72 +421,135 @@ class UploadAction:
         Returns:
             True si toutes les vérifications sont ok, sinon False
         """
-        i_nb_sec_between_check = Config().get_int("upload", "nb_sec_between_check_updates")
+        return UploadAction.monitor_uploads_until_end([upload], callback, ctrl_c_action, mode_cartes)[0]
+
+    @staticmethod
+    def monitor_uploads_until_end(
+        uploads: List[Upload],
+        callback: Optional[Callable[[str], None]] = None,
+        ctrl_c_action: Optional[Callable[[], bool]] = None,
+        mode_cartes: Optional[bool] = None,
+    ) -> List[bool]:
+        """Attend que toutes les vérifications des Livraisons indiquées soient terminées (en erreur ou en succès).
+
+        Les livraisons sont suivies ensemble par un StatusPoller (section `upload` de la configuration) : à chaque
+        tour, les vérifications des livraisons non terminées sont récupérées ensemble et les livraisons dont les
+        vérifications n'évoluent plus sont interrogées de moins en moins souvent. La durée du suivi est donc celle
+        de la livraison la plus longue à vérifier et non la somme des durées.
+
+        S'il y a plusieurs livraisons, le message de suivi passé à la fonction callback est préfixé par la livraison
+        et n'est transmis que lorsqu'il change.
+
+        Args:
+            uploads (List[Upload]): Livraisons à monitorer
+            callback (Optional[Callable[[str], None]]): fonction de callback à exécuter avec le message de suivi.
+            ctrl_c_action (Optional[Callable[[], bool]], optional): gestion du ctrl-C. Si None ou si la fonction renvoie True,
+                il faut arrêter les vérifications de toutes les livraisons non terminées.
+            mode_cartes (Optional[bool]): Si le mode carte est activé
+
+        Returns:
+            List[bool]: pour chaque livraison (dans l'ordre), True si toutes les vérifications sont ok, sinon False
+        """
+        o_poller = StatusPoller.from_config("upload")
         s_check_message_pattern = Config().get_str("upload", "check_message_pattern")
-        b_success: Optional[bool] = None
-        Config().om.info(f"Monitoring des vérifications toutes les {i_nb_sec_between_check} secondes...", force_flush=True)
-        while b_success is None:
+        b_mode_cartes = mode_cartes if mode_cartes is not None else Config().get_bool("compatibility_cartes", "activate", False)
+        for i_index, o_upload in enumerate(uploads):
+            s_pattern = s_check_message_pattern if len(uploads) == 1 else f"{o_upload} : {s_check_message_pattern}"
+            o_poller.add(
+                i_index,
+                o_upload.api_list_checks,
+                UploadAction.__checks_finished,
+                functools.partial(UploadAction.__report_checks, o_upload, s_pattern, callback, b_mode_cartes),
+                on_change_only=len(uploads) > 1,
+            )
+        Config().om.info(f"Monitoring des vérifications toutes les {o_poller.interval} secondes...", force_flush=True)
+        while o_poller.pending:
             try:
-                # On récupère les vérifications
-                d_checks = upload.api_list_checks()
-                # On peut déterminer b_success s'il n'y en a plus en attente et en cours
-                if 0 == len(d_checks["asked"]) == len(d_checks["in_progress"]):
-                    b_success = len(d_checks["failed"]) == 0
-                # On affiche un rapport via la fonction de callback précisée
-                s_message = s_check_message_pattern.format(
-                    nb_asked=len(d_checks["asked"]),
-                    nb_in_progress=len(d_checks["in_progress"]),
-                    nb_passed=len(d_checks["passed"]),
-                    nb_failed=len(d_checks["failed"]),
-                )
-                if callback is not None:
-                    callback(s_message)
-                # Si l'état est toujours indéterminé
-                if b_success is None:
-                    # On attend le temps demandé
-                    time.sleep(i_nb_sec_between_check)
-
+                o_poller.run()
             except KeyboardInterrupt:
                 # on appelle la callback de gestion du ctrl-C
                 if ctrl_c_action is None or ctrl_c_action():
-                    # on doit arrêter les vérifications :
-                    # si les vérifications sont déjà terminées, on ne fait rien => transmission de l'interruption
-                    d_checks = upload.api_list_checks()
-                    if 0 == len(d_checks["asked"]) == len(d_checks["in_progress"]):
-                        Config().om.warning("vérifications déjà terminées.")
-                        raise
-
-                    # arrêt des vérifications
-                    Config().om.warning("Ctrl+C : vérifications en cours d’interruption, veuillez attendre...", force_flush=True)
-                    # suppression des vérifications non terminées
-                    for d_check_exec in d_checks["in_progress"]:
-                        CheckExecution(d_check_exec, upload.datastore).api_delete()
-                    for d_check_exec in d_checks["asked"]:
-                        # on doit attendre que l'exécution soit lancée pour n'annulée
-                        o_check_exec = CheckExecution.api_get(d_check_exec["_id"], upload.datastore)
-                        # on attend que l'exécution soit lancée
-                        while o_check_exec["status"] == "WAITING":
-                            time.sleep(1)
-                            o_check_exec.api_update()
-                        if o_check_exec["status"] == "PROGRESS":
-                            o_check_exec.api_delete()
-
-                    # On rouvre la livraison
-                    upload.api_open()
-
+                    # on doit arrêter les vérifications des livraisons non terminées
+                    l_pending = o_poller.pending
+                    for i_index, o_upload in enumerate(uploads):
+                        if i_index in l_pending:
+                            UploadAction.__interrupt_checks(o_upload)
                     # enfin, transmission de l'interruption
                     raise
 
-        # Si on est sorti du while c'est que les vérifications sont terminées
-        # On log le dernier rapport selon l'état et on sort
-        mode_cartes = mode_cartes if mode_cartes is not None else Config().get_bool("compatibility_cartes", "activate", False)
-        if b_success:
+        return [len(o_poller.state(i_index)["failed"]) == 0 for i_index in range(len(uploads))]
+
+    @staticmethod
+    def __checks_finished(checks: Dict[str, List[Dict[str, Any]]]) -> bool:
+        """Indique si les vérifications sont terminées (plus aucune en attente ou en cours).
+
+        Args:
+            checks (Dict[str, List[Dict[str, Any]]]): vérifications de la livraison (résultat de `Upload.api_list_checks()`)
+
+        Returns:
+            bool: True si les vérifications sont terminées
+        """
+        return 0 == len(checks["asked"]) == len(checks["in_progress"])
+
+    @staticmethod
+    def __report_checks(upload: Upload, check_message_pattern: str, callback: Optional[Callable[[str], None]], mode_cartes: bool, checks: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Transmet le message de suivi des vérifications d'une livraison (et le log si elles sont terminées).
+
+        Args:
+            upload (Upload): Livraison vérifiée
+            check_message_pattern (str): modèle du message de suivi
+            callback (Optional[Callable[[str], None]]): fonction de callback à exécuter avec le message de suivi.
+            mode_cartes (bool): Si le mode carte est activé
+            checks (Dict[str, List[Dict[str, Any]]]): vérifications de la livraison
+        """
+        s_message = check_message_pattern.format(
+            nb_asked=len(checks["asked"]),
+            nb_in_progress=len(checks["in_progress"]),
+            nb_passed=len(checks["passed"]),
+            nb_failed=len(checks["failed"]),
+        )
+        if callback is not None:
+            callback(s_message)
+        # On log le dernier rapport selon l'état
+        if not UploadAction.__checks_finished(checks):
+            return
+        if len(checks["failed"]) == 0:
             Config().om.info(s_message)
             UploadAction.add_carte_tags(mode_cartes, upload, "upload_check_ok")
-            return True
-        Config().om.warning(s_message)
-        UploadAction.add_carte_tags(mode_cartes, upload, "upload_check_ko")
-        return False
+        else:
+            Config().om.warning(s_message)
+            UploadAction.add_carte_tags(mode_cartes, upload, "upload_check_ko")
+
+    @staticmethod
+    def __interrupt_checks(upload: Upload) -> None:
+        """Arrête les vérifications non terminées d'une livraison et la rouvre (suite à un ctrl-C).
+
+        Args:
+            upload (Upload): Livraison dont les vérifications sont à arrêter
+        """
+        # si les vérifications sont déjà terminées, on ne fait rien
+        d_checks = upload.api_list_checks()
+        if 0 == len(d_checks["asked"]) == len(d_checks["in_progress"]):
+            Config().om.warning("vérifications déjà terminées.")
+            return
+
+        # arrêt des vérifications
+        Config().om.warning("Ctrl+C : vérifications en cours d’interruption, veuillez attendre...", force_flush=True)
+        # suppression des vérifications non terminées
+        for d_check_exec in d_checks["in_progress"]:
+            CheckExecution(d_check_exec, upload.datastore).api_delete()
+        for d_check_exec in d_checks["asked"]:
+            # on doit attendre que l'exécution soit lancée pour n'annulée
+            o_check_exec = CheckExecution.api_get(d_check_exec["_id"], upload.datastore)
+            # on attend que l'exécution soit lancée
+            while o_check_exec["status"] == "WAITING":
+                time.sleep(1)
+                o_check_exec.api_update()
+            if o_check_exec["status"] == "PROGRESS":
+                o_check_exec.api_delete()
+
+        # On rouvre la livraison
+        upload.api_open()
 
     @staticmethod
     def parse_tree(tree: List[Dict[str, Any]], prefix: str = "") -> Dict[str, int]:
@@ -1,8 +1,9 @@
 import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from sdk_entrepot_gpf.helper.DictHelper import DictHelper
+from sdk_entrepot_gpf.io.Config import Config
 
 
 class AbstractResolver(ABC):
@@ -11,10 +12,17 @@ class AbstractResolver(ABC):
     Vous pouvez créer vos propres classe de résolution en les héritant de
     celle-ci et en les ajoutant au GlobalResolver.
 
+    Les résolutions sont mises en cache par le GlobalResolver selon `cache_ttl()` et `cache_key()`.
+
     Attributes:
         __name (str): nom de code du resolver
     """
 
+    # Durée de vie (en secondes) des résolutions en cache (None : sans limite, 0 : pas de cache)
+    cache_default_ttl: Optional[float] = None
+    # Résolutions conservées entre deux exécutions (si `resolver_cache.file` est renseigné)
+    cache_persistent: bool = False
+
     def __init__(self, name: str) -> None:
         super().__init__()
         self.__name: str = name
@@ -35,6 +43,28 @@ class AbstractResolver(ABC):
     def name(self) -> str:
         return self.__name
 
+    def cache_ttl(self) -> Optional[float]:
+        """Renvoie la durée de vie des résolutions en cache (`resolver_cache.<nom du résolveur>_ttl`, sinon valeur du résolveur).
+
+        Returns:
+            Optional[float]: durée de vie en secondes (None : sans limite, 0 : pas de cache)
+        """
+        s_ttl = Config().get("resolver_cache", f"{self.name}_ttl")
+        return float(s_ttl) if s_ttl else self.cache_default_ttl
+
+    def cache_key(self, string_to_solve: str, **kwargs: Any) -> str:  # pylint:disable=unused-argument
+        """Renvoie ce qui, en plus de la chaîne à résoudre et des paramètres, distingue une résolution en cache
+        (ex. date de modification d'un fichier lu).
+
+        Args:
+            string_to_solve (str): chaîne à résoudre
+            kwargs (Any): paramètres supplémentaires.
+
+        Returns:
+            str: complément de clef (vide par défaut)
+        """
+        return ""
+
     @staticmethod
     def get(key_value: Dict[str, Any], js_key: str) -> str:
         """Fonction permettant de récupérer une valeur dans un dictionnaire complexe avec une récupération de style JS.
@@ -1,6 +1,6 @@
 from datetime import datetime
 import re
-from typing import Any, Pattern
+from typing import Any, Optional, Pattern
 from dateutil.relativedelta import relativedelta
 
 from sdk_entrepot_gpf.workflow.resolver.AbstractResolver import AbstractResolver
@@ -15,6 +15,9 @@ class DateResolver(AbstractResolver):
         __name (str): nom de code du resolver
     """
 
+    # Date courante : résolution jamais mise en cache
+    cache_default_ttl: Optional[float] = 0
+
     def __init__(self, name: str) -> None:
         """À l'instanciation, le résolveur est nommé selon ce qui est indiqué dans la Config.
 
@@ -134,6 +134,25 @@ class FileResolver(AbstractResolver):
             raise ResolveFileInvalidError(self.name, string_to_solve)
         return s_data
 
+    def cache_key(self, string_to_solve: str, **kwargs: Any) -> str:
+        """La résolution en cache n'est réutilisée que si le fichier (chemin absolu) n'a pas été modifié.
+
+        Args:
+            string_to_solve (str): chaîne à résoudre (type de fichier à traiter et chemin)
+            kwargs (Any): paramètres supplémentaires.
+
+        Returns:
+            str: chemin absolu et date de modification (ns) du fichier
+        """
+        o_result = FileResolver._file_regex.search(string_to_solve)
+        if o_result is None:
+            return ""
+        p_file = self.__root_path / o_result.groupdict()["resolver_file"]
+        try:
+            return f"{p_file}:{p_file.stat().st_mtime_ns}"
+        except OSError:
+            return f"{p_file}:absent"
+
     def resolve(self, string_to_solve: str, **kwargs: Any) -> str:
         """Fonction permettant de renvoyer sous forme de string la résolution
         des paramètres de fichier passés en entrée.
@@ -1,29 +1,36 @@
+import json
 import re
-from typing import Any, Dict, Match, Pattern
+from typing import Any, Dict, Match, Optional, Pattern
 
 from sdk_entrepot_gpf.pattern.Singleton import Singleton
 from sdk_entrepot_gpf.workflow.resolver.AbstractResolver import AbstractResolver
 from sdk_entrepot_gpf.workflow.resolver.Errors import ResolverNotFoundError
+from sdk_entrepot_gpf.workflow.resolver.ResolverCache import ResolverCache
 from sdk_entrepot_gpf.io.Config import Config
 
 
 class GlobalResolver(metaclass=Singleton):
     """Classe permettant de résoudre une action en appelant les tous résolveurs listés.
 
+    Les résolutions sont mises en cache (cf. `ResolverCache`) : la clef comprend le résolveur, la chaîne à
+    résoudre (paramètres imbriqués résolus), les paramètres supplémentaires (ex. datastore) et le complément
+    de clef du résolveur (`cache_key()`). Le cache est partagé par les threads (étapes lancées en parallèle).
+
     Attributes:
         __resolvers (Dict[str, AbstractResolver]): association nom du résolveur / résolveur.
+        __cache (ResolverCache): cache des résolutions.
     """
 
-    _solved_strings: Dict[str, str] = {}
-
     def __init__(self) -> None:
         """Constructeur."""
         self.__resolvers: Dict[str, AbstractResolver] = {}
         self.__regex: Pattern[str] = re.compile(Config().get_str("workflow_resolution_regex", "global_regex"))
+        self.__cache = ResolverCache.from_config()
 
     def add_resolver(self, resolver: AbstractResolver) -> None:
-        """Ajoute un résolveur à la liste."""
+        """Ajoute un résolveur à la liste (les résolutions en cache d'un résolveur remplacé sont oubliées)."""
         self.__resolvers[resolver.name] = resolver
+        self.__cache.invalidate(f"{resolver.name}\n")
 
     def resolve(self, string_to_solve_global: str, **kwargs: Any) -> str:
         """Résout la chaîne à traiter et retourne la chaîne obtenue.
@@ -58,24 +65,33 @@ class GlobalResolver(metaclass=Singleton):
             d_resolution = match.groupdict()
             # La chaîne complète, à remplacer, est donnée par la clé "param"
             s_all: str = d_resolution["param"]
-            # Si cette chaîne n'est pas déjà dans _solved_strings
-            if not s_all in GlobalResolver._solved_strings:
-                # Le nom du résolveur est donnée par la clé "resolver_name"
-                s_resolver_name: str = d_resolution["resolver_name"]
-                # La chaîne à résoudre est donnée par la clé "to_solve"
-                s_to_solve: str = d_resolution["to_solve"]
-                # Vérification de l’existante du resolver
-                if not s_resolver_name in GlobalResolver().resolvers:
-                    Config().om.debug(f"Resolvers : {', '.join(GlobalResolver().resolvers.keys())}")
-                    raise ResolverNotFoundError(s_resolver_name)
-                # On résout globalement la chaîne à résoudre (si jamais on a des paramètres dans des paramètres...)
-                s_to_solve = GlobalResolver().resolve(s_to_solve, **kwargs)
-                # Puis on la résout avec le résolveur à utiliser et on l'ajoute à la liste
-                s_solved = GlobalResolver().resolvers[s_resolver_name].resolve(s_to_solve, **kwargs)
-                GlobalResolver._solved_strings[s_all] = s_solved
-                Config().om.debug(f"resolve_group - {s_all} ({s_resolver_name} : {s_to_solve} => {s_solved})")
-            Config().om.debug(f"resolve_group - {s_all} (from cache)")
-            return GlobalResolver._solved_strings[s_all]
+            # Le nom du résolveur est donnée par la clé "resolver_name"
+            s_resolver_name: str = d_resolution["resolver_name"]
+            # Vérification de l’existante du resolver
+            if not s_resolver_name in GlobalResolver().resolvers:
+                Config().om.debug(f"Resolvers : {', '.join(GlobalResolver().resolvers.keys())}")
+                raise ResolverNotFoundError(s_resolver_name)
+            o_resolver = GlobalResolver().resolvers[s_resolver_name]
+            # On résout globalement la chaîne à résoudre (si jamais on a des paramètres dans des paramètres...)
+            s_to_solve = GlobalResolver().resolve(d_resolution["to_solve"], **kwargs)
+            # Politique de cache du résolveur (les résolveurs ne dérivant pas d'AbstractResolver sont gardés sans limite)
+            f_ttl: Optional[float] = None
+            b_persistent = False
+            s_cache_key = ""
+            if isinstance(o_resolver, AbstractResolver):
+                f_ttl = o_resolver.cache_ttl()
+                b_persistent = o_resolver.cache_persistent
+                s_cache_key = o_resolver.cache_key(s_to_solve, **kwargs)
+            s_key = "\n".join([s_resolver_name, s_to_solve, json.dumps(kwargs, sort_keys=True, default=str), s_cache_key])
+            s_solved = self.__cache.get(s_key, b_persistent)
+            if s_solved is not None:
+                Config().om.debug(f"resolve_group - {s_all} (from cache)")
+                return s_solved
+            # Puis on la résout avec le résolveur à utiliser et on la met en cache
+            s_solved = o_resolver.resolve(s_to_solve, **kwargs)
+            self.__cache.put(s_key, s_solved, f_ttl, b_persistent)
+            Config().om.debug(f"resolve_group - {s_all} ({s_resolver_name} : {s_to_solve} => {s_solved})")
+            return s_solved
 
         return self.__regex.sub(resolve_group, string_to_solve_global)
 
@@ -83,6 +99,10 @@ class GlobalResolver(metaclass=Singleton):
     def resolvers(self) -> Dict[str, AbstractResolver]:
         return self.__resolvers
 
+    @property
+    def cache(self) -> ResolverCache:
+        return self.__cache
+
     @property
     def regex(self) -> Pattern[str]:
         return self.__regex
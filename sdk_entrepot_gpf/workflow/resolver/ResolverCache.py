@@ -0,0 +1,167 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Optional, Tuple
+
+from sdk_entrepot_gpf.io.Config import Config
+
+
+class ResolverCache:
+    """Cache des résolutions du GlobalResolver.
+
+    Chaque résolution est conservée avec une date d'expiration dépendant du résolveur (`cache_ttl()` du résolveur,
+    surchargeable par `resolver_cache.<nom du résolveur>_ttl`) : sans limite (None), quelques secondes, ou pas du
+    tout (0). Le cache mémoire est borné (`resolver_cache.size` résolutions, les moins récemment utilisées sont
+    oubliées).
+
+    Si `resolver_cache.file` est renseigné, les résolutions des résolveurs persistants (`cache_persistent`) sont
+    aussi conservées dans une base SQLite partagée entre deux exécutions (commandes `resolve` et `workflow`).
+
+    Attributes:
+        size (int): nombre maximum de résolutions conservées (en mémoire et dans la base)
+        file (Optional[Path]): base SQLite des résolutions persistantes (None : pas de persistance)
+    """
+
+    def __init__(self, size: int, file: Optional[Path] = None) -> None:
+        self.size = size
+        self.file = file
+        # clef => (date d'expiration ou None, résolution)
+        self.__entries: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__initialized = False
+
+    @classmethod
+    def from_config(cls) -> "ResolverCache":
+        """Instancie le cache selon la configuration (section `resolver_cache`).
+
+        Returns:
+            ResolverCache: cache paramétré
+        """
+        s_file = Config().get("resolver_cache", "file")
+        return cls(size=Config().get_int("resolver_cache", "size", 1000), file=Path(s_file) if s_file else None)
+
+    def get(self, key: str, persistent: bool = False) -> Optional[str]:
+        """Renvoie la résolution en cache si elle n'a pas expiré.
+
+        Args:
+            key (str): clef de la résolution
+            persistent (bool, optional): recherche aussi dans la base persistante. Defaults to False.
+
+        Returns:
+            Optional[str]: résolution (None si absente ou expirée)
+        """
+        with self.__lock:
+            o_entry = self.__entries.get(key)
+            if o_entry is not None:
+                if o_entry[0] is None or o_entry[0] > time.time():
+                    self.__entries.move_to_end(key)
+                    return o_entry[1]
+                del self.__entries[key]
+        if not persistent or self.file is None:
+            return None
+        o_row = self.__select(key)
+        if o_row is None:
+            return None
+        self.__remember(key, o_row[0], o_row[1])
+        return o_row[1]
+
+    def put(self, key: str, value: str, ttl: Optional[float], persistent: bool = False) -> None:
+        """Enregistre une résolution.
+
+        Args:
+            key (str): clef de la résolution
+            value (str): résolution
+            ttl (Optional[float]): durée de vie en secondes (None : sans limite, 0 : pas de cache)
+            persistent (bool, optional): enregistrement aussi dans la base persistante. Defaults to False.
+        """
+        if ttl is not None and ttl <= 0:
+            return
+        f_expires = time.time() + ttl if ttl is not None else None
+        self.__remember(key, f_expires, value)
+        if persistent and self.file is not None:
+            self.__insert(key, f_expires, value)
+
+    def invalidate(self, prefix: str) -> None:
+        """Oublie (en mémoire) les résolutions dont la clef commence par le préfixe indiqué (ex. résolveur remplacé).
+
+        Args:
+            prefix (str): début des clefs à oublier
+        """
+        with self.__lock:
+            for s_key in [s_key for s_key in self.__entries if s_key.startswith(prefix)]:
+                del self.__entries[s_key]
+
+    def clear(self) -> None:
+        """Vide le cache mémoire."""
+        with self.__lock:
+            self.__entries.clear()
+
+    def __remember(self, key: str, expires: Optional[float], value: str) -> None:
+        """Ajoute une résolution au cache mémoire en respectant sa taille maximale.
+
+        Args:
+            key (str): clef de la résolution
+            expires (Optional[float]): date d'expiration (None : sans limite)
+            value (str): résolution
+        """
+        if self.size <= 0:
+            return
+        with self.__lock:
+            self.__entries[key] = (expires, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.size:
+                self.__entries.popitem(last=False)
+
+    def __connect(self) -> sqlite3.Connection:
+        """Ouvre la base (et crée la table en oubliant les résolutions expirées si besoin).
+
+        Returns:
+            sqlite3.Connection: connexion à la base
+        """
+        assert self.file is not None
+        with self.__lock:
+            if not self.__initialized:
+                self.file.parent.mkdir(parents=True, exist_ok=True)
+                with closing(sqlite3.connect(self.file, timeout=60)) as o_connection:
+                    with o_connection:
+                        o_connection.execute("CREATE TABLE IF NOT EXISTS resolution (key TEXT PRIMARY KEY, expires REAL, value TEXT)")
+                        o_connection.execute("DELETE FROM resolution WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+                self.__initialized = True
+        return sqlite3.connect(self.file, timeout=60)
+
+    def __select(self, key: str) -> Optional[Tuple[Optional[float], str]]:
+        """Cherche une résolution non expirée dans la base.
+
+        Args:
+            key (str): clef de la résolution
+
+        Returns:
+            Optional[Tuple[Optional[float], str]]: date d'expiration et résolution (None si absente)
+        """
+        try:
+            with closing(self.__connect()) as o_connection:
+                o_row = o_connection.execute("SELECT expires, value FROM resolution WHERE key = ? AND (expires IS NULL OR expires > ?)", (key, time.time())).fetchone()
+        except sqlite3.Error as e_error:
+            Config().om.warning(f"Cache des résolutions {self.file} inutilisable ({e_error}).")
+            return None
+        return (o_row[0], str(o_row[1])) if o_row is not None else None
+
+    def __insert(self, key: str, expires: Optional[float], value: str) -> None:
+        """Enregistre une résolution dans la base.
+
+        Args:
+            key (str): clef de la résolution
+            expires (Optional[float]): date d'expiration (None : sans limite)
+            value (str): résolution
+        """
+        try:
+            with closing(self.__connect()) as o_connection:
+                with o_connection:
+                    o_connection.execute("INSERT OR REPLACE INTO resolution (key, expires, value) VALUES (?, ?, ?)", (key, expires, value))
+                    # taille bornée : on oublie les résolutions les plus anciennes
+                    o_connection.execute("DELETE FROM resolution WHERE rowid NOT IN (SELECT rowid FROM resolution ORDER BY rowid DESC LIMIT ?)", (max(self.size, 1),))
+        except sqlite3.Error as e_error:
+            Config().om.warning(f"Cache des résolutions {self.file} inutilisable ({e_error}), la résolution n'est pas conservée.")
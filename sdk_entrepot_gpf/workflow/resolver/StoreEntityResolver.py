@@ -1,6 +1,7 @@
 import json
 import re
-from typing import Any, Dict, Optional, Pattern, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Pattern, Type
 
 from sdk_entrepot_gpf.workflow.resolver.AbstractResolver import AbstractResolver
 from sdk_entrepot_gpf.workflow.resolver.Errors import NoEntityFoundError, ResolverError
@@ -18,11 +19,17 @@ from sdk_entrepot_gpf.store.Datastore import Datastore
 from sdk_entrepot_gpf.store.Permission import Permission
 from sdk_entrepot_gpf.store.Key import Key
 from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.helper.DictHelper import DictHelper
 
 
 class StoreEntityResolver(AbstractResolver):
     """Classe permettant de résoudre des paramètres faisant référence à une entité.
 
+    Les entités listées ne sont complétées (requête `GET`) que si l'information demandée n'est pas dans le
+    listing ; les entités à compléter le sont ensemble (`store_api.nb_parallel_hydrate` requêtes simultanées).
+    Les résolutions sont gardées en cache peu de temps (les entités peuvent être modifiées ou supprimées)
+    et peuvent être conservées entre deux exécutions (cf. `ResolverCache`).
+
     Attributes:
         __name (str): nom de code du resolver
         __regex (Pattern[str]): regex du resolver
@@ -42,6 +49,9 @@ class StoreEntityResolver(AbstractResolver):
         Key.entity_name(): Key,
     }
 
+    cache_default_ttl: Optional[float] = 60
+    cache_persistent = True
+
     def __init__(self, name: str) -> None:
         """À l'instanciation, le résolveur est nommé selon ce qui est indiqué dans la Config.
 
@@ -94,21 +104,20 @@ class StoreEntityResolver(AbstractResolver):
 
         if d_groups["number_dict"] == "ONE":
             # json de la première entité trouvée
-            l_entities[0].api_update()
+            self._hydrate(l_entities[:1], d_groups)
             return l_entities[0].to_json()
         if d_groups["number_dict"] == "ALL":
             # json de toutes les entités trouvées
-            l_res1 = []
-            for o_entity in l_entities:
-                o_entity.api_update()
-                l_res1.append(o_entity.get_store_properties())
-            return json.dumps(l_res1)
+            self._hydrate(l_entities, d_groups)
+            return json.dumps([o_entity.get_store_properties() for o_entity in l_entities])
         try:
             if not d_groups["number_selected"] or d_groups["number_selected"] == "ONE":
                 # une seule entité à traiter, affichage d'une info ou d'un tag
+                self._hydrate(l_entities[:1], d_groups)
                 return self._get_info_or_tag(l_entities[0], d_groups)
             if d_groups["number_selected"] == "ALL":
                 # affichage d'une info ou d'un tag pour toutes les entités trouvées
+                self._hydrate(l_entities, d_groups)
                 l_res2 = [self._get_info_or_tag(o_entity, d_groups) for o_entity in l_entities]
                 if d_groups["selected_field_type"] == "tags":
                     l_res2 = list(set(l_res2))
@@ -119,7 +128,6 @@ class StoreEntityResolver(AbstractResolver):
         raise ResolverError(self.name, string_to_solve)
 
     def _get_info_or_tag(self, o_entity: StoreEntity, d_groups: Dict[str, Any]) -> str:
-        o_entity.api_update()
         s_selected_field = d_groups["selected_field"]
         # On doit envoyer une info ?
         if d_groups["selected_field_type"] == "infos":
@@ -130,6 +138,44 @@ class StoreEntityResolver(AbstractResolver):
             return o_entity.get_tag(s_selected_field)
         raise KeyError(s_selected_field)
 
+    def _hydrate(self, entities: List[StoreEntity], d_groups: Dict[str, Any]) -> None:
+        """Complète ensemble les entités partielles (issues du listing) dont le listing ne contient pas l'information demandée.
+
+        Args:
+            entities (List[StoreEntity]): entités à traiter
+            d_groups (Dict[str, Any]): groupes de la chaîne à résoudre (information ou tag demandé)
+        """
+        l_to_update = [o_entity for o_entity in entities if o_entity.is_partial and not StoreEntityResolver.__in_listing(o_entity, d_groups)]
+        i_nb_workers = min(Config().get_int("store_api", "nb_parallel_hydrate", 1), len(l_to_update))
+        if i_nb_workers <= 1:
+            for o_entity in l_to_update:
+                o_entity.api_update()
+            return
+        Config().om.debug(f"Récupération complète de {len(l_to_update)} entités ({i_nb_workers} simultanément)...")
+        with ThreadPoolExecutor(max_workers=i_nb_workers) as o_executor:
+            # attente de toutes les requêtes et propagation des erreurs
+            for o_future in [o_executor.submit(o_entity.api_update) for o_entity in l_to_update]:
+                o_future.result()
+
+    @staticmethod
+    def __in_listing(entity: StoreEntity, d_groups: Dict[str, Any]) -> bool:
+        """Indique si l'information ou le tag demandé est déjà connu (entité complète non demandée).
+
+        Args:
+            entity (StoreEntity): entité partielle
+            d_groups (Dict[str, Any]): groupes de la chaîne à résoudre
+
+        Returns:
+            bool: True si la requête `GET` de l'entité est inutile
+        """
+        if not d_groups["selected_field"]:
+            # entité complète demandée
+            return False
+        d_properties = entity.get_store_properties()
+        if d_groups["selected_field_type"] == "tags":
+            return d_groups["selected_field"] in d_properties.get("tags", {})
+        return DictHelper.get(d_properties, d_groups["selected_field"], raise_error=False) is not None
+
     @property
     def regex(self) -> Pattern[str]:
         return self.__regex
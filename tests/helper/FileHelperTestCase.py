@@ -20,3 +20,17 @@ class FileHelperTestCase(GpfTestCase):
     def test_md5_hash(self) -> None:
         """Vérification du bon fonctionnement de la fonction md5_hash."""
         self.assertEqual("54b63bf2c922188c1f19abe97e865005", FileHelper.md5_hash(GpfTestCase.test_dir_path / "helper" / "FileHelper" / "md5.txt"))
+        # Taille de bloc différente : même clef
+        self.assertEqual("54b63bf2c922188c1f19abe97e865005", FileHelper.md5_hash(GpfTestCase.test_dir_path / "helper" / "FileHelper" / "md5.txt", 3))
+
+    def test_md5_hash_files(self) -> None:
+        """Vérification du bon fonctionnement de la fonction md5_hash_files (un ou plusieurs processus)."""
+        p_dir = GpfTestCase.data_dir_path / "datasets" / "3_test_dataset_sub_dir" / "CANTON"
+        l_files = sorted(p_file for p_file in p_dir.iterdir() if p_file.is_file())
+        d_expected = {p_file: FileHelper.md5_hash(p_file) for p_file in l_files}
+        for i_nb_workers in [1, 2]:
+            l_done = []
+            d_md5 = FileHelper.md5_hash_files(l_files, i_nb_workers, 1024, callback=lambda p_file, s_md5: l_done.append((p_file, s_md5)))  # pylint:disable=cell-var-from-loop
+            self.assertDictEqual(d_md5, d_expected)
+            # Suivi de l'avancement : un appel par fichier
+            self.assertCountEqual(l_done, list(d_expected.items()))
@@ -0,0 +1,36 @@
+from unittest.mock import patch
+
+from requests.adapters import HTTPAdapter
+
+from sdk_entrepot_gpf.helper.SessionHelper import SessionHelper
+from sdk_entrepot_gpf.io.Config import Config
+from tests.GpfTestCase import GpfTestCase
+
+
+class SessionHelperTestCase(GpfTestCase):
+    """Test de la classe SessionHelper.
+
+    cmd : python3 -m unittest -b tests.helper.SessionHelperTestCase
+    """
+
+    def test_new_session(self) -> None:
+        """Vérification du bon fonctionnement de la fonction new_session."""
+        # Paramétrage par défaut
+        o_session = SessionHelper.new_session("store_api")
+        o_adapter = o_session.get_adapter("https://data.geopf.fr/api")
+        self.assertIsInstance(o_adapter, HTTPAdapter)
+        assert isinstance(o_adapter, HTTPAdapter)
+        self.assertEqual(getattr(o_adapter, "_pool_connections"), Config().get_int("store_api", "pool_connections"))
+        self.assertEqual(getattr(o_adapter, "_pool_maxsize"), Config().get_int("store_api", "pool_maxsize"))
+        self.assertEqual(o_adapter.max_retries.total, Config().get_int("store_api", "max_retries"))
+        self.assertIs(o_session.get_adapter("http://data.geopf.fr/api"), o_adapter)
+        self.assertEqual(o_session.headers["Connection"], "keep-alive")
+        # Sans keep-alive
+        d_conf = {"pool_connections": "2", "pool_maxsize": "3", "max_retries": "1", "pool_block": "False", "keep_alive": "False"}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf[option]):
+            o_session = SessionHelper.new_session("test")
+        o_adapter = o_session.get_adapter("https://data.geopf.fr/api")
+        assert isinstance(o_adapter, HTTPAdapter)
+        self.assertEqual(getattr(o_adapter, "_pool_maxsize"), 3)
+        self.assertEqual(o_adapter.max_retries.total, 1)
+        self.assertEqual(o_session.headers["Connection"], "close")
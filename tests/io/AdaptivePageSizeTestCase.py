@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import requests
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.io.AdaptivePageSize import AdaptivePageSize
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import InternalServerError, NotFoundError
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class AdaptivePageSizeTestCase(GpfTestCase):
+    """Tests AdaptivePageSize class.
+
+    cmd : python3 -m unittest -b tests.io.AdaptivePageSizeTestCase
+    """
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe : taille adaptative entre 5 et 40, départ à 10"""
+        AdaptivePageSize._instance = None
+        d_conf = {"nb_limit": "10", "page_size_adaptive": "true", "page_size_min": "5", "page_size_max": "40", "page_size_max_item_latency": "0.1", "page_size_growth_factor": "2"}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            AdaptivePageSize()
+
+    def tearDown(self) -> None:
+        """fonction lancée après chaque test de la classe : on oublie les tailles mémorisées"""
+        AdaptivePageSize._instance = None
+
+    def test_disabled(self) -> None:
+        """Vérifie que la taille est fixe (nb_limit) par défaut."""
+        AdaptivePageSize._instance = None
+        self.assertFalse(AdaptivePageSize().enabled)
+        self.assertEqual(AdaptivePageSize().get("route"), 10)
+        self.assertEqual(AdaptivePageSize().record("route", None, 10, 10, 0), 10)
+        self.assertEqual(AdaptivePageSize().back_off("route", None, 10), 10)
+
+    def test_record_back_off(self) -> None:
+        """Vérifie l'agrandissement, la réduction et la mémorisation par (route, datastore)."""
+        o_page_size = AdaptivePageSize()
+        self.assertTrue(o_page_size.enabled)
+        self.assertEqual(o_page_size.get("route", "ds"), 10)
+        # Page pleine et rapide : on agrandit jusqu'au max
+        self.assertEqual(o_page_size.record("route", "ds", 10, 10, 0.5), 20)
+        self.assertEqual(o_page_size.record("route", "ds", 20, 20, 1), 40)
+        self.assertEqual(o_page_size.record("route", "ds", 40, 40, 1), 40)
+        # Page lente ou incomplète : on garde la taille
+        self.assertEqual(o_page_size.record("route", "ds", 40, 40, 10), 40)
+        self.assertEqual(o_page_size.record("route", "ds", 40, 3, 0), 40)
+        # Mémorisation par route et datastore
+        self.assertEqual(o_page_size.get("route", "ds"), 40)
+        self.assertEqual(o_page_size.get("route", "other"), 10)
+        self.assertEqual(o_page_size.get("other", "ds"), 10)
+        # Réduction jusqu'au min
+        self.assertEqual(o_page_size.back_off("route", "ds", 40), 20)
+        self.assertEqual(o_page_size.back_off("route", "ds", 20), 10)
+        self.assertEqual(o_page_size.back_off("route", "ds", 10), 5)
+        self.assertEqual(o_page_size.back_off("route", "ds", 5), 5)
+        self.assertEqual(o_page_size.get("route", "ds"), 5)
+        # On ne réatteint pas une taille ayant échoué
+        self.assertEqual(o_page_size.record("route", "ds", 5, 5, 0), 5)
+        # Oubli
+        o_page_size.reset()
+        self.assertEqual(o_page_size.get("route", "ds"), 10)
+
+    def test_is_overload(self) -> None:
+        """Vérifie la détection des erreurs pouvant venir d'une page trop grande."""
+        self.assertTrue(AdaptivePageSize.is_overload(requests.Timeout()))
+        e_server = InternalServerError("url", "GET", None, None)
+        e_server.status_code = 500
+        try:
+            raise GpfSdkError("échec") from e_server
+        except GpfSdkError as e_error:
+            self.assertTrue(AdaptivePageSize.is_overload(e_error))
+        e_not_found = NotFoundError("url", "GET", None, None, "")
+        e_not_found.status_code = 404
+        self.assertFalse(AdaptivePageSize.is_overload(e_not_found))
+        self.assertFalse(AdaptivePageSize.is_overload(GpfSdkError("échec")))
@@ -1,6 +1,7 @@
 from http import HTTPStatus
 from io import BufferedReader
 import json
+import threading
 from pathlib import Path
 from typing import Dict, Tuple
 from unittest.mock import MagicMock, patch, mock_open
@@ -11,7 +12,9 @@ from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.auth.Authentifier import Authentifier
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
-from sdk_entrepot_gpf.io.Errors import NotFoundError, RouteNotFoundError, ConflictError
+from sdk_entrepot_gpf.io.ResponseCache import ResponseCache
+from sdk_entrepot_gpf.io.AdaptivePageSize import AdaptivePageSize
+from sdk_entrepot_gpf.io.Errors import InternalServerError, NotFoundError, RouteNotFoundError, ConflictError
 from tests.GpfTestCase import GpfTestCase
 
 # pylint:disable=protected-access
@@ -79,7 +82,7 @@ class ApiRequesterTestCase(GpfTestCase):
             )
             # Vérification sur o_mock_request
             s_url = "https://api.test.io/api/v1/datastores/TEST_DATASTORE/create/42"
-            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, -1000)
+            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, -1000, route_name="test_create")
             # Vérification sur la réponse renvoyée par la fonction : ça doit être celle renvoyée par url_request
             self.assertEqual(o_fct_response, o_api_response)
 
@@ -101,7 +104,7 @@ class ApiRequesterTestCase(GpfTestCase):
             )
             # Vérification sur o_mock_request
             s_url = "https://api.test.io/api/v1/datastores/TEST_DATASTORE/timeout/42"
-            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, 40)
+            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, 40, route_name="test_timeout")
             # Vérification sur la réponse renvoyée par la fonction : ça doit être celle renvoyée par url_request
             self.assertEqual(o_fct_response, o_api_response)
         # timeout pour la route
@@ -117,7 +120,7 @@ class ApiRequesterTestCase(GpfTestCase):
             )
             # Vérification sur o_mock_request
             s_url = "https://api.test.io/api/v1/datastores/TEST_DATASTORE/timeout/42"
-            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, 50)
+            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, 50, route_name="test_timeout")
             # Vérification sur la réponse renvoyée par la fonction : ça doit être celle renvoyée par url_request
             self.assertEqual(o_fct_response, o_api_response)
 
@@ -138,7 +141,7 @@ class ApiRequesterTestCase(GpfTestCase):
             )
             # Vérification sur o_mock_request
             s_url = "https://api.test.io/api/v1/datastores/OTHER_DATASTORE/create/42"
-            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, -1000)
+            o_mock_request.assert_called_once_with(s_url, ApiRequester.POST, self.param, self.data, self.files, {}, -1000, route_name="test_create")
             # Vérification sur la réponse renvoyée par la fonction : ça doit être celle renvoyée par url_request
             self.assertEqual(o_fct_response, o_api_response)
 
@@ -199,6 +202,79 @@ class ApiRequesterTestCase(GpfTestCase):
             # Requête 1 : timeout valeur par défaut
             self.assertEqual(o_history[0].timeout, 600, "timeout")
 
+    def test_route_request_bytes_header(self) -> None:
+        """Test de route_request avec des données brutes et un header additionnel."""
+        with requests_mock.Mocker() as o_mock:
+            o_mock.put("https://api.test.io/api/v1/datastores/TEST_DATASTORE/create/42", json=self.response)
+            ApiRequester().route_request("test_create", {"id": 42}, ApiRequester.PUT, data=b"\x00\x01", header={"Content-Range": "bytes 0-1/2"})
+            o_request = o_mock.request_history[0]
+            # Les données sont envoyées telles quelles
+            self.assertEqual(o_request.body, b"\x00\x01")
+            self.assertEqual(o_request.headers["content-type"], "application/octet-stream")
+            # Le header additionnel est ajouté
+            self.assertEqual(o_request.headers["Content-Range"], "bytes 0-1/2")
+
+    def test_url_request_session(self) -> None:
+        """Test de url_request : toutes les requêtes passent par la même session."""
+        o_session = ApiRequester().session
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(self.url, json=self.response)
+            with patch.object(o_session, "request", wraps=o_session.request) as o_mock_request:
+                ApiRequester().url_request(self.url, ApiRequester.GET)
+                ApiRequester().url_request(self.url, ApiRequester.GET)
+                self.assertEqual(o_mock_request.call_count, 2)
+        # La session est conservée tant qu'on ne ferme pas
+        self.assertIs(ApiRequester().session, o_session)
+        ApiRequester().close()
+        self.assertIsNot(ApiRequester().session, o_session)
+
+    def test_url_request_rate_limiter(self) -> None:
+        """Test de route_request : le limiteur de débit est appelé avec le nom de la route à chaque tentative."""
+        s_url = "https://api.test.io/api/v1/datastores/TEST_DATASTORE/create/42"
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(s_url, [{"status_code": HTTPStatus.SERVICE_UNAVAILABLE}, {"status_code": HTTPStatus.OK}])
+            with patch.object(ApiRequester().rate_limiter, "acquire", return_value=0) as o_mock_acquire:
+                ApiRequester().route_request("test_create", {"id": 42})
+                self.assertEqual(o_mock_acquire.call_count, 2)
+                o_mock_acquire.assert_called_with("test_create")
+
+    def test_url_request_conditional_get(self) -> None:
+        """Test de url_request : requête conditionnelle et réponse en cache si 304."""
+        # Cache désactivé par défaut
+        self.assertFalse(ApiRequester().response_cache.enabled)
+        o_default_cache = ApiRequester().response_cache
+        ApiRequester().response_cache = ResponseCache(10)
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(
+                self.url,
+                [
+                    {"status_code": HTTPStatus.OK, "json": self.response, "headers": {"ETag": '"v1"', "Content-Range": "1-1/1"}},
+                    {"status_code": HTTPStatus.NOT_MODIFIED, "headers": {"ETag": '"v1"'}},
+                ],
+            )
+            # Première requête : pas d'en-tête conditionnel
+            o_response = ApiRequester().url_request(self.url, ApiRequester.GET, params=self.param)
+            self.assertDictEqual(o_response.json(), self.response)
+            self.assertNotIn("If-None-Match", o_mock.request_history[0].headers)
+            # Seconde requête : en-tête conditionnel, 304 et réponse en cache
+            o_response = ApiRequester().url_request(self.url, ApiRequester.GET, params=self.param)
+            self.assertEqual(o_mock.request_history[1].headers["If-None-Match"], '"v1"')
+            self.assertEqual(o_response.status_code, HTTPStatus.OK)
+            self.assertDictEqual(o_response.json(), self.response)
+            self.assertEqual(o_response.headers["Content-Range"], "1-1/1")
+        # Pas de requête conditionnelle pour les autres méthodes
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post(self.url, json=self.response, headers={"ETag": '"v1"'})
+            ApiRequester().url_request(self.url, ApiRequester.POST, params=self.param)
+            self.assertNotIn("If-None-Match", o_mock.request_history[0].headers)
+        # Ni pour les téléchargements de fichiers
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(self.url, content=b"fichier", headers={"ETag": '"v1"'})
+            ApiRequester().url_request(self.url, ApiRequester.GET, route_name="static_download")
+            ApiRequester().url_request(self.url, ApiRequester.GET, route_name="static_download")
+            self.assertNotIn("If-None-Match", o_mock.request_history[1].headers)
+        ApiRequester().response_cache = o_default_cache
+
     def test_url_request_timeout_param(self) -> None:
         """Test de url_request pour les timeout."""
         # Timeout None
@@ -259,6 +335,46 @@ class ApiRequesterTestCase(GpfTestCase):
             # On a dû faire 3 requêtes
             self.assertEqual(o_mock.call_count, 3, "o_mock.call_count == 3")
 
+    def test_url_request_retry_after(self) -> None:
+        """Test de url_request : l'en-tête Retry-After est respecté sur 429/503."""
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(
+                self.url,
+                [
+                    {"status_code": HTTPStatus.TOO_MANY_REQUESTS, "headers": {"Retry-After": "7"}},
+                    {"status_code": HTTPStatus.SERVICE_UNAVAILABLE, "headers": {"Retry-After": "3"}},
+                    {"status_code": HTTPStatus.OK, "json": self.response},
+                ],
+            )
+            with patch("time.sleep", return_value=None) as o_mock_sleep:
+                o_response = ApiRequester().url_request(self.url, ApiRequester.GET)
+            self.assertDictEqual(o_response.json(), self.response)
+            self.assertEqual(o_mock.call_count, 3)
+            self.assertListEqual([c.args[0] for c in o_mock_sleep.call_args_list], [7.0, 3.0])
+
+    def test_route_request_retry_status(self) -> None:
+        """Test de route_request : les codes et méthodes rejouables sont définis par route."""
+        s_url = "https://api.test.io/api/v1/datastores/TEST_DATASTORE/retry"
+        # 500 non rejouable pour cette route : une seule tentative
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(s_url, status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
+            with self.assertRaises(GpfSdkError) as o_arc:
+                ApiRequester().route_request("test_retry")
+            self.assertEqual(o_arc.exception.message, "L'exécution d'une requête a échoué après 1 tentatives.")
+            self.assertEqual(o_mock.call_count, 1)
+        # 503 rejouable pour cette route : toutes les tentatives
+        with requests_mock.Mocker() as o_mock:
+            o_mock.get(s_url, status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+            with self.assertRaises(GpfSdkError):
+                ApiRequester().route_request("test_retry")
+            self.assertEqual(o_mock.call_count, 3)
+        # POST non rejouable pour cette route
+        with requests_mock.Mocker() as o_mock:
+            o_mock.post(s_url, status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+            with self.assertRaises(GpfSdkError):
+                ApiRequester().route_request("test_retry", method=ApiRequester.POST)
+            self.assertEqual(o_mock.call_count, 1)
+
     def test_url_request_bad_request(self) -> None:
         """Test de url_request dans le cadre de 1 erreur bad request."""
         # On mock...
@@ -396,6 +512,139 @@ class ApiRequesterTestCase(GpfTestCase):
         # Content-Range non parsable : on doit s'arrêter
         self.assertFalse(ApiRequester.range_next_page("non_parsable", 0))
 
+    def test_range_total(self) -> None:
+        """Test de range_total."""
+        self.assertEqual(ApiRequester.range_total("1-10/25"), 25)
+        self.assertIsNone(ApiRequester.range_total(None))
+        self.assertIsNone(ApiRequester.range_total("non_parsable"))
+
+    def test_route_request_pages(self) -> None:
+        """Test de route_request_pages en mode séquentiel et parallèle : les éléments sont renvoyés dans l'ordre."""
+        # La génération des réponses simulées n'est pas thread-safe
+        o_lock = threading.Lock()
+
+        def side_effect(*_args: str, **kwargs: Dict[str, int]) -> requests.Response:
+            # 25 éléments au total, pages de 10
+            i_page, i_limit = kwargs["params"]["page"], kwargs["params"]["limit"]
+            l_items = list(range((i_page - 1) * i_limit, min(25, i_page * i_limit)))
+            with o_lock:
+                return GpfTestCase.get_response(json=l_items, headers={"Content-Range": f"{l_items[0]}-{l_items[-1]}/25"})
+
+        for i_workers in [1, 3]:
+            with patch.object(ApiRequester(), "route_request", side_effect=side_effect) as o_mock_request:
+                l_items = ApiRequester().route_request_pages("route", route_params={"datastore": "ds"}, params={"k": "v"}, limit=10, nb_workers=i_workers)
+                self.assertListEqual(l_items, list(range(25)))
+                self.assertEqual(o_mock_request.call_count, 3)
+                self.assertCountEqual(
+                    [o_call.kwargs["params"] for o_call in o_mock_request.call_args_list],
+                    [{"k": "v", "page": i, "limit": 10} for i in [1, 2, 3]],
+                )
+
+        # Une seule page : pas d'autre requête
+        o_response = GpfTestCase.get_response(json=[1, 2], headers={"Content-Range": "1-2/2"})
+        with patch.object(ApiRequester(), "route_request", return_value=o_response) as o_mock_request:
+            self.assertListEqual(ApiRequester().route_request_pages("route", limit=10, nb_workers=3), [1, 2])
+            o_mock_request.assert_called_once_with("route", route_params=None, params={"page": 1, "limit": 10})
+
+    def test_route_request_iter_pages_adaptive(self) -> None:
+        """Test de route_request_iter_pages avec une taille de page adaptative : agrandissement puis réduction sur erreur 5xx."""
+        AdaptivePageSize._instance = None  # pylint:disable=protected-access
+        d_conf = {"nb_limit": "10", "page_size_adaptive": "true", "page_size_max": "40"}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            AdaptivePageSize()
+        l_calls = []
+
+        def side_effect(*_args: str, **kwargs: Dict[str, int]) -> requests.Response:
+            # 100 éléments au total, erreur serveur si on demande plus de 20 éléments
+            i_page, i_limit = kwargs["params"]["page"], kwargs["params"]["limit"]
+            l_calls.append((i_page, i_limit))
+            if i_limit > 20:
+                e_server = InternalServerError("url", "GET", None, None)
+                e_server.status_code = 500
+                raise GpfSdkError("échec") from e_server
+            l_items = list(range((i_page - 1) * i_limit, min(100, i_page * i_limit)))
+            return GpfTestCase.get_response(json=l_items, headers={"Content-Range": f"{l_items[0]}-{l_items[-1]}/100"})
+
+        try:
+            with patch.object(ApiRequester(), "route_request", side_effect=side_effect):
+                l_items = [i for l_page in ApiRequester().route_request_iter_pages("route", route_params={"datastore": "ds"}) for i in l_page]
+            # Tous les éléments sont récupérés, dans l'ordre
+            self.assertListEqual(l_items, list(range(100)))
+            # Page 1 de 10 : 10 n'est pas multiple de 20, on garde 10 pour la page 2 ; puis 20 (page 2 de 20 = éléments 20 à 39),
+            # 40 (erreur) et on revient à 20
+            self.assertListEqual(l_calls[:4], [(1, 10), (2, 10), (2, 20), (2, 40)])
+            self.assertEqual(l_calls[4], (3, 20))
+            # La taille réduite est mémorisée
+            self.assertEqual(AdaptivePageSize().get("route", "ds"), 20)
+        finally:
+            AdaptivePageSize._instance = None  # pylint:disable=protected-access
+
+    def test_route_request_iter_pages_back_off(self) -> None:
+        """Test de route_request_iter_pages : après réduction, le listing reprend au dernier élément récupéré même si la nouvelle taille ne divise pas la position."""
+        AdaptivePageSize._instance = None  # pylint:disable=protected-access
+        d_conf = {"nb_limit": "30", "page_size_adaptive": "true", "page_size_max": "30", "page_size_growth_factor": "4"}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            AdaptivePageSize()
+        l_calls = []
+
+        def side_effect(*_args: str, **kwargs: Dict[str, int]) -> requests.Response:
+            # 47 éléments au total, erreur serveur sur la 2e page de 30
+            i_page, i_limit = kwargs["params"]["page"], kwargs["params"]["limit"]
+            l_calls.append((i_page, i_limit))
+            if (i_page, i_limit) == (2, 30):
+                e_server = InternalServerError("url", "GET", None, None)
+                e_server.status_code = 500
+                raise GpfSdkError("échec") from e_server
+            l_items = list(range((i_page - 1) * i_limit, min(47, i_page * i_limit)))
+            return GpfTestCase.get_response(json=l_items, headers={"Content-Range": f"{l_items[0]}-{l_items[-1]}/47"})
+
+        try:
+            with patch.object(ApiRequester(), "route_request", side_effect=side_effect):
+                l_items = [i for l_page in ApiRequester().route_request_iter_pages("route", route_params={"datastore": "ds"}) for i in l_page]
+            self.assertListEqual(l_items, list(range(47)))
+            # Taille réduite à 7 : la page 5 (éléments 28 à 34) recouvre 2 éléments déjà reçus, puis pages alignées
+            self.assertListEqual(l_calls, [(1, 30), (2, 30), (5, 7), (6, 7), (7, 7)])
+        finally:
+            AdaptivePageSize._instance = None  # pylint:disable=protected-access
+
+    def test_route_request_pages_parallel_adaptive(self) -> None:
+        """Test de route_request_pages en parallèle avec une taille de page adaptative : mesures mémorisées et réduction sur erreur 5xx."""
+        AdaptivePageSize._instance = None  # pylint:disable=protected-access
+        d_conf = {"nb_limit": "10", "page_size_adaptive": "true", "page_size_max": "40", "page_size_max_item_latency": "10"}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            AdaptivePageSize()
+        l_calls = []
+        # La génération des réponses simulées n'est pas thread-safe
+        o_lock = threading.Lock()
+
+        def side_effect(*_args: str, **kwargs: Dict[str, int]) -> requests.Response:
+            # 50 éléments au total, erreur serveur si on demande plus de 20 éléments hors 1re page
+            i_page, i_limit = kwargs["params"]["page"], kwargs["params"]["limit"]
+            l_calls.append((i_page, i_limit))
+            if i_limit > 20 and i_page > 1:
+                e_server = InternalServerError("url", "GET", None, None)
+                e_server.status_code = 500
+                raise GpfSdkError("échec") from e_server
+            l_items = list(range((i_page - 1) * i_limit, min(50, i_page * i_limit)))
+            with o_lock:
+                return GpfTestCase.get_response(json=l_items, headers={"Content-Range": f"{l_items[0]}-{l_items[-1]}/50"})
+
+        try:
+            with patch.object(ApiRequester(), "route_request", side_effect=side_effect):
+                # Pages de 10 rapides : la taille est agrandie pour le listing suivant
+                self.assertListEqual(ApiRequester().route_request_pages("route", route_params={"datastore": "ds"}, nb_workers=3), list(range(50)))
+                self.assertTrue(all(i_limit == 10 for _, i_limit in l_calls))
+                self.assertEqual(AdaptivePageSize().get("route", "ds"), 20)
+                self.assertListEqual(ApiRequester().route_request_pages("route", route_params={"datastore": "ds"}, nb_workers=3), list(range(50)))
+                self.assertEqual(AdaptivePageSize().get("route", "ds"), 40)
+                # Pages de 40 en échec : taille réduite et listing refait page par page
+                l_calls.clear()
+                self.assertListEqual(ApiRequester().route_request_pages("route", route_params={"datastore": "ds"}, nb_workers=3), list(range(50)))
+                self.assertListEqual(l_calls, [(1, 40), (2, 40), (1, 20), (2, 20), (3, 20)])
+                self.assertEqual(AdaptivePageSize().get("route", "ds"), 20)
+        finally:
+            AdaptivePageSize._instance = None  # pylint:disable=protected-access
+
     def test_route_upload_file(self) -> None:
         """test de route_upload_file"""
         p_file = Path("rep/file")
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.AsyncApiRequester import AsyncApiRequester
+from sdk_entrepot_gpf.io.Errors import NotFoundError
+from tests.GpfTestCase import GpfTestCase
+
+
+class AsyncApiRequesterTestCase(GpfTestCase):
+    """Tests AsyncApiRequester class.
+
+    cmd : python3 -m unittest -b tests.io.AsyncApiRequesterTestCase
+    """
+
+    def test_route_request(self) -> None:
+        """Test de route_request : appel de la version synchrone avec les mêmes paramètres."""
+        o_response = GpfTestCase.get_response(json={"key": "value"})
+        with patch.object(ApiRequester, "route_request", return_value=o_response) as o_mock_request:
+            o_result = asyncio.run(AsyncApiRequester().route_request("route", {"id": 42}, ApiRequester.POST, params={"p": 1}, data={"d": 2}))
+            o_mock_request.assert_called_once_with("route", {"id": 42}, ApiRequester.POST, {"p": 1}, {"d": 2}, None, -1000, None)
+            self.assertEqual(o_result, o_response)
+        # Header additionnel transmis
+        with patch.object(ApiRequester, "route_request", return_value=o_response) as o_mock_request:
+            asyncio.run(AsyncApiRequester().route_request("route", method=ApiRequester.PUT, data=b"data", header={"Content-Range": "bytes 0-3/4"}))
+            o_mock_request.assert_called_once_with("route", None, ApiRequester.PUT, None, b"data", None, -1000, {"Content-Range": "bytes 0-3/4"})
+
+    def test_url_request(self) -> None:
+        """Test de url_request : appel de la version synchrone avec les mêmes paramètres."""
+        o_response = GpfTestCase.get_response()
+        with patch.object(ApiRequester, "url_request", return_value=o_response) as o_mock_request:
+            o_result = asyncio.run(AsyncApiRequester().url_request("https://api.test.io/", ApiRequester.GET, timeout=10))
+            o_mock_request.assert_called_once_with("https://api.test.io/", ApiRequester.GET, None, None, None, {}, 10)
+            self.assertEqual(o_result, o_response)
+
+    def test_route_upload_file(self) -> None:
+        """Test de route_upload_file : appel de la version synchrone avec les mêmes paramètres."""
+        o_response = GpfTestCase.get_response()
+        p_file = Path("rep/file")
+        with patch.object(ApiRequester, "route_upload_file", return_value=o_response) as o_mock_request:
+            o_result = asyncio.run(AsyncApiRequester().route_upload_file("route", p_file, "file", {"id": 42}))
+            o_mock_request.assert_called_once_with("route", p_file, "file", {"id": 42}, "POST", None, None, -1000)
+            self.assertEqual(o_result, o_response)
+
+    def test_error(self) -> None:
+        """Test de la propagation des erreurs de ApiRequester."""
+        with patch.object(ApiRequester, "route_request", side_effect=NotFoundError("url", "GET", None, None, "")):
+            with self.assertRaises(NotFoundError):
+                asyncio.run(AsyncApiRequester().route_request("route"))
+
+    def test_run_concurrency(self) -> None:
+        """Test de run : les appels sont bien exécutés en parallèle."""
+        l_threads: List[str] = []
+        o_barrier = threading.Barrier(3, timeout=5)
+
+        def f_wait(i: int) -> int:
+            # Chaque appel attend les deux autres : ça bloquerait si l'exécution était séquentielle
+            o_barrier.wait()
+            l_threads.append(threading.current_thread().name)
+            time.sleep(0.01)
+            return i * 2
+
+        async def f_main() -> Any:
+            return await asyncio.gather(*[AsyncApiRequester().run(f_wait, i) for i in range(3)])
+
+        self.assertEqual(asyncio.run(f_main()), [0, 2, 4])
+        self.assertEqual(len(set(l_threads)), 3)
@@ -0,0 +1,141 @@
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import requests
+
+from sdk_entrepot_gpf.Errors import GpfSdkError
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.ChunkedUpload import ChunkedUpload
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy
+from tests.GpfTestCase import GpfTestCase
+
+
+class ChunkedUploadTestCase(GpfTestCase):
+    """Tests ChunkedUpload class.
+
+    cmd : python3 -m unittest -b tests.io.ChunkedUploadTestCase
+    """
+
+    s_content = b"0123456789"
+    d_route_params = {"datastore": "ds", "upload": "up"}
+    d_params = {"path": "data/file.bin"}
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe : fichier de 10 octets et serveur simulé"""
+        self.o_tmp_dir = tempfile.TemporaryDirectory()  # pylint:disable=consider-using-with
+        self.p_dir = Path(self.o_tmp_dir.name)
+        self.p_file = self.p_dir / "file.bin"
+        self.p_file.write_bytes(self.s_content)
+        # Contenu reçu par le serveur et requêtes effectuées
+        self.o_received = bytearray()
+        self.l_ranges: List[str] = []
+        # Nombre d'échecs à simuler par Content-Range et en-tête Range à renvoyer
+        self.d_failures: Dict[str, int] = {}
+        self.s_range: Optional[str] = None
+
+    def tearDown(self) -> None:
+        """fonction lancée après chaque test de la classe : suppression du dossier temporaire"""
+        self.o_tmp_dir.cleanup()
+
+    def route_request(self, *_args: Any, data: bytes, header: Dict[str, str], **_kwargs: Any) -> requests.Response:
+        """Serveur simulé : échoue selon d_failures, sinon réassemble le morceau reçu.
+
+        Args:
+            data (bytes): morceau envoyé
+            header (Dict[str, str]): header de la requête
+
+        Returns:
+            requests.Response: réponse simulée
+        """
+        s_content_range = header["Content-Range"]
+        self.l_ranges.append(s_content_range)
+        if self.d_failures.get(s_content_range, 0) > 0:
+            self.d_failures[s_content_range] -= 1
+            raise GpfSdkError("échec")
+        o_match = re.match(r"bytes (\d+)-", s_content_range)
+        assert o_match
+        i_start = int(o_match.group(1))
+        self.o_received[i_start : i_start + len(data)] = data
+        return GpfTestCase.get_response(headers={"Range": self.s_range} if self.s_range else {})
+
+    def upload(self, o_chunked_upload: ChunkedUpload) -> None:
+        """Lance le téléversement avec le serveur simulé.
+
+        Args:
+            o_chunked_upload (ChunkedUpload): téléverseur
+        """
+        with patch.object(ApiRequester(), "route_request", side_effect=self.route_request):
+            with patch("sdk_entrepot_gpf.io.ChunkedUpload.time.sleep"):
+                o_chunked_upload.upload("upload_push_data_chunk", self.p_file, self.d_route_params, self.d_params)
+
+    def test_is_chunked(self) -> None:
+        """Vérifie le choix du découpage."""
+        self.assertFalse(ChunkedUpload(0, self.p_dir).is_chunked(self.p_file))
+        self.assertFalse(ChunkedUpload(10, self.p_dir).is_chunked(self.p_file))
+        self.assertTrue(ChunkedUpload(4, self.p_dir).is_chunked(self.p_file))
+
+    def test_upload(self) -> None:
+        """Vérifie l'envoi par morceaux et la suppression du journal."""
+        o_chunked_upload = ChunkedUpload(4, self.p_dir / "journal")
+        self.upload(o_chunked_upload)
+        self.assertEqual(self.l_ranges, ["bytes 0-3/10", "bytes 4-7/10", "bytes 8-9/10"])
+        self.assertEqual(bytes(self.o_received), self.s_content)
+        self.assertEqual(list((self.p_dir / "journal").iterdir()), [])
+
+    def test_upload_retry(self) -> None:
+        """Vérifie qu'un morceau en échec est retenté."""
+        self.d_failures = {"bytes 4-7/10": 2}
+        o_chunked_upload = ChunkedUpload(4, self.p_dir / "journal", nb_attempts=3)
+        self.upload(o_chunked_upload)
+        self.assertEqual(self.l_ranges, ["bytes 0-3/10", "bytes 4-7/10", "bytes 4-7/10", "bytes 4-7/10", "bytes 8-9/10"])
+        self.assertEqual(bytes(self.o_received), self.s_content)
+
+    def test_upload_resume(self) -> None:
+        """Vérifie la reprise au dernier morceau acquitté après une interruption."""
+        self.d_failures = {"bytes 8-9/10": 2}
+        o_chunked_upload = ChunkedUpload(4, self.p_dir / "journal", nb_attempts=2)
+        with self.assertRaises(GpfSdkError):
+            self.upload(o_chunked_upload)
+        # Les 2 premiers morceaux sont consignés dans le journal
+        self.assertEqual(o_chunked_upload.acknowledged("upload_push_data_chunk", self.p_file, self.d_route_params, self.d_params), 8)
+        self.assertEqual(o_chunked_upload.acknowledged("upload_push_data_chunk", self.p_file, self.d_route_params, {"path": "other"}), 0)
+        # Reprise : seul le dernier morceau est renvoyé
+        self.l_ranges = []
+        self.upload(o_chunked_upload)
+        self.assertEqual(self.l_ranges, ["bytes 8-9/10"])
+        self.assertEqual(bytes(self.o_received), self.s_content)
+        self.assertEqual(o_chunked_upload.acknowledged("upload_push_data_chunk", self.p_file, self.d_route_params, self.d_params), 0)
+
+    def test_resume_offset(self) -> None:
+        """Vérifie que la reprise n'a lieu que si la taille sur le serveur correspond au journal."""
+        self.d_failures = {"bytes 8-9/10": 2}
+        o_chunked_upload = ChunkedUpload(4, self.p_dir / "journal", nb_attempts=2)
+        with self.assertRaises(GpfSdkError):
+            self.upload(o_chunked_upload)
+        # Taille identique : reprise à 8 octets
+        self.assertEqual(o_chunked_upload.resume_offset("upload_push_data_chunk", self.p_file, 8, self.d_route_params, self.d_params), 8)
+        # Taille différente : le journal est supprimé et on repart de zéro
+        self.assertEqual(o_chunked_upload.resume_offset("upload_push_data_chunk", self.p_file, 4, self.d_route_params, self.d_params), 0)
+        self.assertEqual(o_chunked_upload.acknowledged("upload_push_data_chunk", self.p_file, self.d_route_params, self.d_params), 0)
+        self.l_ranges = []
+        self.upload(o_chunked_upload)
+        self.assertEqual(self.l_ranges, ["bytes 0-3/10", "bytes 4-7/10", "bytes 8-9/10"])
+        # Sans journal : pas de reprise
+        self.assertEqual(o_chunked_upload.resume_offset("upload_push_data_chunk", self.p_file, 8, self.d_route_params, self.d_params), 0)
+
+    def test_single_retry_layer(self) -> None:
+        """Vérifie que la route de téléversement par morceaux n'est pas rejouée par l'ApiRequester."""
+        self.assertFalse(RetryPolicy.from_config("upload_push_data_chunk").is_retryable(ApiRequester.PUT, 500))
+        self.assertTrue(RetryPolicy.from_config("upload_push_data").is_retryable(ApiRequester.PUT, 500))
+
+    def test_upload_server_range(self) -> None:
+        """Vérifie que la position indiquée par le serveur (en-tête Range) est respectée."""
+        self.s_range = "bytes=0-1"
+        o_chunked_upload = ChunkedUpload(4, self.p_dir / "journal")
+        # Le serveur n'acquitte jamais au-delà de 2 octets : erreur au 2e morceau
+        with self.assertRaises(GpfSdkError):
+            self.upload(o_chunked_upload)
+        self.assertEqual(self.l_ranges, ["bytes 0-3/10", "bytes 2-5/10"])
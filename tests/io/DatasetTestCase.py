@@ -1,7 +1,13 @@
+import tempfile
+import threading
+import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
+from sdk_entrepot_gpf.Errors import GpfSdkError
 from sdk_entrepot_gpf.helper.FileHelper import FileHelper
 from sdk_entrepot_gpf.helper.JsonHelper import JsonHelper
+from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.io.Dataset import Dataset
 
 from tests.GpfTestCase import GpfTestCase
@@ -50,3 +56,155 @@ class DatasetTestCase(GpfTestCase):
             s_md5 = FileHelper.md5_hash(p_file)
             s_line = f"{s_md5}  {p_file.relative_to(p_root).as_posix()}"
             self.assertIn(s_line, s_data_md5)
+
+    def test_generate_md5_files_deferred(self) -> None:
+        """Test de la génération différée des fichiers md5 (pendant le téléversement)."""
+        p_root = GpfTestCase.data_dir_path / "datasets" / "3_test_dataset_sub_dir"
+        d_dataset = JsonHelper.load(p_root / "upload_descriptor.json")["datasets"][0]
+        p_md5 = p_root / "CANTON.md5"
+        p_md5.unlink(missing_ok=True)
+        # Génération différée : le fichier md5 est listé mais pas encore créé
+        o_dataset = Dataset(d_dataset, p_root, generate_md5=False)
+        self.assertEqual(o_dataset.md5_files, [p_md5])
+        self.assertFalse(o_dataset.md5_generated)
+        self.assertFalse(p_md5.exists(), "CANTON.md5 existe")
+        # Génération (sur 2 processus)
+        with patch.object(Config(), "get_int", side_effect=lambda section, option, fallback=None: {"md5_nb_workers": 2}.get(option, fallback)):
+            o_dataset.generate_md5_files()
+        self.assertTrue(o_dataset.md5_generated)
+        self.assertTrue(p_md5.exists(), "CANTON.md5 n'existe pas")
+        self.assertFalse(p_md5.with_suffix(".md5.tmp").exists())
+        l_lines = p_md5.read_text(encoding="UTF-8").splitlines()
+        # Une ligne par fichier, dans l'ordre des chemins
+        self.assertListEqual(l_lines, [f"{FileHelper.md5_hash(p_file)}  {p_file.relative_to(p_root).as_posix()}" for p_file in sorted(o_dataset.data_files, key=str)])
+        # Second appel sans effet
+        with patch.object(FileHelper, "md5_hash_files") as o_mock_hash:
+            o_dataset.generate_md5_files()
+            o_mock_hash.assert_not_called()
+
+    def test_generate_md5_files_cancel(self) -> None:
+        """Test de l'annulation de la génération des fichiers md5."""
+        p_root = GpfTestCase.data_dir_path / "datasets" / "3_test_dataset_sub_dir"
+        d_dataset = JsonHelper.load(p_root / "upload_descriptor.json")["datasets"][0]
+        p_md5 = p_root / "CANTON.md5"
+        p_md5.unlink(missing_ok=True)
+        o_dataset = Dataset(d_dataset, p_root, generate_md5=False)
+        o_cancel = threading.Event()
+        o_cancel.set()
+        with self.assertRaises(GpfSdkError) as o_arc:
+            o_dataset.generate_md5_files(o_cancel)
+        self.assertEqual(o_arc.exception.message, "Calcul des clefs md5 annulé.")
+        self.assertFalse(o_dataset.md5_generated)
+        self.assertFalse(p_md5.exists(), "CANTON.md5 existe")
+
+    def test_include_exclude(self) -> None:
+        """Test des filtres include/exclude du dataset."""
+        p_root = GpfTestCase.data_dir_path / "datasets" / "3_test_dataset_sub_dir"
+        d_dataset = JsonHelper.load(p_root / "upload_descriptor.json")["datasets"][0]
+        # Seuls les .shp et les .txt, sauf ceux du sous-dossier
+        d_dataset["include"] = ["*.shp", "*.txt"]
+        d_dataset["exclude"] = ["CANTON/sous_dossier/*"]
+        o_dataset = Dataset(d_dataset, p_root, generate_md5=False)
+        self.assertDictEqual(o_dataset.data_files, {p_root / "CANTON/CANTON.shp": "CANTON"})
+        # Exclusion seule
+        d_dataset["include"] = []
+        d_dataset["exclude"] = ["*.sh?", "*.cpg"]
+        o_dataset = Dataset(d_dataset, p_root, generate_md5=False)
+        self.assertDictEqual(
+            o_dataset.data_files,
+            {
+                p_root / "CANTON/CANTON.dbf": "CANTON",
+                p_root / "CANTON/CANTON.prj": "CANTON",
+                p_root / "CANTON/sous_dossier/coucou.txt": "CANTON/sous_dossier",
+            },
+        )
+
+    def test_include_exclude_md5(self) -> None:
+        """Test des fichiers md5 de deux datasets filtrant différemment un même dossier."""
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_root = Path(s_dir)
+            (p_root / "data").mkdir()
+            for s_name in ["a.shp", "a.dbf", "b.shp"]:
+                (p_root / "data" / s_name).write_text(s_name, encoding="utf-8")
+            # fichier md5 d'une livraison précédente non filtrée : non réutilisé
+            (p_root / "data.md5").write_text("ancien", encoding="utf-8")
+            d_dataset = {"data_dirs": ["data"], "upload_infos": {}, "comments": [], "tags": {}}
+            o_dataset_shp = Dataset({**d_dataset, "include": ["*.shp"]}, p_root)
+            o_dataset_dbf = Dataset({**d_dataset, "include": ["*.dbf"]}, p_root)
+            p_md5_shp, p_md5_dbf = o_dataset_shp.md5_files[0], o_dataset_dbf.md5_files[0]
+            self.assertNotEqual(p_md5_shp, p_md5_dbf)
+            self.assertNotIn(p_root / "data.md5", [p_md5_shp, p_md5_dbf])
+            self.assertListEqual([s_line.split("  ")[1] for s_line in p_md5_shp.read_text(encoding="utf-8").splitlines()], ["data/a.shp", "data/b.shp"])
+            self.assertListEqual([s_line.split("  ")[1] for s_line in p_md5_dbf.read_text(encoding="utf-8").splitlines()], ["data/a.dbf"])
+            # même filtres : fichier md5 réutilisé tant que la sélection n'a pas changé
+            i_mtime_ns = p_md5_shp.stat().st_mtime_ns
+            self.assertEqual(Dataset({**d_dataset, "include": ["*.shp"]}, p_root).md5_files, [p_md5_shp])
+            self.assertEqual(p_md5_shp.stat().st_mtime_ns, i_mtime_ns)
+            # nouveau fichier sélectionné : fichier md5 régénéré
+            (p_root / "data" / "c.shp").write_text("c.shp", encoding="utf-8")
+            Dataset({**d_dataset, "include": ["*.shp"]}, p_root)
+            self.assertListEqual([s_line.split("  ")[1] for s_line in p_md5_shp.read_text(encoding="utf-8").splitlines()], ["data/a.shp", "data/b.shp", "data/c.shp"])
+
+    def test_bundle(self) -> None:
+        """Test du regroupement des petits fichiers : les fichiers md5 décrivent les archives."""
+        p_root = GpfTestCase.data_dir_path / "datasets" / "3_test_dataset_sub_dir"
+        d_dataset = JsonHelper.load(p_root / "upload_descriptor.json")["datasets"][0]
+        o_get = Config().get
+        with tempfile.TemporaryDirectory() as s_dir:
+            d_conf = {"bundle_max_file_size": "1000", "bundle_dir": s_dir}
+            with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf[option] if option in d_conf else o_get(section, option, fallback)):
+                o_dataset = Dataset(d_dataset, p_root)
+                # Rien n'est écrit à la construction : regroupement et fichiers md5 juste avant le téléversement
+                self.assertFalse(o_dataset.md5_generated)
+                self.assertListEqual(list(Path(s_dir).iterdir()), [])
+                o_dataset.generate_md5_files()
+            p_bundle = next(Path(s_dir).glob("*/CANTON/_bundle_00001.zip"))
+            # Les petits fichiers de CANTON sont remplacés par l'archive, le fichier seul du sous-dossier est conservé
+            l_small_files = sorted(p_file.name for p_file in (p_root / "CANTON").iterdir() if p_file.is_file() and p_file.stat().st_size < 1000)
+            with zipfile.ZipFile(p_bundle) as o_zip:
+                self.assertListEqual(o_zip.namelist(), l_small_files)
+            d_expected = {p_root / "CANTON" / s_name: "CANTON" for s_name in ["CANTON.dbf", "CANTON.shp", "CANTON.cpg", "CANTON.prj", "CANTON.shx"] if s_name not in l_small_files}
+            d_expected[p_bundle] = "CANTON"
+            d_expected[p_root / "CANTON/sous_dossier/coucou.txt"] = "CANTON/sous_dossier"
+            self.assertDictEqual(o_dataset.data_files, d_expected)
+            # Fichier md5 généré à côté des archives et décrivant la livraison regroupée
+            p_md5 = p_bundle.parent.with_suffix(".md5")
+            self.assertListEqual(o_dataset.md5_files, [p_md5])
+            l_lines = p_md5.read_text(encoding="UTF-8").splitlines()
+            self.assertIn(f"{FileHelper.md5_hash(p_bundle)}  CANTON/_bundle_00001.zip", l_lines)
+            self.assertEqual(len(l_lines), len(d_expected))
+            # Nouvelle livraison du même dataset : archives inchangées, le fichier md5 n'est pas régénéré
+            with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf[option] if option in d_conf else o_get(section, option, fallback)):
+                i_md5_mtime_ns = p_md5.stat().st_mtime_ns
+                Dataset(d_dataset, p_root).generate_md5_files()
+                self.assertEqual(p_md5.stat().st_mtime_ns, i_md5_mtime_ns)
+                # Archive réécrite : le fichier md5 est régénéré
+                p_bundle.with_suffix(".json").unlink()
+                o_dataset = Dataset(d_dataset, p_root)
+                o_dataset.bundle_files()
+                self.assertFalse(p_md5.exists())
+                o_dataset.generate_md5_files()
+            self.assertListEqual(p_md5.read_text(encoding="UTF-8").splitlines(), l_lines)
+
+    def test_bundle_same_data_dir(self) -> None:
+        """Test du regroupement de deux datasets d'un même dossier : archives et fichiers md5 distincts."""
+        o_get = Config().get
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_root = Path(s_dir) / "root"
+            (p_root / "data").mkdir(parents=True)
+            for s_name in ["a.shp", "b.shp", "a.dbf", "b.dbf"]:
+                (p_root / "data" / s_name).write_text(s_name, encoding="utf-8")
+            d_dataset = {"data_dirs": ["data"], "comments": [], "tags": {}}
+            d_conf = {"bundle_max_file_size": "1000", "bundle_dir": str(Path(s_dir) / "bundles")}
+            with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf[option] if option in d_conf else o_get(section, option, fallback)):
+                o_dataset_shp = Dataset({**d_dataset, "include": ["*.shp"], "upload_infos": {"name": "shp"}}, p_root)
+                o_dataset_dbf = Dataset({**d_dataset, "include": ["*.dbf"], "upload_infos": {"name": "dbf"}}, p_root)
+                o_dataset_shp.generate_md5_files()
+                o_dataset_dbf.generate_md5_files()
+            self.assertNotEqual(o_dataset_shp.md5_files, o_dataset_dbf.md5_files)
+            for o_dataset, l_names in [(o_dataset_shp, ["a.shp", "b.shp"]), (o_dataset_dbf, ["a.dbf", "b.dbf"])]:
+                p_bundle = next(iter(o_dataset.data_files))
+                self.assertEqual(p_bundle.name, "_bundle_00001.zip")
+                with zipfile.ZipFile(p_bundle) as o_zip:
+                    self.assertListEqual(o_zip.namelist(), l_names)
+                self.assertIn(f"{FileHelper.md5_hash(p_bundle)}  data/_bundle_00001.zip", o_dataset.md5_files[0].read_text(encoding="UTF-8").splitlines())
@@ -0,0 +1,82 @@
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.FileBundler import FileBundler
+from tests.GpfTestCase import GpfTestCase
+
+
+class FileBundlerTestCase(GpfTestCase):
+    """Tests FileBundler class.
+
+    cmd : python3 -m unittest -b tests.io.FileBundlerTestCase
+    """
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe : dossier de données temporaire"""
+        self.o_tmp_dir = tempfile.TemporaryDirectory()  # pylint:disable=consider-using-with
+        self.p_dir = Path(self.o_tmp_dir.name)
+        self.p_data = self.p_dir / "data"
+        (self.p_data / "sub").mkdir(parents=True)
+        # 4 petits fichiers de 10 octets dans data, 1 dans data/sub, 1 gros fichier dans data
+        self.d_files = {}
+        for i in range(4):
+            p_file = self.p_data / f"small_{i}.txt"
+            p_file.write_bytes(f"{i}".encode("utf-8") * 10)
+            self.d_files[p_file] = "data"
+        p_file = self.p_data / "sub" / "alone.txt"
+        p_file.write_bytes(b"a" * 10)
+        self.d_files[p_file] = "data/sub"
+        self.p_big = self.p_data / "big.bin"
+        self.p_big.write_bytes(b"b" * 1000)
+        self.d_files[self.p_big] = "data"
+
+    def tearDown(self) -> None:
+        """fonction lancée après chaque test de la classe : suppression du dossier temporaire"""
+        self.o_tmp_dir.cleanup()
+
+    def test_from_config(self) -> None:
+        """Vérifie la configuration (désactivé par défaut)."""
+        o_bundler = FileBundler.from_config(self.p_data)
+        self.assertFalse(o_bundler.enabled)
+        self.assertEqual(o_bundler.bundle(self.d_files), self.d_files)
+        d_conf = {"bundle_max_file_size": "100", "bundle_size": "1000", "bundle_dir": str(self.p_dir / "bundles")}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            o_bundler = FileBundler.from_config(self.p_data)
+        self.assertTrue(o_bundler.enabled)
+        self.assertEqual(o_bundler.directory.parent, self.p_dir / "bundles")
+        # un dossier par dataset, même pour un dossier racine commun
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            self.assertNotEqual(FileBundler.from_config(self.p_data, "dataset_1").directory, FileBundler.from_config(self.p_data, "dataset_2").directory)
+
+    def test_bundle(self) -> None:
+        """Vérifie le regroupement, le découpage en plusieurs archives et la réutilisation des archives."""
+        p_bundles = self.p_dir / "bundles"
+        # 25 octets max par archive : 2 fichiers de 10 octets par archive
+        o_bundler = FileBundler(100, 25, False, p_bundles)
+        d_bundled = o_bundler.bundle(self.d_files)
+        p_bundle_1 = p_bundles / "data" / "_bundle_00001.zip"
+        p_bundle_2 = p_bundles / "data" / "_bundle_00002.zip"
+        # Gros fichier et fichier seul non regroupés
+        self.assertDictEqual(d_bundled, {self.p_big: "data", self.p_data / "sub" / "alone.txt": "data/sub", p_bundle_1: "data", p_bundle_2: "data"})
+        with zipfile.ZipFile(p_bundle_1) as o_zip:
+            self.assertEqual(o_zip.namelist(), ["small_0.txt", "small_1.txt"])
+            self.assertEqual(o_zip.read("small_1.txt"), b"1" * 10)
+        with zipfile.ZipFile(p_bundle_2) as o_zip:
+            self.assertEqual(o_zip.namelist(), ["small_2.txt", "small_3.txt"])
+        # Relance sans modification : archives réutilisées (même contenu, non réécrites)
+        s_content = p_bundle_1.read_bytes()
+        i_mtime_ns = p_bundle_1.stat().st_mtime_ns
+        self.assertDictEqual(o_bundler.bundle(self.d_files), d_bundled)
+        self.assertEqual(p_bundle_1.stat().st_mtime_ns, i_mtime_ns)
+        # Archive reconstruite à l'identique
+        p_bundle_1.with_suffix(".json").unlink()
+        o_bundler.bundle(self.d_files)
+        self.assertEqual(p_bundle_1.read_bytes(), s_content)
+        # Fichier modifié : archive reconstruite
+        (self.p_data / "small_0.txt").write_bytes(b"z" * 12)
+        o_bundler.bundle(self.d_files)
+        with zipfile.ZipFile(p_bundle_1) as o_zip:
+            self.assertEqual(o_zip.read("small_0.txt"), b"z" * 12)
@@ -0,0 +1,83 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.helper.FileHelper import FileHelper
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Md5Cache import Md5Cache
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class Md5CacheTestCase(GpfTestCase):
+    """Tests Md5Cache class.
+
+    cmd : python3 -m unittest -b tests.io.Md5CacheTestCase
+    """
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe : cache dans un dossier temporaire"""
+        self.o_tmp_dir = tempfile.TemporaryDirectory()  # pylint:disable=consider-using-with
+        self.p_dir = Path(self.o_tmp_dir.name)
+        self.p_file = self.p_dir / "file.txt"
+        self.p_file.write_text("contenu", encoding="utf-8")
+        Md5Cache._instance = None
+        d_conf = {"md5_cache": "true", "md5_cache_file": str(self.p_dir / "cache" / "md5.sqlite")}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            Md5Cache()
+
+    def tearDown(self) -> None:
+        """fonction lancée après chaque test de la classe : suppression du cache"""
+        Md5Cache._instance = None
+        self.o_tmp_dir.cleanup()
+
+    def test_get_put(self) -> None:
+        """Vérifie l'enregistrement et l'invalidation des clefs."""
+        o_cache = Md5Cache()
+        self.assertTrue(o_cache.enabled)
+        self.assertEqual(o_cache.get([self.p_file]), {})
+        o_cache.put([(self.p_file, self.p_file.stat(), "md5_1")])
+        self.assertTrue(o_cache.file.exists())
+        self.assertEqual(o_cache.get([self.p_file]), {self.p_file: "md5_1"})
+        # Même clef pour un chemin relatif équivalent
+        p_relative = Path(os.path.relpath(self.p_file))
+        self.assertEqual(o_cache.get([p_relative]), {p_relative: "md5_1"})
+        # Modification du fichier (taille et date) : la clef n'est plus valide
+        o_stat = self.p_file.stat()
+        self.p_file.write_text("autre contenu", encoding="utf-8")
+        os.utime(self.p_file, ns=(o_stat.st_atime_ns, o_stat.st_mtime_ns))
+        self.assertEqual(o_cache.get([self.p_file]), {})
+        # État lu avant une modification : la clef n'est pas réutilisée
+        o_cache.put([(self.p_file, o_stat, "md5_2")])
+        self.assertEqual(o_cache.get([self.p_file]), {})
+
+    def test_disabled(self) -> None:
+        """Vérifie que rien n'est conservé si le cache est désactivé."""
+        Md5Cache._instance = None
+        d_conf = {"md5_cache": "false", "md5_cache_file": str(self.p_dir / "md5.sqlite")}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            o_cache = Md5Cache()
+        self.assertFalse(o_cache.enabled)
+        o_cache.put([(self.p_file, self.p_file.stat(), "md5")])
+        self.assertEqual(o_cache.get([self.p_file]), {})
+        self.assertFalse((self.p_dir / "md5.sqlite").exists())
+
+    def test_md5_hash_files(self) -> None:
+        """Vérifie que FileHelper ne recalcule que les fichiers modifiés."""
+        p_other = self.p_dir / "other.txt"
+        p_other.write_text("autre", encoding="utf-8")
+        d_md5 = FileHelper.md5_hash_files([self.p_file, p_other])
+        # Tout est en cache : aucun calcul
+        with patch.object(FileHelper, "md5_hash", side_effect=FileHelper.md5_hash) as o_mock_hash:
+            self.assertEqual(FileHelper.md5_hash_files([self.p_file, p_other]), d_md5)
+            o_mock_hash.assert_not_called()
+        # Un fichier modifié : seul lui est recalculé
+        self.p_file.write_text("nouveau contenu", encoding="utf-8")
+        with patch.object(FileHelper, "md5_hash", side_effect=FileHelper.md5_hash) as o_mock_hash:
+            d_new_md5 = FileHelper.md5_hash_files([self.p_file, p_other])
+            o_mock_hash.assert_called_once_with(self.p_file, FileHelper.MD5_BUFFER_SIZE, False)
+        self.assertEqual(d_new_md5[p_other], d_md5[p_other])
+        self.assertNotEqual(d_new_md5[self.p_file], d_md5[self.p_file])
+        self.assertEqual(FileHelper.md5_hash(self.p_file), d_new_md5[self.p_file])
@@ -0,0 +1,79 @@
+import threading
+from typing import List
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.RateLimiter import RateLimiter, TokenBucket
+from tests.GpfTestCase import GpfTestCase
+
+
+class RateLimiterTestCase(GpfTestCase):
+    """Tests RateLimiter and TokenBucket classes.
+
+    cmd : python3 -m unittest -b tests.io.RateLimiterTestCase
+    """
+
+    def test_token_bucket(self) -> None:
+        """Vérifie le seau à jetons : la rafale passe puis on attend 1/rate par requête."""
+        with patch("time.monotonic", return_value=100.0), patch("time.sleep", return_value=None) as o_mock_sleep:
+            o_bucket = TokenBucket(rate=2, capacity=2)
+            # Rafale de 2 : pas d'attente
+            self.assertEqual(o_bucket.acquire(), 0)
+            self.assertEqual(o_bucket.acquire(), 0)
+            o_mock_sleep.assert_not_called()
+            # Ensuite il faut attendre 0.5 s puis 1 s (le temps ne s'écoule pas ici)
+            self.assertEqual(o_bucket.acquire(), 0.5)
+            self.assertEqual(o_bucket.acquire(), 1.0)
+            self.assertListEqual([c.args[0] for c in o_mock_sleep.call_args_list], [0.5, 1.0])
+        # Le seau se remplit avec le temps
+        with patch("time.monotonic", return_value=110.0), patch("time.sleep", return_value=None) as o_mock_sleep:
+            self.assertEqual(o_bucket.acquire(), 0)
+            o_mock_sleep.assert_not_called()
+        # Capacité par défaut
+        self.assertEqual(TokenBucket(rate=0.5).capacity, 1)
+        self.assertEqual(TokenBucket(rate=5).capacity, 5)
+
+    def test_token_bucket_threads(self) -> None:
+        """Vérifie que le seau est partagé correctement entre threads (chaque jeton n'est consommé qu'une fois)."""
+        l_waits: List[float] = []
+        o_lock = threading.Lock()
+        with patch("time.monotonic", return_value=100.0), patch("time.sleep", return_value=None):
+            o_bucket = TokenBucket(rate=10, capacity=1)
+
+            def f_run() -> None:
+                f_wait = o_bucket.acquire()
+                with o_lock:
+                    l_waits.append(f_wait)
+
+            l_threads = [threading.Thread(target=f_run) for _ in range(10)]
+            for o_thread in l_threads:
+                o_thread.start()
+            for o_thread in l_threads:
+                o_thread.join()
+        # Chaque thread a une attente différente : 0, 0.1, 0.2, ...
+        self.assertListEqual(sorted(round(f, 6) for f in l_waits), [round(i * 0.1, 6) for i in range(10)])
+
+    def test_rate_limiter(self) -> None:
+        """Vérifie la lecture de la configuration (globale et par route)."""
+        d_conf = {
+            ("store_api", "rate_limit"): "0",
+            ("store_api", "rate_limit_burst"): "0",
+            ("routing", "upload_push_data_rate_limit"): "2",
+            ("routing", "upload_push_data_rate_limit_burst"): "3",
+        }
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get((section, option), fallback)):
+            with patch.object(TokenBucket, "acquire", return_value=0.25) as o_mock_acquire:
+                o_limiter = RateLimiter()
+                # Pas de limite globale ni pour la route
+                self.assertEqual(o_limiter.acquire(), 0)
+                self.assertEqual(o_limiter.acquire("upload_list"), 0)
+                o_mock_acquire.assert_not_called()
+                # Limite pour la route
+                self.assertEqual(o_limiter.acquire("upload_push_data"), 0.25)
+                o_mock_acquire.assert_called_once_with()
+                # Limite globale (après reset pour relire la config)
+                d_conf[("store_api", "rate_limit")] = "10"
+                self.assertEqual(o_limiter.acquire("upload_push_data"), 0.25)
+                o_limiter.reset()
+                self.assertEqual(o_limiter.acquire("upload_push_data"), 0.5)
+                self.assertEqual(o_limiter.acquire("upload_list"), 0.25)
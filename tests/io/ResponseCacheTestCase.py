@@ -0,0 +1,108 @@
+import tempfile
+import time
+from pathlib import Path
+
+import requests_mock
+
+from sdk_entrepot_gpf.io.ResponseCache import ResponseCache
+from tests.GpfTestCase import GpfTestCase
+
+
+class ResponseCacheTestCase(GpfTestCase):
+    """Tests ResponseCache class.
+
+    cmd : python3 -m unittest -b tests.io.ResponseCacheTestCase
+    """
+
+    url = "https://api.test.io/entity"
+
+    def test_key(self) -> None:
+        """Vérifie le calcul de la clef : URL complète avec les paramètres encodés."""
+        self.assertEqual(ResponseCache.key(self.url), self.url)
+        self.assertEqual(ResponseCache.key(self.url, {"page": 1, "fields[]": ["a", "b"]}), self.url + "?page=1&fields%5B%5D=a&fields%5B%5D=b")
+
+    def test_put_get(self) -> None:
+        """Vérifie la conservation des réponses revalidables et la reconstruction sur 304."""
+        o_cache = ResponseCache(2)
+        self.assertTrue(o_cache.enabled)
+        # Réponse sans validateur : non conservée
+        o_cache.put("k0", GpfTestCase.get_response(json={"a": 0}))
+        self.assertIsNone(o_cache.get("k0"))
+        self.assertDictEqual(o_cache.conditional_headers("k0"), {})
+        # Réponse avec ETag et Last-Modified
+        o_response = GpfTestCase.get_response(json={"a": 1}, headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT", "Content-Range": "1-1/1"})
+        o_cache.put("k1", o_response)
+        self.assertDictEqual(o_cache.conditional_headers("k1"), {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        # Reconstruction à partir d'une 304
+        o_not_modified = GpfTestCase.get_response(status_code=304, headers={"ETag": '"v1"'})
+        o_rebuilt = o_cache.response("k1", o_not_modified)
+        assert o_rebuilt is not None
+        self.assertEqual(o_rebuilt.status_code, 200)
+        self.assertDictEqual(o_rebuilt.json(), {"a": 1})
+        self.assertEqual(o_rebuilt.headers["Content-Range"], "1-1/1")
+        self.assertIsNone(o_cache.response("k_absent", o_not_modified))
+        # LRU : taille 2
+        o_cache.put("k2", GpfTestCase.get_response(json={"a": 2}, headers={"ETag": '"v2"'}))
+        o_cache.get("k1")
+        o_cache.put("k3", GpfTestCase.get_response(json={"a": 3}, headers={"ETag": '"v3"'}))
+        self.assertIsNotNone(o_cache.get("k1"))
+        self.assertIsNone(o_cache.get("k2"))
+        self.assertIsNotNone(o_cache.get("k3"))
+        # Vidage
+        o_cache.clear()
+        self.assertIsNone(o_cache.get("k1"))
+        # Cache désactivé
+        o_cache = ResponseCache(0)
+        self.assertFalse(o_cache.enabled)
+        o_cache.put("k1", o_response)
+        self.assertIsNone(o_cache.get("k1"))
+
+    def test_disk(self) -> None:
+        """Vérifie la persistance sur disque entre deux instances."""
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_dir = Path(s_dir) / "cache"
+            o_cache = ResponseCache(10, p_dir)
+            o_cache.put("k1", GpfTestCase.get_response(json={"a": 1}, headers={"ETag": '"v1"'}))
+            self.assertEqual(len(list(p_dir.iterdir())), 1)
+            # Nouvelle instance : l'entrée est relue depuis le disque
+            o_cache = ResponseCache(10, p_dir)
+            d_entry = o_cache.get("k1")
+            assert d_entry is not None
+            self.assertEqual(d_entry["etag"], '"v1"')
+            self.assertEqual(d_entry["content"], b'{"a": 1}')
+            # Fichier corrompu : ignoré
+            for p_file in p_dir.iterdir():
+                p_file.write_text("pas du json", encoding="utf-8")
+            self.assertIsNone(ResponseCache(10, p_dir).get("k1"))
+
+    def test_size_limits(self) -> None:
+        """Vérifie que les réponses volumineuses ne sont pas conservées et que le dossier du cache est borné."""
+        o_cache = ResponseCache(10, max_entry_size=10)
+        o_cache.put("k1", GpfTestCase.get_response(text="x" * 11, headers={"ETag": '"v1"'}))
+        self.assertIsNone(o_cache.get("k1"))
+        o_cache.put("k2", GpfTestCase.get_response(text="x" * 10, headers={"ETag": '"v2"'}))
+        self.assertIsNotNone(o_cache.get("k2"))
+        o_cache.put("k3", GpfTestCase.get_response(text="x", headers={"ETag": '"v3"', "Content-Length": "1000"}))
+        self.assertIsNone(o_cache.get("k3"))
+        with tempfile.TemporaryDirectory() as s_dir:
+            p_dir = Path(s_dir)
+            o_cache = ResponseCache(10, p_dir, directory_max_size=1000)
+            for i in range(10):
+                o_cache.put(f"k{i}", GpfTestCase.get_response(text="x" * 200, headers={"ETag": f'"v{i}"'}))
+                # dates de modification distinctes (ordre d'utilisation)
+                time.sleep(0.02)
+            # chaque fichier fait plus de 200 octets : au plus 4 fichiers conservés, les plus récents
+            l_files = list(p_dir.iterdir())
+            self.assertLessEqual(sum(p_file.stat().st_size for p_file in l_files), 1000)
+            self.assertGreaterEqual(len(l_files), 1)
+            self.assertIsNotNone(ResponseCache(10, p_dir).get("k9"))
+            self.assertIsNone(ResponseCache(10, p_dir).get("k0"))
+
+    def test_mocker(self) -> None:
+        """Vérifie qu'un 304 sans corps ne casse pas la reconstruction."""
+        with requests_mock.Mocker():
+            o_cache = ResponseCache(1)
+            o_cache.put(self.url, GpfTestCase.get_response(text="contenu", headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+            o_rebuilt = o_cache.response(self.url, GpfTestCase.get_response(status_code=304))
+            assert o_rebuilt is not None
+            self.assertEqual(o_rebuilt.text, "contenu")
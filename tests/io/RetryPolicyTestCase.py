@@ -0,0 +1,94 @@
+import datetime
+from email.utils import format_datetime
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.RetryPolicy import RetryPolicy
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class RetryPolicyTestCase(GpfTestCase):
+    """Tests RetryPolicy class.
+
+    cmd : python3 -m unittest -b tests.io.RetryPolicyTestCase
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """fonction lancée une fois avant tous les tests de la classe"""
+        super().setUpClass()
+        Config._instance = None
+        Config().read(GpfTestCase.conf_dir_path / "test_requester.ini")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """fonction lancée une fois après tous les tests de la classe"""
+        super().tearDownClass()
+        Config._instance = None
+
+    def test_from_config(self) -> None:
+        """Vérifie la lecture de la configuration, globale ou surchargée par route."""
+        o_policy = RetryPolicy.from_config()
+        self.assertEqual(o_policy.nb_attempts, 3)
+        self.assertEqual(o_policy.base_delay, 0)
+        self.assertEqual(o_policy.backoff_factor, 2)
+        self.assertTrue(o_policy.jitter)
+        self.assertSetEqual(o_policy.retry_status, set())
+        self.assertSetEqual(o_policy.retry_methods, {"GET", "POST", "PUT", "PATCH", "DELETE"})
+        # Route sans surcharge
+        self.assertSetEqual(RetryPolicy.from_config("test_create").retry_status, set())
+        # Route avec surcharge
+        o_policy = RetryPolicy.from_config("test_retry")
+        self.assertSetEqual(o_policy.retry_status, {429, 503})
+        self.assertSetEqual(o_policy.retry_methods, {"GET"})
+
+    def test_is_retryable(self) -> None:
+        """Vérifie is_retryable."""
+        # Pas de restriction sur les codes
+        o_policy = RetryPolicy(3, 1)
+        self.assertTrue(o_policy.is_retryable("GET", 500))
+        self.assertTrue(o_policy.is_retryable("post", None))
+        # Restriction sur les codes et méthodes
+        o_policy = RetryPolicy(3, 1, retry_status={429, 503}, retry_methods={"GET"})
+        self.assertTrue(o_policy.is_retryable("GET", 429))
+        self.assertTrue(o_policy.is_retryable("GET", None))
+        self.assertFalse(o_policy.is_retryable("GET", 500))
+        self.assertFalse(o_policy.is_retryable("POST", 503))
+
+    def test_next_delay(self) -> None:
+        """Vérifie next_delay : exponentiel, plafonné, avec gigue et Retry-After."""
+        # Sans gigue
+        o_policy = RetryPolicy(10, 1, backoff_factor=2, max_delay=5, jitter=False)
+        self.assertListEqual([o_policy.next_delay(i) for i in range(1, 6)], [1, 2, 4, 5, 5])
+        # Avec gigue : tirage entre 0 et le délai calculé
+        o_policy = RetryPolicy(10, 1, backoff_factor=2, max_delay=5, jitter=True)
+        with patch("random.uniform", return_value=1.5) as o_mock_uniform:
+            self.assertEqual(o_policy.next_delay(3), 1.5)
+            o_mock_uniform.assert_called_once_with(0, 4)
+        # Retry-After en secondes
+        self.assertEqual(o_policy.next_delay(1, "12"), 12)
+        # Retry-After sous forme de date
+        o_date = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=30)
+        f_delay = o_policy.next_delay(1, format_datetime(o_date, usegmt=True))
+        self.assertTrue(25 < f_delay <= 30, f_delay)
+        # Retry-After non parsable : délai calculé
+        with patch("random.uniform", return_value=0.5):
+            self.assertEqual(o_policy.next_delay(1, "n'importe quoi"), 0.5)
+
+    def test_can_retry(self) -> None:
+        """Vérifie can_retry : nombre de tentatives et budget de temps."""
+        o_policy = RetryPolicy(3, 1, max_total_time=10)
+        self.assertTrue(o_policy.can_retry("GET", 500, 1, 0, 1))
+        self.assertTrue(o_policy.can_retry("GET", 500, 2, 5, 5))
+        # Nombre de tentatives atteint
+        self.assertFalse(o_policy.can_retry("GET", 500, 3, 0, 1))
+        # Budget de temps dépassé
+        self.assertFalse(o_policy.can_retry("GET", 500, 1, 8, 3))
+        # Méthode non rejouable
+        o_policy.retry_methods = {"GET"}
+        self.assertFalse(o_policy.can_retry("POST", 500, 1, 0, 1))
+        # Pas de budget
+        o_policy = RetryPolicy(3, 1)
+        self.assertTrue(o_policy.can_retry("GET", 500, 1, 10000, 1000))
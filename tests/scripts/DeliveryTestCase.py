@@ -0,0 +1,69 @@
+import signal
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sdk_entrepot_gpf.scripts.delivery import Delivery
+from sdk_entrepot_gpf.scripts.utils import Utils
+from tests.GpfTestCase import GpfTestCase
+
+
+class DeliveryTestCase(GpfTestCase):
+    """Tests Delivery class.
+
+    cmd : python3 -m unittest -b tests.scripts.DeliveryTestCase
+    """
+
+    def test_upload_from_descriptor_file_jobs(self) -> None:
+        """Vérifie les livraisons simultanées et le suivi groupé des vérifications."""
+        # 3 datasets : la livraison du 2e échoue
+        l_datasets = [MagicMock(upload_infos={"name": f"dataset_{i}"}) for i in range(3)]
+        l_uploads = [MagicMock(name=f"upload_{i}") for i in range(3)]
+
+        def run(o_dataset: MagicMock) -> MagicMock:
+            o_ua = MagicMock()
+            if o_dataset is l_datasets[1]:
+                o_ua.run.side_effect = ValueError("erreur")
+            else:
+                o_ua.run.return_value = l_uploads[l_datasets.index(o_dataset)]
+            return o_ua
+
+        with patch("sdk_entrepot_gpf.scripts.delivery.UploadDescriptorFileReader", return_value=MagicMock(datasets=l_datasets)):
+            with patch("sdk_entrepot_gpf.scripts.delivery.UploadAction", side_effect=lambda o_dataset, **_kwargs: run(o_dataset)) as o_mock_ua:
+                with patch.object(Utils, "monitoring_uploads", return_value=[True, False]) as o_mock_monitoring:
+                    with patch.object(Utils, "monitoring_upload") as o_mock_monitoring_upload:
+                        d_res = Delivery.upload_from_descriptor_file("descriptor.json", datastore="datastore", callback=None, ctrl_c_action=None, jobs=2)
+        self.assertEqual(o_mock_ua.call_count, 3)
+        # Suivi groupé des livraisons créées (ordre des datasets conservé)
+        o_mock_monitoring.assert_called_once_with([l_uploads[0], l_uploads[2]], "Livraison {upload} créée avec succès.", "Livraison {upload} créée en erreur !", None, None, None)
+        o_mock_monitoring_upload.assert_not_called()
+        self.assertEqual(d_res["ok"], [l_uploads[0]])
+        self.assertEqual(d_res["check_fail"], [l_uploads[2]])
+        self.assertEqual(list(d_res["upload_fail"]), ["dataset_1"])
+
+    @unittest.skipUnless(hasattr(signal, "pthread_kill"), "envoi du ctrl-C au thread principal impossible")
+    def test_upload_from_descriptor_file_jobs_ctrl_c(self) -> None:
+        """Vérifie qu'un ctrl-C pendant des livraisons simultanées arrête les livraisons sans attendre leur fin."""
+        l_datasets = [MagicMock(upload_infos={"name": f"dataset_{i}"}) for i in range(3)]
+        i_main_thread = threading.get_ident()
+        o_started = threading.Barrier(2)
+        o_stopped = threading.Barrier(3)
+        l_cancelled = []
+
+        def run(datastore: str, check_before_close: bool, cancel: threading.Event) -> None:  # pylint:disable=unused-argument
+            # les 2 premières livraisons sont en cours quand l'utilisateur fait ctrl-C
+            if o_started.wait(5) == 0:
+                signal.pthread_kill(i_main_thread, signal.SIGINT)
+            # le téléversement s'arrête dès que l'interruption est signalée
+            l_cancelled.append(cancel.wait(5))
+            o_stopped.wait(5)
+
+        o_mock_ua = MagicMock(**{"return_value.run.side_effect": run})
+        with patch("sdk_entrepot_gpf.scripts.delivery.UploadDescriptorFileReader", return_value=MagicMock(datasets=l_datasets)):
+            with patch("sdk_entrepot_gpf.scripts.delivery.UploadAction", o_mock_ua):
+                with self.assertRaises(KeyboardInterrupt):
+                    Delivery.upload_from_descriptor_file("descriptor.json", datastore="datastore", callback=None, ctrl_c_action=None, jobs=2)
+                # les livraisons en cours s'arrêtent, la 3e n'est pas lancée
+                o_stopped.wait(5)
+        self.assertListEqual(l_cancelled, [True, True])
+        self.assertEqual(o_mock_ua.call_count, 2)
@@ -78,3 +78,15 @@ class MainTestCase(GpfTestCase):
         self.assertIsNone(o_args.file)
         self.assertEqual(o_args.section, "store_authentification")
         self.assertEqual(o_args.option, "password")
+
+    def test_parse_args_entities_stream(self) -> None:
+        """Vérifie que --stream et --page sont exclusifs."""
+        o_args = Main.parse_args(args=["datastore", "--stream"])
+        self.assertTrue(o_args.stream)
+        self.assertIsNone(o_args.page)
+        o_args = Main.parse_args(args=["upload", "--page", "2"])
+        self.assertFalse(o_args.stream)
+        self.assertEqual(o_args.page, 2)
+        with self.assertRaises(SystemExit) as o_arc:
+            Main.parse_args(args=["upload", "--page", "2", "--stream"])
+        self.assertEqual(o_arc.exception.code, 2)
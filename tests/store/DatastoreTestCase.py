@@ -38,6 +38,14 @@ class DatastoreTestCase(GpfTestCase):
                 self.assertEqual(o_entity["name"], DatastoreTestCase.json_request["communities_member"][i - 1]["community"]["name"])
                 self.assertEqual(o_entity["technical_name"], DatastoreTestCase.json_request["communities_member"][i - 1]["community"]["technical_name"])
 
+    def test_api_iter(self) -> None:
+        """Vérifie le bon fonctionnement de api_iter (pas de route de listing paginé : api_list)."""
+        o_response = GpfTestCase.get_response(json=DatastoreTestCase.json_request)
+        with patch.object(ApiRequester(), "route_request", return_value=o_response) as o_mock_request:
+            l_entities = list(Datastore.api_iter(infos_filter={"name": "ds2"}))
+            o_mock_request.assert_called_once_with("user_get")
+            self.assertEqual([o_entity.id for o_entity in l_entities], ["2"])
+
     def test_api_list_filer_name(self) -> None:
         """Vérifie le bon fonctionnement de api_list quand on fait un filtre sur le nom."""
         # On a une réponse renvoyant 2 entités et on ne doit en conserver qu'une
@@ -76,6 +76,15 @@ class EndpointTestCase(GpfTestCase):
             self.assertIsInstance(l_endpoints[0], Endpoint)
             self.assertEqual(l_endpoints[0].id, "endpoint_2")
 
+    def test_api_iter(self) -> None:
+        """Vérifie le bon fonctionnement de api_iter (pas de route de listing paginé : api_list)."""
+        d_data = {"endpoints": [{"endpoint": {"_id": "endpoint_1", "type": "WMTS-TMS"}}, {"endpoint": {"_id": "endpoint_2", "type": "DOWNLOAD"}}]}
+        o_response = GpfTestCase.get_response(json=d_data)
+        with patch.object(ApiRequester(), "route_request", return_value=o_response) as o_mock_request:
+            l_endpoints = list(Endpoint.api_iter(infos_filter={"type": "DOWNLOAD"}, datastore="datastore_id"))
+            o_mock_request.assert_called_once_with("datastore_get", route_params={"datastore": "datastore_id"})
+            self.assertEqual([o_endpoint.id for o_endpoint in l_endpoints], ["endpoint_2"])
+
     def test_api_create(self) -> None:
         """Vérifie le bon fonctionnement de api_create."""
         with self.assertRaises(StoreEntityError) as o_arc:
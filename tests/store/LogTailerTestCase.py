@@ -0,0 +1,58 @@
+from typing import List
+from unittest.mock import MagicMock
+
+from sdk_entrepot_gpf.store.LogTailer import LogTailer
+from tests.GpfTestCase import GpfTestCase
+
+
+class LogTailerTestCase(GpfTestCase):
+    """Tests LogTailer class.
+
+    cmd : python3 -m unittest -b tests.store.LogTailerTestCase
+    """
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe : entité simulée dont les logs grandissent"""
+        self.l_logs: List[str] = []
+        self.l_pages: List[int] = []
+        self.o_entity = MagicMock()
+        self.o_entity.api_logs_page.side_effect = self.api_logs_page
+
+    def api_logs_page(self, page: int, limit: int) -> List[str]:
+        """Renvoie une page des logs simulés.
+
+        Args:
+            page (int): numéro de page
+            limit (int): nombre de lignes par page
+
+        Returns:
+            List[str]: lignes de la page
+        """
+        self.l_pages.append(page)
+        return self.l_logs[(page - 1) * limit : page * limit]
+
+    def test_new_lines(self) -> None:
+        """Vérifie que seules les nouvelles lignes sont renvoyées et que seules les dernières pages sont demandées."""
+        o_tailer = LogTailer(self.o_entity, page_size=3)
+        self.assertEqual(o_tailer.new_lines(), [])
+        self.l_logs += ["l1", "l2"]
+        self.assertEqual(o_tailer.new_lines(), ["l1", "l2"])
+        self.assertEqual(o_tailer.new_lines(), [])
+        # 5 nouvelles lignes : fin de la page 1, page 2 complète, début de la page 3
+        self.l_logs += ["l3", "l4", "l5", "l6", "l7"]
+        self.l_pages = []
+        self.assertEqual(o_tailer.new_lines(), ["l3", "l4", "l5", "l6", "l7"])
+        self.assertEqual(self.l_pages, [1, 2, 3])
+        # Appel suivant : seule la page 3 est demandée
+        self.l_pages = []
+        self.l_logs += ["l8"]
+        self.assertEqual(o_tailer.new_lines(), ["l8"])
+        self.assertEqual(self.l_pages, [3])
+
+    def test_new_lines_rewritten(self) -> None:
+        """Vérifie la relecture depuis le début si les logs ont été réécrits."""
+        o_tailer = LogTailer(self.o_entity, page_size=3)
+        self.l_logs += ["l1", "l2"]
+        self.assertEqual(o_tailer.new_lines(), ["l1", "l2"])
+        self.l_logs[:] = ["autre", "log", "l3"]
+        self.assertEqual(o_tailer.new_lines(), ["autre", "log", "l3"])
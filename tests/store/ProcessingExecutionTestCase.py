@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
 from sdk_entrepot_gpf.store.ProcessingExecution import ProcessingExecution
+from sdk_entrepot_gpf.store.StoreEntityCache import StoreEntityCache
 from tests.GpfTestCase import GpfTestCase
 
 
@@ -16,10 +17,12 @@ class ProcessingExecutionTestCase(GpfTestCase):
         """Vérifie le bon fonctionnement de api_launch."""
         for s_datastore in [None, "api_launch"]:
             # On mock la fonction route_request, on veut vérifier qu'elle est appelée avec les bons params
-            with patch.object(ApiRequester, "route_request", return_value=None) as o_mock_request:
+            with patch.object(ApiRequester, "route_request", return_value=None) as o_mock_request, patch.object(StoreEntityCache(), "invalidate") as o_mock_invalidate:
                 # on appelle la fonction à tester : api_launch
                 o_processing_execution = ProcessingExecution({"_id": "id_entité"}, s_datastore)
                 o_processing_execution.api_launch()
+                # l'entité en cache n'est plus à jour
+                o_mock_invalidate.assert_called_once_with("processing_execution", s_datastore, "id_entité")
 
                 # on vérifie que route_request est appelé correctement
                 o_mock_request.assert_called_once_with(
@@ -32,10 +35,12 @@ class ProcessingExecutionTestCase(GpfTestCase):
         """Vérifie le bon fonctionnement de api_abort."""
         for s_datastore in [None, "api_launch"]:
             # On mock la fonction route_request, on veut vérifier qu'elle est appelée avec les bons params
-            with patch.object(ApiRequester, "route_request", return_value=None) as o_mock_request:
+            with patch.object(ApiRequester, "route_request", return_value=None) as o_mock_request, patch.object(StoreEntityCache(), "invalidate") as o_mock_invalidate:
                 # on appelle la fonction à tester : api_abort
                 o_processing_execution = ProcessingExecution({"_id": "id_entité"}, s_datastore)
                 o_processing_execution.api_abort()
+                # l'entité en cache n'est plus à jour
+                o_mock_invalidate.assert_called_once_with("processing_execution", s_datastore, "id_entité")
 
                 # on vérifie que route_request est appelé correctement
                 o_mock_request.assert_called_once_with(
@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.io.Errors import NotFoundError
+from sdk_entrepot_gpf.store.StoreEntityCache import StoreEntityCache
+from sdk_entrepot_gpf.store.StoredData import StoredData
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+class StoreEntityCacheTestCase(GpfTestCase):
+    """Tests StoreEntityCache class.
+
+    cmd : python3 -m unittest -b tests.store.StoreEntityCacheTestCase
+    """
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe : cache actif (60 s, 2 entités)"""
+        StoreEntityCache._instance = None
+        d_conf = {"entity_cache_ttl": "60", "entity_cache_size": "2"}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            StoreEntityCache()
+
+    def tearDown(self) -> None:
+        """fonction lancée après chaque test de la classe : on oublie le cache"""
+        StoreEntityCache._instance = None
+
+    def test_disabled(self) -> None:
+        """Vérifie que le cache est désactivé par défaut."""
+        StoreEntityCache._instance = None
+        self.assertFalse(StoreEntityCache().enabled)
+        o_entity = StoredData({"_id": "1"}, "ds")
+        self.assertIs(StoreEntityCache().put(o_entity), o_entity)
+        self.assertIsNone(StoreEntityCache().get("stored_data", "ds", "1"))
+
+    def test_get_put(self) -> None:
+        """Vérifie put/get : entités complètes ou partielles, expiration, LRU."""
+        self.assertTrue(StoreEntityCache().enabled)
+        o_full = StoredData({"_id": "1", "name": "n", "type": "t"}, "ds")
+        StoreEntityCache().put(o_full)
+        self.assertIs(StoreEntityCache().get("stored_data", "ds", "1"), o_full)
+        self.assertIsNone(StoreEntityCache().get("stored_data", "other_ds", "1"))
+        # Une entité partielle met à jour l'entité complète en cache et c'est elle qui est renvoyée
+        o_partial = StoredData({"_id": "1", "name": "nouveau"}, "ds")
+        self.assertIs(StoreEntityCache().put(o_partial, full=False), o_full)
+        self.assertEqual(o_full["name"], "nouveau")
+        self.assertEqual(o_full["type"], "t")
+        # Une entité partielle seule n'est pas renvoyée par défaut
+        o_partial = StoredData({"_id": "2"}, "ds")
+        self.assertIs(StoreEntityCache().put(o_partial, full=False), o_partial)
+        self.assertIsNone(StoreEntityCache().get("stored_data", "ds", "2"))
+        self.assertIs(StoreEntityCache().get("stored_data", "ds", "2", partial=True), o_partial)
+        # LRU : 2 entités max
+        StoreEntityCache().put(StoredData({"_id": "3"}, "ds"))
+        self.assertIsNone(StoreEntityCache().get("stored_data", "ds", "1"))
+        # Expiration
+        with patch("time.monotonic", return_value=10**12):
+            self.assertIsNone(StoreEntityCache().get("stored_data", "ds", "3"))
+        # Invalidation et vidage
+        StoreEntityCache().put(o_full)
+        StoreEntityCache().invalidate("stored_data", "ds", "1")
+        self.assertIsNone(StoreEntityCache().get("stored_data", "ds", "1"))
+        StoreEntityCache().put(o_full)
+        StoreEntityCache().clear()
+        self.assertIsNone(StoreEntityCache().get("stored_data", "ds", "1"))
+
+    def test_store_entity(self) -> None:
+        """Vérifie l'utilisation du cache par StoreEntity : api_get, api_update, api_delete, api_add_tags."""
+        o_response = GpfTestCase.get_response(json={"_id": "1", "name": "n"})
+        with patch.object(ApiRequester, "route_request", return_value=o_response) as o_mock_request:
+            # Premier api_get : requête ; second : cache
+            o_stored_data = StoredData.api_get("1", "ds")
+            self.assertIs(StoredData.api_get("1", "ds"), o_stored_data)
+            self.assertEqual(o_mock_request.call_count, 1)
+            # api_update requête toujours
+            o_stored_data.api_update()
+            self.assertEqual(o_mock_request.call_count, 2)
+            self.assertIs(StoredData.api_get("1", "ds"), o_stored_data)
+            # Modification des tags : invalidation
+            o_stored_data.api_add_tags({"k": "v"})
+            self.assertEqual(o_mock_request.call_count, 3)
+            StoredData.api_get("1", "ds")
+            self.assertEqual(o_mock_request.call_count, 4)
+            # Suppression : invalidation
+            o_stored_data.api_delete()
+            StoredData.api_get("1", "ds")
+            self.assertEqual(o_mock_request.call_count, 6)
+        # Entité supprimée côté API : invalidation
+        with patch.object(ApiRequester, "route_request", side_effect=NotFoundError("url", "GET", None, None, "")):
+            with self.assertRaises(NotFoundError):
+                o_stored_data.api_update()
+        self.assertIsNone(StoreEntityCache().get("stored_data", "ds", "1"))
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import time
 from typing import List
@@ -6,6 +7,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 from sdk_entrepot_gpf.store.Errors import StoreEntityError
 from sdk_entrepot_gpf.store.StoreEntity import StoreEntity
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
+from sdk_entrepot_gpf.io.Config import Config
 from tests.GpfTestCase import GpfTestCase
 
 
@@ -74,6 +76,25 @@ class StoreEntityTestCase(GpfTestCase):
             StoreEntity.filter_dict_from_str("pas de signe égal")
         self.assertEqual(o_arc.exception.message, "filter_tags_dict_from_str : le filtre 'pas de signe égal' ne contient pas le caractère '='")
 
+    def test_aapi(self) -> None:
+        """Vérifie le bon fonctionnement des fonctions asynchrones : elles délèguent aux fonctions synchrones."""
+        o_entity = StoreEntity({"_id": "123456789"}, "datastore_1")
+        with patch.object(StoreEntity, "api_get", return_value=o_entity) as o_mock_get:
+            self.assertEqual(asyncio.run(StoreEntity.aapi_get("123456789", "datastore_1")), o_entity)
+            o_mock_get.assert_called_once_with("123456789", "datastore_1")
+        with patch.object(StoreEntity, "api_list", return_value=[o_entity]) as o_mock_list:
+            self.assertListEqual(asyncio.run(StoreEntity.aapi_list({"name": "toto"}, datastore="datastore_1")), [o_entity])
+            o_mock_list.assert_called_once_with({"name": "toto"}, None, None, "datastore_1", None)
+        with patch.object(StoreEntity, "api_create", return_value=o_entity) as o_mock_create:
+            self.assertEqual(asyncio.run(StoreEntity.aapi_create({"name": "toto"})), o_entity)
+            o_mock_create.assert_called_once_with({"name": "toto"}, None)
+        with patch.object(StoreEntity, "api_delete", return_value=None) as o_mock_delete:
+            asyncio.run(o_entity.aapi_delete())
+            o_mock_delete.assert_called_once_with()
+        with patch.object(StoreEntity, "api_update", return_value=None) as o_mock_update:
+            asyncio.run(o_entity.aapi_update())
+            o_mock_update.assert_called_once_with()
+
     def test_api_get_1(self) -> None:
         """Vérifie le bon fonctionnement de api_get si tout va bien, sans choix du datastore."""
         # Instanciation d'une fausse réponse HTTP
@@ -238,6 +259,71 @@ class StoreEntityTestCase(GpfTestCase):
                 self.assertIsInstance(o_entity, StoreEntity)
                 self.assertEqual(o_entity.id, str(i))
 
+    def test_api_list_parallel(self) -> None:
+        """Vérifie le bon fonctionnement de api_list si les pages sont récupérées en parallèle : l'ordre est conservé."""
+        l_responses = [
+            GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(1, 11)], headers={"Content-Range": "1-10/25"}),
+            GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(11, 21)], headers={"Content-Range": "11-20/25"}),
+            GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(21, 26)], headers={"Content-Range": "21-25/25"}),
+        ]
+        d_conf = {"nb_limit": "10", "nb_parallel_pages": "4"}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            with patch.object(ApiRequester(), "route_request", side_effect=lambda *args, **kwargs: l_responses[kwargs["params"]["page"] - 1]) as o_mock_request:
+                l_entities = StoreEntity.api_list(datastore="datastore1")
+                # 3 requêtes : la première puis les 2 pages restantes calculées à partir du Content-Range
+                self.assertEqual(o_mock_request.call_count, 3)
+                self.assertListEqual([o_entity.id for o_entity in l_entities], [str(i) for i in range(1, 26)])
+
+    def test_api_iter(self) -> None:
+        """Vérifie le bon fonctionnement de api_iter : entités renvoyées page par page, dans l'ordre."""
+        l_responses = [
+            GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(1, 6)], headers={"Content-Range": "1-5/12"}),
+            GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(6, 11)], headers={"Content-Range": "6-10/12"}),
+            GpfTestCase.get_response(json=[{"_id": str(i)} for i in range(11, 13)], headers={"Content-Range": "11-12/12"}),
+        ]
+        with patch.object(ApiRequester(), "route_request", side_effect=l_responses) as o_mock_request:
+            o_iterator = StoreEntity.api_iter(infos_filter={"k_info": "v_info"}, tags_filter={"k_tag": "v_tag"}, datastore="datastore1", page_size=5)
+            # Rien n'est requêté tant qu'on ne parcourt pas
+            o_mock_request.assert_not_called()
+            # La première entité est disponible dès la première page (la suivante est demandée en avance)
+            self.assertEqual(next(o_iterator).id, "1")
+            l_ids = ["1"] + [o_entity.id for o_entity in o_iterator]
+            self.assertListEqual(l_ids, [str(i) for i in range(1, 13)])
+            self.assertListEqual(
+                o_mock_request.call_args_list,
+                [call("store_entity_list", route_params={"datastore": "datastore1"}, params={"k_info": "v_info", "tags[k_tag]": "v_tag", "page": i, "limit": 5}) for i in range(1, 4)],
+            )
+
+    def test_api_list_fields_lazy(self) -> None:
+        """Vérifie la sélection des champs à lister et la récupération complète à la demande (une seule fois)."""
+        o_list_response = GpfTestCase.get_response(json=[{"_id": "1", "name": "n1"}], headers={"Content-Range": "1-1/1"})
+        with patch.object(ApiRequester(), "route_request", return_value=o_list_response) as o_mock_request:
+            l_entities = StoreEntity.api_list(datastore="datastore1", fields=["name"])
+            o_mock_request.assert_called_once_with("store_entity_list", route_params={"datastore": "datastore1"}, params={"fields": ["name"], "page": 1, "limit": 10})
+        o_entity = l_entities[0]
+        self.assertTrue(o_entity.is_partial)
+        o_get_response = GpfTestCase.get_response(json={"_id": "1", "name": "n1", "status": "GENERATED", "type": {"name": "t"}})
+        with patch.object(ApiRequester(), "route_request", return_value=o_get_response) as o_mock_request:
+            # Champ présent ou propriétés sélectionnées : pas de requête
+            self.assertEqual(o_entity["name"], "n1")
+            self.assertDictEqual(o_entity.get_store_properties(["name", "status"]), {"name": "n1", "status": None})
+            o_mock_request.assert_not_called()
+            # Champ absent : récupération complète
+            self.assertEqual(o_entity["status"], "GENERATED")
+            o_mock_request.assert_called_once_with("store_entity_get", route_params={"datastore": "datastore1", "store_entity": "1"})
+            self.assertFalse(o_entity.is_partial)
+            # Ensuite plus de requête, même pour une clef inexistante
+            self.assertEqual(o_entity.get("type.name"), "t")
+            self.assertIsNone(o_entity.get("absent"))
+            with self.assertRaises(KeyError):
+                o_entity["absent"]  # pylint:disable=pointless-statement
+            o_mock_request.assert_called_once()
+        # Via get()
+        o_entity = StoreEntity._from_list_item({"_id": "1"}, "datastore1")  # pylint:disable=protected-access
+        with patch.object(ApiRequester(), "route_request", return_value=o_get_response) as o_mock_request:
+            self.assertEqual(o_entity.get("type.name"), "t")
+            o_mock_request.assert_called_once()
+
     def test_api_list_no_loop(self) -> None:
         """Vérifie le bon fonctionnement de api_list si on demande tout mais qu'on ne doit pas boucler.
         On ne doit pas boucler si Content-Range indique qu'on a tout récupéré, ou qu'il n'est pas défini ou qu'il est non parsable.
@@ -4,6 +4,7 @@ from typing import Any, Dict, List
 
 from sdk_entrepot_gpf.io.Config import Config
 from sdk_entrepot_gpf.store.Upload import Upload
+from sdk_entrepot_gpf.store.StoreEntityCache import StoreEntityCache
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
 from tests.GpfTestCase import GpfTestCase
 
@@ -41,6 +42,25 @@ class UploadTestCase(GpfTestCase):
                 method=ApiRequester.POST,
             )
 
+    def test_api_push_data_file_chunked(self) -> None:
+        """Vérifie que api_push_data_file envoie par morceaux si la route est définie et le fichier gros."""
+        o_upload = Upload({"_id": "id_de_test"}, "id_datastore")
+        p_file_path = GpfTestCase.data_dir_path / "datasets" / "3_test_dataset_sub_dir" / "CANTON" / "CANTON.shp"
+        d_conf = {"upload_push_data_chunk": "{upload_get}/data/chunk", "chunk_size": "1000", "push_data_file_key": "file", "tmp_workdir": str(GpfTestCase.test_dir_path)}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            with patch.object(ApiRequester, "route_upload_file", return_value=None) as o_mock_upload_file:
+                with patch("sdk_entrepot_gpf.store.Upload.ChunkedUpload.upload", return_value=None) as o_mock_chunk:
+                    o_upload.api_push_data_file(p_file_path, "CANTON")
+                    o_mock_upload_file.assert_not_called()
+                    o_mock_chunk.assert_called_once_with(
+                        "upload_push_data_chunk",
+                        p_file_path,
+                        route_params={"datastore": "id_datastore", "upload": "id_de_test"},
+                        params={"path": "CANTON/CANTON.shp"},
+                    )
+                    # Sans journal, pas de reprise possible
+                    self.assertFalse(o_upload.is_push_data_file_resumable(p_file_path, "CANTON", 0))
+
     def test_api_push_md5_file(self) -> None:
         """Vérifie le bon fonctionnement de api_push_md5_file.
         Dans ce test, le datastore n'est pas défini (cf. route_params).
@@ -202,13 +222,15 @@ class UploadTestCase(GpfTestCase):
         Dans ce test, le datastore n'est pas défini (cf. route_params).
         """
         # On mock la fonction route_request, on veut vérifier qu'elle est appelée avec les bons params
-        with patch.object(ApiRequester, "route_request", return_value=None) as o_mock_request:
+        with patch.object(ApiRequester, "route_request", return_value=None) as o_mock_request, patch.object(StoreEntityCache(), "invalidate") as o_mock_invalidate:
             # On instancie une livraison
             o_upload_run_checks = Upload({"_id": "id"})
             # liste des ids à verifier
             l_list_checks_ids: List[Any] = ["id1", "id2"]
             # On appelle la fonction api_run_checks
             o_upload_run_checks.api_run_checks(l_list_checks_ids)
+            # La livraison en cache n'est plus à jour
+            o_mock_invalidate.assert_called_once_with("upload", None, "id")
             # Vérification sur o_mock_request
             o_mock_request.assert_called_once_with(
                 "upload_run_checks",
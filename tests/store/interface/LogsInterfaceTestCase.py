@@ -99,3 +99,15 @@ class LogsInterfaceTestCase(GpfTestCase):
                 self.assertEqual(s_response_info, "\n".join(s_data_recupere_info))
                 self.assertEqual("", "\n".join(s_data_recupere_error))
                 self.assertEqual(s_response_success, "\n".join(s_data_recupere_success))
+
+    def test_api_logs_page(self) -> None:
+        "Vérifie le bon fonctionnement de api_logs_page."
+        o_response = GpfTestCase.get_response(json=["log1", "log2"])
+        with patch.object(ApiRequester, "route_request", return_value=o_response) as o_mock_request:
+            o_log_interface = LogsInterface({"_id": "id_entité"}, datastore="datastore_id")
+            self.assertEqual(o_log_interface.api_logs_page(3, 100), ["log1", "log2"])
+            o_mock_request.assert_called_once_with(
+                "store_entity_logs",
+                route_params={"datastore": "datastore_id", "store_entity": "id_entité"},
+                params={"page": 3, "limit": 100},
+            )
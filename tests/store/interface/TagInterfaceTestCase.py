@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch
 
 from sdk_entrepot_gpf.io.ApiRequester import ApiRequester
@@ -29,6 +30,16 @@ class TagInterfaceTestCase(GpfTestCase):
         with self.assertRaises(StoreEntityError):
             o_tag_interface.get_tag("tag_not_existing")
 
+    def test_get_tag_partial(self) -> None:
+        """Vérifie que get_tag complète une entité partielle (issue d'un listing) sans les tags."""
+        o_tag_interface = TagInterface._from_list_item({"_id": "123456789"}, "datastore_id")  # pylint:disable=protected-access
+        o_response = GpfTestCase.get_response(json={"_id": "123456789", "tags": {"tag_key": "tag_value"}})
+        with patch.object(ApiRequester(), "route_request", return_value=o_response) as o_mock_request:
+            self.assertEqual(o_tag_interface.get_tag("tag_key"), "tag_value")
+            with self.assertRaises(StoreEntityError):
+                o_tag_interface.get_tag("tag_not_existing")
+            o_mock_request.assert_called_once_with("store_entity_get", route_params={"datastore": "datastore_id", "store_entity": "123456789"})
+
     def test_api_add_tags(self) -> None:
         "Vérifie le bon fonctionnement de api_add_tags."
         # créer une instance TagInterface
@@ -86,3 +97,13 @@ class TagInterfaceTestCase(GpfTestCase):
                     method=ApiRequester.DELETE,
                     params={"tags[]": l_less_tag_data},
                 )
+
+    def test_aapi_tags(self) -> None:
+        "Vérifie le bon fonctionnement de aapi_add_tags et aapi_remove_tags."
+        o_tag_interface = TagInterface({"_id": "123456789"}, "datastore_1")
+        with patch.object(TagInterface, "api_add_tags", return_value=None) as o_mock_add:
+            asyncio.run(o_tag_interface.aapi_add_tags({"tag_key": "tag_value"}))
+            o_mock_add.assert_called_once_with({"tag_key": "tag_value"})
+        with patch.object(TagInterface, "api_remove_tags", return_value=None) as o_mock_remove:
+            asyncio.run(o_tag_interface.aapi_remove_tags(["tag_key"]))
+            o_mock_remove.assert_called_once_with(["tag_key"])
@@ -0,0 +1,81 @@
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, call, patch
+
+from sdk_entrepot_gpf.workflow.StatusPoller import StatusPoller
+from tests.GpfTestCase import GpfTestCase
+
+# pylint:disable=protected-access
+
+
+def is_end(state: Any) -> bool:
+    """État final des entités de test."""
+    return str(state) == "end"
+
+
+class StatusPollerTestCase(GpfTestCase):
+    """Tests StatusPoller class.
+
+    cmd : python3 -m unittest -b tests.workflow.StatusPollerTestCase
+    """
+
+    def test_next_interval(self) -> None:
+        """Vérifie l'espacement des mises à jour d'une entité dont l'état ne change plus."""
+        o_poller = StatusPoller(10, max_interval=60, nb_checks_before_backoff=2)
+        self.assertEqual([o_poller._next_interval(i) for i in range(6)], [10, 10, 20, 40, 60, 60])
+        # Sans nb_checks_before_backoff : intervalle fixe
+        o_poller = StatusPoller(10, max_interval=60)
+        self.assertEqual(o_poller._next_interval(100), 10)
+        # Facteur d'espacement
+        o_poller = StatusPoller(10, max_interval=1000, nb_checks_before_backoff=1, backoff_factor=3)
+        self.assertEqual([o_poller._next_interval(i) for i in range(5)], [10, 30, 90, 270, 810])
+
+    def test_next_interval_remaining(self) -> None:
+        """Vérifie l'espacement des mises à jour selon le temps restant estimé."""
+        o_poller = StatusPoller(10, max_interval=300, nb_checks_before_backoff=2)
+        # Fin lointaine : moitié du temps restant, limitée à max_interval
+        self.assertEqual(o_poller._next_interval(0, 3600), 300)
+        self.assertEqual(o_poller._next_interval(0, 200), 100)
+        # Fin proche ou dépassée : intervalle habituel
+        self.assertEqual(o_poller._next_interval(0, 15), 10)
+        self.assertEqual(o_poller._next_interval(3, -50), 40)
+
+    def test_run(self) -> None:
+        """Vérifie le suivi de plusieurs entités, les callbacks et la reprise après une interruption."""
+        # États successifs renvoyés par chaque entité ("raise" : interruption)
+        d_states: Dict[str, List[Any]] = {"a": ["wait", "wait", "end"], "b": ["wait", "raise", "run", "end"]}
+
+        def refresh(s_key: str) -> Any:
+            o_state = d_states[s_key].pop(0)
+            if o_state == "raise":
+                raise KeyboardInterrupt()
+            return o_state
+
+        f_callback_a = MagicMock()
+        f_callback_b = MagicMock()
+        o_poller = StatusPoller(0)
+        o_poller.add("a", lambda: refresh("a"), is_end, f_callback_a)
+        o_poller.add("b", lambda: refresh("b"), is_end, f_callback_b, on_change_only=True)
+        with patch("sdk_entrepot_gpf.workflow.StatusPoller.time.sleep") as o_mock_sleep:
+            with self.assertRaises(KeyboardInterrupt):
+                o_poller.run()
+            self.assertEqual(o_poller.pending, ["a", "b"])
+            self.assertEqual(o_poller.state("a"), "wait")
+            # Reprise du suivi
+            d_result = o_poller.run()
+        self.assertEqual(d_result, {"a": "end", "b": "end"})
+        self.assertEqual(o_poller.pending, [])
+        # Callback à chaque mise à jour pour "a", à chaque changement pour "b"
+        self.assertEqual(f_callback_a.call_args_list, [call("wait"), call("wait"), call("end")])
+        self.assertEqual(f_callback_b.call_args_list, [call("wait"), call("run"), call("end")])
+        # Une attente entre chaque tour
+        self.assertEqual(o_mock_sleep.call_count, 2)
+
+    def test_run_workers(self) -> None:
+        """Vérifie la mise à jour simultanée des entités."""
+        o_poller = StatusPoller(0, nb_workers=4)
+        l_refresh = [MagicMock(return_value="end") for _ in range(10)]
+        for i, f_refresh in enumerate(l_refresh):
+            o_poller.add(i, f_refresh, is_end)
+        self.assertEqual(o_poller.run(), {i: "end" for i in range(10)})
+        for f_refresh in l_refresh:
+            f_refresh.assert_called_once_with()
@@ -0,0 +1,127 @@
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+from sdk_entrepot_gpf.store.Configuration import Configuration
+from sdk_entrepot_gpf.workflow.Workflow import Workflow
+from sdk_entrepot_gpf.workflow.WorkflowJournal import WorkflowJournal
+from sdk_entrepot_gpf.workflow.action.ActionAbstract import ActionAbstract
+from sdk_entrepot_gpf.workflow.action.ConfigurationAction import ConfigurationAction
+from tests.GpfTestCase import GpfTestCase
+
+
+class WorkflowJournalTestCase(GpfTestCase):
+    """Tests WorkflowJournal class.
+
+    cmd : python3 -m unittest -b tests.workflow.WorkflowJournalTestCase
+    """
+
+    def setUp(self) -> None:
+        """fonction lancée avant chaque test de la classe : dossier temporaire"""
+        self.o_tmp_dir = tempfile.TemporaryDirectory()  # pylint:disable=consider-using-with
+        self.p_workflow = Path(self.o_tmp_dir.name) / "mon_workflow.jsonc"
+
+    def tearDown(self) -> None:
+        """fonction lancée après chaque test de la classe : suppression du dossier temporaire"""
+        self.o_tmp_dir.cleanup()
+
+    def test_record_get_done(self) -> None:
+        """Vérifie l'enregistrement, la relecture et la remise à zéro du journal."""
+        o_journal = WorkflowJournal.for_workflow(self.p_workflow)
+        self.assertEqual(o_journal.path, self.p_workflow.with_name("mon_workflow.journal.json"))
+        d_definition = {"type": "configuration", "body_parameters": {"name": "{nom}"}}
+        o_configuration = Configuration({"_id": "conf_1", "name": "nom"}, "datastore_id")
+        o_journal.record("etape", 0, d_definition, {"type": "configuration", "body_parameters": {"name": "nom"}}, [o_configuration])
+        self.assertTrue(o_journal.path.exists())
+        # hors reprise : rien n'est réutilisé
+        self.assertIsNone(o_journal.get_done("etape", 0, d_definition))
+        # reprise : entités recréées sans requête
+        o_resume = WorkflowJournal.for_workflow(self.p_workflow, resume=True)
+        l_entities = o_resume.get_done("etape", 0, d_definition)
+        assert l_entities is not None
+        self.assertEqual(len(l_entities), 1)
+        self.assertIsInstance(l_entities[0], Configuration)
+        self.assertEqual(l_entities[0].id, "conf_1")
+        self.assertEqual(l_entities[0].datastore, "datastore_id")
+        # action non terminée ou définition modifiée : à relancer
+        self.assertIsNone(o_resume.get_done("etape", 1, d_definition))
+        self.assertIsNone(o_resume.get_done("etape", 0, {**d_definition, "tags": {"clef": "valeur"}}))
+        # contexte de résolution différent (paramètres, datastore) : à relancer
+        o_params = WorkflowJournal.for_workflow(self.p_workflow, resume=True, context={"params": {"nom": "autre"}})
+        self.assertIsNone(o_params.get_done("etape", 0, d_definition))
+        o_params.record("etape", 0, d_definition, d_definition, [o_configuration], {"datastore": "datastore_id"})
+        self.assertIsNotNone(o_params.get_done("etape", 0, d_definition, {"datastore": "datastore_id"}))
+        self.assertIsNone(o_params.get_done("etape", 0, d_definition, {"datastore": "autre_datastore"}))
+        self.assertIsNone(o_resume.get_done("etape", 0, d_definition, {"datastore": "datastore_id"}))
+        o_resume.record("etape", 0, d_definition, d_definition, [o_configuration])
+        # reprise : le journal de l'étape est conservé au lancement ; sinon il est vidé
+        o_resume.start_step("etape")
+        self.assertIsNotNone(WorkflowJournal.for_workflow(self.p_workflow, resume=True).get_done("etape", 0, d_definition))
+        WorkflowJournal.for_workflow(self.p_workflow).start_step("etape")
+        self.assertIsNone(WorkflowJournal.for_workflow(self.p_workflow, resume=True).get_done("etape", 0, d_definition))
+        # journal illisible : ignoré
+        o_journal.path.write_text("pas du json", encoding="utf-8")
+        self.assertIsNone(WorkflowJournal.for_workflow(self.p_workflow, resume=True).get_done("etape", 0, d_definition))
+
+    def test_run_step_resume(self) -> None:
+        """Vérifie que la reprise d'une étape ne relance pas les actions terminées."""
+        d_workflow = {"workflow": {"steps": {"etape": {"parents": [], "actions": [{"type": "action-0"}, {"type": "action-1"}, {"type": "action-2"}]}}}}
+        l_run: List[str] = []
+        l_interrupted: List[bool] = []
+
+        def generate(workflow_context: str, definition_dict: Dict[str, Any], parent_action: Optional[ActionAbstract], *args: Any) -> MagicMock:  # pylint:disable=unused-argument
+            o_mock_action = MagicMock(spec=ConfigurationAction)
+            o_mock_action.definition_dict = definition_dict
+            o_mock_action.index = 0 if parent_action is None else parent_action.index + 1
+            o_mock_action.configuration = Configuration({"_id": f"id_{definition_dict['type']}"}, "datastore_id")
+
+            def run(datastore: Optional[str] = None) -> None:  # pylint:disable=unused-argument
+                # première exécution : interrompue sur la dernière action
+                if definition_dict["type"] == "action-2" and not l_interrupted:
+                    l_interrupted.append(True)
+                    l_run.append("interruption")
+                    raise KeyboardInterrupt()
+                l_run.append(definition_dict["type"])
+
+            o_mock_action.run.side_effect = run
+            return o_mock_action
+
+        with patch.object(Workflow, "generate", side_effect=generate):
+            with self.assertRaises(KeyboardInterrupt):
+                Workflow("nom", d_workflow, WorkflowJournal.for_workflow(self.p_workflow)).run_step("etape")
+            self.assertListEqual(l_run, ["action-0", "action-1", "interruption"])
+            # reprise : seule la dernière action est relancée, les entités des actions terminées sont renvoyées
+            l_entities = Workflow("nom", d_workflow, WorkflowJournal.for_workflow(self.p_workflow, resume=True)).run_step("etape")
+            self.assertListEqual(l_run, ["action-0", "action-1", "interruption", "action-2"])
+            self.assertListEqual([o_entity.id for o_entity in l_entities], ["id_action-0", "id_action-1", "id_action-2"])
+            # nouvelle reprise : tout est terminé
+            Workflow("nom", d_workflow, WorkflowJournal.for_workflow(self.p_workflow, resume=True)).run_step("etape")
+            self.assertEqual(len(l_run), 4)
+
+    def test_run_step_resume_context(self) -> None:
+        """Vérifie que la reprise relance les actions dont le contexte de résolution (datastore, itération) a changé."""
+        d_step = {"parents": [], "iter_key": "val", "iter_vals": [{"nom": "a"}, {"nom": "b"}], "actions": [{"type": "action", "name": "{val.nom}"}]}
+        l_run: List[str] = []
+
+        def generate(workflow_context: str, definition_dict: Dict[str, Any], parent_action: Optional[ActionAbstract], *args: Any) -> MagicMock:  # pylint:disable=unused-argument
+            o_mock_action = MagicMock(spec=ConfigurationAction)
+            o_mock_action.definition_dict = definition_dict
+            o_mock_action.index = 0 if parent_action is None else parent_action.index + 1
+            o_mock_action.configuration = Configuration({"_id": f"id_{len(l_run)}"}, "datastore_id")
+            o_mock_action.run.side_effect = lambda datastore=None: l_run.append(str(datastore))
+            return o_mock_action
+
+        with patch.object(Workflow, "generate", side_effect=generate):
+            Workflow("nom", {"workflow": {"steps": {"etape": d_step}}}, WorkflowJournal.for_workflow(self.p_workflow, resume=True)).run_step("etape", datastore="ds_1")
+            self.assertEqual(len(l_run), 2)
+            # même contexte : rien n'est relancé
+            Workflow("nom", {"workflow": {"steps": {"etape": d_step}}}, WorkflowJournal.for_workflow(self.p_workflow, resume=True)).run_step("etape", datastore="ds_1")
+            self.assertEqual(len(l_run), 2)
+            # valeur de la seconde itération modifiée (définition brute identique) : seule la seconde action est relancée
+            d_step["iter_vals"] = [{"nom": "a"}, {"nom": "c"}]
+            Workflow("nom", {"workflow": {"steps": {"etape": d_step}}}, WorkflowJournal.for_workflow(self.p_workflow, resume=True)).run_step("etape", datastore="ds_1")
+            self.assertListEqual(l_run, ["ds_1", "ds_1", "ds_1"])
+            # autre datastore : tout est relancé
+            Workflow("nom", {"workflow": {"steps": {"etape": d_step}}}, WorkflowJournal.for_workflow(self.p_workflow, resume=True)).run_step("etape", datastore="ds_2")
+            self.assertListEqual(l_run, ["ds_1", "ds_1", "ds_1", "ds_2", "ds_2"])
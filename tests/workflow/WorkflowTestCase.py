@@ -1,7 +1,11 @@
+import hashlib
 import json
+import threading
+import time
+from concurrent.futures import wait
 from pathlib import Path
 from typing import Any, Dict, Optional, Type, List
-from unittest.mock import PropertyMock, patch, MagicMock
+from unittest.mock import ANY, PropertyMock, patch, MagicMock
 
 import jsonschema
 
@@ -95,8 +99,9 @@ class WorkflowTestCase(GpfTestCase):
                     l_actions += json.loads(s_actions.replace("{" + d_etape["iter_key"] + "}", s_val))  # json.loads ok car on est dans des tests
             else:
                 # on a une liste de sous dict ou apparenté on utilise un résolveur
+                s_step_key = hashlib.sha256(s_etape.encode("utf-8")).hexdigest()[:8]
                 for i, s_val in enumerate(d_etape["iter_vals"]):
-                    l_actions += json.loads(s_actions.replace(d_etape["iter_key"], f"iter_resolve_{i}"))  # json.loads ok car on est dans des tests
+                    l_actions += json.loads(s_actions.replace(d_etape["iter_key"], f"iter_resolve_{s_step_key}_{i}"))  # json.loads ok car on est dans des tests
         return l_actions
 
     # pylint: disable=too-many-locals
@@ -636,3 +641,161 @@ class WorkflowTestCase(GpfTestCase):
         self.assertEqual(l_steps[1], "Etape « etape2A » [parent(s) : etape1]")
         self.assertEqual(l_steps[2], "Etape « etape2B » [parent(s) : etape1]")
         self.assertEqual(l_steps[3], "Etape « etape3 » [parent(s) : etape2A, etape2B]")
+
+    def test_run_all(self) -> None:
+        """test de run_all : étapes lancées dès que leurs parents sont terminés"""
+        d_steps: Dict[str, Dict[str, List[str]]] = {
+            "mise-en-base-A": {"parents": [], "actions": []},
+            "mise-en-base-B": {"parents": [], "actions": []},
+            "pyramide-A": {"parents": ["mise-en-base-A"], "actions": []},
+            "pyramide-B": {"parents": ["mise-en-base-B"], "actions": []},
+            "publication": {"parents": ["pyramide-A", "pyramide-B"], "actions": []},
+        }
+        o_workflow = Workflow("workflow_name", {"workflow": {"steps": d_steps}})
+        for i_jobs in [1, 3]:
+            l_started: List[str] = []
+
+            def run_step(step_name: str, *args: Any, **kwargs: Any) -> List[Any]:  # pylint:disable=unused-argument
+                # tous les parents sont terminés au lancement de l'étape
+                for s_parent in d_steps[step_name]["parents"]:
+                    self.assertIn(s_parent, l_started)  # pylint:disable=cell-var-from-loop
+                l_started.append(step_name)  # pylint:disable=cell-var-from-loop
+                return [step_name]
+
+            with patch.object(o_workflow, "run_step", side_effect=run_step) as o_mock_run_step:
+                d_results = o_workflow.run_all(i_jobs, comments=["commentaire"], tags={"tag": "val"})
+            self.assertEqual(o_mock_run_step.call_count, 5)
+            self.assertEqual(d_results, {s_step: [s_step] for s_step in d_steps})
+            self.assertEqual(l_started[-1], "publication")
+            # chaque étape reçoit sa propre copie des commentaires et des tags
+            o_mock_run_step.assert_any_call("publication", None if i_jobs == 1 else ANY, None if i_jobs == 1 else ANY, None, None, ["commentaire"], {"tag": "val"}, None)
+
+        # échec d'une branche : ses descendants ne sont pas lancés, l'autre branche continue
+        def run_step_ko(step_name: str, *args: Any, **kwargs: Any) -> List[Any]:  # pylint:disable=unused-argument
+            if step_name == "mise-en-base-A":
+                raise WorkflowError("erreur")
+            return []
+
+        for i_jobs in [1, 2]:
+            with patch.object(o_workflow, "run_step", side_effect=run_step_ko) as o_mock_run_step:
+                with self.assertRaises(WorkflowError) as o_arc:
+                    o_workflow.run_all(i_jobs)
+            self.assertEqual(sorted(o_call.args[0] for o_call in o_mock_run_step.call_args_list), ["mise-en-base-A", "mise-en-base-B", "pyramide-B"])
+            self.assertEqual(o_arc.exception.message, "Les étapes suivantes ont échoué : mise-en-base-A. Étapes non lancées : pyramide-A, publication.")
+
+        # parent inconnu et cycle
+        for d_bad_steps, s_message in [
+            ({"a": {"parents": ["z"], "actions": []}}, "Le parent « z » de l'étape « a » n'est pas défini dans le workflow."),
+            ({"a": {"parents": ["b"], "actions": []}, "b": {"parents": ["a"], "actions": []}}, "Les étapes suivantes dépendent les unes des autres (cycle) : a, b."),
+        ]:
+            with self.assertRaises(WorkflowError) as o_arc:
+                Workflow("workflow_name", {"workflow": {"steps": d_bad_steps}}).run_all()
+            self.assertEqual(o_arc.exception.message, s_message)
+
+    def test_run_all_parallel_iter_vals(self) -> None:
+        """test de run_all en parallèle avec deux étapes itérant sur des dictionnaires : chaque étape résout ses propres valeurs"""
+        d_steps = {s_step: {"actions": [{"type": "{val.v}"}], "iter_vals": [{"v": f"{s_step}0"}, {"v": f"{s_step}1"}], "iter_key": "val", "parents": []} for s_step in ["A", "B"]}
+        d_resolved: Dict[str, List[str]] = {"A": [], "B": []}
+        # les deux étapes sont développées (résolveurs d'itération déclarés) avant la résolution de leurs actions
+        o_barrier = threading.Barrier(2)
+
+        def generate(workflow_context: str, definition_dict: Dict[str, Any], *args: Any) -> MagicMock:  # pylint:disable=unused-argument
+            o_barrier.wait(5)
+            o_mock_action = MagicMock()
+            o_mock_action.definition_dict = definition_dict
+
+            def resolve(**kwargs: Any) -> None:  # pylint:disable=unused-argument
+                d_resolved[workflow_context].append(GlobalResolver().resolve(definition_dict["type"]))
+
+            o_mock_action.resolve.side_effect = resolve
+            return o_mock_action
+
+        with patch.object(Workflow, "generate", side_effect=generate):
+            Workflow("nom", {"workflow": {"steps": d_steps}}).run_all(2)
+        self.assertListEqual(d_resolved["A"], ["A0", "A1"])
+        self.assertListEqual(d_resolved["B"], ["B0", "B1"])
+
+    def test_run_all_iter_parallel_interrupt(self) -> None:
+        """test de run_all + iter_parallel : le ctrl-C arrête toutes les itérations en cours et les suivantes ne sont pas lancées"""
+        d_workflow = {"workflow": {"steps": {"mise-en-base": {"actions": [{"type": "{dep}"}], "iter_vals": ["01", "02", "03"], "iter_key": "dep", "iter_parallel": 2, "parents": []}}}}
+        l_started: List[str] = []
+        l_interrupted: List[str] = []
+        o_all_started = threading.Event()
+
+        def generate(workflow_context: str, definition_dict: Dict[str, Any], *args: Any) -> MagicMock:  # pylint:disable=unused-argument
+            o_mock_action = MagicMock(spec=ProcessingExecutionAction)
+            o_mock_action.definition_dict = definition_dict
+
+            def monitoring_until_end(callback: Any, ctrl_c_action: Any) -> str:  # pylint:disable=unused-argument
+                l_started.append(definition_dict["type"])
+                if len(l_started) == 2:
+                    o_all_started.set()
+                try:
+                    # suivi de l'exécution jusqu'à son arrêt
+                    for _ in range(500):
+                        callback(MagicMock())
+                        time.sleep(0.01)
+                except KeyboardInterrupt:
+                    l_interrupted.append(definition_dict["type"])
+                    return ProcessingExecution.STATUS_ABORTED
+                return ProcessingExecution.STATUS_SUCCESS
+
+            o_mock_action.monitoring_until_end.side_effect = monitoring_until_end
+            return o_mock_action
+
+        l_ctrl_c: List[bool] = []
+
+        def wait_ctrl_c(*args: Any, **kwargs: Any) -> Any:
+            # ctrl-C (reçu par le thread principal) une fois les 2 premières itérations lancées
+            if threading.current_thread() is threading.main_thread() and not l_ctrl_c:
+                o_all_started.wait(5)
+                l_ctrl_c.append(True)
+                raise KeyboardInterrupt()
+            return wait(*args, **kwargs)
+
+        with patch.object(Workflow, "generate", side_effect=generate), patch.object(GlobalResolver, "resolve", side_effect=lambda x, **kwargs: x):
+            with patch("sdk_entrepot_gpf.workflow.Workflow.wait", side_effect=wait_ctrl_c):
+                with self.assertRaises(KeyboardInterrupt):
+                    Workflow("nom", d_workflow).run_all(2, ctrl_c_action=lambda: True)
+        # les 2 itérations en cours ont été arrêtées, la 3e n'a pas été lancée
+        self.assertCountEqual(l_started, ["01", "02"])
+        self.assertCountEqual(l_interrupted, ["01", "02"])
+
+    def test_run_step_iter_parallel(self) -> None:
+        """test de run_step avec iter_parallel : itérations lancées en parallèle, échecs indiqués par itération"""
+        d_workflow = {
+            "workflow": {
+                "steps": {
+                    "mise-en-base": {
+                        "actions": [{"type": "action1-{dep}"}, {"type": "action2-{dep}"}],
+                        "iter_vals": ["01", "02", "03", "04"],
+                        "iter_key": "dep",
+                        "iter_parallel": 3,
+                        "parents": [],
+                    },
+                }
+            }
+        }
+        l_generated: List[Any] = []
+
+        def generate(workflow_context: str, definition_dict: Dict[str, Any], parent_action: Optional[ActionAbstract], *args: Any) -> MagicMock:  # pylint:disable=unused-argument
+            o_mock_action = MagicMock(spec=ConfigurationAction)
+            o_mock_action.definition_dict = definition_dict
+            o_mock_action.configuration = f"Entity_{definition_dict['type']}"
+            # l'itération 03 échoue
+            if definition_dict["type"] == "action2-03":
+                o_mock_action.run.side_effect = WorkflowError("erreur 03")
+            l_generated.append((definition_dict["type"], parent_action.definition_dict["type"] if parent_action is not None else None))
+            return o_mock_action
+
+        o_workflow = Workflow("nom", d_workflow)
+        with patch.object(Workflow, "generate", side_effect=generate), patch.object(GlobalResolver, "resolve", side_effect=lambda x, **kwargs: x):
+            with self.assertRaises(WorkflowError) as o_arc:
+                o_workflow.run_step("mise-en-base")
+            self.assertEqual(o_arc.exception.message, "1 itération(s) sur 4 de l'étape mise-en-base ont échoué : mise-en-base (itération n°3 : 03).")
+            # toutes les itérations ont été lancées, chacune avec sa propre chaîne d'actions
+            self.assertCountEqual(l_generated, [(f"action1-{s_dep}", None) for s_dep in ["01", "02", "03", "04"]] + [(f"action2-{s_dep}", f"action1-{s_dep}") for s_dep in ["01", "02", "03", "04"]])
+            # sans échec : entités dans l'ordre des itérations
+            d_workflow["workflow"]["steps"]["mise-en-base"]["iter_vals"] = ["01", "02", "04"]
+            l_entities = o_workflow.run_step("mise-en-base")
+            self.assertListEqual(l_entities, [f"Entity_action{i}-{s_dep}" for s_dep in ["01", "02", "04"] for i in [1, 2]])
@@ -1,5 +1,6 @@
 # mypy: disable-error-code="attr-defined"
 import time
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List
 
 from unittest.mock import PropertyMock, call, patch, MagicMock
@@ -956,6 +957,67 @@ class ProcessingExecutionActionTestCase(GpfTestCase):
                 for o_upload in l_inputs:
                     o_upload.api_add_tags({"integration_progress": "execution_end_ko_integration_progress"})
 
+    def test_monitor_executions_until_end(self) -> None:
+        """test de monitor_executions_until_end : suivi simultané de plusieurs exécutions"""
+        l_status = {
+            "pe_1": [ProcessingExecution.STATUS_PROGRESS, ProcessingExecution.STATUS_SUCCESS],
+            "pe_2": [ProcessingExecution.STATUS_PROGRESS, ProcessingExecution.STATUS_PROGRESS, ProcessingExecution.STATUS_FAILURE],
+        }
+        l_actions = []
+        l_mocks = []
+        for s_name, l_pe_status in l_status.items():
+            o_mock_processing_execution = MagicMock(name=s_name)
+            o_mock_processing_execution.get_store_properties.side_effect = [{"status": s_status} for s_status in l_pe_status]
+            o_pea = ProcessingExecutionAction("contexte", {}, compatibility_cartes=False)
+            o_pea._ProcessingExecutionAction__processing_execution = o_mock_processing_execution
+            l_actions.append(o_pea)
+            l_mocks.append(o_mock_processing_execution)
+        f_callback = MagicMock()
+        with patch.object(time, "sleep", return_value=None) as o_mock_sleep:
+            with patch.object(Config, "get_int", return_value=0):
+                l_return = ProcessingExecutionAction.monitor_executions_until_end(l_actions, f_callback)
+        self.assertEqual(l_return, [ProcessingExecution.STATUS_SUCCESS, ProcessingExecution.STATUS_FAILURE])
+        # une mise à jour et un appel à la callback par statut, une attente par tour
+        self.assertEqual(l_mocks[0].api_update.call_count, 2)
+        self.assertEqual(l_mocks[1].api_update.call_count, 3)
+        self.assertEqual(f_callback.call_count, 5)
+        self.assertEqual(o_mock_sleep.call_count, 2)
+
+    def test_remaining_estimator(self) -> None:
+        """test de l'estimation du temps restant à partir des exécutions passées du traitement"""
+        o_pea = ProcessingExecutionAction("contexte", {}, compatibility_cartes=False)
+        o_pe = ProcessingExecution({"_id": "pe_current", "processing": {"_id": "processing_id"}, "status": "PROGRESS"}, datastore="datastore")
+        o_pea._ProcessingExecutionAction__processing_execution = o_pe
+        l_executions = [
+            ProcessingExecution({"_id": "pe_1", "start": "2024-01-01T10:00:00+00:00", "finish": "2024-01-01T11:00:00+00:00"}),
+            ProcessingExecution({"_id": "pe_2", "start": "2024-01-01T10:00:00+00:00", "finish": "2024-01-01T12:00:00+00:00"}),
+            ProcessingExecution({"_id": "pe_3", "start": "2024-01-01T10:00:00+00:00", "finish": "2024-01-01T13:00:00+00:00"}),
+            ProcessingExecution({"_id": "pe_4", "start": "2024-01-01T10:00:00+00:00"}),
+            ProcessingExecution({"_id": "pe_current", "start": "2024-01-01T10:00:00+00:00", "finish": "2024-01-02T10:00:00+00:00"}),
+        ]
+        with patch.object(ProcessingExecution, "api_list", return_value=l_executions) as o_mock_list:
+            f_remaining = o_pea._remaining_estimator()
+        o_mock_list.assert_called_once_with(infos_filter={"processing": "processing_id", "status": "SUCCESS"}, datastore="datastore", fields=["start", "finish"])
+        assert f_remaining is not None
+        # pas encore démarrée : pas d'estimation
+        self.assertIsNone(f_remaining(ProcessingExecution.STATUS_PROGRESS))
+        # démarrée il y a 30 minutes : il reste environ 1h30 (médiane : 2h)
+        o_pe._store_api_dict["start"] = (datetime.now(timezone.utc) - timedelta(minutes=30)).isoformat()
+        f_value = f_remaining(ProcessingExecution.STATUS_PROGRESS)
+        assert f_value is not None
+        self.assertAlmostEqual(f_value, 5400, delta=60)
+        # seules les 2 exécutions les plus récentes (pe_3 et pe_2, médiane : 2h30) sont prises en compte
+        with patch.object(Config(), "get_int", return_value=2):
+            with patch.object(ProcessingExecution, "api_list", return_value=l_executions):
+                f_remaining = o_pea._remaining_estimator()
+        assert f_remaining is not None
+        f_value = f_remaining(ProcessingExecution.STATUS_PROGRESS)
+        assert f_value is not None
+        self.assertAlmostEqual(f_value, 7200, delta=60)
+        # sans exécution passée : pas d'estimation
+        with patch.object(ProcessingExecution, "api_list", return_value=[]):
+            self.assertIsNone(o_pea._remaining_estimator())
+
     def test_output_new_entity(self) -> None:
         """test de output_new_entity"""
         for s_output in ["upload", "stored_data"]:
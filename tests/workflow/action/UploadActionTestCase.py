@@ -1,7 +1,8 @@
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+import threading
+from unittest.mock import ANY, MagicMock, call, patch
 
 import requests
 from sdk_entrepot_gpf.io.Errors import ConflictError
@@ -19,6 +20,7 @@ from tests.GpfTestCase import GpfTestCase
 # pylint:disable=too-many-arguments
 # pylint:disable=too-many-locals
 # pylint:disable=too-many-branches
+# pylint:disable=too-many-lines
 # pylint:disable=dangerous-default-value
 # pylint:disable=too-many-statements
 # pylint:disable=protected-access
@@ -69,7 +71,14 @@ class  UploadActionNoPrivate(UploadAction):
             nom (str): non du ficher md5
         """
         self._UploadAction__normalise_api_push_md5_file(path, nom) # pylint: disable=no-member
-    def push_files(self, l_files: List[Tuple[Path, str]], f_api_push: Callable[[Path, str], None], f_api_delete: Callable[[str], None], check_conflict: bool = True) -> int:
+    def push_files(
+        self,
+        l_files: List[Tuple[Path, str]],
+        f_api_push: Callable[[Path, str], None],
+        f_api_delete: Callable[[str], None],
+        check_conflict: bool = True,
+        f_api_resumable: Optional[Callable[[Path, str, int], bool]] = None,
+    ) -> int:
         """pousse un ficher de données ou un ficher md5 sur le store. Gére la reprise de Livraison et les conflicts lors de la livraison.
 
         Args:
@@ -77,11 +86,12 @@ class  UploadActionNoPrivate(UploadAction):
             f_api_push (Callable[[Path, str], None]): fonction pour livrer les données
             f_api_delete (Callable[[str], None]): fonction pour supprimé les données si livrer partiellement.
             check_conflict (bool): Si une vérification de la bonne livraison des fichier en conflict ou en timeout est lancée..
+            f_api_resumable (Optional[Callable[[Path, str, int], bool]]): fonction indiquant si un fichier livré partiellement peut être repris.
 
         Returns:
             int: nombre de ficher réellement téléverser durant l'action
         """
-        return self._UploadAction__push_files(l_files, f_api_push, f_api_delete, check_conflict) # pylint: disable=no-member
+        return self._UploadAction__push_files(l_files, f_api_push, f_api_delete, check_conflict, f_api_resumable) # pylint: disable=no-member
     def check_file_uploaded(self, l_files: List[Tuple[Path, str]]) -> List[Tuple[Path, str]]:
         """vérifie si les fichiers donnée en entrée soit bien livrer
 
@@ -229,6 +239,10 @@ class UploadActionTestCase(GpfTestCase):
             )
             o_mock__add_comments.assert_called_once_with()
             o_mock__push_data_files.assert_called_once_with(True)
+            # regroupement des petits fichiers juste avant le téléversement
+            o_mock_dataset.bundle_files.assert_called_once_with()
+            # génération des fichiers md5 (si nécessaire) pendant le téléversement des données
+            o_mock_dataset.generate_md5_files.assert_called_once_with(ANY)
             o_mock__push_md5_files.assert_called_once_with(True)
             o_mock__check_file_uploaded.assert_not_called()
             o_mock__close.assert_called_once_with()
@@ -332,6 +346,38 @@ class UploadActionTestCase(GpfTestCase):
             )
             o_mock__close.assert_not_called()
 
+    def test_run_push_error(self) -> None:
+        """test de run : si le téléversement échoue, le calcul des clefs md5 est annulé et attendu"""
+        l_md5_events: List[threading.Event] = []
+
+        def generate_md5_files(cancel: threading.Event) -> None:
+            l_md5_events.append(cancel)
+            # le calcul se termine une fois annulé
+            if not cancel.wait(5):
+                raise AssertionError("calcul des clefs md5 non annulé")
+            raise GpfSdkError("Calcul des clefs md5 annulé.")
+
+        o_mock_dataset = MagicMock()
+        o_mock_dataset.generate_md5_files.side_effect = generate_md5_files
+        o_mock_upload = MagicMock()
+        o_mock_upload.is_open.return_value = True
+        with patch.object(UploadAction, "_UploadAction__create_upload"), patch.object(UploadAction, "_UploadAction__add_tags"), patch.object(
+            UploadAction, "_UploadAction__add_carte_tags"
+        ), patch.object(UploadAction, "_UploadAction__add_comments"), patch.object(
+            UploadAction, "_UploadAction__push_data_files", side_effect=GpfSdkError("erreur de téléversement")
+        ), patch.object(
+            UploadAction, "_UploadAction__push_md5_files"
+        ) as o_mock__push_md5_files:
+            o_ua = UploadActionNoPrivate(o_mock_dataset)
+            o_ua.set_upload(o_mock_upload)
+            with self.assertRaises(GpfSdkError) as o_arc:
+                o_ua.run("datastore_id")
+        self.assertEqual(o_arc.exception.message, "erreur de téléversement")
+        # calcul annulé et terminé (thread attendu)
+        self.assertEqual(len(l_md5_events), 1)
+        self.assertTrue(l_md5_events[0].is_set())
+        o_mock__push_md5_files.assert_not_called()
+
     def test_create_upload(self)->None:
         """vérifie fonction __create_upload"""
         s_datastore="test"
@@ -514,6 +560,7 @@ class UploadActionTestCase(GpfTestCase):
                 o_mock_upload.api_push_data_file,
                 o_mock_upload.api_delete_data_file,
                 b_check_conflict,
+                o_mock_upload.is_push_data_file_resumable,
             )
 
 
@@ -693,6 +740,76 @@ class UploadActionTestCase(GpfTestCase):
                         o_mock_upload.push.assert_any_call(o_file, f"base/{o_file.name}")
                     o_mock_check_file.assert_called_once_with(l_files)
 
+    def test_push_files_resumable(self)->None:
+        """test de __push_files : un fichier partiellement livré par morceaux est repris et non supprimé"""
+        o_mock_upload=MagicMock()
+        o_mock_upload.api_tree.return_value = []
+        o_ua = UploadActionNoPrivate(MagicMock())
+        o_ua.set_upload(o_mock_upload)
+        l_files_upload = []
+        for i in range(2):
+            o_mock = MagicMock()
+            o_mock.stat().st_size = 50
+            o_mock.name=f"partial_{i}"
+            l_files_upload.append(o_mock)
+        l_files = [(o_mock, "base") for o_mock in l_files_upload]
+        # seul le 1er fichier peut être repris
+        o_mock_resumable = MagicMock(side_effect=lambda p_file, s_path, i_size: p_file is l_files_upload[0])
+        with patch.object(UploadAction, "parse_tree", return_value={f"base/{o_file.name}": 10 for o_file in l_files_upload}):
+            i=o_ua.push_files(l_files, o_mock_upload.push, o_mock_upload.delete, False, o_mock_resumable)
+        o_mock_upload.delete.assert_called_once_with(f"base/{l_files_upload[1].name}")
+        self.assertEqual(2, o_mock_upload.push.call_count)
+        self.assertEqual(2, i)
+        # la taille sur l'entrepôt est transmise pour vérifier le journal de reprise
+        o_mock_resumable.assert_any_call(l_files_upload[0], "base", 10)
+
+    def test_push_files_parallel(self)->None:
+        """test de __push_files avec plusieurs fichiers livrés en parallèle : résultats dans l'ordre des fichiers"""
+        l_files_upload = []
+        for i in range(6):
+            o_mock = MagicMock()
+            o_mock.name = f"upload_{i}"
+            l_files_upload.append(o_mock)
+        l_files = [(o_mock, "base") for o_mock in l_files_upload]
+        # un fichier déjà livré, deux en conflit
+        o_mock_uploaded = l_files_upload[0]
+        o_mock_uploaded.stat().st_size = 10
+        def push(p_file: MagicMock, s_api_path: str) -> None:  # pylint:disable=unused-argument
+            if p_file.name in ("upload_2", "upload_5"):
+                raise ConflictError("", "", {}, {}, "")
+        o_mock_upload=MagicMock(**{"api_tree.return_value" : [], "push.side_effect": push})
+        o_ua = UploadActionNoPrivate(MagicMock())
+        o_ua.set_upload(o_mock_upload)
+        d_conf = {"parallel_files": "3"}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            with patch.object(UploadAction, "parse_tree", return_value={"base/upload_0": 10}):
+                with patch.object(UploadAction, "_UploadAction__check_file_uploaded", return_value=[]) as o_mock_check_file:
+                    i=o_ua.push_files(l_files, o_mock_upload.push, o_mock_upload.delete, check_conflict=True)
+        self.assertEqual(3, i)
+        self.assertEqual(5, o_mock_upload.push.call_count)
+        o_mock_upload.delete.assert_not_called()
+        o_mock_check_file.assert_called_once_with([l_files[2], l_files[5]])
+
+    def test_push_files_cancel(self)->None:
+        """test de __push_files : arrêt avant le fichier suivant si l'interruption est demandée"""
+        l_files_upload = []
+        for i in range(3):
+            o_mock = MagicMock()
+            o_mock.name = f"upload_{i}"
+            l_files_upload.append(o_mock)
+        l_files = [(o_mock, "base") for o_mock in l_files_upload]
+        o_cancel = threading.Event()
+        # interruption demandée pendant la livraison du 2e fichier
+        o_mock_upload=MagicMock(**{"api_tree.return_value" : [], "push.side_effect": lambda p_file, s_api_path: o_cancel.set() if p_file is l_files_upload[1] else None})
+        o_ua = UploadActionNoPrivate(MagicMock())
+        o_ua.set_upload(o_mock_upload)
+        o_ua._UploadAction__cancel = o_cancel # pylint: disable=attribute-defined-outside-init,invalid-name
+        with patch.object(UploadAction, "parse_tree", return_value={}):
+            with self.assertRaises(GpfSdkError) as o_arc:
+                o_ua.push_files(l_files, o_mock_upload.push, o_mock_upload.delete)
+        self.assertIn("téléversement interrompu", o_arc.exception.message)
+        self.assertEqual(2, o_mock_upload.push.call_count)
+
     def test_check_file_uploaded(self)->None:
         """test de __check_file_uploaded"""
         # pas d'upload
@@ -796,6 +913,32 @@ class UploadActionTestCase(GpfTestCase):
                 # Vérification sur add_carte_tags() : on devrait avoir "upload_check_ko"
                 o_mock__add_carte_tags.assert_called_once_with(True, o_upload, "upload_check_ko")
 
+    def test_monitor_uploads_until_end(self) -> None:
+        """Vérifie le suivi simultané de plusieurs livraisons."""
+        d_list_checks_wait = {"asked": [{}],"in_progress": [],"passed": [],"failed": []}
+        d_list_checks_ok = {"asked": [],"in_progress": [],"passed": [{}],"failed": []}
+        d_list_checks_ko = {"asked": [],"in_progress": [],"passed": [],"failed": [{}]}
+        o_upload_1 = Upload({"_id": "id_upload_1"})
+        o_upload_2 = Upload({"_id": "id_upload_2"})
+        # 1er tour : upload_1 en erreur, upload_2 en attente ; 2e tour : seul upload_2 est interrogé, il est ok
+        d_returns = {"id_upload_1": [d_list_checks_ko], "id_upload_2": [d_list_checks_wait, d_list_checks_ok]}
+        with patch.object(Upload, "api_list_checks", autospec=True, side_effect=lambda o_upload: d_returns[o_upload.id].pop(0)) as o_mock_list_checks:
+            with patch.object(UploadAction, "add_carte_tags") as o_mock__add_carte_tags:
+                with patch("sdk_entrepot_gpf.workflow.action.UploadAction.time.sleep") as o_mock_sleep:
+                    f_callback = MagicMock()
+                    l_result = UploadAction.monitor_uploads_until_end([o_upload_1, o_upload_2], f_callback, None, mode_cartes=True)
+        self.assertEqual(l_result, [False, True])
+        self.assertEqual(o_mock_list_checks.call_count, 3)
+        # Une seule attente par tour
+        o_mock_sleep.assert_called_once()
+        # Messages préfixés par la livraison
+        f_callback.assert_any_call(f"{o_upload_1} : Vérifications : 0 en attente, 0 en cours, 1 en échec, 0 en succès")
+        f_callback.assert_any_call(f"{o_upload_2} : Vérifications : 1 en attente, 0 en cours, 0 en échec, 0 en succès")
+        self.assertEqual(o_mock__add_carte_tags.call_args_list, [
+            call(True, o_upload_1, "upload_check_ko"),
+            call(True, o_upload_2, "upload_check_ok"),
+        ])
+
     def test_interrupt_monitor_until_end(self) -> None:
         """Vérifie le bon fonctionnement de monitor_until_end si il y a interruption en cours de route."""
         # tout déjà traité
@@ -1,7 +1,11 @@
-from unittest.mock import MagicMock
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from sdk_entrepot_gpf.workflow.resolver.DictResolver import DictResolver
 from sdk_entrepot_gpf.workflow.resolver.Errors import ResolverNotFoundError
+from sdk_entrepot_gpf.workflow.resolver.FileResolver import FileResolver
 from sdk_entrepot_gpf.workflow.resolver.GlobalResolver import GlobalResolver
 
 from tests.GpfTestCase import GpfTestCase
@@ -146,3 +150,36 @@ class GlobalResolverTestCase(GpfTestCase):
             GlobalResolver().resolve("{resolver_not_found.foo}")
         self.assertEqual(o_arc.exception.resolver_name, "resolver_not_found")
         self.assertEqual(o_arc.exception.message, "Le résolveur 'resolver_not_found' demandé est non défini.")
+
+    def test_resolve_cache(self) -> None:
+        """Vérifie la mise en cache des résolutions selon le résolveur."""
+        o_resolver = DictResolver("cached", {"a": "1", "b": "2"})
+        GlobalResolver().add_resolver(o_resolver)
+        with patch.object(o_resolver, "resolve", wraps=o_resolver.resolve) as o_mock_resolve:
+            # Résolution en cache : le résolveur n'est appelé qu'une fois par chaîne et paramètres
+            self.assertEqual(GlobalResolver().resolve("{cached.a}"), "1")
+            self.assertEqual(GlobalResolver().resolve("{cached.a}_{cached.a}"), "1_1")
+            self.assertEqual(o_mock_resolve.call_count, 1)
+            self.assertEqual(GlobalResolver().resolve("{cached.a}", datastore="other"), "1")
+            self.assertEqual(o_mock_resolve.call_count, 2)
+            # Pas de cache (durée de vie nulle, ex. résolveur datetime)
+            with patch.object(DictResolver, "cache_default_ttl", 0):
+                GlobalResolver().resolve("{cached.b}")
+                GlobalResolver().resolve("{cached.b}")
+            self.assertEqual(o_mock_resolve.call_count, 4)
+        # Résolveur remplacé : ses résolutions sont oubliées
+        GlobalResolver().add_resolver(DictResolver("cached", {"a": "3"}))
+        self.assertEqual(GlobalResolver().resolve("{cached.a}"), "3")
+        del GlobalResolver().resolvers["cached"]
+
+    def test_resolve_cache_file(self) -> None:
+        """Vérifie que la résolution d'un fichier est refaite s'il a été modifié."""
+        with tempfile.TemporaryDirectory() as s_tmp_dir:
+            p_file = Path(s_tmp_dir) / "text.txt"
+            p_file.write_text("v1", encoding="utf-8")
+            GlobalResolver().add_resolver(FileResolver("file", Path(s_tmp_dir)))
+            self.assertEqual(GlobalResolver().resolve("{file.str(text.txt)}"), "v1")
+            p_file.write_text("v2", encoding="utf-8")
+            os.utime(p_file, ns=(p_file.stat().st_atime_ns, p_file.stat().st_mtime_ns + 10**9))
+            self.assertEqual(GlobalResolver().resolve("{file.str(text.txt)}"), "v2")
+        del GlobalResolver().resolvers["file"]
@@ -0,0 +1,87 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from sdk_entrepot_gpf.io.Config import Config
+from sdk_entrepot_gpf.workflow.resolver.ResolverCache import ResolverCache
+from tests.GpfTestCase import GpfTestCase
+
+
+class ResolverCacheTestCase(GpfTestCase):
+    """Tests ResolverCache class.
+
+    cmd : python3 -m unittest -b tests.workflow.resolver.ResolverCacheTestCase
+    """
+
+    def test_from_config(self) -> None:
+        """Vérifie la configuration (pas de persistance par défaut)."""
+        o_cache = ResolverCache.from_config()
+        self.assertEqual(o_cache.size, 1000)
+        self.assertIsNone(o_cache.file)
+        d_conf = {"size": "5", "file": "cache.sqlite"}
+        with patch.object(Config(), "get", side_effect=lambda section, option, fallback=None: d_conf.get(option, fallback)):
+            o_cache = ResolverCache.from_config()
+        self.assertEqual(o_cache.size, 5)
+        self.assertEqual(o_cache.file, Path("cache.sqlite"))
+
+    def test_ttl(self) -> None:
+        """Vérifie la durée de vie des résolutions."""
+        o_cache = ResolverCache(10)
+        with patch("time.time", return_value=1000.0):
+            o_cache.put("forever", "v1", None)
+            o_cache.put("short", "v2", 60)
+            o_cache.put("never", "v3", 0)
+            self.assertEqual(o_cache.get("forever"), "v1")
+            self.assertEqual(o_cache.get("short"), "v2")
+            self.assertIsNone(o_cache.get("never"))
+        # 60 s plus tard : la résolution "short" a expiré
+        with patch("time.time", return_value=1060.0):
+            self.assertEqual(o_cache.get("forever"), "v1")
+            self.assertIsNone(o_cache.get("short"))
+
+    def test_size_and_invalidate(self) -> None:
+        """Vérifie la taille maximale (oubli des moins récemment utilisées) et l'invalidation par préfixe."""
+        o_cache = ResolverCache(2)
+        o_cache.put("a\n1", "v1", None)
+        o_cache.put("a\n2", "v2", None)
+        # Utilisation de a\n1 : c'est a\n2 qui est oubliée
+        self.assertEqual(o_cache.get("a\n1"), "v1")
+        o_cache.put("b\n1", "v3", None)
+        self.assertIsNone(o_cache.get("a\n2"))
+        self.assertEqual(o_cache.get("a\n1"), "v1")
+        self.assertEqual(o_cache.get("b\n1"), "v3")
+        o_cache.invalidate("a\n")
+        self.assertIsNone(o_cache.get("a\n1"))
+        self.assertEqual(o_cache.get("b\n1"), "v3")
+        o_cache.clear()
+        self.assertIsNone(o_cache.get("b\n1"))
+        # Taille nulle : pas de cache en mémoire
+        o_cache = ResolverCache(0)
+        o_cache.put("a", "v1", None)
+        self.assertIsNone(o_cache.get("a"))
+
+    def test_persistent(self) -> None:
+        """Vérifie la persistance entre deux instances (seulement pour les résolutions persistantes)."""
+        with tempfile.TemporaryDirectory() as s_tmp_dir:
+            p_file = Path(s_tmp_dir) / "sub" / "cache.sqlite"
+            o_cache = ResolverCache(2, p_file)
+            with patch("time.time", return_value=1000.0):
+                o_cache.put("p1", "v1", 60, persistent=True)
+                o_cache.put("p2", "v2", None, persistent=True)
+                o_cache.put("p3", "v3", None, persistent=True)
+                o_cache.put("m1", "v4", None)
+            # Nouvelle instance (nouvelle exécution)
+            o_cache = ResolverCache(2, p_file)
+            with patch("time.time", return_value=1010.0):
+                self.assertIsNone(o_cache.get("m1", persistent=True))
+                # Base bornée à 2 résolutions : la plus ancienne est oubliée
+                self.assertIsNone(o_cache.get("p1", persistent=True))
+                self.assertEqual(o_cache.get("p2", persistent=True), "v2")
+                self.assertEqual(o_cache.get("p3", persistent=True), "v3")
+                # Recherche non persistante : seulement en mémoire
+                self.assertIsNone(ResolverCache(2, p_file).get("p2"))
+            o_cache = ResolverCache(5, p_file)
+            with patch("time.time", return_value=2000.0):
+                o_cache.put("p4", "v5", 60, persistent=True)
+            with patch("time.time", return_value=2100.0):
+                self.assertIsNone(ResolverCache(5, p_file).get("p4", persistent=True))
@@ -86,6 +86,9 @@ class StoreEntityResolverTestCase(GpfTestCase):
             Upload({"_id": "upload_1", "name": "Name 1", "tags": {"k_tag": "v_tag"}}),
             Upload({"_id": "upload_2", "name": "Name 2", "tags": {"k_tag": "v_tag"}}),
         ]
+        # entités issues d'un listing : complétées car la clef n'est pas dans le listing
+        for o_upload in l_uploads:
+            o_upload._partial = True  # pylint:disable=protected-access
 
         # TEST 1 : attributs, on tente de récupérer différents attributs du 1er élément
 
@@ -117,6 +120,9 @@ class StoreEntityResolverTestCase(GpfTestCase):
             d_param (Dict[str,Any]): dictionnaire
         """
         o_store_entity_resolver = StoreEntityResolver("store_entity")
+        # entités issues d'un listing
+        for o_entity in d_param["return_api_list"]:
+            o_entity._partial = True  # pylint:disable=protected-access
         # On mock la fonction api_list, on veut vérifier qu'elle est appelée avec les bons param
         with patch.object(d_param["classe"], "api_list", return_value=d_param["return_api_list"]) as o_mock_api_list:
             with patch.object(d_param["classe"], "api_update", return_value=None) as o_mock_api_update:
@@ -125,8 +131,8 @@ class StoreEntityResolverTestCase(GpfTestCase):
                 o_mock_api_list.assert_called_once_with(**d_param["data_api_list"])
                 # Vérification id récupérée
                 self.assertEqual(s_result, d_param["expected_result"])
-                # Vérification maj entité via appel de api_update
-                self.assertEqual(o_mock_api_update.call_count, d_param.get("nb_api_update", 1))
+                # Vérification maj entité via appel de api_update (seulement si l'information n'est pas dans le listing)
+                self.assertEqual(o_mock_api_update.call_count, d_param.get("nb_api_update", 0))
 
     def test_resolve_upload(self) -> None:
         """Vérifie le bon fonctionnement de la fonction resolve pour un upload."""
@@ -195,6 +201,7 @@ class StoreEntityResolverTestCase(GpfTestCase):
                 "data_api_list": {"infos_filter": {"name": "start_%"}, "tags_filter": {"k_tag": "v_tag"}, "page": 1, "datastore": None},
                 "expression": {"string_to_solve": "upload.ONE [INFOS(name=start_%), TAGS(k_tag=v_tag)]"},
                 "expected_result": l_uploads[0].to_json(),
+                "nb_api_update": 1,
             },
             # TEST 4 : utilisation de ALL
             {
@@ -203,7 +210,6 @@ class StoreEntityResolverTestCase(GpfTestCase):
                 "data_api_list": {"infos_filter": {"name": "start_%"}, "tags_filter": {"k_tag": "v_tag"}, "page": 1, "datastore": "datastore_1"},
                 "expression": {"string_to_solve": "upload.ALL.infos._id [INFOS(name=start_%), TAGS(k_tag=v_tag)]", "datastore": "datastore_1"},
                 "expected_result": json.dumps([o_upload["_id"] for o_upload in l_uploads]),
-                "nb_api_update": len(l_uploads),
             },
             {
                 "classe": Upload,
@@ -211,7 +217,6 @@ class StoreEntityResolverTestCase(GpfTestCase):
                 "data_api_list": {"infos_filter": {"name": "start_%"}, "tags_filter": {"k_tag": "v_tag"}, "page": 1, "datastore": "datastore_1"},
                 "expression": {"string_to_solve": "upload.ALL.infos.name [INFOS(name=start_%), TAGS(k_tag=v_tag)]", "datastore": "datastore_1"},
                 "expected_result": json.dumps([o_upload["name"] for o_upload in l_uploads]),
-                "nb_api_update": len(l_uploads),
             },
             {
                 "classe": Upload,
@@ -227,7 +232,6 @@ class StoreEntityResolverTestCase(GpfTestCase):
                 "data_api_list": {"infos_filter": {"name": "start_%"}, "tags_filter": {}, "page": 1, "datastore": "datastore_1"},
                 "expression": {"string_to_solve": "upload.ALL.tags.k_tag [INFOS(name=start_%)]", "datastore": "datastore_1"},
                 "expected_result": json.dumps(list({o_upload["tags"]["k_tag"] for o_upload in l_uploads})),
-                "nb_api_update": len(l_uploads),
             },
         ]
         for d_param in l_param:
@@ -280,3 +284,26 @@ class StoreEntityResolverTestCase(GpfTestCase):
         ]
         for d_param in l_param:
             self.run_resolve(d_param)
+
+    def test_resolve_hydrate(self) -> None:
+        """Vérifie que seules les entités dont le listing ne contient pas l'information sont complétées, simultanément."""
+        o_store_entity_resolver = StoreEntityResolver("store_entity")
+        # listing : le statut n'est connu que pour la première donnée livrée
+        l_uploads = [Upload._from_list_item({"_id": "upload_1", "name": "Name 1", "status": "OPEN"})]  # pylint:disable=protected-access
+        l_uploads += [Upload._from_list_item({"_id": f"upload_{i}", "name": f"Name {i}"}) for i in range(2, 6)]  # pylint:disable=protected-access
+
+        def api_update(self: Upload) -> None:
+            self._store_api_dict = {**self._store_api_dict, "status": "CLOSED"}  # pylint:disable=protected-access
+            self._partial = False  # pylint:disable=protected-access
+
+        with patch.object(Upload, "api_list", return_value=l_uploads), patch.object(Upload, "api_update", autospec=True, side_effect=api_update) as o_mock_api_update:
+            # nom dans le listing : aucune requête
+            self.assertEqual(o_store_entity_resolver.resolve("upload.ALL.infos.name [INFOS(name=Name%)]"), json.dumps([f"Name {i}" for i in range(1, 6)]))
+            o_mock_api_update.assert_not_called()
+            # statut absent du listing : seules les entités concernées sont complétées
+            self.assertEqual(o_store_entity_resolver.resolve("upload.ALL.infos.status [INFOS(name=Name%)]"), json.dumps(["OPEN"] + ["CLOSED"] * 4))
+            self.assertCountEqual([o_call.args[0].id for o_call in o_mock_api_update.call_args_list], [f"upload_{i}" for i in range(2, 6)])
+            # entités entières demandées : seule la première (encore partielle) est complétée
+            o_store_entity_resolver.resolve("upload.ALL [INFOS(name=Name%)]")
+            self.assertEqual(o_mock_api_update.call_count, 5)
+            o_mock_api_update.assert_called_with(l_uploads[0])